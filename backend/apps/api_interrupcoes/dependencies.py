@@ -1,7 +1,18 @@
 """Dependencias da API 1 - Interrupcoes."""
 
+import hmac
+
 from fastapi import Header, HTTPException, Request
 
+from backend.shared.infrastructure.auth.api_key_index import (
+    ApiKeyStatus,
+    get_api_key_index_repository,
+)
+from backend.shared.infrastructure.auth.ip_matcher import (
+    get_allowed_ips_matcher,
+    get_trusted_proxies_matcher,
+    resolve_client_ip,
+)
 from backend.shared.infrastructure.config import get_settings
 from backend.shared.infrastructure.logger import get_logger
 
@@ -13,6 +24,10 @@ async def verify_api_key(
     """
     Verifica a chave de API no header.
 
+    Com auth_backend=token a chave e validada no indice de TOKEN_ACESSO
+    (expiracao e IPs permitidos por token); senao, contra a chave unica
+    da configuracao.
+
     Args:
         request: Request FastAPI
         x_api_key: Chave de API do header
@@ -21,49 +36,62 @@ async def verify_api_key(
         Chave de API validada
 
     Raises:
-        HTTPException: Se a chave for invalida ou ausente
+        HTTPException: Se a chave for invalida, expirada ou ausente, ou se
+            o IP nao for permitido para o token
     """
     logger = get_logger("auth")
     settings = get_settings()
+    client_ip = get_client_ip(request)
 
     if not x_api_key:
         logger.warning(
             "Requisicao sem API Key",
             path=request.url.path,
-            client_ip=request.client.host if request.client else "unknown",
-        )
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "idcStatusRequisicao": 2,
-                "emailIndisponibilidade": settings.email_indisponibilidade,
-                "mensagem": "Header x-api-key e obrigatorio",
-                "interrupcaoFornecimento": [],
-            },
+            client_ip=client_ip or "unknown",
         )
-
-    if x_api_key != settings.api_key:
-        logger.warning(
-            "API Key invalida",
-            path=request.url.path,
-            client_ip=request.client.host if request.client else "unknown",
-        )
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "idcStatusRequisicao": 2,
-                "emailIndisponibilidade": settings.email_indisponibilidade,
-                "mensagem": "API Key invalida",
-                "interrupcaoFornecimento": [],
-            },
-        )
-
-    return x_api_key
+        raise _auth_error(401, "Header x-api-key e obrigatorio")
+
+    if settings.auth_backend == "token":
+        repository = get_api_key_index_repository()
+        index = await repository.get_index()
+        status, token = repository.validate(x_api_key, client_ip, index)
+    else:
+        valid = hmac.compare_digest(x_api_key.encode(), settings.api_key.encode())
+        status, token = (ApiKeyStatus.VALIDA if valid else ApiKeyStatus.INVALIDA), None
+
+    if status is ApiKeyStatus.VALIDA:
+        return x_api_key
+
+    logger.warning(
+        "API Key recusada",
+        reason=status.value,
+        token=token.nome if token else None,
+        path=request.url.path,
+        client_ip=client_ip or "unknown",
+    )
+    if status is ApiKeyStatus.IP_NAO_PERMITIDO:
+        raise _auth_error(403, "Acesso nao autorizado para este IP")
+    if status is ApiKeyStatus.EXPIRADA:
+        raise _auth_error(401, "API Key expirada")
+    raise _auth_error(401, "API Key invalida")
+
+
+def _auth_error(status_code: int, mensagem: str) -> HTTPException:
+    """Erro de autenticacao no envelope ANEEL."""
+    return HTTPException(
+        status_code=status_code,
+        detail={
+            "idcStatusRequisicao": 2,
+            "emailIndisponibilidade": get_settings().email_indisponibilidade,
+            "mensagem": mensagem,
+            "interrupcaoFornecimento": [],
+        },
+    )
 
 
 async def verify_ip_whitelist(request: Request) -> None:
     """
-    Verifica se o IP do cliente esta na whitelist.
+    Verifica se o IP do cliente esta na whitelist (IPs ou faixas CIDR).
 
     Args:
         request: Request FastAPI
@@ -71,28 +99,25 @@ async def verify_ip_whitelist(request: Request) -> None:
     Raises:
         HTTPException: Se o IP nao estiver na whitelist
     """
-    settings = get_settings()
-    logger = get_logger("auth")
-
-    # Se whitelist for *, permite todos
-    if "*" in settings.allowed_ips_list:
+    allowed_ips = get_allowed_ips_matcher()
+    if allowed_ips.allow_all:
         return
 
-    client_ip = request.client.host if request.client else None
-
-    if client_ip and client_ip not in settings.allowed_ips_list:
-        logger.warning(
+    client_ip = get_client_ip(request)
+    if client_ip and not allowed_ips.match(client_ip):
+        get_logger("auth").warning(
             "IP nao autorizado",
             path=request.url.path,
             client_ip=client_ip,
-            allowed_ips=settings.allowed_ips_list,
-        )
-        raise HTTPException(
-            status_code=403,
-            detail={
-                "idcStatusRequisicao": 2,
-                "emailIndisponibilidade": settings.email_indisponibilidade,
-                "mensagem": "Acesso nao autorizado para este IP",
-                "interrupcaoFornecimento": [],
-            },
+            allowed_ips=repr(allowed_ips),
         )
+        raise _auth_error(403, "Acesso nao autorizado para este IP")
+
+
+def get_client_ip(request: Request) -> str | None:
+    """IP real do cliente (X-Forwarded-For apenas via proxy confiavel)."""
+    return resolve_client_ip(
+        request.client.host if request.client else None,
+        request.headers,
+        get_trusted_proxies_matcher(),
+    )
@@ -7,18 +7,50 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.shared.infrastructure.auth.api_key_index import get_api_key_index_repository
+from backend.shared.infrastructure.auth.ip_matcher import (
+    get_allowed_ips_matcher,
+    get_trusted_proxies_matcher,
+)
 from backend.shared.infrastructure.config import get_settings
 from backend.shared.infrastructure.database.oracle_pool import oracle_pool
 from backend.shared.infrastructure.cache.memory_cache import memory_cache
+from backend.shared.infrastructure.cache.refresh_ahead import RefreshAheadScheduler
+from backend.shared.infrastructure.cache.shared_cache import LeaderLock, get_leader_lock
 from backend.shared.infrastructure.logger import configure_logging, get_logger
+from backend.shared.infrastructure.logging.audit_sink import get_audit_sink
 
+from backend.apps.api_interrupcoes.repositories.dispositivo_index_repository import (
+    get_dispositivo_index_repository,
+)
+from backend.apps.api_interrupcoes.repositories.materialized_interrupcao_repository import (
+    get_materialized_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.outages_programadas_repository import (
+    get_outages_programadas_repository,
+)
+from backend.apps.api_interrupcoes.repositories.universo_repository import (
+    get_universo_repository,
+)
 from backend.apps.api_interrupcoes.routes import router
+from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_ativas import (
+    get_interrupcoes_ativas_use_case,
+    uses_universo_cache,
+)
+from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_historico import (
+    get_interrupcoes_historico_use_case,
+)
 from backend.apps.api_interrupcoes.middleware import (
-    RateLimitMiddleware,
-    RequestLoggingMiddleware,
-    ErrorHandlerMiddleware,
+    AuditStage,
+    ErrorHandlerStage,
+    MiddlewarePipeline,
+    PipelineStage,
+    RateLimitStage,
+    RequestLoggingStage,
 )
 
+HISTORY_PURGE_INTERVAL_SECONDS = 24 * 3600
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -44,15 +76,167 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await memory_cache.start()
     logger.info("Cache inicializado")
 
+    # Writer da auditoria em lote (depende do pool)
+    if uses_audit_sink():
+        await get_audit_sink().start()
+
+    # Tokens de acesso: recarga e gravacao dos acessos (por worker)
+    api_key_refresh: RefreshAheadScheduler | None = None
+    if settings.auth_backend == "token":
+        api_key_interval = settings.api_key_refresh_interval_seconds
+        api_key_refresh = RefreshAheadScheduler(
+            name="auth:api_keys",
+            refresh=get_api_key_index_repository().refresh,
+            interval_seconds=api_key_interval,
+            jitter_seconds=api_key_interval * settings.cache_refresh_jitter_ratio,
+        )
+        await api_key_refresh.start()
+
+    # Lider entre os workers: historico, expurgo e refresh da materialized
+    # view rodam apenas nele. Com cache shared, tambem apenas o lider
+    # recalcula o snapshot
+    leader_lock: LeaderLock | None = None
+    if (
+        settings.snapshot_history_enabled
+        or settings.aggregation_mode == "materialized"
+        or settings.cache_backend == "shared"
+    ):
+        leader_lock = get_leader_lock()
+    cache_leader = (
+        leader_lock.try_acquire if leader_lock and settings.cache_backend == "shared" else None
+    )
+
+    # Universo de UCs atendidas: cadencia propria (CacheTTL.UNIVERSO)
+    universo_refresh: RefreshAheadScheduler | None = None
+    if uses_universo_cache():
+        universo = get_universo_repository()
+        universo_interval = universo.ttl_seconds * settings.cache_refresh_ahead_ratio
+        universo_refresh = RefreshAheadScheduler(
+            name=universo.CACHE_KEY,
+            refresh=universo.refresh,
+            interval_seconds=universo_interval,
+            jitter_seconds=universo_interval * settings.cache_refresh_jitter_ratio,
+            is_leader=cache_leader,
+        )
+        await universo_refresh.start()
+
+    # Refresh da materialized view: custo dos DBLinks fora das leituras.
+    # DBMS_MVIEW.REFRESH e global: um unico worker executa
+    mview_refresh: RefreshAheadScheduler | None = None
+    if settings.aggregation_mode == "materialized":
+        refresher = get_materialized_interrupcao_repository().refresher
+        mview_interval = settings.aggregation_mview_refresh_interval_seconds
+        mview_refresh = RefreshAheadScheduler(
+            name=refresher.mview,
+            refresh=refresher.refresh,
+            interval_seconds=mview_interval,
+            jitter_seconds=mview_interval * settings.cache_refresh_jitter_ratio,
+            is_leader=get_leader_lock().try_acquire,
+        )
+        await mview_refresh.start()
+
+    # Indice de dispositivos e ocorrencias programadas (por worker: ambos
+    # sao em processo)
+    device_index_reload: RefreshAheadScheduler | None = None
+    outages_programadas_refresh: RefreshAheadScheduler | None = None
+    if settings.aggregation_mode == "indexed":
+        device_index_reload = RefreshAheadScheduler(
+            name="indice:dispositivos",
+            refresh=get_dispositivo_index_repository().reload,
+            interval_seconds=settings.device_index_reload_interval_seconds,
+            jitter_seconds=(
+                settings.device_index_reload_interval_seconds * settings.cache_refresh_jitter_ratio
+            ),
+        )
+        await device_index_reload.start()
+
+        outages_interval = settings.outages_programadas_refresh_interval_seconds
+        outages_programadas_refresh = RefreshAheadScheduler(
+            name="indice:outages_programadas",
+            refresh=get_outages_programadas_repository().refresh,
+            interval_seconds=outages_interval,
+            jitter_seconds=outages_interval * settings.cache_refresh_jitter_ratio,
+        )
+        await outages_programadas_refresh.start()
+
+    refresh_scheduler: RefreshAheadScheduler | None = None
+    if settings.cache_refresh_ahead_enabled:
+        use_case = await get_interrupcoes_ativas_use_case()
+        interval = settings.cache_refresh_interval_seconds
+        refresh_scheduler = RefreshAheadScheduler(
+            name=use_case.CACHE_KEY,
+            refresh=use_case.refresh,
+            interval_seconds=interval,
+            jitter_seconds=interval * settings.cache_refresh_jitter_ratio,
+            is_leader=cache_leader,
+        )
+        await refresh_scheduler.start()
+        logger.info(
+            "Refresh antecipado iniciado",
+            interval_seconds=interval,
+            cache_backend=settings.cache_backend,
+        )
+    app.state.refresh_scheduler = refresh_scheduler
+
+    # Expurgo diario do historico de snapshots (retencao)
+    history_purge: RefreshAheadScheduler | None = None
+    if settings.snapshot_history_enabled:
+        historico_use_case = await get_interrupcoes_historico_use_case()
+        history_purge = RefreshAheadScheduler(
+            name="interrupcoes:historico:retencao",
+            refresh=historico_use_case.purge_expired,
+            interval_seconds=HISTORY_PURGE_INTERVAL_SECONDS,
+            is_leader=get_leader_lock().try_acquire,
+        )
+        await history_purge.start()
+
     yield
 
     # Shutdown
     logger.info("Encerrando aplicacao...")
+    if refresh_scheduler is not None:
+        await refresh_scheduler.stop()
+    if history_purge is not None:
+        await history_purge.stop()
+    if universo_refresh is not None:
+        await universo_refresh.stop()
+    if mview_refresh is not None:
+        await mview_refresh.stop()
+    if device_index_reload is not None:
+        await device_index_reload.stop()
+    if outages_programadas_refresh is not None:
+        await outages_programadas_refresh.stop()
+    if api_key_refresh is not None:
+        await api_key_refresh.stop()
+        try:
+            await get_api_key_index_repository().flush_acessos()
+        except Exception as e:
+            logger.warning("Acessos dos tokens nao gravados", error=str(e))
+    if leader_lock is not None:
+        leader_lock.release()
+    if uses_audit_sink():
+        await get_audit_sink().stop()
     await memory_cache.stop()
     await oracle_pool.close()
     logger.info("Aplicacao encerrada")
 
 
+def uses_audit_sink() -> bool:
+    """Auditoria gravada em lote na tabela CONSULTA."""
+    settings = get_settings()
+    return settings.audit_enabled and settings.audit_sink == "oracle"
+
+
+def create_pipeline_stages() -> list[PipelineStage]:
+    """Estagios do pipeline de middlewares, do mais externo ao mais interno."""
+    settings = get_settings()
+    stages: list[PipelineStage] = []
+    if settings.audit_enabled:
+        stages.append(AuditStage(get_audit_sink() if uses_audit_sink() else None))
+    stages += [RateLimitStage(), RequestLoggingStage(), ErrorHandlerStage()]
+    return stages
+
+
 def create_app() -> FastAPI:
     """Factory para criar a aplicacao FastAPI."""
     settings = get_settings()
@@ -66,6 +250,11 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Listas de IPs compiladas uma vez (CIDR invalido falha aqui, nao na
+    # primeira requisicao)
+    get_allowed_ips_matcher()
+    get_trusted_proxies_matcher()
+
     # CORS
     app.add_middleware(
         CORSMiddleware,
@@ -75,10 +264,8 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Middlewares customizados (ordem inversa de execucao)
-    app.add_middleware(ErrorHandlerMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
-    app.add_middleware(RateLimitMiddleware)
+    # Pipeline ASGI unico (estagios na ordem de execucao)
+    app.add_middleware(MiddlewarePipeline, stages=create_pipeline_stages())
 
     # Rotas
     app.include_router(router)
@@ -1,101 +1,209 @@
-"""Middlewares da API 1 - Interrupcoes."""
+"""Middlewares da API 1 - Interrupcoes.
+
+Um unico middleware ASGI puro (MiddlewarePipeline) executa estagios
+plugaveis em ordem. Cada estagio implementa apenas os ganchos que usa:
+
+- on_request: pode responder antes da aplicacao (ex.: 429 do rate limit)
+- on_response: acrescenta headers no inicio da resposta
+- on_error: converte uma excecao em resposta (envelope ANEEL)
+- on_complete: observa status e duracao ao final (logs, auditoria)
+
+Ao contrario de BaseHTTPMiddleware, nao ha task nem stream intermediario
+por camada: o corpo da aplicacao segue direto para o servidor e todos os
+estagios compartilham um unico wrapper de send.
+
+Ganchos de resposta, erro e conclusao so rodam nos estagios cujo
+on_request deixou a requisicao seguir, do mais interno para o mais
+externo (mesma semantica do empilhamento de middlewares).
+"""
+
+from __future__ import annotations
 
 import time
 import uuid
-from collections import defaultdict
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from collections.abc import Sequence
 from typing import Any
 
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.shared.domain.clock import agora_brasilia
+from backend.shared.infrastructure.auth.ip_matcher import (
+    get_trusted_proxies_matcher,
+    resolve_client_ip,
+)
 from backend.shared.infrastructure.http.aneel_response import AneelResponseBuilder
+from backend.shared.infrastructure.http.rate_limiter import RateLimiter, create_rate_limiter
 from backend.shared.infrastructure.logger import get_logger, log_request
 from backend.shared.infrastructure.logging.audit import get_audit_logger
-
-# Type alias para o callback do middleware
-RequestResponseEndpoint = Callable[[Request], Awaitable[Response]]
-
-
-@dataclass
-class RateLimitEntry:
-    """Entrada de rate limit para um cliente."""
-
-    count: int = 0
-    window_start: float = field(default_factory=time.time)
-
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware para rate limiting conforme especificacao ANEEL (10 req/min)."""
+from backend.shared.infrastructure.logging.audit_sink import (
+    AuditRecord,
+    AuditSink,
+)
+
+EXCLUDED_PATHS = frozenset(["/", "/health", "/docs", "/openapi.json", "/redoc"])
+
+
+class RequestContext:
+    """
+    Estado de uma requisicao compartilhado entre os estagios.
+
+    Attributes:
+        scope: Scope ASGI da requisicao
+        method: Metodo HTTP
+        path: Path da requisicao
+        headers: Headers da requisicao
+        client_host: IP da conexao (None se desconhecido)
+        start: Inicio do processamento (perf_counter)
+        status_code: Status enviado (0 enquanto a resposta nao comecou)
+        state: Dados por requisicao dos estagios
+    """
+
+    __slots__ = (
+        "scope",
+        "method",
+        "path",
+        "headers",
+        "client_host",
+        "start",
+        "status_code",
+        "state",
+    )
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.headers = Headers(scope=scope)
+        client = scope.get("client")
+        self.client_host: str | None = client[0] if client else None
+        self.start = time.perf_counter()
+        self.status_code = 0
+        self.state: dict[str, Any] = {}
+
+    @property
+    def duration_ms(self) -> float:
+        """Tempo desde o inicio da requisicao."""
+        return (time.perf_counter() - self.start) * 1000
+
+
+class PipelineStage:
+    """Estagio do pipeline; os ganchos padrao nao fazem nada."""
+
+    async def on_request(self, ctx: RequestContext) -> ASGIApp | None:
+        """Retorna uma resposta para interromper o pipeline, ou None."""
+        return None
+
+    def on_response(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        """Ajusta os headers da resposta (inclusive de erro)."""
+
+    def on_error(self, ctx: RequestContext, exc: Exception) -> ASGIApp | None:
+        """Retorna uma resposta para a excecao, ou None para propagar."""
+        return None
+
+    def on_complete(self, ctx: RequestContext, error: Exception | None) -> None:
+        """Chamado ao final, com a excecao (tratada ou nao) se houver."""
+
+
+class MiddlewarePipeline:
+    """
+    Middleware ASGI unico que executa os estagios em ordem.
+
+    Uso:
+        app.add_middleware(MiddlewarePipeline, stages=[...])
+    """
+
+    def __init__(self, app: ASGIApp, stages: Sequence[PipelineStage] = ()) -> None:
+        self.app = app
+        self.stages = tuple(stages)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = RequestContext(scope)
+        active: list[PipelineStage] = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                ctx.status_code = message["status"]
+                if active:
+                    headers = MutableHeaders(raw=list(message.get("headers", ())))
+                    for stage in reversed(active):
+                        stage.on_response(ctx, headers)
+                    message["headers"] = headers.raw
+            await send(message)
+
+        error: Exception | None = None
+        try:
+            response = None
+            for stage in self.stages:
+                response = await stage.on_request(ctx)
+                if response is not None:
+                    break
+                active.append(stage)
+            await (response or self.app)(scope, receive, send_wrapper)
+        except Exception as exc:
+            error = exc
+            response = None
+            if not ctx.status_code:
+                for stage in reversed(active):
+                    response = stage.on_error(ctx, exc)
+                    if response is not None:
+                        break
+            if response is None:
+                self._complete(active, ctx, error)
+                raise
+            await response(scope, receive, send_wrapper)
+
+        self._complete(active, ctx, error)
+
+    @staticmethod
+    def _complete(
+        active: list[PipelineStage],
+        ctx: RequestContext,
+        error: Exception | None,
+    ) -> None:
+        """Executa on_complete do estagio mais interno ao mais externo."""
+        for stage in reversed(active):
+            stage.on_complete(ctx, error)
+
+
+class RateLimitStage(PipelineStage):
+    """
+    Rate limiting conforme especificacao ANEEL (10 req/min).
+
+    A contagem e por janela deslizante; o backend (memoria por worker ou
+    compartilhado entre workers) vem de rate_limit_backend.
+    """
 
     RATE_LIMIT = 10
     WINDOW_SECONDS = 60
-    EXCLUDED_PATHS = frozenset(["/", "/health", "/docs", "/openapi.json", "/redoc"])
+    EXCLUDED_PATHS = EXCLUDED_PATHS
 
-    def __init__(self, app: Any) -> None:
-        super().__init__(app)
-        self._clients: dict[str, RateLimitEntry] = defaultdict(RateLimitEntry)
+    def __init__(self, limiter: RateLimiter | None = None) -> None:
+        if limiter is None:
+            limiter = create_rate_limiter(self.RATE_LIMIT, self.WINDOW_SECONDS)
+        self._limiter = limiter
 
-    def _get_client_key(self, request: Request) -> str:
+    def _get_client_key(self, ctx: RequestContext) -> str:
         """Gera chave unica para o cliente (IP + API Key)."""
-        client_ip = request.client.host if request.client else "unknown"
-        api_key = request.headers.get("x-api-key", "")
+        client_ip = ctx.client_host or "unknown"
+        api_key = ctx.headers.get("x-api-key", "")
         return f"{client_ip}:{api_key}"
 
-    def _is_excluded_path(self, path: str) -> bool:
-        """Verifica se o path esta excluido do rate limiting."""
-        return path in self.EXCLUDED_PATHS
-
-    def _should_skip_rate_limit(self, request: Request) -> bool:
-        """Verifica se deve pular rate limiting (sem autenticacao)."""
-        return "x-api-key" not in request.headers
-
-    def _get_rate_limit_info(self, client_key: str) -> tuple[int, int]:
-        """Retorna (remaining, retry_after) para o cliente."""
-        entry = self._clients[client_key]
-        current_time = time.time()
-
-        # Reset window se expirou
-        if current_time - entry.window_start >= self.WINDOW_SECONDS:
-            entry.count = 0
-            entry.window_start = current_time
-
-        remaining = max(0, self.RATE_LIMIT - entry.count)
-        retry_after = int(self.WINDOW_SECONDS - (current_time - entry.window_start))
-
-        return remaining, max(1, retry_after)
-
-    def _increment_counter(self, client_key: str) -> None:
-        """Incrementa contador de requisicoes do cliente."""
-        entry = self._clients[client_key]
-        current_time = time.time()
-
-        # Reset window se expirou
-        if current_time - entry.window_start >= self.WINDOW_SECONDS:
-            entry.count = 1
-            entry.window_start = current_time
-        else:
-            entry.count += 1
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def on_request(self, ctx: RequestContext) -> ASGIApp | None:
         """Aplica rate limiting nas requisicoes."""
-        # Paths excluidos
-        if self._is_excluded_path(request.url.path):
-            return await call_next(request)
+        # Paths excluidos e requisicoes sem autenticacao nao contam
+        if ctx.path in self.EXCLUDED_PATHS or "x-api-key" not in ctx.headers:
+            return None
 
-        # Requisicoes sem autenticacao nao contam
-        if self._should_skip_rate_limit(request):
-            return await call_next(request)
-
-        client_key = self._get_client_key(request)
-        remaining, retry_after = self._get_rate_limit_info(client_key)
+        decision = self._limiter.hit(self._get_client_key(ctx))
 
         # Se excedeu o limite
-        if remaining == 0:
+        if not decision.allowed:
             return JSONResponse(
                 status_code=429,
                 content={
@@ -105,163 +213,144 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "interrupcaoFornecimento": [],
                 },
                 headers={
-                    "Retry-After": str(retry_after),
-                    "X-RateLimit-Limit": str(self.RATE_LIMIT),
+                    "Retry-After": str(decision.retry_after),
+                    "X-RateLimit-Limit": str(decision.limit),
                     "X-RateLimit-Remaining": "0",
                 },
             )
 
-        # Incrementa contador
-        self._increment_counter(client_key)
-
-        # Processa requisicao
-        response = await call_next(request)
-
-        # Adiciona headers de rate limit
-        new_remaining = max(0, self.RATE_LIMIT - self._clients[client_key].count)
-        response.headers["X-RateLimit-Limit"] = str(self.RATE_LIMIT)
-        response.headers["X-RateLimit-Remaining"] = str(new_remaining)
+        ctx.state["rate_limit"] = decision
+        return None
 
-        return response
+    def on_response(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        """Adiciona headers de rate limit."""
+        decision = ctx.state.get("rate_limit")
+        if decision is not None:
+            headers["X-RateLimit-Limit"] = str(decision.limit)
+            headers["X-RateLimit-Remaining"] = str(decision.remaining)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware para logging de requisicoes."""
+class RequestLoggingStage(PipelineStage):
+    """Logging de requisicoes."""
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Loga todas as requisicoes."""
-        start_time = time.perf_counter()
-
-        response = await call_next(request)
-
-        duration_ms = (time.perf_counter() - start_time) * 1000
+    def on_complete(self, ctx: RequestContext, error: Exception | None) -> None:
+        """Loga todas as requisicoes respondidas."""
+        if not ctx.status_code:
+            return
 
         log_request(
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration_ms=duration_ms,
-            client_ip=request.client.host if request.client else None,
+            method=ctx.method,
+            path=ctx.path,
+            status_code=ctx.status_code,
+            duration_ms=ctx.duration_ms,
+            client_ip=ctx.client_host,
         )
 
-        return response
 
+class ErrorHandlerStage(PipelineStage):
+    """Tratamento global de erros (envelope ANEEL)."""
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware para tratamento global de erros."""
+    def __init__(self) -> None:
+        self.logger = get_logger("error")
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def on_error(self, ctx: RequestContext, exc: Exception) -> ASGIApp | None:
         """Trata excecoes nao capturadas."""
-        logger = get_logger("error")
+        self.logger.error(
+            "Erro nao tratado",
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+            path=ctx.path,
+            exc_info=exc,
+        )
 
-        try:
-            return await call_next(request)
-        except Exception as e:
-            logger.error(
-                "Erro nao tratado",
-                error_type=type(e).__name__,
-                error_message=str(e),
-                path=request.url.path,
-                exc_info=True,
-            )
+        return JSONResponse(
+            status_code=500,
+            content=AneelResponseBuilder.internal_error(),
+        )
 
-            from fastapi.responses import JSONResponse
 
-            return JSONResponse(
-                status_code=500,
-                content=AneelResponseBuilder.internal_error(),
-            )
+class AuditStage(PipelineStage):
+    """
+    Auditoria de requisicoes conforme RAD-124.
 
+    Sem sink, inicio e fim sao registrados no log de auditoria durante a
+    requisicao. Com sink, a requisicao apenas enfileira um registro ao
+    final; o writer do sink grava em lote na tabela CONSULTA.
+    """
 
-class AuditMiddleware(BaseHTTPMiddleware):
-    """Middleware para auditoria de requisicoes conforme RAD-124."""
+    EXCLUDED_PATHS = EXCLUDED_PATHS
+    TIPO_CONSULTA_INTERRUPCAO = 1
 
-    EXCLUDED_PATHS = frozenset(["/", "/health", "/docs", "/openapi.json", "/redoc"])
+    def __init__(self, sink: AuditSink | None = None) -> None:
+        self.sink = sink
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Audita todas as requisicoes."""
-        audit = get_audit_logger()
-
-        # Gerar request_id unico
+    async def on_request(self, ctx: RequestContext) -> ASGIApp | None:
+        """Gera o request_id e registra o inicio da requisicao."""
+        # Gerar request_id unico (tambem em request.state.request_id)
         request_id = str(uuid.uuid4())[:8]
-        request.state.request_id = request_id
+        ctx.state["request_id"] = request_id
+        ctx.scope.setdefault("state", {})["request_id"] = request_id
 
         # Paths excluidos
-        if request.url.path in self.EXCLUDED_PATHS:
-            response = await call_next(request)
-            response.headers["X-Request-ID"] = request_id
-            return response
-
-        # Extrair informacoes
-        client_ip = self._get_client_ip(request)
-        api_key = request.headers.get("x-api-key")
-        method = request.method
-        path = request.url.path
-
-        # Log inicio
-        audit.log_request(
+        if ctx.path in self.EXCLUDED_PATHS:
+            return None
+
+        ctx.state["audited"] = True
+        if self.sink is not None:
+            ctx.state["audit_inicio"] = agora_brasilia()
+            return None
+
+        get_audit_logger().log_request(
             request_id=request_id,
-            client_ip=client_ip,
-            api_key=api_key,
-            method=method,
-            path=path,
+            client_ip=self._get_client_ip(ctx),
+            api_key=ctx.headers.get("x-api-key"),
+            method=ctx.method,
+            path=ctx.path,
         )
-
-        # Processar
-        start_time = time.perf_counter()
-        try:
-            response = await call_next(request)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Log fim
-            audit.log_response(
-                request_id=request_id,
-                status_code=response.status_code,
-                duration_ms=duration_ms,
+        return None
+
+    def on_response(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        """Header de correlacao."""
+        headers["X-Request-ID"] = ctx.state["request_id"]
+
+    def on_complete(self, ctx: RequestContext, error: Exception | None) -> None:
+        """Registra o fim da requisicao."""
+        if not ctx.state.get("audited"):
+            return
+
+        if self.sink is not None:
+            self.sink.enqueue(
+                AuditRecord.from_request(
+                    request_id=ctx.state["request_id"],
+                    tipo_consulta=self.TIPO_CONSULTA_INTERRUPCAO,
+                    inicio=ctx.state["audit_inicio"],
+                    duration_ms=ctx.duration_ms,
+                    client_ip=self._get_client_ip(ctx),
+                    api_key=ctx.headers.get("x-api-key"),
+                    method=ctx.method,
+                    path=ctx.path,
+                    query=ctx.scope.get("query_string", b"").decode("latin-1"),
+                    status_code=ctx.status_code or 500,
+                    error=str(error) if error is not None else None,
+                )
             )
+            return
 
-            # Headers de correlacao
-            response.headers["X-Request-ID"] = request_id
-
-            return response
-
-        except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            audit.log_response(
-                request_id=request_id,
-                status_code=500,
-                duration_ms=duration_ms,
-                error=str(e),
-            )
-            raise
+        get_audit_logger().log_response(
+            request_id=ctx.state["request_id"],
+            status_code=ctx.status_code or 500,
+            duration_ms=ctx.duration_ms,
+            error=str(error) if error is not None else None,
+        )
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, ctx: RequestContext) -> str:
         """
         Obtem IP real do cliente.
 
-        Considera headers de proxy reverso:
-        - X-Forwarded-For
-        - X-Real-IP
+        X-Forwarded-For e X-Real-IP so valem quando a conexao vem de um
+        proxy em trusted_proxies.
         """
-        # Tentar X-Forwarded-For primeiro (lista de IPs separados por virgula)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            # Primeiro IP e o cliente original
-            return forwarded_for.split(",")[0].strip()
-
-        # Tentar X-Real-IP
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip.strip()
-
-        # Fallback para IP direto
-        if request.client:
-            return request.client.host
-
-        return "unknown"
+        client_ip = resolve_client_ip(
+            ctx.client_host, ctx.headers, get_trusted_proxies_matcher()
+        )
+        return client_ip or "unknown"
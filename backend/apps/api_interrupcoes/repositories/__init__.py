@@ -1,19 +1,91 @@
 """Repositorios da API 1 - Interrupcoes."""
 
+from backend.apps.api_interrupcoes.repositories.async_oracle_interrupcao_repository import (
+    AsyncOracleInterrupcaoRepository,
+    async_interrupcao_repository,
+    get_async_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.dispositivo_index_repository import (
+    DispositivoIndex,
+    DispositivoIndexRepository,
+    get_dispositivo_index_repository,
+)
+from backend.apps.api_interrupcoes.repositories.fanout_interrupcao_repository import (
+    FanoutInterrupcaoRepository,
+    fanout_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.incremental_interrupcao_repository import (
+    IncrementalInterrupcaoRepository,
+    get_incremental_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.indexed_interrupcao_repository import (
+    IndexedInterrupcaoRepository,
+    get_indexed_interrupcao_repository,
+)
 from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (
     InterrupcaoAgregadaDB,
     InterrupcaoRepository,
     get_interrupcao_repository,
     interrupcao_repository,
 )
+from backend.apps.api_interrupcoes.repositories.local_snapshot_historico_repository import (
+    LocalSnapshotHistoricoRepository,
+    get_local_snapshot_historico_repository,
+)
+from backend.apps.api_interrupcoes.repositories.materialized_interrupcao_repository import (
+    MaterializedInterrupcaoRepository,
+    get_materialized_interrupcao_repository,
+)
 from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
     OracleInterrupcaoRepository,
 )
+from backend.apps.api_interrupcoes.repositories.outages_programadas_repository import (
+    OutagesProgramadas,
+    OutagesProgramadasRepository,
+    get_outages_programadas_repository,
+)
+from backend.apps.api_interrupcoes.repositories.snapshot_historico_repository import (
+    OracleSnapshotHistoricoRepository,
+    SnapshotHistorico,
+    SnapshotHistoricoRepository,
+    get_snapshot_historico_repository,
+    snapshot_historico_repository,
+)
+from backend.apps.api_interrupcoes.repositories.universo_repository import (
+    UniversoRepository,
+    get_universo_repository,
+)
 
 __all__ = [
+    "AsyncOracleInterrupcaoRepository",
+    "DispositivoIndex",
+    "DispositivoIndexRepository",
+    "FanoutInterrupcaoRepository",
+    "IncrementalInterrupcaoRepository",
+    "IndexedInterrupcaoRepository",
     "InterrupcaoAgregadaDB",
     "InterrupcaoRepository",
+    "LocalSnapshotHistoricoRepository",
+    "MaterializedInterrupcaoRepository",
     "OracleInterrupcaoRepository",
+    "OracleSnapshotHistoricoRepository",
+    "OutagesProgramadas",
+    "OutagesProgramadasRepository",
+    "SnapshotHistorico",
+    "SnapshotHistoricoRepository",
+    "UniversoRepository",
+    "async_interrupcao_repository",
+    "fanout_interrupcao_repository",
+    "get_async_interrupcao_repository",
+    "get_dispositivo_index_repository",
+    "get_incremental_interrupcao_repository",
+    "get_indexed_interrupcao_repository",
     "get_interrupcao_repository",
+    "get_local_snapshot_historico_repository",
+    "get_materialized_interrupcao_repository",
+    "get_outages_programadas_repository",
+    "get_snapshot_historico_repository",
+    "get_universo_repository",
     "interrupcao_repository",
+    "snapshot_historico_repository",
 ]
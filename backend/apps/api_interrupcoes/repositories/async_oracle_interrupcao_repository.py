@@ -0,0 +1,200 @@
+"""Oracle Repository assincrono para Interrupcoes.
+
+Usa o OraclePool (oracledb.AsyncConnectionPool): a concorrencia fica
+limitada apenas pelo tamanho do pool, e nao pelo ThreadPoolExecutor de
+OracleConnection.execute_async (10 threads).
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from backend.shared.domain.entities.interrupcao import Interrupcao
+from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
+    QUERY_ALTERADAS,
+    QUERY_ATIVAS,
+    QUERY_HISTORICO,
+    QUERY_POR_CONJUNTO,
+    QUERY_POR_MUNICIPIO,
+    InterrupcaoColunas,
+    OracleInterrupcaoRepository,
+    map_interrupcao_colunas,
+    map_interrupcao_records,
+)
+
+logger = get_logger(__name__)
+
+
+class AsyncOracleInterrupcaoRepository:
+    """
+    Implementacao Oracle assincrona do AsyncInterrupcaoRepository.
+
+    Mesmas queries e mesmo mapeamento de OracleInterrupcaoRepository,
+    executados no pool assincrono.
+
+    Attributes:
+        pool: Pool de conexoes Oracle assincrono
+    """
+
+    AG_ID_RORAIMA = OracleInterrupcaoRepository.AG_ID_RORAIMA
+    DIST_RORAIMA = OracleInterrupcaoRepository.DIST_RORAIMA
+
+    def __init__(self, pool: OraclePool) -> None:
+        """
+        Inicializa repositorio com o pool assincrono.
+
+        Args:
+            pool: Pool de conexoes Oracle
+        """
+        self.pool = pool
+
+    async def buscar_ativas(self) -> list[Interrupcao]:
+        """
+        Busca todas as interrupcoes ativas (is_open = 'T').
+
+        Returns:
+            Lista de entidades Interrupcao
+        """
+        logger.info("buscando_interrupcoes_ativas", ag_id=self.AG_ID_RORAIMA)
+
+        interrupcoes = await self._fetch(QUERY_ATIVAS, {})
+        logger.info("interrupcoes_encontradas", quantidade=len(interrupcoes))
+
+        return interrupcoes
+
+    async def buscar_ativas_colunas(self) -> InterrupcaoColunas:
+        """
+        Busca as interrupcoes ativas em colunas paralelas.
+
+        Caminho de agregacao: nenhuma entidade e criada por linha. Use
+        com InterrupcaoAggregatorService.agregar_colunar().
+
+        Returns:
+            InterrupcaoColunas com as interrupcoes ativas validas
+        """
+        rows = await self.pool.execute_rows(
+            QUERY_ATIVAS,
+            {"ag_id": self.AG_ID_RORAIMA, "dist": self.DIST_RORAIMA},
+        )
+        colunas = map_interrupcao_colunas(rows)
+        logger.info("interrupcoes_encontradas", quantidade=len(colunas))
+
+        return colunas
+
+    async def buscar_por_municipio(self, codigo_ibge: CodigoIBGE) -> list[Interrupcao]:
+        """
+        Busca interrupcoes ativas de um municipio especifico.
+
+        Args:
+            codigo_ibge: Codigo IBGE do municipio (Value Object)
+
+        Returns:
+            Lista de interrupcoes do municipio
+        """
+        logger.info(
+            "buscando_interrupcoes_por_municipio",
+            municipio=codigo_ibge.valor,
+        )
+        return await self._fetch(QUERY_POR_MUNICIPIO, {"ibge": codigo_ibge.valor})
+
+    async def buscar_por_conjunto(self, id_conjunto: int) -> list[Interrupcao]:
+        """
+        Busca interrupcoes ativas de um conjunto eletrico especifico.
+
+        Args:
+            id_conjunto: ID do conjunto eletrico
+
+        Returns:
+            Lista de interrupcoes do conjunto
+        """
+        logger.info(
+            "buscando_interrupcoes_por_conjunto",
+            conjunto=id_conjunto,
+        )
+        return await self._fetch(QUERY_POR_CONJUNTO, {"conjunto": id_conjunto})
+
+    async def buscar_historico(
+        self,
+        data_inicio: datetime,
+        data_fim: datetime,
+    ) -> list[Interrupcao]:
+        """
+        Busca historico de interrupcoes em um periodo.
+
+        Args:
+            data_inicio: Data inicial do periodo
+            data_fim: Data final do periodo
+
+        Returns:
+            Lista de interrupcoes no periodo
+        """
+        logger.info(
+            "buscando_historico_interrupcoes",
+            data_inicio=data_inicio.isoformat(),
+            data_fim=data_fim.isoformat(),
+        )
+        return await self._fetch(
+            QUERY_HISTORICO, {"dt_inicio": data_inicio, "dt_fim": data_fim}
+        )
+
+    async def buscar_alteradas_desde(self, desde: datetime) -> list[Interrupcao]:
+        """
+        Busca eventos abertos ou fechados a partir de um instante.
+
+        Usado pela agregacao incremental: o custo depende do volume de
+        alteracoes, nao do total de eventos abertos.
+
+        Args:
+            desde: Marca d'agua (horario de Brasilia, inclusive)
+
+        Returns:
+            Interrupcoes alteradas; fechadas possuem data_fim preenchida
+        """
+        logger.debug("buscando_interrupcoes_alteradas", desde=desde.isoformat())
+        return await self._fetch(QUERY_ALTERADAS, {"desde": desde})
+
+    async def stream_ativas(self, batch_size: int = 500) -> AsyncIterator[list[Interrupcao]]:
+        """
+        Busca as interrupcoes ativas em lotes.
+
+        Durante grandes eventos (milhares de AGENCY_EVENT abertos) apenas
+        um lote fica em memoria por vez; ideal para agregar com
+        AcumuladorInterrupcoes.
+
+        Args:
+            batch_size: Linhas buscadas por round-trip
+
+        Yields:
+            Lotes de entidades Interrupcao (IBGE invalido e ignorado)
+        """
+        logger.info("streaming_interrupcoes_ativas", batch_size=batch_size)
+
+        async for rows in self.pool.stream(
+            QUERY_ATIVAS,
+            {"ag_id": self.AG_ID_RORAIMA, "dist": self.DIST_RORAIMA},
+            batch_size=batch_size,
+        ):
+            yield map_interrupcao_records(rows)
+
+    async def _fetch(self, sql: str, params: dict) -> list[Interrupcao]:
+        """Executa a query com os binds da agencia e mapeia o resultado."""
+        # Tuplas na ordem do SELECT (ROW_FIELDS), sem dict por linha
+        rows = await self.pool.execute_rows(
+            sql,
+            {"ag_id": self.AG_ID_RORAIMA, "dist": self.DIST_RORAIMA, **params},
+        )
+        return map_interrupcao_records(rows)
+
+
+# Instancia singleton
+async_interrupcao_repository = AsyncOracleInterrupcaoRepository(oracle_pool)
+
+
+async def get_async_interrupcao_repository() -> AsyncOracleInterrupcaoRepository:
+    """Dependency injection para FastAPI."""
+    return async_interrupcao_repository
@@ -0,0 +1,220 @@
+"""Indice em processo dispositivo -> (conjunto, municipio).
+
+A topologia da rede (OMS_CONNECTIVITY) e o municipio de cada dispositivo
+(IND_UNIVERSOS) mudam raramente, mas as queries de interrupcoes resolvem
+dev_id -> (conjunto, ibge) com joins remotos a cada execucao. Aqui o
+mapeamento e carregado uma vez (uma query por DBLink, em paralelo),
+mantido em memoria e recarregado em background. A query quente precisa
+apenas dos eventos; o enriquecimento e O(1) por dispositivo.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.fanout_interrupcao_repository import (
+    QUERY_MUNICIPIO_POR_DISPOSITIVO,
+)
+
+QUERY_CONJUNTO_POR_DISPOSITIVO = query_registry.register(
+    "indice_conjunto_por_dispositivo",
+    """
+    SELECT
+        oc.mslink AS dev_id,
+        oc.conj AS conjunto
+    FROM
+        INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
+    WHERE
+        oc.dist = 370
+    """,
+    arraysize=5000,
+)
+
+# Dispositivo -> pares (conjunto, ibge); quase sempre um unico par
+Localizacoes = tuple[tuple[int, int], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DispositivoIndex:
+    """
+    Versao imutavel do indice dispositivo -> (conjunto, ibge).
+
+    Recargas criam uma nova instancia e trocam a referencia: leitores
+    sempre enxergam um indice completo.
+
+    Attributes:
+        version: Incrementada quando o conteudo muda
+        loaded_at: Momento (epoch) da carga
+        mapa: dev_id -> pares (conjunto, ibge)
+    """
+
+    version: int = 0
+    loaded_at: float | None = None
+    mapa: dict[int, Localizacoes] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Numero de dispositivos indexados."""
+        return len(self.mapa)
+
+    def resolver(self, dev_id: int) -> Localizacoes:
+        """
+        Localizacoes do dispositivo (vazio se desconhecido).
+
+        Mesma semantica do INNER JOIN: dispositivo sem conjunto ou sem
+        municipio nao aparece, e um dispositivo em varios conjuntos ou
+        municipios aparece em cada combinacao.
+        """
+        return self.mapa.get(dev_id, ())
+
+
+def build_dispositivo_mapa(
+    conjuntos: Iterable[tuple[Any, ...]],
+    municipios: Iterable[tuple[Any, ...]],
+) -> dict[int, Localizacoes]:
+    """
+    Junta (dev_id, conjunto) e (dev_id, ibge) no mapa do indice.
+
+    Args:
+        conjuntos: Tuplas (mslink, conjunto) de OMS_CONNECTIVITY
+        municipios: Tuplas (id_dispositivo, ibge) de IND_UNIVERSOS
+
+    Returns:
+        dev_id -> pares (conjunto, ibge)
+    """
+    por_dispositivo: dict[Any, list[int]] = {}
+    for dev_id, ibge in municipios:
+        por_dispositivo.setdefault(dev_id, []).append(ibge)
+
+    pares: dict[int, list[tuple[int, int]]] = {}
+    for dev_id, conjunto in conjuntos:
+        ibges = por_dispositivo.get(dev_id)
+        if ibges:
+            destino = pares.setdefault(dev_id, [])
+            destino.extend((conjunto, ibge) for ibge in ibges)
+
+    return {dev_id: tuple(localizacoes) for dev_id, localizacoes in pares.items()}
+
+
+@dataclass
+class DispositivoIndexStats:
+    """Estatisticas do indice de dispositivos."""
+
+    version: int
+    devices: int
+    reloads: int
+    failures: int
+    loaded_at: float | None
+    last_duration_ms: float | None
+
+
+class DispositivoIndexRepository:
+    """
+    Mantem o indice de dispositivos em memoria.
+
+    Caracteristicas:
+    - Carga sob demanda na primeira leitura (coalescida)
+    - reload() em background (RefreshAheadScheduler); falha mantem a
+      versao anterior
+    - Versao so muda quando o conteudo muda
+    """
+
+    def __init__(self, pool: OraclePool) -> None:
+        self.pool = pool
+        self._index = DispositivoIndex()
+        self._lock = asyncio.Lock()
+        self._reloads = 0
+        self._failures = 0
+        self._last_duration_ms: float | None = None
+        self.logger = get_logger("repository.dispositivo_index")
+
+    @property
+    def current(self) -> DispositivoIndex:
+        """Indice atual (pode estar vazio se ainda nao carregado)."""
+        return self._index
+
+    async def get_index(self) -> DispositivoIndex:
+        """
+        Retorna o indice, carregando na primeira chamada.
+
+        Returns:
+            Versao atual do indice
+
+        Raises:
+            DatabaseQueryError: Se a carga inicial falhar
+        """
+        if self._index.loaded_at is None:
+            async with self._lock:
+                if self._index.loaded_at is None:
+                    await self._load()
+        return self._index
+
+    async def reload(self) -> DispositivoIndex:
+        """
+        Recarrega o indice a partir do banco.
+
+        Returns:
+            Nova versao (ou a mesma, se o conteudo nao mudou)
+
+        Raises:
+            DatabaseQueryError: Se a carga falhar (versao anterior mantida)
+        """
+        async with self._lock:
+            await self._load()
+        return self._index
+
+    def get_stats(self) -> DispositivoIndexStats:
+        """Retorna estatisticas do indice."""
+        return DispositivoIndexStats(
+            version=self._index.version,
+            devices=len(self._index),
+            reloads=self._reloads,
+            failures=self._failures,
+            loaded_at=self._index.loaded_at,
+            last_duration_ms=self._last_duration_ms,
+        )
+
+    async def _load(self) -> None:
+        """Consulta os dois DBLinks em paralelo e troca o indice."""
+        start = time.perf_counter()
+        try:
+            conjuntos, municipios = await asyncio.gather(
+                self.pool.execute_rows(QUERY_CONJUNTO_POR_DISPOSITIVO),
+                self.pool.execute_rows(QUERY_MUNICIPIO_POR_DISPOSITIVO),
+            )
+        except Exception:
+            self._failures += 1
+            raise
+
+        mapa = build_dispositivo_mapa(conjuntos, municipios)
+        anterior = self._index
+        changed = mapa != anterior.mapa
+        self._index = DispositivoIndex(
+            version=anterior.version + 1 if changed else anterior.version,
+            loaded_at=time.time(),
+            mapa=mapa if changed else anterior.mapa,
+        )
+        self._reloads += 1
+        self._last_duration_ms = (time.perf_counter() - start) * 1000
+
+        self.logger.info(
+            "Indice de dispositivos carregado",
+            version=self._index.version,
+            devices=len(mapa),
+            changed=changed,
+            duration_ms=round(self._last_duration_ms, 2),
+        )
+
+
+@lru_cache
+def get_dispositivo_index_repository() -> DispositivoIndexRepository:
+    """Retorna a instancia (por processo) do indice de dispositivos."""
+    return DispositivoIndexRepository(oracle_pool)
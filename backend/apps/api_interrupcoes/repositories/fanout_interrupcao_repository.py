@@ -0,0 +1,170 @@
+"""Interrupcoes agregadas por sub-queries paralelas, uma por DBLink.
+
+A query agregada unica cruza DBLINK_INSERVICE e DBLINK_INDICADORES; o
+join entre links costuma obrigar o Oracle a trazer tabelas remotas
+inteiras. Aqui cada link recebe uma query propria (executada por
+completo no site remoto), as duas rodam em conexoes distintas do pool
+ao mesmo tempo, e o join e feito em Python com indice em dict:
+
+    INSERVICE:   AGENCY_EVENT + SWITCH_PLAN_TASKS + OMS_CONNECTIVITY
+                 -> (dev_id, conjunto, programada, nao_programada)
+    INDICADORES: IND_UNIVERSOS -> (id_dispositivo, codigo_ibge)
+
+O tempo total tende ao do link mais lento, e nao a soma dos dois.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (
+    PLANO_POR_OUTAGE,
+    InterrupcaoAgregadaDB,
+)
+
+# Agregado por dispositivo no site INSERVICE (um unico link)
+QUERY_EVENTOS_POR_DISPOSITIVO = query_registry.register(
+    "fanout_eventos_por_dispositivo",
+    f"""
+    SELECT
+        ae.dev_id AS dev_id,
+        oc.conj AS conjunto,
+        SUM(CASE WHEN spt.plan_id IS NOT NULL THEN ae.num_cust ELSE 0 END) AS qtd_programada,
+        SUM(CASE WHEN spt.plan_id IS NULL THEN ae.num_cust ELSE 0 END) AS qtd_nao_programada
+    FROM
+        INSERVICE.AGENCY_EVENT@DBLINK_INSERVICE ae
+    LEFT JOIN
+        {PLANO_POR_OUTAGE} spt
+        ON spt.outage_num = ae.num_1
+    INNER JOIN
+        INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
+        ON oc.mslink = ae.dev_id
+        AND oc.dist = 370
+    WHERE
+        ae.is_open = 'T'
+        AND ae.ag_id = 370
+    GROUP BY
+        ae.dev_id,
+        oc.conj
+    """,
+    arraysize=1000,
+)
+
+# Mapa dispositivo -> municipio no site INDICADORES
+QUERY_MUNICIPIO_POR_DISPOSITIVO = query_registry.register(
+    "fanout_municipio_por_dispositivo",
+    """
+    SELECT
+        iu.id_dispositivo AS dev_id,
+        iu.cd_universo AS municipio_ibge
+    FROM
+        INDICADORES.IND_UNIVERSOS@DBLINK_INDICADORES iu
+    WHERE
+        iu.cd_tipo_universo = 2
+    """,
+    arraysize=5000,
+)
+
+
+class FanoutInterrupcaoRepository:
+    """
+    Fonte de interrupcoes agregadas com uma sub-query por DBLink.
+
+    Mesmo contrato e mesmo resultado dos demais modos de agregacao: o
+    plano vem de PLANO_POR_OUTAGE, entao cada evento conta uma vez por
+    (conjunto, municipio).
+
+    Attributes:
+        pool: Pool de conexoes Oracle (uma conexao por sub-query)
+    """
+
+    def __init__(self, pool: OraclePool) -> None:
+        self.pool = pool
+        self.logger = get_logger("repository.interrupcao_fanout")
+
+    async def find_ativas_agregadas(
+        self,
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregadaDB]:
+        """
+        Busca interrupcoes ativas agregadas por municipio e conjunto.
+
+        Args:
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Returns:
+            Lista de interrupcoes agregadas (ordenadas por municipio/conjunto)
+
+        Raises:
+            DatabaseQueryError: Se qualquer sub-query falhar
+        """
+        eventos, municipios = await asyncio.gather(
+            self.pool.execute_rows(QUERY_EVENTOS_POR_DISPOSITIVO),
+            self.pool.execute_rows(QUERY_MUNICIPIO_POR_DISPOSITIVO),
+        )
+
+        totais = hash_join_agregados(eventos, municipios)
+        universo = universo or {}
+
+        result = [
+            InterrupcaoAgregadaDB(
+                conjunto=conjunto,
+                municipio_ibge=ibge,
+                qtd_ucs_atendidas=universo.get((conjunto, ibge), 0),
+                qtd_programada=programada,
+                qtd_nao_programada=nao_programada,
+            )
+            for (ibge, conjunto), (programada, nao_programada) in sorted(totais.items())
+        ]
+
+        self.logger.info(
+            "Interrupcoes ativas encontradas",
+            count=len(result),
+            dispositivos=len(eventos),
+        )
+        return result
+
+
+def hash_join_agregados(
+    eventos: Iterable[tuple[Any, ...]],
+    municipios: Iterable[tuple[Any, ...]],
+) -> dict[tuple[int, int], list[int]]:
+    """
+    Junta os agregados por dispositivo ao municipio de cada dispositivo.
+
+    Mesma semantica do INNER JOIN da query unica: dispositivos sem
+    municipio sao descartados e dispositivos com mais de um municipio
+    contam em cada um deles.
+
+    Args:
+        eventos: Tuplas (dev_id, conjunto, programada, nao_programada)
+        municipios: Tuplas (dev_id, codigo_ibge)
+
+    Returns:
+        Mapa (ibge, conjunto) -> [programada, nao_programada]
+    """
+    # Lado de build: dispositivo -> municipios
+    indice: dict[Any, list[int]] = {}
+    for dev_id, ibge in municipios:
+        indice.setdefault(dev_id, []).append(ibge)
+
+    # Lado de probe: O(1) por dispositivo com evento aberto
+    totais: dict[tuple[int, int], list[int]] = {}
+    for dev_id, conjunto, programada, nao_programada in eventos:
+        for ibge in indice.get(dev_id, ()):
+            total = totais.get((ibge, conjunto))
+            if total is None:
+                total = totais[(ibge, conjunto)] = [0, 0]
+            total[0] += programada or 0
+            total[1] += nao_programada or 0
+    return totais
+
+
+# Instancia singleton
+fanout_interrupcao_repository = FanoutInterrupcaoRepository(oracle_pool)
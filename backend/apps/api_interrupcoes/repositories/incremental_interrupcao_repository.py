@@ -0,0 +1,175 @@
+"""Agregacao incremental de interrupcoes ativas por deltas de AGENCY_EVENT."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from backend.shared.domain.clock import agora_brasilia
+from backend.shared.domain.repositories.interrupcao_repository import (
+    AsyncInterrupcaoRepository,
+)
+from backend.shared.domain.services.interrupcao_aggregator import AgregacaoIncremental
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.async_oracle_interrupcao_repository import (
+    async_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (
+    InterrupcaoAgregadaDB,
+)
+
+
+@dataclass
+class IncrementalStats:
+    """Estatisticas da agregacao incremental."""
+
+    deltas: int
+    reconciliations: int
+    drifted_groups: int
+    last_delta_rows: int
+    open_events: int
+    watermark: datetime | None
+
+
+class IncrementalInterrupcaoRepository:
+    """
+    Fonte de interrupcoes agregadas mantida por deltas.
+
+    Mesmo contrato de InterrupcaoRepository.find_ativas_agregadas(), para
+    uso direto no GetInterrupcoesAtivasUseCase:
+
+    - Primeira chamada (e a cada reconcile_interval_seconds): busca todos
+      os eventos abertos e reconstroi o estado (reconciliacao)
+    - Demais chamadas: busca apenas eventos abertos/fechados desde a
+      marca d'agua e aplica os deltas
+
+    A marca d'agua e o relogio da aplicacao no inicio da busca menos
+    overlap_seconds, cobrindo diferenca de relogio com o banco e
+    commits atrasados; a aplicacao dos deltas e idempotente, entao a
+    sobreposicao nao conta eventos em dobro. Alteracoes que nao mudam
+    DT_ON/DT_OFF (ex.: NUM_CUST corrigido) sao capturadas na proxima
+    reconciliacao.
+
+    Nao e seguro para chamadas concorrentes: o caso de uso ja coalesce
+    os refreshes via SingleFlight.
+    """
+
+    def __init__(
+        self,
+        source: AsyncInterrupcaoRepository,
+        reconcile_interval_seconds: float = 900,
+        overlap_seconds: float = 120,
+        clock: Callable[[], datetime] = agora_brasilia,
+    ) -> None:
+        self.source = source
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self._clock = clock
+        self._estado = AgregacaoIncremental()
+        self._watermark: datetime | None = None
+        self._last_reconcile: float | None = None
+        self._deltas = 0
+        self._reconciliations = 0
+        self._drifted_groups = 0
+        self._last_delta_rows = 0
+        self.logger = get_logger("repository.interrupcao_incremental")
+
+    async def find_ativas_agregadas(
+        self,
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregadaDB]:
+        """
+        Retorna as interrupcoes ativas agregadas, atualizando o estado.
+
+        Args:
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Returns:
+            Lista de interrupcoes agregadas (ordenadas por municipio/conjunto)
+
+        Raises:
+            DatabaseQueryError: Se falhar ao consultar o banco (estado mantido)
+        """
+        inicio = self._clock()
+
+        if self._reconcile_due():
+            await self._reconcile()
+        else:
+            await self._apply_delta()
+
+        self._watermark = inicio - self.overlap
+
+        return [
+            InterrupcaoAgregadaDB(
+                conjunto=agregada.id_conjunto,
+                municipio_ibge=agregada.municipio.valor,
+                qtd_ucs_atendidas=agregada.qtd_ucs_atendidas,
+                qtd_programada=agregada.qtd_programada,
+                qtd_nao_programada=agregada.qtd_nao_programada,
+            )
+            for agregada in self._estado.resultado(universo)
+        ]
+
+    def get_stats(self) -> IncrementalStats:
+        """Retorna estatisticas da agregacao incremental."""
+        return IncrementalStats(
+            deltas=self._deltas,
+            reconciliations=self._reconciliations,
+            drifted_groups=self._drifted_groups,
+            last_delta_rows=self._last_delta_rows,
+            open_events=len(self._estado),
+            watermark=self._watermark,
+        )
+
+    def _reconcile_due(self) -> bool:
+        """Verifica se e hora da reconciliacao completa."""
+        if self._watermark is None or self._last_reconcile is None:
+            return True
+        return time.monotonic() - self._last_reconcile >= self.reconcile_interval_seconds
+
+    async def _reconcile(self) -> None:
+        """Reconstroi o estado com todos os eventos abertos."""
+        abertas = await self.source.buscar_ativas()
+        first = self._last_reconcile is None
+        drift = self._estado.reconciliar(abertas)
+        self._last_reconcile = time.monotonic()
+        self._reconciliations += 1
+
+        if not first:
+            self._drifted_groups += drift
+            if drift:
+                self.logger.warning(
+                    "Drift corrigido na reconciliacao da agregacao incremental",
+                    drifted_groups=drift,
+                    open_events=len(self._estado),
+                )
+
+    async def _apply_delta(self) -> None:
+        """Aplica os eventos alterados desde a marca d'agua."""
+        assert self._watermark is not None
+        alteradas = await self.source.buscar_alteradas_desde(self._watermark)
+        changed = self._estado.aplicar(alteradas)
+        self._deltas += 1
+        self._last_delta_rows = len(alteradas)
+
+        self.logger.debug(
+            "Delta aplicado na agregacao incremental",
+            rows=len(alteradas),
+            changed=changed,
+            open_events=len(self._estado),
+        )
+
+
+@lru_cache
+def get_incremental_interrupcao_repository() -> IncrementalInterrupcaoRepository:
+    """Retorna a instancia (por processo) da agregacao incremental."""
+    settings = get_settings()
+    return IncrementalInterrupcaoRepository(
+        async_interrupcao_repository,
+        reconcile_interval_seconds=settings.aggregation_reconcile_interval_seconds,
+    )
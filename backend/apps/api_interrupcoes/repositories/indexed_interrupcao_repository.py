@@ -0,0 +1,161 @@
+"""Interrupcoes agregadas com enriquecimento local por dispositivo.
+
+A query quente toca apenas AGENCY_EVENT (um unico DBLink, sem joins);
+conjunto e municipio vem do DispositivoIndex e a classificacao
+programada/nao programada do conjunto OutagesProgramadas, ambos em
+memoria.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.dispositivo_index_repository import (
+    DispositivoIndex,
+    DispositivoIndexRepository,
+    get_dispositivo_index_repository,
+)
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (
+    InterrupcaoAgregadaDB,
+)
+from backend.apps.api_interrupcoes.repositories.outages_programadas_repository import (
+    OutagesProgramadas,
+    OutagesProgramadasRepository,
+    get_outages_programadas_repository,
+)
+
+QUERY_EVENTOS_ABERTOS = query_registry.register(
+    "indexed_eventos_abertos",
+    """
+    SELECT
+        ae.dev_id AS dev_id,
+        ae.num_1 AS outage_num,
+        ae.num_cust AS ucs_afetadas
+    FROM
+        INSERVICE.AGENCY_EVENT@DBLINK_INSERVICE ae
+    WHERE
+        ae.is_open = 'T'
+        AND ae.ag_id = 370
+    """,
+    arraysize=1000,
+)
+
+
+class IndexedInterrupcaoRepository:
+    """
+    Fonte de interrupcoes agregadas com o indice de dispositivos.
+
+    Mesmo contrato e mesmo resultado dos demais modos de agregacao: cada
+    evento conta uma vez por (conjunto, municipio), programado se a
+    ocorrencia tem PLAN_ID (regra de PLANO_POR_OUTAGE). Ressalva: o
+    conjunto de programadas pode ficar defasado ate a proxima
+    reconciliacao (ver OutagesProgramadasRepository).
+
+    Attributes:
+        pool: Pool de conexoes Oracle
+        index: Indice dispositivo -> (conjunto, ibge)
+        programadas: Conjunto de ocorrencias com plano de manobra
+    """
+
+    def __init__(
+        self,
+        pool: OraclePool,
+        index: DispositivoIndexRepository,
+        programadas: OutagesProgramadasRepository,
+    ) -> None:
+        self.pool = pool
+        self.index = index
+        self.programadas = programadas
+        self.logger = get_logger("repository.interrupcao_indexada")
+
+    async def find_ativas_agregadas(
+        self,
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregadaDB]:
+        """
+        Busca interrupcoes ativas agregadas por municipio e conjunto.
+
+        Args:
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Returns:
+            Lista de interrupcoes agregadas (ordenadas por municipio/conjunto)
+
+        Raises:
+            DatabaseQueryError: Se falhar a query ou a carga inicial do
+                indice ou do conjunto de programadas
+        """
+        index = await self.index.get_index()
+        programadas = await self.programadas.get_programadas()
+        eventos = await self.pool.execute_rows(QUERY_EVENTOS_ABERTOS)
+
+        totais = enriquecer_eventos(eventos, index, programadas)
+        universo = universo or {}
+
+        result = [
+            InterrupcaoAgregadaDB(
+                conjunto=conjunto,
+                municipio_ibge=ibge,
+                qtd_ucs_atendidas=universo.get((conjunto, ibge), 0),
+                qtd_programada=programada,
+                qtd_nao_programada=nao_programada,
+            )
+            for (ibge, conjunto), (programada, nao_programada) in sorted(totais.items())
+        ]
+
+        self.logger.info(
+            "Interrupcoes ativas encontradas",
+            count=len(result),
+            index_version=index.version,
+            programadas_version=programadas.version,
+        )
+        return result
+
+
+def enriquecer_eventos(
+    eventos: Iterable[tuple[Any, ...]],
+    index: DispositivoIndex,
+    programadas: OutagesProgramadas,
+) -> dict[tuple[int, int], list[int]]:
+    """
+    Classifica cada evento e distribui as UCs pelos (conjunto, ibge).
+
+    Args:
+        eventos: Tuplas (dev_id, outage_num, ucs_afetadas)
+        index: Indice de dispositivos
+        programadas: Ocorrencias com plano de manobra
+
+    Returns:
+        Mapa (ibge, conjunto) -> [programada, nao_programada]
+    """
+    resolver = index.resolver
+    com_plano = programadas.outages
+    totais: dict[tuple[int, int], list[int]] = {}
+    for dev_id, outage_num, ucs in eventos:
+        localizacoes = resolver(dev_id)
+        if not localizacoes:
+            continue
+        # Mesma regra de TipoInterrupcao.from_plan_id
+        coluna = 0 if outage_num in com_plano else 1
+        for conjunto, ibge in localizacoes:
+            total = totais.get((ibge, conjunto))
+            if total is None:
+                total = totais[(ibge, conjunto)] = [0, 0]
+            total[coluna] += ucs or 0
+    return totais
+
+
+@lru_cache
+def get_indexed_interrupcao_repository() -> IndexedInterrupcaoRepository:
+    """Retorna a instancia (por processo) da fonte indexada."""
+    return IndexedInterrupcaoRepository(
+        oracle_pool,
+        get_dispositivo_index_repository(),
+        get_outages_programadas_repository(),
+    )
@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
 from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
 from backend.shared.infrastructure.logger import get_logger
 
+from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
+
+# Plano de manobra por ocorrencia. SWITCH_PLAN_TASKS tem uma linha por
+# tarefa: no join direto o evento se repetia (e suas UCs eram somadas)
+# uma vez por tarefa. Agregada por OUTAGE_NUM, cada ocorrencia casa no
+# maximo uma linha. Usada por todas as queries que classificam eventos.
+PLANO_POR_OUTAGE = """(
+            SELECT
+                spt.outage_num,
+                MAX(spt.plan_id) AS plan_id
+            FROM
+                INSERVICE.SWITCH_PLAN_TASKS@DBLINK_INSERVICE spt
+            WHERE
+                spt.outage_num IS NOT NULL
+            GROUP BY
+                spt.outage_num
+        )"""
+
 
 @dataclass
 class InterrupcaoAgregadaDB:
@@ -19,6 +39,16 @@ class InterrupcaoAgregadaDB:
     qtd_programada: int
     qtd_nao_programada: int
 
+    def to_aneel_format(self) -> InterrupcaoAgregadaItem:
+        """Converte para formato ANEEL."""
+        return InterrupcaoAgregadaItem(
+            ideConjuntoUnidadeConsumidora=self.conjunto,
+            ideMunicipio=self.municipio_ibge,
+            qtdUCsAtendidas=self.qtd_ucs_atendidas,
+            qtdOcorrenciaProgramada=self.qtd_programada,
+            qtdOcorrenciaNaoProgramada=self.qtd_nao_programada,
+        )
+
 
 class InterrupcaoRepository:
     """
@@ -27,8 +57,12 @@ class InterrupcaoRepository:
     Utiliza DBLinks para consultar dados do INSERVICE e INDICADORES.
     """
 
-    # Query principal para buscar interrupcoes ativas agregadas
-    QUERY_INTERRUPCOES_ATIVAS = """
+    # Query principal para buscar interrupcoes ativas agregadas.
+    # Poucas centenas de linhas (municipio x conjunto): prefetch de
+    # arraysize + 1 traz tudo no round-trip do execute.
+    QUERY_INTERRUPCOES_ATIVAS = query_registry.register(
+        "interrupcoes_ativas",
+        f"""
         SELECT
             oc.conj AS conjunto,
             iu.cd_universo AS municipio_ibge,
@@ -38,7 +72,7 @@ class InterrupcaoRepository:
         FROM
             INSERVICE.AGENCY_EVENT@DBLINK_INSERVICE ae
         LEFT JOIN
-            INSERVICE.SWITCH_PLAN_TASKS@DBLINK_INSERVICE spt
+            {PLANO_POR_OUTAGE} spt
             ON spt.outage_num = ae.num_1
         INNER JOIN
             INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
@@ -57,16 +91,61 @@ class InterrupcaoRepository:
         ORDER BY
             iu.cd_universo,
             oc.conj
-    """
+    """,
+        arraysize=500,
+        prefetchrows=501,
+    )
+
+    QUERY_INTERRUPCOES_DETALHADAS = query_registry.register(
+        "interrupcoes_ativas_detalhadas",
+        f"""
+        SELECT
+            ae.num_1 AS id,
+            ae.num_cust AS ucs_afetadas,
+            ae.ad_ts AS data_inicio,
+            spt.plan_id,
+            oc.conj AS conjunto,
+            iu.cd_universo AS municipio_ibge
+        FROM
+            INSERVICE.AGENCY_EVENT@DBLINK_INSERVICE ae
+        LEFT JOIN
+            {PLANO_POR_OUTAGE} spt
+            ON spt.outage_num = ae.num_1
+        INNER JOIN
+            INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
+            ON oc.mslink = ae.dev_id
+            AND oc.dist = 370
+        INNER JOIN
+            INDICADORES.IND_UNIVERSOS@DBLINK_INDICADORES iu
+            ON iu.id_dispositivo = ae.dev_id
+            AND iu.cd_tipo_universo = 2
+        WHERE
+            ae.is_open = 'T'
+            AND ae.ag_id = 370
+        ORDER BY
+            ae.ad_ts DESC
+    """,
+        arraysize=1000,
+        row_type="namedtuple",
+    )
 
     def __init__(self, pool: OraclePool) -> None:
         self.pool = pool
         self.logger = get_logger("repository.interrupcao")
 
-    async def find_ativas_agregadas(self) -> list[InterrupcaoAgregadaDB]:
+    async def find_ativas_agregadas(
+        self,
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregadaDB]:
         """
         Busca interrupcoes ativas agregadas por municipio e conjunto.
 
+        A query toca apenas os eventos abertos; qtd_ucs_atendidas vem do
+        universo pre-calculado (UniversoRepository), quando informado.
+
+        Args:
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
         Returns:
             Lista de interrupcoes agregadas
 
@@ -81,7 +160,11 @@ class InterrupcaoRepository:
             InterrupcaoAgregadaDB(
                 conjunto=row["conjunto"],
                 municipio_ibge=row["municipio_ibge"],
-                qtd_ucs_atendidas=row["qtd_ucs_atendidas"] or 0,
+                qtd_ucs_atendidas=(
+                    universo.get((row["conjunto"], row["municipio_ibge"]), 0)
+                    if universo is not None
+                    else row["qtd_ucs_atendidas"] or 0
+                ),
                 qtd_programada=row["qtd_programada"] or 0,
                 qtd_nao_programada=row["qtd_nao_programada"] or 0,
             )
@@ -102,35 +185,27 @@ class InterrupcaoRepository:
         Returns:
             Lista de interrupcoes detalhadas
         """
-        query = """
-            SELECT
-                ae.num_1 AS id,
-                ae.num_cust AS ucs_afetadas,
-                ae.ad_ts AS data_inicio,
-                spt.plan_id,
-                oc.conj AS conjunto,
-                iu.cd_universo AS municipio_ibge
-            FROM
-                INSERVICE.AGENCY_EVENT@DBLINK_INSERVICE ae
-            LEFT JOIN
-                INSERVICE.SWITCH_PLAN_TASKS@DBLINK_INSERVICE spt
-                ON spt.outage_num = ae.num_1
-            INNER JOIN
-                INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
-                ON oc.mslink = ae.dev_id
-                AND oc.dist = 370
-            INNER JOIN
-                INDICADORES.IND_UNIVERSOS@DBLINK_INDICADORES iu
-                ON iu.id_dispositivo = ae.dev_id
-                AND iu.cd_tipo_universo = 2
-            WHERE
-                ae.is_open = 'T'
-                AND ae.ag_id = 370
-            ORDER BY
-                ae.ad_ts DESC
+        return await self.pool.execute(self.QUERY_INTERRUPCOES_DETALHADAS)
+
+    async def stream_ativas_detalhadas(
+        self, batch_size: int = 500
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         """
+        Busca interrupcoes ativas detalhadas em lotes.
+
+        Mesmo conteudo de find_ativas_detalhadas(), mas com no maximo
+        batch_size linhas em memoria por vez.
 
-        return await self.pool.execute(query)
+        Args:
+            batch_size: Linhas buscadas por round-trip
+
+        Yields:
+            Lotes de interrupcoes detalhadas
+        """
+        async for rows in self.pool.stream(
+            self.QUERY_INTERRUPCOES_DETALHADAS, batch_size=batch_size
+        ):
+            yield [row._asdict() for row in rows]
 
 
 # Instancia singleton do repositorio
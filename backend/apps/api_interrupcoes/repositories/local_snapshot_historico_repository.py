@@ -0,0 +1,117 @@
+"""Historico de snapshots em arquivo colunar local."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+
+from backend.shared.infrastructure.archive.columnar_archive import ColumnarArchive
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.snapshot_historico_repository import (
+    SnapshotHistorico,
+)
+from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
+
+
+class LocalSnapshotHistoricoRepository:
+    """
+    Historico de snapshots em segmentos colunares diarios (int32, mmap).
+
+    Alternativa ao armazenamento no Oracle: a busca por dthRecuperacao
+    e uma busca binaria no indice local, na casa de microssegundos, e
+    nao gera carga no banco. Mesmo contrato de SnapshotHistoricoRepository.
+
+    Colunas: conjunto, municipio, UCs atendidas, programada, nao programada.
+    """
+
+    COLUMN_COUNT = 5
+
+    def __init__(self, archive: ColumnarArchive) -> None:
+        self.archive = archive
+        self.logger = get_logger("repository.snapshot_historico_local")
+
+    async def save(
+        self, capturado_em: datetime, items: list[InterrupcaoAgregadaItem]
+    ) -> None:
+        """
+        Grava um snapshot no segmento do dia.
+
+        Args:
+            capturado_em: Momento da captura (horario de Brasilia)
+            items: Interrupcoes agregadas no formato ANEEL
+
+        Raises:
+            ValueError: Se algum valor nao couber em int32
+        """
+        columns = (
+            [item.ideConjuntoUnidadeConsumidora for item in items],
+            [item.ideMunicipio for item in items],
+            [item.qtdUCsAtendidas for item in items],
+            [item.qtdOcorrenciaProgramada for item in items],
+            [item.qtdOcorrenciaNaoProgramada for item in items],
+        )
+
+        if not self.archive.append(capturado_em, columns):
+            self.logger.debug(
+                "Snapshot ignorado: ja existe snapshot mais recente",
+                capturado_em=capturado_em.isoformat(),
+            )
+
+    async def find_nearest(self, dth: datetime) -> SnapshotHistorico | None:
+        """
+        Busca o snapshot mais recente capturado ate dth.
+
+        Args:
+            dth: Data/hora de recuperacao (horario de Brasilia)
+
+        Returns:
+            Snapshot encontrado ou None se nao houver historico ate dth
+        """
+        block = self.archive.find_at(dth)
+        if block is None:
+            return None
+
+        conjuntos, municipios, atendidas, programadas, nao_programadas = block.columns
+        items = [
+            InterrupcaoAgregadaItem(
+                ideConjuntoUnidadeConsumidora=conjuntos[i],
+                ideMunicipio=municipios[i],
+                qtdUCsAtendidas=atendidas[i],
+                qtdOcorrenciaProgramada=programadas[i],
+                qtdOcorrenciaNaoProgramada=nao_programadas[i],
+            )
+            for i in range(block.row_count)
+        ]
+        return SnapshotHistorico(capturado_em=block.timestamp, items=items)
+
+    async def purge_before(self, limite: datetime) -> int:
+        """
+        Remove os segmentos de dias anteriores ao limite.
+
+        Args:
+            limite: Dias anteriores a esta data sao removidos
+
+        Returns:
+            Numero de segmentos diarios removidos
+        """
+        removed = self.archive.purge_before(limite.date())
+        self.logger.info(
+            "Historico local expurgado",
+            limite=limite.date().isoformat(),
+            removed=removed,
+        )
+        return removed
+
+
+@lru_cache
+def get_local_snapshot_historico_repository() -> LocalSnapshotHistoricoRepository:
+    """Retorna a instancia (por processo) do historico local."""
+    settings = get_settings()
+    return LocalSnapshotHistoricoRepository(
+        ColumnarArchive(
+            settings.snapshot_history_dir,
+            column_count=LocalSnapshotHistoricoRepository.COLUMN_COUNT,
+        )
+    )
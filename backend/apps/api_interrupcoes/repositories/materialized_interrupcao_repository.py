@@ -0,0 +1,98 @@
+"""Interrupcoes agregadas lidas da materialized view local."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from backend.shared.infrastructure.database.mview_refresher import MaterializedViewRefresher
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (
+    InterrupcaoAgregadaDB,
+)
+
+MVIEW_INTERRUPCOES = "RADAR_API.MV_INTERRUPCAO_FORNECIMENTO"
+
+QUERY_MATERIALIZADAS = query_registry.register(
+    "interrupcoes_ativas_materializadas",
+    f"""
+    SELECT
+        IDE_CONJUNTO_UC AS conjunto,
+        IDE_MUNICIPIO AS municipio_ibge,
+        QTD_UCS_ATENDIDAS AS qtd_ucs_atendidas,
+        QTD_OCORRENCIA_PROGRAMADA AS qtd_programada,
+        QTD_OCORRENCIA_NAO_PROGRAMADA AS qtd_nao_programada
+    FROM
+        {MVIEW_INTERRUPCOES}
+    ORDER BY
+        IDE_MUNICIPIO,
+        IDE_CONJUNTO_UC
+    """,
+    arraysize=500,
+    prefetchrows=501,
+)
+
+
+class MaterializedInterrupcaoRepository:
+    """
+    Fonte de interrupcoes agregadas baseada em MV_INTERRUPCAO_FORNECIMENTO.
+
+    Mesmo contrato de InterrupcaoRepository.find_ativas_agregadas(). A
+    leitura nao toca DBLinks: o custo remoto fica no refresh da view,
+    executado em background pelo refresher.
+
+    Attributes:
+        pool: Pool de conexoes Oracle
+        refresher: Orquestrador do refresh da materialized view
+    """
+
+    def __init__(self, pool: OraclePool, refresher: MaterializedViewRefresher) -> None:
+        self.pool = pool
+        self.refresher = refresher
+        self.logger = get_logger("repository.interrupcao_materializada")
+
+    async def find_ativas_agregadas(
+        self,
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregadaDB]:
+        """
+        Le as interrupcoes agregadas da materialized view.
+
+        Args:
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas; se
+                informado, substitui o valor materializado
+
+        Returns:
+            Lista de interrupcoes agregadas (ordenadas por municipio/conjunto)
+
+        Raises:
+            DatabaseQueryError: Se falhar ao executar query
+        """
+        rows = await self.pool.execute_rows(QUERY_MATERIALIZADAS)
+
+        result = [
+            InterrupcaoAgregadaDB(
+                conjunto=conjunto,
+                municipio_ibge=ibge,
+                qtd_ucs_atendidas=(
+                    universo.get((conjunto, ibge), 0) if universo is not None else ucs or 0
+                ),
+                qtd_programada=programada or 0,
+                qtd_nao_programada=nao_programada or 0,
+            )
+            for conjunto, ibge, ucs, programada, nao_programada in rows
+        ]
+
+        self.logger.debug("Interrupcoes materializadas lidas", count=len(result))
+        return result
+
+
+@lru_cache
+def get_materialized_interrupcao_repository() -> MaterializedInterrupcaoRepository:
+    """Retorna a instancia (por processo) da fonte materializada."""
+    return MaterializedInterrupcaoRepository(
+        oracle_pool,
+        MaterializedViewRefresher(oracle_pool, MVIEW_INTERRUPCOES),
+    )
@@ -6,8 +6,11 @@ Este e o padrao recomendado para Oracle no projeto de referencia (MJQEE-GFUZ).
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -15,8 +18,11 @@ from sqlalchemy.orm import Session
 from backend.shared.domain.entities.interrupcao import Interrupcao
 from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
 from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
+from backend.shared.infrastructure.database.query_registry import query_registry
 from backend.shared.infrastructure.logger import get_logger
 
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import PLANO_POR_OUTAGE
+
 if TYPE_CHECKING:
     from backend.shared.domain.repositories.interrupcao_repository import (
         InterrupcaoRepository as InterrupcaoRepositoryProtocol,
@@ -24,42 +30,126 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Query base para interrupcoes
+_BASE_QUERY = f"""
+    SELECT
+        ae.num_1 AS id,
+        ae.NUM_CUST AS ucs_afetadas,
+        spt.plan_id AS plan_id,
+        oc.conj AS conjunto,
+        iu.CD_UNIVERSO AS codigo_ibge,
+        ae.DT_ON AS data_inicio,
+        ae.DT_OFF AS data_fim
+    FROM INSERVICE.AGENCY_EVENT@DBLINK_INSERVICE ae
+    LEFT JOIN {PLANO_POR_OUTAGE} spt
+        ON spt.outage_num = ae.num_1
+    INNER JOIN INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
+        ON oc.mslink = ae.dev_id
+        AND oc.dist = :dist
+    INNER JOIN INDICADORES.IND_UNIVERSOS@DBLINK_INDICADORES iu
+        ON iu.ID_DISPOSITIVO = ae.dev_id
+        AND iu.CD_TIPO_UNIVERSO = 2
+"""
 
-class OracleInterrupcaoRepository:
-    """
-    Implementacao Oracle do InterrupcaoRepository.
-
-    Busca dados de interrupcoes ativas via DBLinks usando
-    Session SINCRONA do SQLAlchemy (padrao do projeto de referencia).
-
-    Attributes:
-        _session: Session SQLAlchemy (sincrona)
-    """
-
-    # Constantes da agencia Roraima Energia
-    AG_ID_RORAIMA = 370
-    DIST_RORAIMA = 370
-
-    # Query base para interrupcoes
-    _BASE_QUERY = """
+QUERY_ATIVAS = query_registry.register(
+    "interrupcoes_entidades_ativas",
+    f"""
+        {_BASE_QUERY}
+        WHERE ae.is_open = 'T'
+            AND ae.ag_id = :ag_id
+    """,
+    arraysize=500,
+)
+
+QUERY_POR_MUNICIPIO = query_registry.register(
+    "interrupcoes_entidades_por_municipio",
+    f"""
+        {_BASE_QUERY}
+        WHERE ae.is_open = 'T'
+            AND ae.ag_id = :ag_id
+            AND iu.CD_UNIVERSO = :ibge
+    """,
+    arraysize=500,
+)
+
+QUERY_POR_CONJUNTO = query_registry.register(
+    "interrupcoes_entidades_por_conjunto",
+    f"""
+        {_BASE_QUERY}
+        WHERE ae.is_open = 'T'
+            AND ae.ag_id = :ag_id
+            AND oc.conj = :conjunto
+    """,
+    arraysize=500,
+)
+
+QUERY_HISTORICO = query_registry.register(
+    "interrupcoes_entidades_historico",
+    f"""
+        {_BASE_QUERY}
+        WHERE ae.ag_id = :ag_id
+            AND ae.DT_ON BETWEEN :dt_inicio AND :dt_fim
+    """,
+    arraysize=1000,
+)
+
+# Eventos abertos ou fechados desde a marca (delta da agregacao
+# incremental). data_fim e NULL apenas para eventos abertos.
+QUERY_ALTERADAS = query_registry.register(
+    "interrupcoes_entidades_alteradas",
+    f"""
         SELECT
             ae.num_1 AS id,
             ae.NUM_CUST AS ucs_afetadas,
-            spt.PLAN_ID AS plan_id,
+            spt.plan_id AS plan_id,
             oc.conj AS conjunto,
             iu.CD_UNIVERSO AS codigo_ibge,
             ae.DT_ON AS data_inicio,
-            ae.DT_OFF AS data_fim
+            CASE
+                WHEN ae.is_open = 'T' THEN NULL
+                ELSE GREATEST(NVL(ae.DT_OFF, ae.DT_ON), ae.DT_ON)
+            END AS data_fim
         FROM INSERVICE.AGENCY_EVENT@DBLINK_INSERVICE ae
-        LEFT JOIN INSERVICE.SWITCH_PLAN_TASKS@DBLINK_INSERVICE spt
-            ON spt.OUTAGE_NUM = ae.num_1
+        LEFT JOIN {PLANO_POR_OUTAGE} spt
+            ON spt.outage_num = ae.num_1
         INNER JOIN INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
             ON oc.mslink = ae.dev_id
             AND oc.dist = :dist
         INNER JOIN INDICADORES.IND_UNIVERSOS@DBLINK_INDICADORES iu
             ON iu.ID_DISPOSITIVO = ae.dev_id
             AND iu.CD_TIPO_UNIVERSO = 2
+        WHERE ae.ag_id = :ag_id
+            AND (ae.DT_ON >= :desde OR ae.DT_OFF >= :desde)
+    """,
+    arraysize=500,
+)
+
+# Ordem das colunas consumida por map_interrupcao_records()
+ROW_FIELDS = (
+    "id",
+    "ucs_afetadas",
+    "plan_id",
+    "conjunto",
+    "codigo_ibge",
+    "data_inicio",
+    "data_fim",
+)
+
+
+class OracleInterrupcaoRepository:
     """
+    Implementacao Oracle do InterrupcaoRepository.
+
+    Busca dados de interrupcoes ativas via DBLinks usando
+    Session SINCRONA do SQLAlchemy (padrao do projeto de referencia).
+
+    Attributes:
+        _session: Session SQLAlchemy (sincrona)
+    """
+
+    # Constantes da agencia Roraima Energia
+    AG_ID_RORAIMA = 370
+    DIST_RORAIMA = 370
 
     def __init__(self, session: Session) -> None:
         """
@@ -77,11 +167,7 @@ class OracleInterrupcaoRepository:
         Returns:
             Lista de entidades Interrupcao
         """
-        query = text(f"""
-            {self._BASE_QUERY}
-            WHERE ae.is_open = 'T'
-                AND ae.ag_id = :ag_id
-        """)
+        query = text(QUERY_ATIVAS)
 
         logger.info("buscando_interrupcoes_ativas", ag_id=self.AG_ID_RORAIMA)
 
@@ -106,12 +192,7 @@ class OracleInterrupcaoRepository:
         Returns:
             Lista de interrupcoes do municipio
         """
-        query = text(f"""
-            {self._BASE_QUERY}
-            WHERE ae.is_open = 'T'
-                AND ae.ag_id = :ag_id
-                AND iu.CD_UNIVERSO = :ibge
-        """)
+        query = text(QUERY_POR_MUNICIPIO)
 
         logger.info(
             "buscando_interrupcoes_por_municipio",
@@ -140,12 +221,7 @@ class OracleInterrupcaoRepository:
         Returns:
             Lista de interrupcoes do conjunto
         """
-        query = text(f"""
-            {self._BASE_QUERY}
-            WHERE ae.is_open = 'T'
-                AND ae.ag_id = :ag_id
-                AND oc.conj = :conjunto
-        """)
+        query = text(QUERY_POR_CONJUNTO)
 
         logger.info(
             "buscando_interrupcoes_por_conjunto",
@@ -179,11 +255,7 @@ class OracleInterrupcaoRepository:
         Returns:
             Lista de interrupcoes no periodo
         """
-        query = text(f"""
-            {self._BASE_QUERY}
-            WHERE ae.ag_id = :ag_id
-                AND ae.DT_ON BETWEEN :dt_inicio AND :dt_fim
-        """)
+        query = text(QUERY_HISTORICO)
 
         logger.info(
             "buscando_historico_interrupcoes",
@@ -217,40 +289,203 @@ class OracleInterrupcaoRepository:
         Note:
             Registros com IBGE invalido sao ignorados (logged).
         """
-        entities: list[Interrupcao] = []
-
-        for row in rows:
-            # Criar Value Objects
-            ibge_result = CodigoIBGE.create(row.codigo_ibge)
-            if ibge_result.is_failure:
-                logger.warning(
-                    "ibge_invalido_ignorado",
-                    codigo_ibge=row.codigo_ibge,
-                    interrupcao_id=row.id,
-                    error=ibge_result.error,
-                )
-                continue
-
-            tipo = TipoInterrupcao.from_plan_id(row.plan_id)
-
-            # Criar entidade
-            interrupcao_result = Interrupcao.create(
-                id=row.id,
-                tipo=tipo,
-                municipio=ibge_result.value,
-                conjunto=row.conjunto,
-                ucs_afetadas=row.ucs_afetadas or 0,
-                data_inicio=row.data_inicio,
-                data_fim=row.data_fim,
+        return map_interrupcao_records(map(_ROW_ATTRS, rows))
+
+
+_ROW_ATTRS = attrgetter(*ROW_FIELDS)
+
+
+# VOs compartilhados: 15 municipios validos, nenhuma instancia por linha
+_MUNICIPIOS = {codigo: CodigoIBGE.create_unsafe(codigo) for codigo in CodigoIBGE.CODIGOS_RORAIMA}
+
+# Quantos ids rejeitados entram, como amostra, no log de resumo
+_MAX_AMOSTRA_REJEITADOS = 10
+
+
+@dataclass(slots=True)
+class InterrupcaoColunas:
+    """
+    Interrupcoes validas em colunas paralelas (struct-of-arrays).
+
+    Saida do mapeamento rapido: nenhuma entidade e criada por linha.
+    A posicao i de cada coluna corresponde a mesma interrupcao.
+    Entidades so sao construidas em to_entities(), quando necessarias.
+    """
+
+    ids: list[int] = field(default_factory=list)
+    conjuntos: list[int] = field(default_factory=list)
+    ibges: list[int] = field(default_factory=list)
+    ucs_afetadas: list[int] = field(default_factory=list)
+    programadas: list[bool] = field(default_factory=list)
+    datas_inicio: list[datetime] = field(default_factory=list)
+    datas_fim: list[datetime | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Numero de interrupcoes."""
+        return len(self.ids)
+
+    def to_entities(self) -> list[Interrupcao]:
+        """
+        Constroi as entidades de dominio (linhas ja validadas).
+
+        Returns:
+            Lista de entidades Interrupcao, na mesma ordem das colunas
+        """
+        return [
+            Interrupcao(
+                id=id_,
+                tipo=TipoInterrupcao.PROGRAMADA if programada else TipoInterrupcao.NAO_PROGRAMADA,
+                municipio=_MUNICIPIOS[ibge],
+                conjunto=conjunto,
+                ucs_afetadas=ucs,
+                data_inicio=data_inicio,
+                data_fim=data_fim,
+            )
+            for id_, conjunto, ibge, ucs, programada, data_inicio, data_fim in zip(
+                self.ids,
+                self.conjuntos,
+                self.ibges,
+                self.ucs_afetadas,
+                self.programadas,
+                self.datas_inicio,
+                self.datas_fim,
+            )
+        ]
+
+
+class _Rejeicoes:
+    """Acumula registros rejeitados para um unico evento de log."""
+
+    __slots__ = ("motivos", "amostra")
+
+    def __init__(self) -> None:
+        self.motivos: dict[str, int] = {}
+        self.amostra: list[Any] = []
+
+    def registrar(self, motivo: str, id_: Any) -> None:
+        """Conta a rejeicao e guarda o id na amostra (limitada)."""
+        self.motivos[motivo] = self.motivos.get(motivo, 0) + 1
+        if len(self.amostra) < _MAX_AMOSTRA_REJEITADOS:
+            self.amostra.append(id_)
+
+    def log(self) -> None:
+        """Emite o resumo (somente se houve rejeicao)."""
+        if self.motivos:
+            logger.warning(
+                "registros_rejeitados",
+                total=sum(self.motivos.values()),
+                motivos=self.motivos,
+                amostra_ids=self.amostra,
             )
 
-            if interrupcao_result.is_success:
-                entities.append(interrupcao_result.value)
-            else:
-                logger.warning(
-                    "interrupcao_invalida_ignorada",
-                    interrupcao_id=row.id,
-                    error=interrupcao_result.error,
-                )
 
-        return entities
+def _linhas_validas(
+    records: Iterable[tuple[Any, ...]],
+    rejeicoes: _Rejeicoes,
+) -> Iterator[tuple[Any, int, bool, int, int, datetime, datetime | None]]:
+    """
+    Valida os registros em lote, com as mesmas regras de CodigoIBGE.create
+    e Interrupcao.create, sem criar Result nem Value Objects por linha.
+
+    Yields:
+        Tuplas (id, ucs_afetadas, programada, conjunto, ibge, data_inicio, data_fim)
+    """
+    validos = CodigoIBGE.CODIGOS_RORAIMA
+
+    for id_, ucs_afetadas, plan_id, conjunto, codigo_ibge, data_inicio, data_fim in records:
+        if codigo_ibge not in validos:
+            rejeicoes.registrar("ibge_invalido", id_)
+            continue
+
+        ucs = ucs_afetadas or 0
+        if ucs < 0:
+            rejeicoes.registrar("ucs_negativas", id_)
+        elif conjunto < 0:
+            rejeicoes.registrar("conjunto_negativo", id_)
+        elif data_fim is not None and data_fim < data_inicio:
+            rejeicoes.registrar("data_fim_anterior_inicio", id_)
+        else:
+            yield id_, ucs, plan_id is not None, conjunto, codigo_ibge, data_inicio, data_fim
+
+
+def map_interrupcao_records(records: Iterable[tuple[Any, ...]]) -> list[Interrupcao]:
+    """
+    Mapeia registros (na ordem de ROW_FIELDS) para entidades de dominio.
+
+    Compartilhado pelos repositorios sync (Session) e async (OraclePool),
+    garantindo a mesma semantica de mapeamento nos dois caminhos.
+
+    Args:
+        records: Tuplas (id, ucs_afetadas, plan_id, conjunto, codigo_ibge,
+            data_inicio, data_fim)
+
+    Returns:
+        Lista de entidades Interrupcao
+
+    Note:
+        Registros invalidos sao ignorados e resumidos em um unico log.
+    """
+    rejeicoes = _Rejeicoes()
+    programada = TipoInterrupcao.PROGRAMADA
+    nao_programada = TipoInterrupcao.NAO_PROGRAMADA
+
+    entities = [
+        Interrupcao(
+            id=id_,
+            tipo=programada if is_programada else nao_programada,
+            municipio=_MUNICIPIOS[ibge],
+            conjunto=conjunto,
+            ucs_afetadas=ucs,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+        )
+        for id_, ucs, is_programada, conjunto, ibge, data_inicio, data_fim in _linhas_validas(
+            records, rejeicoes
+        )
+    ]
+
+    rejeicoes.log()
+    return entities
+
+
+def map_interrupcao_colunas(records: Iterable[tuple[Any, ...]]) -> InterrupcaoColunas:
+    """
+    Mapeia registros (na ordem de ROW_FIELDS) para colunas paralelas.
+
+    Caminho rapido para agregacao: mesmas regras de validacao de
+    map_interrupcao_records(), sem alocar entidades por linha. As
+    colunas alimentam InterrupcaoAggregatorService.agregar_colunar().
+
+    Args:
+        records: Tuplas (id, ucs_afetadas, plan_id, conjunto, codigo_ibge,
+            data_inicio, data_fim)
+
+    Returns:
+        InterrupcaoColunas com as linhas validas
+
+    Note:
+        Registros invalidos sao ignorados e resumidos em um unico log.
+    """
+    rejeicoes = _Rejeicoes()
+    colunas = InterrupcaoColunas()
+    ids = colunas.ids.append
+    ucs_afetadas = colunas.ucs_afetadas.append
+    programadas = colunas.programadas.append
+    conjuntos = colunas.conjuntos.append
+    ibges = colunas.ibges.append
+    datas_inicio = colunas.datas_inicio.append
+    datas_fim = colunas.datas_fim.append
+
+    for id_, ucs, programada, conjunto, ibge, data_inicio, data_fim in _linhas_validas(
+        records, rejeicoes
+    ):
+        ids(id_)
+        ucs_afetadas(ucs)
+        programadas(programada)
+        conjuntos(conjunto)
+        ibges(ibge)
+        datas_inicio(data_inicio)
+        datas_fim(data_fim)
+
+    rejeicoes.log()
+    return colunas
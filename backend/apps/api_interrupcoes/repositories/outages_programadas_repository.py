@@ -0,0 +1,259 @@
+"""Conjunto em processo das ocorrencias com plano de manobra.
+
+A classificacao programada/nao programada (TipoInterrupcao.from_plan_id)
+depende apenas de existir PLAN_ID nao nulo em SWITCH_PLAN_TASKS para o
+OUTAGE_NUM do evento (mesma regra de PLANO_POR_OUTAGE). Em vez do LEFT JOIN remoto a cada refresh, o conjunto de
+OUTAGE_NUMs com plano e mantido em memoria e atualizado por marca
+d'agua (PLAN_ID); a classificacao vira um teste de pertinencia.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
+from backend.shared.infrastructure.logger import get_logger
+
+_BASE_QUERY = """
+    SELECT
+        spt.outage_num AS outage_num,
+        MAX(spt.plan_id) AS plan_id
+    FROM
+        INSERVICE.SWITCH_PLAN_TASKS@DBLINK_INSERVICE spt
+    WHERE
+        spt.outage_num IS NOT NULL
+"""
+
+QUERY_OUTAGES_PROGRAMADAS = query_registry.register(
+    "outages_programadas",
+    f"""
+    {_BASE_QUERY}
+    GROUP BY
+        spt.outage_num
+    HAVING
+        MAX(spt.plan_id) IS NOT NULL
+    """,
+    arraysize=5000,
+)
+
+# Planos criados (ou ainda recebendo tarefas) desde a marca d'agua
+QUERY_OUTAGES_PROGRAMADAS_DESDE = query_registry.register(
+    "outages_programadas_desde",
+    f"""
+    {_BASE_QUERY}
+        AND spt.plan_id >= :plan_id
+    GROUP BY
+        spt.outage_num
+    HAVING
+        MAX(spt.plan_id) IS NOT NULL
+    """,
+    arraysize=500,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class OutagesProgramadas:
+    """
+    Versao imutavel do conjunto de OUTAGE_NUMs com plano de manobra.
+
+    Attributes:
+        version: Incrementada quando o conteudo muda
+        watermark: Maior PLAN_ID lido
+        loaded_at: Momento (epoch) da ultima atualizacao
+        outages: OUTAGE_NUMs com ao menos uma tarefa de plano
+    """
+
+    version: int = 0
+    watermark: int | None = None
+    loaded_at: float | None = None
+    outages: frozenset[int] = field(default_factory=frozenset)
+
+    def __len__(self) -> int:
+        """Numero de ocorrencias programadas."""
+        return len(self.outages)
+
+    def __contains__(self, outage_num: object) -> bool:
+        """Mesma regra de from_plan_id: existe plano -> PROGRAMADA."""
+        return outage_num in self.outages
+
+
+def max_plan_id(rows: Iterable[tuple[Any, ...]], atual: int | None = None) -> int | None:
+    """
+    Maior PLAN_ID entre as linhas (outage_num, plan_id) e a marca atual.
+
+    Args:
+        rows: Tuplas (outage_num, plan_id)
+        atual: Marca d'agua atual
+
+    Returns:
+        Nova marca d'agua (None se nenhuma linha e nenhuma marca)
+    """
+    marca = atual
+    for _, plan_id in rows:
+        if plan_id is not None and (marca is None or plan_id > marca):
+            marca = plan_id
+    return marca
+
+
+@dataclass
+class OutagesProgramadasStats:
+    """Estatisticas do conjunto de ocorrencias programadas."""
+
+    version: int
+    outages: int
+    watermark: int | None
+    deltas: int
+    reconciliations: int
+    failures: int
+    last_delta_rows: int
+
+
+class OutagesProgramadasRepository:
+    """
+    Mantem o conjunto de ocorrencias programadas em memoria.
+
+    - Primeira leitura (e a cada reconcile_interval_seconds): carga
+      completa, que tambem descarta planos removidos
+    - Demais atualizacoes: apenas linhas com PLAN_ID >= marca d'agua.
+      O ultimo plano e relido (>=) porque tarefas costumam ser
+      acrescentadas ao plano mais recente
+    - SWITCH_PLAN_TASKS nao tem coluna de alteracao: tarefa nova em um
+      plano anterior a marca d'agua (ocorrencia passando a programada
+      em um plano antigo) so aparece na proxima reconciliacao, ou seja,
+      a classificacao pode ficar defasada em ate
+      reconcile_interval_seconds (900s por padrao)
+    - Falha mantem a versao anterior; versao so muda com o conteudo
+    """
+
+    def __init__(self, pool: OraclePool, reconcile_interval_seconds: float = 900) -> None:
+        self.pool = pool
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self._programadas = OutagesProgramadas()
+        self._lock = asyncio.Lock()
+        self._last_reconcile: float | None = None
+        self._deltas = 0
+        self._reconciliations = 0
+        self._failures = 0
+        self._last_delta_rows = 0
+        self.logger = get_logger("repository.outages_programadas")
+
+    @property
+    def current(self) -> OutagesProgramadas:
+        """Conjunto atual (pode estar vazio se ainda nao carregado)."""
+        return self._programadas
+
+    async def get_programadas(self) -> OutagesProgramadas:
+        """
+        Retorna o conjunto, carregando na primeira chamada.
+
+        Returns:
+            Versao atual do conjunto
+
+        Raises:
+            DatabaseQueryError: Se a carga inicial falhar
+        """
+        if self._programadas.loaded_at is None:
+            await self.refresh()
+        return self._programadas
+
+    async def refresh(self) -> OutagesProgramadas:
+        """
+        Atualiza o conjunto (delta ou reconciliacao, conforme a cadencia).
+
+        Returns:
+            Nova versao (ou a mesma, se o conteudo nao mudou)
+
+        Raises:
+            DatabaseQueryError: Se a consulta falhar (versao anterior mantida)
+        """
+        async with self._lock:
+            try:
+                if self._reconcile_due():
+                    await self._reconcile()
+                else:
+                    await self._apply_delta()
+            except Exception:
+                self._failures += 1
+                raise
+        return self._programadas
+
+    def get_stats(self) -> OutagesProgramadasStats:
+        """Retorna estatisticas do conjunto."""
+        return OutagesProgramadasStats(
+            version=self._programadas.version,
+            outages=len(self._programadas),
+            watermark=self._programadas.watermark,
+            deltas=self._deltas,
+            reconciliations=self._reconciliations,
+            failures=self._failures,
+            last_delta_rows=self._last_delta_rows,
+        )
+
+    def _reconcile_due(self) -> bool:
+        """Verifica se e hora da carga completa."""
+        if self._last_reconcile is None or self._programadas.watermark is None:
+            return True
+        return time.monotonic() - self._last_reconcile >= self.reconcile_interval_seconds
+
+    async def _reconcile(self) -> None:
+        """Recarrega o conjunto inteiro."""
+        rows = await self.pool.execute_rows(QUERY_OUTAGES_PROGRAMADAS)
+        outages = frozenset(outage_num for outage_num, _ in rows)
+        self._swap(outages, max_plan_id(rows))
+        self._last_reconcile = time.monotonic()
+        self._reconciliations += 1
+
+        self.logger.info(
+            "Ocorrencias programadas carregadas",
+            version=self._programadas.version,
+            outages=len(outages),
+            watermark=self._programadas.watermark,
+        )
+
+    async def _apply_delta(self) -> None:
+        """Acrescenta as ocorrencias dos planos desde a marca d'agua."""
+        atual = self._programadas
+        rows = await self.pool.execute_rows(
+            QUERY_OUTAGES_PROGRAMADAS_DESDE, {"plan_id": atual.watermark}
+        )
+        novas = {outage_num for outage_num, _ in rows}.difference(atual.outages)
+        self._swap(
+            atual.outages.union(novas) if novas else atual.outages,
+            max_plan_id(rows, atual.watermark),
+        )
+        self._deltas += 1
+        self._last_delta_rows = len(rows)
+
+        self.logger.debug(
+            "Delta de ocorrencias programadas aplicado",
+            rows=len(rows),
+            added=len(novas),
+            outages=len(self._programadas),
+        )
+
+    def _swap(self, outages: frozenset[int], watermark: int | None) -> None:
+        """Publica a nova versao (mantendo o numero se nada mudou)."""
+        anterior = self._programadas
+        changed = outages != anterior.outages
+        self._programadas = OutagesProgramadas(
+            version=anterior.version + 1 if changed else anterior.version,
+            watermark=watermark,
+            loaded_at=time.time(),
+            outages=outages if changed else anterior.outages,
+        )
+
+
+@lru_cache
+def get_outages_programadas_repository() -> OutagesProgramadasRepository:
+    """Retorna a instancia (por processo) do conjunto de ocorrencias programadas."""
+    return OutagesProgramadasRepository(
+        oracle_pool,
+        reconcile_interval_seconds=get_settings().aggregation_reconcile_interval_seconds,
+    )
@@ -0,0 +1,236 @@
+"""Repositorio do historico de snapshots - parametro dthRecuperacao."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+from uuid import uuid4
+
+from backend.shared.domain.clock import agora_brasilia
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
+
+@dataclass(frozen=True, slots=True)
+class SnapshotHistorico:
+    """Snapshot de interrupcoes agregadas gravado no historico."""
+
+    capturado_em: datetime
+    items: list[InterrupcaoAgregadaItem]
+
+
+class SnapshotHistoricoRepository(Protocol):
+    """Contrato de armazenamento do historico de snapshots."""
+
+    async def save(
+        self, capturado_em: datetime, items: list[InterrupcaoAgregadaItem]
+    ) -> None:
+        """Grava um snapshot (horario de Brasilia)."""
+        ...
+
+    async def find_nearest(self, dth: datetime) -> SnapshotHistorico | None:
+        """Retorna o snapshot mais recente capturado ate dth."""
+        ...
+
+    async def purge_before(self, limite: datetime) -> int:
+        """Remove snapshots capturados antes de limite."""
+        ...
+
+
+class OracleSnapshotHistoricoRepository:
+    """
+    Historico de snapshots nas tabelas CONSULTA / INTERRUPCAO_ATIVA.
+
+    Cada refresh grava uma linha em CONSULTA (STATUS = 'SNAPSHOT') e as
+    linhas agregadas em INTERRUPCAO_ATIVA via array binding, na mesma
+    transacao. A busca por dthRecuperacao usa o indice
+    (ID_TIPO_CONSULTA, STATUS, DATA_BRASILIA): leitura pontual do snapshot
+    mais recente, sem consultar o INSERVICE via DBLink.
+    """
+
+    TIPO_CONSULTA_INTERRUPCAO = 1
+    STATUS_SNAPSHOT = "SNAPSHOT"
+
+    INSERT_CONSULTA = """
+        INSERT INTO RADAR_API.CONSULTA (
+            ID, ID_TIPO_CONSULTA, DATA_BRASILIA, DATA_INICIO, DATA_FIM, STATUS
+        ) VALUES (
+            :id, :tipo, :capturado_em, :capturado_em, :capturado_em, :status
+        )
+    """
+
+    INSERT_INTERRUPCAO = """
+        INSERT INTO RADAR_API.INTERRUPCAO_ATIVA (
+            ID, ID_CONSULTA, ID_CONJUNTO_UC, ID_MUNICIPIO,
+            QTD_UCS_ATENDIDAS, QTD_PROGRAMADA, QTD_NAO_PROGRAMADA
+        ) VALUES (
+            RADAR_API.SEQ_INTERRUPCAO_ATIVA.NEXTVAL, :id_consulta, :conjunto,
+            :municipio, :qtd_ucs_atendidas, :qtd_programada, :qtd_nao_programada
+        )
+    """
+
+    # LEFT JOIN: snapshot sem interrupcoes retorna uma linha com itens nulos
+    QUERY_SNAPSHOT_ATE = """
+        SELECT
+            c.DATA_BRASILIA AS capturado_em,
+            ia.ID_CONJUNTO_UC AS conjunto,
+            ia.ID_MUNICIPIO AS municipio_ibge,
+            ia.QTD_UCS_ATENDIDAS AS qtd_ucs_atendidas,
+            ia.QTD_PROGRAMADA AS qtd_programada,
+            ia.QTD_NAO_PROGRAMADA AS qtd_nao_programada
+        FROM (
+            SELECT ID, DATA_BRASILIA
+            FROM RADAR_API.CONSULTA
+            WHERE ID_TIPO_CONSULTA = :tipo
+                AND STATUS = :status
+                AND DATA_BRASILIA <= :dth
+            ORDER BY DATA_BRASILIA DESC
+            FETCH FIRST 1 ROWS ONLY
+        ) c
+        LEFT JOIN RADAR_API.INTERRUPCAO_ATIVA ia
+            ON ia.ID_CONSULTA = c.ID
+        ORDER BY
+            ia.ID_MUNICIPIO,
+            ia.ID_CONJUNTO_UC
+    """
+
+    DELETE_INTERRUPCOES_ANTIGAS = """
+        DELETE FROM RADAR_API.INTERRUPCAO_ATIVA
+        WHERE ID_CONSULTA IN (
+            SELECT ID FROM RADAR_API.CONSULTA
+            WHERE ID_TIPO_CONSULTA = :tipo
+                AND STATUS = :status
+                AND DATA_BRASILIA < :limite
+        )
+    """
+
+    DELETE_CONSULTAS_ANTIGAS = """
+        DELETE FROM RADAR_API.CONSULTA
+        WHERE ID_TIPO_CONSULTA = :tipo
+            AND STATUS = :status
+            AND DATA_BRASILIA < :limite
+    """
+
+    def __init__(self, pool: OraclePool) -> None:
+        self.pool = pool
+        self.logger = get_logger("repository.snapshot_historico")
+
+    async def save(
+        self, capturado_em: datetime, items: list[InterrupcaoAgregadaItem]
+    ) -> None:
+        """
+        Grava um snapshot em uma unica transacao.
+
+        Args:
+            capturado_em: Momento da captura (horario de Brasilia)
+            items: Interrupcoes agregadas no formato ANEEL
+
+        Raises:
+            DatabaseQueryError: Se falhar ao gravar
+        """
+        id_consulta = str(uuid4())
+        rows = [
+            {
+                "id_consulta": id_consulta,
+                "conjunto": item.ideConjuntoUnidadeConsumidora,
+                "municipio": item.ideMunicipio,
+                "qtd_ucs_atendidas": item.qtdUCsAtendidas,
+                "qtd_programada": item.qtdOcorrenciaProgramada,
+                "qtd_nao_programada": item.qtdOcorrenciaNaoProgramada,
+            }
+            for item in items
+        ]
+
+        await self.pool.execute_batch(
+            [
+                (
+                    self.INSERT_CONSULTA,
+                    {
+                        "id": id_consulta,
+                        "tipo": self.TIPO_CONSULTA_INTERRUPCAO,
+                        "capturado_em": capturado_em,
+                        "status": self.STATUS_SNAPSHOT,
+                    },
+                ),
+                (self.INSERT_INTERRUPCAO, rows),
+            ]
+        )
+
+        self.logger.debug(
+            "Snapshot gravado no historico",
+            id_consulta=id_consulta,
+            count=len(rows),
+        )
+
+    async def find_nearest(self, dth: datetime) -> SnapshotHistorico | None:
+        """
+        Busca o snapshot mais recente capturado ate dth.
+
+        Args:
+            dth: Data/hora de recuperacao (horario de Brasilia)
+
+        Returns:
+            Snapshot encontrado ou None se nao houver historico ate dth
+
+        Raises:
+            DatabaseQueryError: Se falhar ao executar query
+        """
+        rows = await self.pool.execute(
+            self.QUERY_SNAPSHOT_ATE,
+            {"tipo": self.TIPO_CONSULTA_INTERRUPCAO, "status": self.STATUS_SNAPSHOT, "dth": dth},
+        )
+        if not rows:
+            return None
+
+        items = [
+            InterrupcaoAgregadaItem(
+                ideConjuntoUnidadeConsumidora=row["conjunto"],
+                ideMunicipio=row["municipio_ibge"],
+                qtdUCsAtendidas=row["qtd_ucs_atendidas"] or 0,
+                qtdOcorrenciaProgramada=row["qtd_programada"] or 0,
+                qtdOcorrenciaNaoProgramada=row["qtd_nao_programada"] or 0,
+            )
+            for row in rows
+            if row["conjunto"] is not None
+        ]
+        return SnapshotHistorico(capturado_em=rows[0]["capturado_em"], items=items)
+
+    async def purge_before(self, limite: datetime) -> int:
+        """
+        Remove snapshots anteriores ao limite de retencao.
+
+        Args:
+            limite: Snapshots capturados antes desta data sao removidos
+
+        Returns:
+            Total de linhas removidas
+        """
+        params = {
+            "tipo": self.TIPO_CONSULTA_INTERRUPCAO,
+            "status": self.STATUS_SNAPSHOT,
+            "limite": limite,
+        }
+        removed = await self.pool.execute_batch(
+            [
+                (self.DELETE_INTERRUPCOES_ANTIGAS, params),
+                (self.DELETE_CONSULTAS_ANTIGAS, params),
+            ]
+        )
+
+        self.logger.info(
+            "Historico de snapshots expurgado",
+            limite=limite.isoformat(),
+            removed=removed,
+        )
+        return removed
+
+
+# Instancia singleton
+snapshot_historico_repository = OracleSnapshotHistoricoRepository(oracle_pool)
+
+
+async def get_snapshot_historico_repository() -> OracleSnapshotHistoricoRepository:
+    """Dependency injection para FastAPI."""
+    return snapshot_historico_repository
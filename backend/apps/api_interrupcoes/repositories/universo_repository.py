@@ -0,0 +1,130 @@
+"""Universo de UCs atendidas por conjunto/municipio (qtdUCsAtendidas).
+
+O COUNT(DISTINCT PREMISE) sobre CISPERSL x OMS_CONNECTIVITY e a parte
+mais cara da view de interrupcoes e muda apenas diariamente. Aqui ele e
+calculado a parte, guardado no cache em CacheKeys.UNIVERSO_CONJUNTOS e
+recalculado na cadencia de CacheTTL.UNIVERSO; a query de interrupcoes
+ativas passa a tocar apenas os eventos abertos.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from backend.shared.domain.cache.cache_service import CacheKeys, CacheTTL, StaleCacheService
+from backend.shared.infrastructure.cache.memory_cache import memory_cache
+from backend.shared.infrastructure.cache.shared_cache import get_shared_cache
+from backend.shared.infrastructure.cache.single_flight import SingleFlight
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
+from backend.shared.infrastructure.logger import get_logger
+
+# Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+Universo = dict[tuple[int, int], int]
+
+QUERY_UNIVERSO_CONJUNTOS = query_registry.register(
+    "universo_conjuntos",
+    """
+    SELECT
+        oc.CONJ AS conjunto,
+        c.HXGN_COD_MUNICIPIO_IBGE AS municipio_ibge,
+        COUNT(DISTINCT c.PREMISE) AS qtd_ucs_atendidas
+    FROM
+        INSERVICE.CISPERSL@DBLINK_INSERVICE c
+    INNER JOIN
+        INSERVICE.OMS_CONNECTIVITY@DBLINK_INSERVICE oc
+        ON oc.DEV_NAME = c.XFMR
+    WHERE
+        oc.DIST = '370'
+        AND c.XFMR IS NOT NULL
+        AND c.HXGN_COD_MUNICIPIO_IBGE IS NOT NULL
+    GROUP BY
+        oc.CONJ,
+        c.HXGN_COD_MUNICIPIO_IBGE
+    """,
+    arraysize=1000,
+)
+
+
+class UniversoRepository:
+    """
+    Universo de UCs atendidas, pre-calculado e mantido no cache.
+
+    Caracteristicas:
+    - Leitura pelo cache; o banco so e consultado no miss ou no refresh
+    - Misses concorrentes coalescidos (uma unica consulta)
+    - Falha no banco: usa o universo stale; sem stale, retorna vazio
+      (qtdUCsAtendidas = 0, como antes) sem derrubar a resposta
+    """
+
+    CACHE_KEY = CacheKeys.UNIVERSO_CONJUNTOS
+    CACHE_TTL_SECONDS = CacheTTL.UNIVERSO
+
+    def __init__(
+        self,
+        pool: OraclePool,
+        cache: StaleCacheService[Universo],
+        single_flight: SingleFlight | None = None,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        self.pool = pool
+        self.cache = cache
+        self.single_flight = single_flight or SingleFlight()
+        self.ttl_seconds = ttl_seconds or self.CACHE_TTL_SECONDS
+        self.logger = get_logger("repository.universo")
+
+    async def get_universo(self) -> Universo:
+        """
+        Retorna o universo (cache, banco ou stale, nessa ordem).
+
+        Returns:
+            Mapa (conjunto, ibge) -> qtd_ucs_atendidas (vazio se indisponivel)
+        """
+        cached = await self.cache.get(self.CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        try:
+            return await self.refresh()
+        except Exception as e:
+            stale = await self.cache.get_stale(self.CACHE_KEY)
+            self.logger.warning(
+                "Falha ao calcular universo de UCs atendidas",
+                error=str(e),
+                using_stale=stale is not None,
+            )
+            return stale if stale is not None else {}
+
+    async def refresh(self) -> Universo:
+        """
+        Recalcula o universo e atualiza o cache.
+
+        Usado no cache miss e pelo refresh periodico (CacheTTL.UNIVERSO).
+
+        Returns:
+            Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Raises:
+            DatabaseQueryError: Se falhar ao executar a query
+        """
+        return await self.single_flight.do(self.CACHE_KEY, self._refresh)
+
+    async def _refresh(self) -> Universo:
+        """Consulta o banco e grava o universo no cache."""
+        rows = await self.pool.execute_rows(QUERY_UNIVERSO_CONJUNTOS)
+        universo = {
+            (int(conjunto), int(ibge)): int(qtd or 0) for conjunto, ibge, qtd in rows
+        }
+
+        await self.cache.set(self.CACHE_KEY, universo, self.ttl_seconds)
+        self.logger.info("Universo de UCs atendidas atualizado", groups=len(universo))
+
+        return universo
+
+
+@lru_cache
+def get_universo_repository() -> UniversoRepository:
+    """Retorna a instancia (por processo) do universo, no cache configurado."""
+    cache = get_shared_cache() if get_settings().cache_backend == "shared" else memory_cache
+    return UniversoRepository(oracle_pool, cache)
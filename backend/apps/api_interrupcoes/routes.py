@@ -1,8 +1,15 @@
 """Rotas da API 1 - Quantitativo de Interrupcoes Ativas."""
 
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse
 
+from backend.shared.domain.clock import agora_brasilia
+from backend.shared.domain.value_objects.data_recuperacao import DataRecuperacao
 from backend.shared.infrastructure.http.aneel_response import AneelResponseBuilder
+from backend.shared.infrastructure.http.conditional import (
+    is_not_modified,
+    not_modified_response,
+)
 from backend.shared.infrastructure.config import Settings, get_settings
 
 from backend.apps.api_interrupcoes.dependencies import verify_api_key
@@ -10,6 +17,10 @@ from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_ativas import (
     GetInterrupcoesAtivasUseCase,
     get_interrupcoes_ativas_use_case,
 )
+from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_historico import (
+    GetInterrupcoesHistoricoUseCase,
+    get_interrupcoes_historico_use_case,
+)
 from backend.apps.api_interrupcoes.schemas import (
     InterrupcoesAtivasResponse,
     HealthResponse,
@@ -28,27 +39,63 @@ router = APIRouter()
 
     **Autenticacao**: Header `x-api-key` obrigatorio.
 
+    **Historico**: `dthRecuperacao` (dd/mm/yyyy hh:mm, horario de Brasilia)
+    retorna o snapshot vigente naquele momento (retencao de 36 meses).
+
     **Formato de Resposta**: Padrao ANEEL conforme Oficio Circular 14/2025-SFE/ANEEL.
     """,
     tags=["Interrupcoes"],
 )
 async def get_quantitativo_interrupcoes_ativas(
+    request: Request,
+    dth_recuperacao: str | None = Query(
+        default=None,
+        alias="dthRecuperacao",
+        description="Data/hora para recuperacao historica (dd/mm/yyyy hh:mm)",
+    ),
     x_api_key: str = Depends(verify_api_key),
     use_case: GetInterrupcoesAtivasUseCase = Depends(get_interrupcoes_ativas_use_case),
-) -> dict:
+    historico_use_case: GetInterrupcoesHistoricoUseCase = Depends(
+        get_interrupcoes_historico_use_case
+    ),
+) -> Response:
     """
     Endpoint principal para consulta de interrupcoes ativas.
 
     Retorna dados agregados por municipio e conjunto eletrico,
     separando interrupcoes programadas e nao programadas.
+
+    O corpo de sucesso vem pre-serializado do snapshot em cache
+    (com variantes gzip/br), sem nova validacao ou serializacao.
+    Requisicoes condicionais (If-None-Match / If-Modified-Since) que ja
+    possuem o snapshot atual recebem 304 sem corpo.
     """
-    result = await use_case.execute()
+    if dth_recuperacao is None:
+        result = await use_case.execute()
+    else:
+        dth = DataRecuperacao.create(dth_recuperacao, agora=agora_brasilia())
+        if dth.is_failure:
+            return JSONResponse(
+                status_code=400,
+                content=AneelResponseBuilder.validation_error("dthRecuperacao", dth.error),
+            )
+        result = await historico_use_case.execute(dth.value)
 
     if result.is_failure:
-        return AneelResponseBuilder.error(result.error)
-
-    return AneelResponseBuilder.success(
-        {"interrupcaoFornecimento": [item.model_dump() for item in result.value]}
+        return JSONResponse(content=AneelResponseBuilder.error(result.error))
+
+    snapshot = result.value
+    if is_not_modified(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+        snapshot.body.etag,
+        snapshot.generated_at,
+    ):
+        return not_modified_response(snapshot.cache_headers)
+
+    return snapshot.body.to_response(
+        request.headers.get("accept-encoding"),
+        headers=snapshot.cache_headers,
     )
 
 
@@ -64,13 +111,86 @@ async def health_check(
 ) -> dict:
     """Endpoint de health check."""
     from backend.shared.infrastructure.database.oracle_pool import oracle_pool
-    from backend.shared.infrastructure.cache.memory_cache import memory_cache
+    from backend.shared.infrastructure.database.query_registry import query_registry
+    from backend.shared.infrastructure.cache.single_flight import single_flight
+
+    from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_ativas import (
+        get_interrupcoes_cache,
+    )
 
     db_health = await oracle_pool.health_check()
-    cache_stats = memory_cache.get_stats()
+    cache_stats = get_interrupcoes_cache().get_stats()
+    flight_stats = single_flight.get_stats()
 
     status = "healthy" if db_health["healthy"] else "unhealthy"
 
+    checks: dict = {}
+    if settings.aggregation_mode == "materialized":
+        from backend.apps.api_interrupcoes.repositories.materialized_interrupcao_repository import (
+            get_materialized_interrupcao_repository,
+        )
+
+        mview_stats = get_materialized_interrupcao_repository().refresher.get_stats()
+        checks["materialized_view"] = {
+            "refreshes": mview_stats.refreshes,
+            "failures": mview_stats.failures,
+            "last_duration_ms": (
+                round(mview_stats.last_duration_ms, 2)
+                if mview_stats.last_duration_ms is not None
+                else None
+            ),
+            "last_row_count": mview_stats.last_row_count,
+        }
+    if settings.aggregation_mode == "indexed":
+        from backend.apps.api_interrupcoes.repositories.dispositivo_index_repository import (
+            get_dispositivo_index_repository,
+        )
+        from backend.apps.api_interrupcoes.repositories.outages_programadas_repository import (
+            get_outages_programadas_repository,
+        )
+
+        index_stats = get_dispositivo_index_repository().get_stats()
+        checks["device_index"] = {
+            "version": index_stats.version,
+            "devices": index_stats.devices,
+            "reloads": index_stats.reloads,
+            "failures": index_stats.failures,
+        }
+        outages_stats = get_outages_programadas_repository().get_stats()
+        checks["outages_programadas"] = {
+            "version": outages_stats.version,
+            "outages": outages_stats.outages,
+            "watermark": outages_stats.watermark,
+            "reconciliations": outages_stats.reconciliations,
+            "failures": outages_stats.failures,
+        }
+
+    if settings.auth_backend == "token":
+        from backend.shared.infrastructure.auth.api_key_index import (
+            get_api_key_index_repository,
+        )
+
+        auth_stats = get_api_key_index_repository().get_stats()
+        checks["api_keys"] = {
+            "version": auth_stats.version,
+            "tokens": auth_stats.tokens,
+            "failures": auth_stats.failures,
+            "invalid_tokens": auth_stats.invalid_tokens,
+            "pending_tokens": auth_stats.pending_tokens,
+            "flush_failures": auth_stats.flush_failures,
+        }
+
+    if settings.audit_enabled and settings.audit_sink == "oracle":
+        from backend.shared.infrastructure.logging.audit_sink import get_audit_sink
+
+        audit_stats = get_audit_sink().get_stats()
+        checks["audit_sink"] = {
+            "written": audit_stats.written,
+            "dropped": audit_stats.dropped,
+            "failed_batches": audit_stats.failed_batches,
+            "queue_size": audit_stats.queue_size,
+        }
+
     return {
         "status": status,
         "version": settings.app_version,
@@ -80,7 +200,20 @@ async def health_check(
                 "status": "up",
                 "item_count": cache_stats.item_count,
                 "hit_rate": round(cache_stats.hit_rate, 2),
+                "refreshes": flight_stats.executions,
+                "coalesced_waiters": flight_stats.coalesced,
+            },
+            "queries": {
+                name: {
+                    "executions": stats.executions,
+                    "errors": stats.errors,
+                    "avg_execute_ms": round(stats.avg_execute_ms, 2),
+                    "avg_fetch_ms": round(stats.avg_fetch_ms, 2),
+                }
+                for name, stats in query_registry.get_stats().items()
+                if stats.executions or stats.errors
             },
+            **checks,
         },
     }
 
@@ -2,7 +2,18 @@
 
 from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_ativas import (
     GetInterrupcoesAtivasUseCase,
+    InterrupcoesSnapshot,
     get_interrupcoes_ativas_use_case,
 )
+from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_historico import (
+    GetInterrupcoesHistoricoUseCase,
+    get_interrupcoes_historico_use_case,
+)
 
-__all__ = ["GetInterrupcoesAtivasUseCase", "get_interrupcoes_ativas_use_case"]
+__all__ = [
+    "GetInterrupcoesAtivasUseCase",
+    "GetInterrupcoesHistoricoUseCase",
+    "InterrupcoesSnapshot",
+    "get_interrupcoes_ativas_use_case",
+    "get_interrupcoes_historico_use_case",
+]
@@ -2,18 +2,64 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
+from backend.shared.domain.cache.cache_service import StaleCacheService
+from backend.shared.domain.clock import agora_brasilia
 from backend.shared.domain.result import Result
-from backend.shared.infrastructure.cache.memory_cache import MemoryCache, memory_cache
+from backend.shared.infrastructure.cache.memory_cache import memory_cache
+from backend.shared.infrastructure.cache.shared_cache import get_leader_lock, get_shared_cache
+from backend.shared.infrastructure.cache.single_flight import SingleFlight, single_flight
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.http.aneel_response import AneelResponseBuilder
+from backend.shared.infrastructure.http.conditional import format_http_date
+from backend.shared.infrastructure.http.encoded_body import EncodedBody
 from backend.shared.infrastructure.logger import get_logger
 
+from backend.apps.api_interrupcoes.repositories.fanout_interrupcao_repository import (
+    FanoutInterrupcaoRepository,
+    fanout_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.incremental_interrupcao_repository import (
+    IncrementalInterrupcaoRepository,
+    get_incremental_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.indexed_interrupcao_repository import (
+    IndexedInterrupcaoRepository,
+    get_indexed_interrupcao_repository,
+)
 from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (
     InterrupcaoRepository,
     interrupcao_repository,
 )
+from backend.apps.api_interrupcoes.repositories.local_snapshot_historico_repository import (
+    get_local_snapshot_historico_repository,
+)
+from backend.apps.api_interrupcoes.repositories.materialized_interrupcao_repository import (
+    MaterializedInterrupcaoRepository,
+    get_materialized_interrupcao_repository,
+)
+from backend.apps.api_interrupcoes.repositories.snapshot_historico_repository import (
+    SnapshotHistoricoRepository,
+    snapshot_historico_repository,
+)
+from backend.apps.api_interrupcoes.repositories.universo_repository import (
+    UniversoRepository,
+    get_universo_repository,
+)
 from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
 
+# Fontes de agregados com o contrato find_ativas_agregadas(universo)
+AgregadasRepository = (
+    InterrupcaoRepository
+    | IncrementalInterrupcaoRepository
+    | MaterializedInterrupcaoRepository
+    | FanoutInterrupcaoRepository
+    | IndexedInterrupcaoRepository
+)
+
 
 @dataclass
 class InterrupcaoAgregada:
@@ -36,6 +82,72 @@ class InterrupcaoAgregada:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class InterrupcoesSnapshot:
+    """
+    Snapshot das interrupcoes ativas, pronto para resposta.
+
+    O corpo ANEEL e serializado (e comprimido) uma unica vez por refresh;
+    cache hits apenas reutilizam os bytes. Os validadores HTTP (ETag do
+    conteudo e Last-Modified da geracao) tambem sao calculados aqui.
+
+    Attributes:
+        items: Interrupcoes agregadas no formato ANEEL
+        body: Resposta de sucesso ANEEL ja codificada
+        generated_at: Momento (epoch) em que o snapshot foi gerado
+        cache_headers: ETag, Last-Modified e Vary prontos para resposta
+    """
+
+    items: list[InterrupcaoAgregadaItem]
+    body: EncodedBody
+    generated_at: float
+    cache_headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def create(
+        cls,
+        items: list[InterrupcaoAgregadaItem],
+        generated_at: float | None = None,
+        previous: InterrupcoesSnapshot | None = None,
+    ) -> InterrupcoesSnapshot:
+        """
+        Cria o snapshot serializando a resposta de sucesso.
+
+        Se o conteudo nao mudou em relacao ao snapshot anterior (mesmo
+        ETag), mantem o generated_at dele: o Last-Modified so avanca
+        quando os dados mudam e If-Modified-Since continua gerando 304.
+
+        Args:
+            items: Interrupcoes agregadas no formato ANEEL
+            generated_at: Momento (epoch) da captura (padrao: agora)
+            previous: Snapshot anterior do mesmo recurso, se houver
+
+        Returns:
+            Snapshot pronto para resposta
+        """
+        payload = AneelResponseBuilder.success(
+            {"interrupcaoFornecimento": [item.model_dump() for item in items]}
+        )
+        body = EncodedBody.from_payload(payload)
+        if previous is not None and body.etag is not None and previous.body.etag == body.etag:
+            generated_at = previous.generated_at
+        elif generated_at is None:
+            generated_at = time.time()
+        cache_headers = {
+            "Last-Modified": format_http_date(generated_at),
+            "Vary": "Accept-Encoding",
+        }
+        if body.etag is not None:
+            cache_headers["ETag"] = body.etag
+
+        return cls(
+            items=items,
+            body=body,
+            generated_at=generated_at,
+            cache_headers=cache_headers,
+        )
+
+
 class GetInterrupcoesAtivasUseCase:
     """
     Caso de uso para obter interrupcoes ativas agregadas.
@@ -43,7 +155,20 @@ class GetInterrupcoesAtivasUseCase:
     Busca interrupcoes ativas no banco de dados (via DBLink),
     agrega por municipio e conjunto, e retorna no formato ANEEL.
 
-    Utiliza cache para melhorar performance.
+    Utiliza cache para melhorar performance. O cache guarda o snapshot
+    com a resposta ja serializada (InterrupcoesSnapshot). Em cache miss, requisicoes
+    concorrentes sao coalescidas: apenas uma consulta vai ao banco e as
+    demais aguardam o mesmo resultado.
+
+    Com refresh antecipado ativo (serve_stale_on_miss), o snapshot e
+    recalculado em background e um miss com dado stale disponivel e
+    respondido com o stale, sem consultar o banco no caminho da requisicao.
+
+    Com historico configurado, cada snapshot recalculado tambem e gravado
+    para atender o parametro dthRecuperacao.
+
+    Com universo configurado, qtdUCsAtendidas vem do mapa pre-calculado
+    (UniversoRepository), recalculado em cadencia propria.
     """
 
     CACHE_KEY = "interrupcoes:ativas"
@@ -51,19 +176,32 @@ class GetInterrupcoesAtivasUseCase:
 
     def __init__(
         self,
-        repository: InterrupcaoRepository,
-        cache: MemoryCache,
+        repository: AgregadasRepository,
+        cache: StaleCacheService[InterrupcoesSnapshot],
+        single_flight: SingleFlight | None = None,
+        ttl_seconds: int | None = None,
+        serve_stale_on_miss: bool = False,
+        history: SnapshotHistoricoRepository | None = None,
+        universo: UniversoRepository | None = None,
+        is_history_writer: Callable[[], bool] | None = None,
     ) -> None:
         self.repository = repository
+        self.history = history
+        # Com varios workers apenas o lider grava o historico (None = sempre)
+        self.is_history_writer = is_history_writer
+        self.universo = universo
         self.cache = cache
+        self.single_flight = single_flight or SingleFlight()
+        self.ttl_seconds = ttl_seconds or self.CACHE_TTL_SECONDS
+        self.serve_stale_on_miss = serve_stale_on_miss
         self.logger = get_logger("use_case.interrupcoes")
 
-    async def execute(self) -> Result[list[InterrupcaoAgregadaItem]]:
+    async def execute(self) -> Result[InterrupcoesSnapshot]:
         """
         Executa o caso de uso.
 
         Returns:
-            Result com lista de interrupcoes agregadas ou erro
+            Result com o snapshot de interrupcoes agregadas ou erro
         """
         # Tentar obter do cache
         cached = await self.cache.get(self.CACHE_KEY)
@@ -71,11 +209,18 @@ class GetInterrupcoesAtivasUseCase:
             self.logger.debug("Cache hit para interrupcoes ativas")
             return Result.ok(cached)
 
+        # Refresh em background: preferir stale a consultar o banco
+        if self.serve_stale_on_miss:
+            stale = await self.cache.get_stale(self.CACHE_KEY)
+            if stale is not None:
+                self.logger.debug("Cache miss - servindo stale ate o proximo refresh")
+                return Result.ok(stale)
+
         self.logger.debug("Cache miss - buscando do banco")
 
-        # Buscar do banco
+        # Buscar do banco (uma unica consulta para misses concorrentes)
         try:
-            interrupcoes = await self.repository.find_ativas_agregadas()
+            result = await self.refresh()
         except Exception as e:
             self.logger.error(
                 "Erro ao buscar interrupcoes",
@@ -91,24 +236,118 @@ class GetInterrupcoesAtivasUseCase:
 
             return Result.fail(f"Erro ao consultar banco de dados: {str(e)}")
 
-        # Converter para formato ANEEL
-        result = [item.to_aneel_format() for item in interrupcoes]
+        return Result.ok(result)
+
+    async def refresh(self) -> InterrupcoesSnapshot:
+        """
+        Recalcula o snapshot, coalescendo execucoes concorrentes.
+
+        Usado tanto no cache miss quanto pelo refresh antecipado.
+
+        Returns:
+            Snapshot com as interrupcoes agregadas no formato ANEEL
+
+        Raises:
+            Exception: Erros do repositorio sao propagados
+        """
+        return await self.single_flight.do(self.CACHE_KEY, self._refresh)
+
+    async def _refresh(self) -> InterrupcoesSnapshot:
+        """
+        Consulta o banco e atualiza o cache.
+
+        Returns:
+            Snapshot com as interrupcoes agregadas no formato ANEEL
+        """
+        if self.universo is None:
+            interrupcoes = await self.repository.find_ativas_agregadas()
+        else:
+            # Universo vem do cache (falha nao afeta a resposta)
+            universo = await self.universo.get_universo()
+            interrupcoes = await self.repository.find_ativas_agregadas(universo)
+
+        # Converter para formato ANEEL e serializar uma unica vez
+        snapshot = InterrupcoesSnapshot.create(
+            [item.to_aneel_format() for item in interrupcoes],
+            previous=await self.cache.get_stale(self.CACHE_KEY),
+        )
 
         # Armazenar no cache
-        await self.cache.set(self.CACHE_KEY, result, self.CACHE_TTL_SECONDS)
+        await self.cache.set(self.CACHE_KEY, snapshot, self.ttl_seconds)
         self.logger.debug(
             "Dados armazenados no cache",
-            count=len(result),
-            ttl=self.CACHE_TTL_SECONDS,
+            count=len(snapshot.items),
+            ttl=self.ttl_seconds,
+            body_bytes=len(snapshot.body.identity),
         )
 
-        return Result.ok(result)
+        # Gravar no historico (falha nao afeta a resposta)
+        if self.history is not None and (
+            self.is_history_writer is None or self.is_history_writer()
+        ):
+            try:
+                await self.history.save(agora_brasilia(), snapshot.items)
+            except Exception as e:
+                self.logger.warning(
+                    "Falha ao gravar snapshot no historico",
+                    error=str(e),
+                )
+
+        return snapshot
+
+
+def get_interrupcoes_cache() -> StaleCacheService[InterrupcoesSnapshot]:
+    """
+    Retorna o backend de cache configurado.
+
+    Com cache_backend="shared" todos os workers leem o mesmo snapshot,
+    gravado pelo worker lider do refresh antecipado.
+    """
+    if get_settings().cache_backend == "shared":
+        return get_shared_cache()
+    return memory_cache
+
+
+def get_agregadas_repository() -> AgregadasRepository:
+    """Retorna a fonte de agregados configurada (aggregation_mode)."""
+    mode = get_settings().aggregation_mode
+    if mode == "incremental":
+        return get_incremental_interrupcao_repository()
+    if mode == "materialized":
+        return get_materialized_interrupcao_repository()
+    if mode == "fanout":
+        return fanout_interrupcao_repository
+    if mode == "indexed":
+        return get_indexed_interrupcao_repository()
+    return interrupcao_repository
+
+
+def get_historico_repository() -> SnapshotHistoricoRepository:
+    """Retorna o armazenamento de historico configurado (oracle ou local)."""
+    if get_settings().snapshot_history_backend == "local":
+        return get_local_snapshot_historico_repository()
+    return snapshot_historico_repository
+
+
+def uses_universo_cache() -> bool:
+    """Universo pre-calculado em uso (a materialized view ja traz o universo)."""
+    settings = get_settings()
+    return settings.universo_cache_enabled and settings.aggregation_mode != "materialized"
 
 
 # Dependency injection
 async def get_interrupcoes_ativas_use_case() -> GetInterrupcoesAtivasUseCase:
     """Factory para injecao de dependencia."""
+    settings = get_settings()
     return GetInterrupcoesAtivasUseCase(
-        repository=interrupcao_repository,
-        cache=memory_cache,
+        repository=get_agregadas_repository(),
+        cache=get_interrupcoes_cache(),
+        single_flight=single_flight,
+        ttl_seconds=settings.cache_ttl_seconds,
+        serve_stale_on_miss=settings.cache_refresh_ahead_enabled,
+        history=get_historico_repository() if settings.snapshot_history_enabled else None,
+        universo=get_universo_repository() if uses_universo_cache() else None,
+        is_history_writer=(
+            get_leader_lock().try_acquire if settings.snapshot_history_enabled else None
+        ),
     )
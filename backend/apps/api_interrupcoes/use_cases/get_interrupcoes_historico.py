@@ -0,0 +1,131 @@
+"""Caso de uso: Obter Interrupcoes Ativas em uma data/hora passada."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from backend.shared.domain.cache.cache_service import CacheTTL, StaleCacheService
+from backend.shared.domain.clock import BRASILIA, agora_brasilia
+from backend.shared.domain.result import Result
+from backend.shared.domain.value_objects.data_recuperacao import DataRecuperacao
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.logger import get_logger
+
+from backend.apps.api_interrupcoes.repositories.snapshot_historico_repository import (
+    SnapshotHistoricoRepository,
+)
+from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_ativas import (
+    InterrupcoesSnapshot,
+    get_historico_repository,
+    get_interrupcoes_cache,
+)
+
+
+class GetInterrupcoesHistoricoUseCase:
+    """
+    Caso de uso para o parametro dthRecuperacao.
+
+    Retorna o snapshot mais recente gravado ate a data/hora informada,
+    lido do historico (indice por data) em vez de reprocessar o INSERVICE.
+
+    Snapshots antigos sao imutaveis e ficam em cache; datas muito
+    recentes nao sao cacheadas, pois um snapshot mais novo ainda pode
+    ser gravado ate o proximo refresh.
+    """
+
+    CACHE_KEY_PREFIX = "interrupcoes:historico:"
+    CACHE_TTL_SECONDS = CacheTTL.UNIVERSO
+    # Janela em que um snapshot ate dth ainda pode ser gravado
+    JANELA_RECENTE = timedelta(minutes=10)
+
+    def __init__(
+        self,
+        history: SnapshotHistoricoRepository,
+        cache: StaleCacheService[InterrupcoesSnapshot],
+        retention_months: int = 36,
+    ) -> None:
+        self.history = history
+        self.cache = cache
+        self.retention_months = retention_months
+        self.logger = get_logger("use_case.interrupcoes_historico")
+
+    async def execute(self, dth: DataRecuperacao) -> Result[InterrupcoesSnapshot]:
+        """
+        Executa o caso de uso.
+
+        Args:
+            dth: Data/hora de recuperacao (horario de Brasilia)
+
+        Returns:
+            Result com o snapshot vigente em dth ou erro
+        """
+        agora = agora_brasilia()
+        if dth.valor < self._retention_limit(agora):
+            return Result.fail(
+                f"dthRecuperacao {dth} fora do periodo de retencao "
+                f"({self.retention_months} meses)"
+            )
+
+        cache_key = f"{self.CACHE_KEY_PREFIX}{dth.valor:%Y%m%d%H%M}"
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return Result.ok(cached)
+
+        try:
+            historico = await self.history.find_nearest(dth.valor)
+        except Exception as e:
+            self.logger.error(
+                "Erro ao buscar historico de interrupcoes",
+                dth=str(dth),
+                error=str(e),
+                exc_info=True,
+            )
+            return Result.fail(f"Erro ao consultar historico: {str(e)}")
+
+        if historico is None:
+            return Result.fail(f"Nenhum snapshot disponivel ate {dth}")
+
+        snapshot = InterrupcoesSnapshot.create(
+            historico.items,
+            generated_at=_epoch_brasilia(historico.capturado_em),
+        )
+
+        if dth.valor < agora - self.JANELA_RECENTE:
+            await self.cache.set(cache_key, snapshot, self.CACHE_TTL_SECONDS)
+
+        self.logger.debug(
+            "Snapshot historico recuperado",
+            dth=str(dth),
+            capturado_em=historico.capturado_em.isoformat(),
+            count=len(historico.items),
+        )
+        return Result.ok(snapshot)
+
+    async def purge_expired(self) -> int:
+        """
+        Remove do historico os snapshots fora do periodo de retencao.
+
+        Returns:
+            Total de linhas removidas
+        """
+        return await self.history.purge_before(self._retention_limit(agora_brasilia()))
+
+    def _retention_limit(self, agora: datetime) -> datetime:
+        """Data/hora mais antiga mantida no historico."""
+        return agora - timedelta(days=30 * self.retention_months)
+
+
+def _epoch_brasilia(valor: datetime) -> float:
+    """Converte data/hora de Brasilia (sem timezone) para epoch."""
+    return valor.replace(tzinfo=BRASILIA).timestamp()
+
+
+# Dependency injection
+async def get_interrupcoes_historico_use_case() -> GetInterrupcoesHistoricoUseCase:
+    """Factory para injecao de dependencia."""
+    settings = get_settings()
+    return GetInterrupcoesHistoricoUseCase(
+        history=get_historico_repository(),
+        cache=get_interrupcoes_cache(),
+        retention_months=settings.snapshot_history_retention_months,
+    )
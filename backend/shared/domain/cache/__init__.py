@@ -3,6 +3,7 @@ from backend.shared.domain.cache.cache_service import (
     CacheKeys,
     CacheService,
     CacheTTL,
+    StaleCacheService,
 )
 
-__all__ = ["CacheService", "CacheKeys", "CacheTTL"]
+__all__ = ["CacheService", "CacheKeys", "CacheTTL", "StaleCacheService"]
@@ -66,6 +66,27 @@ class CacheService(Protocol[T]):
         ...
 
 
+class StaleCacheService(CacheService[T], Protocol):
+    """
+    Cache que preserva valores expirados para fallback.
+
+    Implementado por MemoryCache (processo unico) e SharedFileCache
+    (compartilhado entre workers).
+    """
+
+    async def get_stale(self, key: str) -> T | None:
+        """
+        Recupera valor do cache, mesmo que expirado.
+
+        Args:
+            key: Chave do cache
+
+        Returns:
+            Valor armazenado ou None se nao existir
+        """
+        ...
+
+
 class CacheKeys:
     """Chaves padrao do cache."""
 
@@ -0,0 +1,13 @@
+"""Relogio de Brasilia - padrao de data/hora das tabelas e das respostas."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+BRASILIA = ZoneInfo("America/Sao_Paulo")
+
+
+def agora_brasilia() -> datetime:
+    """Data/hora atual em Brasilia, sem timezone (padrao das tabelas)."""
+    return datetime.now(BRASILIA).replace(tzinfo=None)
@@ -6,7 +6,8 @@ NAO de implementacoes concretas (Dependency Inversion Principle).
 """
 
 from backend.shared.domain.repositories.interrupcao_repository import (
+    AsyncInterrupcaoRepository,
     InterrupcaoRepository,
 )
 
-__all__ = ["InterrupcaoRepository"]
+__all__ = ["AsyncInterrupcaoRepository", "InterrupcaoRepository"]
@@ -8,10 +8,12 @@ Regras:
 - NAO importar SQLAlchemy, oracledb ou outros frameworks
 - Retornar entidades de dominio (Interrupcao)
 - Metodos SINCRONOS (padrao do projeto de referencia MJQEE-GFUZ)
+- AsyncInterrupcaoRepository: mesmo contrato para pools assincronos
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Protocol
 
@@ -119,3 +121,50 @@ class InterrupcaoRepository(Protocol):
             conforme Oficio Circular 14/2025-SMA/ANEEL
         """
         ...
+
+
+class AsyncInterrupcaoRepository(Protocol):
+    """
+    Port assincrono para repositorio de interrupcoes.
+
+    Mesmo contrato e mesma semantica de InterrupcaoRepository, com
+    metodos `async`. Evita ocupar threads do executor em endpoints
+    `async def`: a concorrencia fica limitada pelo pool de conexoes.
+
+    Implementacoes concretas:
+    - AsyncOracleInterrupcaoRepository (backend/apps/api_interrupcoes/repositories/)
+    """
+
+    async def buscar_ativas(self) -> list[Interrupcao]:
+        """Busca todas as interrupcoes ativas no momento."""
+        ...
+
+    def stream_ativas(self, batch_size: int = 500) -> AsyncIterator[list[Interrupcao]]:
+        """Busca as interrupcoes ativas em lotes (memoria limitada ao lote)."""
+        ...
+
+    async def buscar_alteradas_desde(self, desde: datetime) -> list[Interrupcao]:
+        """Busca eventos abertos ou fechados desde a marca (fechados com data_fim)."""
+        ...
+
+    async def buscar_por_municipio(
+        self,
+        codigo_ibge: CodigoIBGE,
+    ) -> list[Interrupcao]:
+        """Busca interrupcoes ativas por municipio."""
+        ...
+
+    async def buscar_por_conjunto(
+        self,
+        id_conjunto: int,
+    ) -> list[Interrupcao]:
+        """Busca interrupcoes ativas por conjunto eletrico."""
+        ...
+
+    async def buscar_historico(
+        self,
+        data_inicio: datetime,
+        data_fim: datetime,
+    ) -> list[Interrupcao]:
+        """Busca historico de interrupcoes em um periodo."""
+        ...
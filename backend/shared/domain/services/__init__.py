@@ -5,11 +5,15 @@ a uma entidade especifica.
 """
 
 from backend.shared.domain.services.interrupcao_aggregator import (
+    AcumuladorInterrupcoes,
+    AgregacaoIncremental,
     InterrupcaoAggregatorService,
     InterrupcaoAgregada,
 )
 
 __all__ = [
+    "AcumuladorInterrupcoes",
+    "AgregacaoIncremental",
     "InterrupcaoAgregada",
     "InterrupcaoAggregatorService",
 ]
@@ -12,11 +12,20 @@ Regra de Negocio ANEEL:
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import AsyncIterable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependencia opcional (extra "perf")
+    np = None  # type: ignore[assignment]
+
+# Chave composta (conjunto, ibge) em int64: IBGE tem 7 digitos
+_IBGE_BASE = 10_000_000
+
 if TYPE_CHECKING:
     from backend.shared.domain.entities.interrupcao import Interrupcao
 
@@ -51,6 +60,249 @@ class InterrupcaoAgregada:
         return self.total_interrupcoes > 0
 
 
+class AcumuladorInterrupcoes:
+    """Acumulador incremental de UCs afetadas por municipio/conjunto.
+
+    Recebe as interrupcoes lote a lote (ex.: OraclePool.stream), de modo
+    que apenas os totais ficam em memoria, nunca a lista completa.
+
+    Exemplo de uso:
+        acumulador = AcumuladorInterrupcoes()
+        async for lote in repository.stream_ativas():
+            acumulador.adicionar(lote)
+        agregadas = acumulador.resultado(universo)
+    """
+
+    __slots__ = ("_totais", "_quantidade")
+
+    def __init__(self) -> None:
+        # {(conjunto, ibge): [programada, nao_programada]}
+        self._totais: dict[tuple[int, int], list[int]] = {}
+        self._quantidade = 0
+
+    def __len__(self) -> int:
+        """Numero de grupos (municipio/conjunto) acumulados."""
+        return len(self._totais)
+
+    @property
+    def quantidade(self) -> int:
+        """Numero de interrupcoes individuais acumuladas."""
+        return self._quantidade
+
+    def adicionar(self, interrupcoes: Iterable[Interrupcao]) -> None:
+        """Soma um lote de interrupcoes aos totais.
+
+        Args:
+            interrupcoes: Lote de interrupcoes individuais
+        """
+        totais = self._totais
+        for interrupcao in interrupcoes:
+            chave = (interrupcao.conjunto, interrupcao.municipio.valor)
+            total = totais.get(chave)
+            if total is None:
+                total = totais[chave] = [0, 0]
+
+            if interrupcao.is_programada():
+                total[0] += interrupcao.ucs_afetadas
+            else:
+                total[1] += interrupcao.ucs_afetadas
+            self._quantidade += 1
+
+    def resultado(
+        self,
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregada]:
+        """Gera os agregados com os totais acumulados ate aqui.
+
+        Args:
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Returns:
+            Lista de interrupcoes agregadas, na ordem de primeira ocorrencia
+        """
+        universo = universo or {}
+
+        return [
+            InterrupcaoAgregada(
+                id_conjunto=conjunto,
+                municipio=CodigoIBGE.create_unsafe(ibge),
+                qtd_ucs_atendidas=universo.get((conjunto, ibge), 0),
+                qtd_programada=programada,
+                qtd_nao_programada=nao_programada,
+            )
+            for (conjunto, ibge), (programada, nao_programada) in self._totais.items()
+        ]
+
+
+class AgregacaoIncremental:
+    """Estado agregado mantido por deltas de eventos (abertos/fechados).
+
+    Guarda a contribuicao de cada evento aberto, de modo que um delta
+    pode ser aplicado de forma idempotente:
+    - evento aberto novo: soma suas UCs ao grupo
+    - evento aberto ja conhecido: substitui a contribuicao anterior
+    - evento fechado: subtrai a contribuicao anterior (se conhecida)
+
+    Um evento vem em uma linha por (conjunto, municipio) do dispositivo;
+    as linhas do mesmo evento formam uma unica contribuicao, somada uma
+    vez em cada grupo (como no INNER JOIN da query agregada).
+
+    Reaplicar o mesmo delta nao altera o estado, entao janelas de busca
+    sobrepostas sao seguras. reconciliar() reconstroi o estado a partir
+    da lista completa de eventos abertos e informa quantos grupos
+    divergiam (drift).
+
+    Exemplo de uso:
+        estado = AgregacaoIncremental()
+        estado.reconciliar(await repository.buscar_ativas())
+        estado.aplicar(await repository.buscar_alteradas_desde(marca))
+        agregadas = estado.resultado(universo)
+    """
+
+    __slots__ = ("_eventos", "_totais")
+
+    def __init__(self) -> None:
+        # {id_evento: (chaves, programada, ucs)}
+        self._eventos: dict[int, _Contribuicao] = {}
+        # {(conjunto, ibge): [programada, nao_programada, eventos_abertos]}
+        self._totais: dict[tuple[int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        """Numero de eventos abertos no estado."""
+        return len(self._eventos)
+
+    def aplicar(self, interrupcoes: Iterable[Interrupcao]) -> int:
+        """Aplica um delta de eventos alterados.
+
+        Args:
+            interrupcoes: Eventos abertos ou fechados desde a ultima busca
+
+        Returns:
+            Numero de eventos que alteraram o estado
+        """
+        alterados = 0
+        for id_evento, atual in _contribuicoes(interrupcoes).items():
+            anterior = self._eventos.get(id_evento)
+            if anterior == atual:
+                continue
+
+            if anterior is not None:
+                self._remover(id_evento, anterior)
+            if atual is not None:
+                self._adicionar(id_evento, atual)
+            alterados += 1
+        return alterados
+
+    def reconciliar(self, abertas: Iterable[Interrupcao]) -> int:
+        """Reconstroi o estado a partir de todos os eventos abertos.
+
+        Args:
+            abertas: Lista completa de interrupcoes ativas
+
+        Returns:
+            Numero de grupos (municipio/conjunto) que divergiam
+        """
+        anteriores = {chave: total[:2] for chave, total in self._totais.items()}
+
+        self._eventos.clear()
+        self._totais.clear()
+        for id_evento, contribuicao in _contribuicoes(abertas).items():
+            if contribuicao is not None:
+                self._adicionar(id_evento, contribuicao)
+
+        divergentes = 0
+        for chave in anteriores.keys() | self._totais.keys():
+            atual = self._totais.get(chave)
+            if anteriores.get(chave) != (atual[:2] if atual is not None else None):
+                divergentes += 1
+        return divergentes
+
+    def resultado(
+        self,
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregada]:
+        """Gera os agregados do estado atual, ordenados por municipio/conjunto.
+
+        Args:
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Returns:
+            Lista de interrupcoes agregadas
+        """
+        universo = universo or {}
+
+        return [
+            InterrupcaoAgregada(
+                id_conjunto=conjunto,
+                municipio=CodigoIBGE.create_unsafe(ibge),
+                qtd_ucs_atendidas=universo.get((conjunto, ibge), 0),
+                qtd_programada=programada,
+                qtd_nao_programada=nao_programada,
+            )
+            for (conjunto, ibge), (programada, nao_programada, _) in sorted(
+                self._totais.items(), key=lambda item: (item[0][1], item[0][0])
+            )
+        ]
+
+    def _adicionar(self, id_evento: int, contribuicao: _Contribuicao) -> None:
+        """Soma a contribuicao de um evento aberto aos seus grupos."""
+        chaves, programada, ucs = contribuicao
+        coluna = 0 if programada else 1
+        for chave in chaves:
+            total = self._totais.get(chave)
+            if total is None:
+                total = self._totais[chave] = [0, 0, 0]
+            total[coluna] += ucs
+            total[2] += 1
+        self._eventos[id_evento] = contribuicao
+
+    def _remover(self, id_evento: int, contribuicao: _Contribuicao) -> None:
+        """Subtrai a contribuicao de um evento (fechado ou alterado)."""
+        chaves, programada, ucs = contribuicao
+        coluna = 0 if programada else 1
+        for chave in chaves:
+            total = self._totais[chave]
+            total[coluna] -= ucs
+            total[2] -= 1
+            if total[2] == 0:
+                # Grupo sem eventos abertos some do resultado (como na query)
+                del self._totais[chave]
+        del self._eventos[id_evento]
+
+
+# Contribuicao de um evento aberto: (grupos (conjunto, ibge), programada, ucs)
+_Contribuicao = tuple[tuple[tuple[int, int], ...], bool, int]
+
+
+def _contribuicoes(interrupcoes: Iterable[Interrupcao]) -> dict[int, _Contribuicao | None]:
+    """Agrupa as linhas por evento (None para evento fechado).
+
+    Args:
+        interrupcoes: Linhas de eventos, uma por (conjunto, municipio)
+
+    Returns:
+        Mapa id do evento -> contribuicao, na ordem de primeira ocorrencia
+    """
+    grupos: dict[int, tuple[dict[tuple[int, int], None], bool, int] | None] = {}
+    for interrupcao in interrupcoes:
+        if not interrupcao.is_ativa():
+            grupos[interrupcao.id] = None
+            continue
+        grupo = grupos.get(interrupcao.id)
+        if grupo is None:
+            grupo = grupos[interrupcao.id] = (
+                {},
+                interrupcao.is_programada(),
+                interrupcao.ucs_afetadas,
+            )
+        grupo[0][(interrupcao.conjunto, interrupcao.municipio.valor)] = None
+
+    return {
+        id_evento: (tuple(grupo[0]), grupo[1], grupo[2]) if grupo is not None else None
+        for id_evento, grupo in grupos.items()
+    }
+
+
 class InterrupcaoAggregatorService:
     """Servico de dominio para agregacao de interrupcoes.
 
@@ -79,18 +331,67 @@ class InterrupcaoAggregatorService:
         if not interrupcoes:
             return []
 
-        # Estrutura: {(conjunto, ibge): {prog: int, nao_prog: int}}
-        agrupadas: dict[tuple[int, int], dict[str, int]] = defaultdict(
-            lambda: {"programada": 0, "nao_programada": 0}
-        )
+        acumulador = AcumuladorInterrupcoes()
+        acumulador.adicionar(interrupcoes)
+        return acumulador.resultado(universo)
 
-        for interrupcao in interrupcoes:
-            chave = (interrupcao.conjunto, interrupcao.municipio.valor)
+    async def agregar_stream(
+        self,
+        lotes: AsyncIterable[Iterable[Interrupcao]],
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregada]:
+        """Agrega interrupcoes recebidas em lotes, sem materializar a lista.
 
-            if interrupcao.is_programada():
-                agrupadas[chave]["programada"] += interrupcao.ucs_afetadas
-            else:
-                agrupadas[chave]["nao_programada"] += interrupcao.ucs_afetadas
+        Args:
+            lotes: Lotes de interrupcoes (ex.: repository.stream_ativas())
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Returns:
+            Lista de interrupcoes agregadas por municipio/conjunto
+        """
+        acumulador = AcumuladorInterrupcoes()
+        async for lote in lotes:
+            acumulador.adicionar(lote)
+        return acumulador.resultado(universo)
+
+    def agregar_colunar(
+        self,
+        conjuntos: Sequence[int],
+        ibges: Sequence[int],
+        ucs_afetadas: Sequence[int],
+        programadas: Sequence[bool],
+        universo: dict[tuple[int, int], int] | None = None,
+    ) -> list[InterrupcaoAgregada]:
+        """Agrega colunas paralelas (uma posicao por interrupcao).
+
+        Caminho para grandes volumes vindos direto do cursor, sem criar
+        entidades. Com numpy (extra "perf") o agrupamento e vetorizado;
+        sem numpy usa um laco simples sobre as colunas. O resultado e
+        identico ao de agregar() (mesma ordem de primeira ocorrencia).
+
+        Args:
+            conjuntos: Codigo do conjunto de cada interrupcao
+            ibges: Codigo IBGE (ja validado) de cada interrupcao
+            ucs_afetadas: UCs afetadas de cada interrupcao
+            programadas: True se a interrupcao e programada
+            universo: Mapa (conjunto, ibge) -> qtd_ucs_atendidas
+
+        Returns:
+            Lista de interrupcoes agregadas por municipio/conjunto
+
+        Raises:
+            ValueError: Se as colunas tiverem tamanhos diferentes
+        """
+        total = len(conjuntos)
+        if not (len(ibges) == len(ucs_afetadas) == len(programadas) == total):
+            raise ValueError("Colunas com tamanhos diferentes")
+        if total == 0:
+            return []
+
+        if np is not None:
+            grupos = _agrupar_numpy(conjuntos, ibges, ucs_afetadas, programadas)
+        else:
+            grupos = _agrupar_python(conjuntos, ibges, ucs_afetadas, programadas)
 
         universo = universo or {}
 
@@ -99,10 +400,10 @@ class InterrupcaoAggregatorService:
                 id_conjunto=conjunto,
                 municipio=CodigoIBGE.create_unsafe(ibge),
                 qtd_ucs_atendidas=universo.get((conjunto, ibge), 0),
-                qtd_programada=dados["programada"],
-                qtd_nao_programada=dados["nao_programada"],
+                qtd_programada=programada,
+                qtd_nao_programada=nao_programada,
             )
-            for (conjunto, ibge), dados in agrupadas.items()
+            for conjunto, ibge, programada, nao_programada in grupos
         ]
 
     def agregar_por_municipio(
@@ -137,3 +438,52 @@ class InterrupcaoAggregatorService:
             resultado[ibge]["total_ucs"] += interrupcao.ucs_afetadas
 
         return dict(resultado)
+
+
+def _agrupar_python(
+    conjuntos: Sequence[int],
+    ibges: Sequence[int],
+    ucs_afetadas: Sequence[int],
+    programadas: Sequence[bool],
+) -> list[tuple[int, int, int, int]]:
+    """Agrupamento (conjunto, ibge) com laco sobre as colunas."""
+    totais: dict[tuple[int, int], list[int]] = {}
+    for chave_conjunto, chave_ibge, ucs, programada in zip(
+        conjuntos, ibges, ucs_afetadas, programadas
+    ):
+        chave = (int(chave_conjunto), int(chave_ibge))
+        total = totais.get(chave)
+        if total is None:
+            total = totais[chave] = [0, 0]
+        total[0 if programada else 1] += int(ucs)
+
+    return [(c, i, prog, nao_prog) for (c, i), (prog, nao_prog) in totais.items()]
+
+
+def _agrupar_numpy(
+    conjuntos: Sequence[int],
+    ibges: Sequence[int],
+    ucs_afetadas: Sequence[int],
+    programadas: Sequence[bool],
+) -> list[tuple[int, int, int, int]]:
+    """Agrupamento vetorizado: np.unique na chave composta + bincount."""
+    conjunto = np.asarray(conjuntos, dtype=np.int64)
+    chave = conjunto * _IBGE_BASE + np.asarray(ibges, dtype=np.int64)
+    ucs = np.asarray(ucs_afetadas, dtype=np.int64)
+    programada = np.asarray(programadas, dtype=bool)
+
+    unicas, primeiras, grupo = np.unique(chave, return_index=True, return_inverse=True)
+    grupos = len(unicas)
+    soma_prog = np.bincount(grupo, weights=np.where(programada, ucs, 0), minlength=grupos)
+    soma_nao_prog = np.bincount(grupo, weights=np.where(programada, 0, ucs), minlength=grupos)
+
+    # np.unique ordena as chaves; agregar() preserva a primeira ocorrencia
+    ordem = np.argsort(primeiras, kind="stable")
+    return list(
+        zip(
+            (unicas[ordem] // _IBGE_BASE).tolist(),
+            (unicas[ordem] % _IBGE_BASE).tolist(),
+            np.rint(soma_prog[ordem]).astype(np.int64).tolist(),
+            np.rint(soma_nao_prog[ordem]).astype(np.int64).tolist(),
+        )
+    )
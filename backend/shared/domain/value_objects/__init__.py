@@ -1,6 +1,7 @@
 """Value Objects - Objetos imutaveis definidos por seus valores."""
 
 from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
+from backend.shared.domain.value_objects.data_recuperacao import DataRecuperacao
 from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
 
-__all__ = ["CodigoIBGE", "TipoInterrupcao"]
+__all__ = ["CodigoIBGE", "DataRecuperacao", "TipoInterrupcao"]
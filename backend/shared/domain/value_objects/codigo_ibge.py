@@ -41,6 +41,9 @@ class CodigoIBGE:
         1400704,  # Uiramuta
     )
 
+    # Conjunto para validacao O(1) (mapeamento de muitas linhas do banco)
+    CODIGOS_RORAIMA: ClassVar[frozenset[int]] = frozenset(MUNICIPIOS_RORAIMA)
+
     MIN_VALUE: ClassVar[int] = 1000000
     MAX_VALUE: ClassVar[int] = 9999999
 
@@ -91,7 +94,7 @@ class CodigoIBGE:
     @classmethod
     def _belongs_to_roraima(cls, codigo: int) -> bool:
         """Verifica se o codigo pertence a Roraima."""
-        return codigo in cls.MUNICIPIOS_RORAIMA
+        return codigo in cls.CODIGOS_RORAIMA
 
     @classmethod
     def get_all_roraima_codes(cls) -> tuple[int, ...]:
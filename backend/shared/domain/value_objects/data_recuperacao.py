@@ -0,0 +1,53 @@
+"""Value Object para o parametro dthRecuperacao da ANEEL."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import ClassVar
+
+from backend.shared.domain.result import Result
+
+
+@dataclass(frozen=True, slots=True)
+class DataRecuperacao:
+    """
+    Value Object para data/hora de recuperacao historica.
+
+    Imutavel e validado na criacao.
+
+    Regras:
+    - Formato dd/mm/yyyy hh:mm (horario de Brasilia)
+    - Nao pode estar no futuro
+    """
+
+    valor: datetime
+
+    FORMATO: ClassVar[str] = "%d/%m/%Y %H:%M"
+
+    @classmethod
+    def create(cls, texto: str, agora: datetime | None = None) -> Result[DataRecuperacao]:
+        """
+        Factory method para criar DataRecuperacao validada.
+
+        Args:
+            texto: Valor do parametro (dd/mm/yyyy hh:mm)
+            agora: Data/hora atual em Brasilia (padrao: datetime.now())
+
+        Returns:
+            Result com DataRecuperacao valida ou mensagem de erro
+        """
+        try:
+            valor = datetime.strptime(texto.strip(), cls.FORMATO)
+        except ValueError:
+            return Result.fail(
+                f"dthRecuperacao invalido: '{texto}'. Formato esperado: dd/mm/yyyy hh:mm"
+            )
+
+        if valor > (agora or datetime.now()):
+            return Result.fail("dthRecuperacao nao pode estar no futuro")
+
+        return Result.ok(cls(valor=valor))
+
+    def __str__(self) -> str:
+        return self.valor.strftime(self.FORMATO)
@@ -0,0 +1,8 @@
+"""Modulo de arquivo historico local."""
+
+from backend.shared.infrastructure.archive.columnar_archive import (
+    ArchiveBlock,
+    ColumnarArchive,
+)
+
+__all__ = ["ArchiveBlock", "ColumnarArchive"]
@@ -0,0 +1,331 @@
+"""Arquivo colunar local, append-only, para snapshots historicos.
+
+Cada snapshot e um bloco de linhas com colunas int32 de largura fixa.
+Os blocos sao gravados em segmentos diarios:
+
+    AAAAMMDD.seg  blocos: [n_linhas uint32][coluna 0 int32 * n]...[coluna k]
+    AAAAMMDD.idx  entradas (timestamp int64, offset int64) em ordem crescente
+
+Leitura do "estado em T":
+1. Segmento do dia de T (ou o dia anterior mais proximo com dados)
+2. Busca binaria no indice mapeado em memoria (mmap)
+3. Colunas do bloco lidas direto do mmap, sem copia ate a conversao
+
+O indice so recebe a entrada depois que o bloco foi gravado: leitores
+nunca enxergam um bloco parcial. Escritas sao serializadas por flock.
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows (sem multiplos workers)
+    fcntl = None  # type: ignore[assignment]
+
+_EPOCH = datetime(1970, 1, 1)
+_ROW_COUNT = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<qq")
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveBlock:
+    """
+    Bloco (snapshot) lido do arquivo.
+
+    Attributes:
+        timestamp: Momento da captura (sem timezone)
+        columns: Colunas int32, todas com o mesmo numero de linhas
+    """
+
+    timestamp: datetime
+    columns: tuple[tuple[int, ...], ...]
+
+    @property
+    def row_count(self) -> int:
+        """Numero de linhas do bloco."""
+        return len(self.columns[0]) if self.columns else 0
+
+    def rows(self) -> list[tuple[int, ...]]:
+        """Linhas do bloco (transposicao das colunas)."""
+        return list(zip(*self.columns))
+
+
+class _Segment:
+    """Segmento diario mapeado em memoria (somente leitura)."""
+
+    def __init__(self, seg_path: Path, idx_path: Path) -> None:
+        self.seg_path = seg_path
+        self.idx_path = idx_path
+        self._idx_size = -1
+        self._idx_map: mmap.mmap | None = None
+        self._seg_map: mmap.mmap | None = None
+        self._timestamps: memoryview | None = None
+
+    def timestamps(self) -> Sequence[int]:
+        """Timestamps do indice (remapeia se o arquivo cresceu)."""
+        self._refresh()
+        return self._timestamps if self._timestamps is not None else ()
+
+    def offset(self, position: int) -> int:
+        """Offset do bloco na posicao do indice."""
+        assert self._idx_map is not None
+        _, offset = _INDEX_ENTRY.unpack_from(self._idx_map, position * _INDEX_ENTRY.size)
+        return int(offset)
+
+    def read_block(self, offset: int, column_count: int) -> tuple[tuple[int, ...], ...]:
+        """Le as colunas do bloco no offset."""
+        assert self._seg_map is not None
+        (row_count,) = _ROW_COUNT.unpack_from(self._seg_map, offset)
+        start = offset + _ROW_COUNT.size
+        end = start + row_count * column_count * 4
+        values = memoryview(self._seg_map)[start:end].cast("i")
+        try:
+            return tuple(
+                tuple(values[i * row_count : (i + 1) * row_count])
+                for i in range(column_count)
+            )
+        finally:
+            values.release()
+
+    def close(self) -> None:
+        """Libera os mapeamentos."""
+        if self._timestamps is not None:
+            self._timestamps.release()
+            self._timestamps = None
+        for mapped in (self._idx_map, self._seg_map):
+            if mapped is not None:
+                mapped.close()
+        self._idx_map = None
+        self._seg_map = None
+        self._idx_size = -1
+
+    def _refresh(self) -> None:
+        """Remapeia indice e dados quando o tamanho mudou."""
+        idx_size = self.idx_path.stat().st_size
+        # Ignora entrada parcial no fim do indice (escrita em andamento)
+        idx_size -= idx_size % _INDEX_ENTRY.size
+        if idx_size == self._idx_size:
+            return
+
+        self.close()
+        if idx_size == 0:
+            self._idx_size = 0
+            return
+
+        self._idx_map = _map_file(self.idx_path)
+        self._seg_map = _map_file(self.seg_path)
+        self._idx_size = idx_size
+        # Visao strided: apenas os timestamps (int64 a cada 16 bytes)
+        entries = memoryview(self._idx_map)[:idx_size].cast("q")
+        self._timestamps = entries[::2]
+        entries.release()
+
+
+class ColumnarArchive:
+    """
+    Arquivo append-only de blocos colunares int32 por dia.
+
+    Caracteristicas:
+    - Busca do bloco vigente em T por busca binaria (O(log n))
+    - Segmentos mapeados em memoria e reutilizados entre leituras
+    - Expurgo por dia inteiro (remocao de arquivos)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        column_count: int,
+        max_open_segments: int = 32,
+    ) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._column_count = column_count
+        self._max_open = max_open_segments
+        self._segments: OrderedDict[date, _Segment] = OrderedDict()
+        self._days: list[date] = []
+        self._days_mtime = -1
+
+    @property
+    def column_count(self) -> int:
+        """Numero de colunas de cada bloco."""
+        return self._column_count
+
+    def append(self, timestamp: datetime, columns: Sequence[Sequence[int]]) -> bool:
+        """
+        Grava um bloco no segmento do dia.
+
+        Args:
+            timestamp: Momento da captura (sem timezone)
+            columns: Colunas int32 (mesmo tamanho)
+
+        Returns:
+            False se ja existe bloco igual ou mais recente no dia (ignorado)
+
+        Raises:
+            ValueError: Se as colunas forem invalidas ou fora de int32
+        """
+        if len(columns) != self._column_count:
+            raise ValueError(
+                f"Esperadas {self._column_count} colunas, recebidas {len(columns)}"
+            )
+        row_count = len(columns[0]) if columns else 0
+        if any(len(column) != row_count for column in columns):
+            raise ValueError("Colunas com tamanhos diferentes")
+
+        payload = bytearray(_ROW_COUNT.pack(row_count))
+        for column in columns:
+            try:
+                payload += struct.pack(f"<{row_count}i", *column)
+            except struct.error as e:
+                raise ValueError(f"Valor fora do intervalo int32: {e}") from e
+
+        ts = _to_micros(timestamp)
+        seg_path, idx_path = self._paths(timestamp.date())
+
+        with open(seg_path, "ab") as seg, open(idx_path, "ab") as idx:
+            if fcntl is not None:
+                fcntl.flock(idx.fileno(), fcntl.LOCK_EX)
+            try:
+                if _last_timestamp(idx_path) >= ts:
+                    return False
+
+                offset = seg.seek(0, os.SEEK_END)
+                seg.write(payload)
+                seg.flush()
+                # Indice depois dos dados: leitores nunca veem bloco parcial
+                idx.write(_INDEX_ENTRY.pack(ts, offset))
+                idx.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(idx.fileno(), fcntl.LOCK_UN)
+        return True
+
+    def find_at(self, timestamp: datetime) -> ArchiveBlock | None:
+        """
+        Retorna o bloco mais recente gravado ate timestamp.
+
+        Args:
+            timestamp: Momento consultado (sem timezone)
+
+        Returns:
+            Bloco vigente em timestamp ou None se nao houver dados
+        """
+        ts = _to_micros(timestamp)
+        days = self.days()
+        position = bisect.bisect_right(days, timestamp.date())
+
+        # Dia de T primeiro; sem bloco ate T, dias anteriores
+        for day in reversed(days[:position]):
+            segment = self._segment(day)
+            timestamps = segment.timestamps()
+            index = bisect.bisect_right(timestamps, ts) - 1
+            if index >= 0:
+                return ArchiveBlock(
+                    timestamp=_from_micros(timestamps[index]),
+                    columns=segment.read_block(segment.offset(index), self._column_count),
+                )
+        return None
+
+    def days(self) -> list[date]:
+        """
+        Dias com segmento gravado, em ordem crescente.
+
+        A listagem so e refeita quando o diretorio muda (novo dia ou
+        expurgo), evitando varrer ~1100 arquivos a cada leitura.
+        """
+        mtime = self._dir.stat().st_mtime_ns
+        if mtime != self._days_mtime:
+            days: list[date] = []
+            for path in self._dir.glob("*.idx"):
+                try:
+                    days.append(datetime.strptime(path.stem, "%Y%m%d").date())
+                except ValueError:
+                    continue
+            self._days = sorted(days)
+            self._days_mtime = mtime
+        return self._days
+
+    def purge_before(self, day: date) -> int:
+        """
+        Remove os segmentos de dias anteriores a day.
+
+        Args:
+            day: Primeiro dia mantido
+
+        Returns:
+            Numero de segmentos removidos
+        """
+        removed = 0
+        for old_day in self.days():
+            if old_day >= day:
+                break
+            segment = self._segments.pop(old_day, None)
+            if segment is not None:
+                segment.close()
+            for path in self._paths(old_day):
+                path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def close(self) -> None:
+        """Libera todos os mapeamentos abertos."""
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    def _paths(self, day: date) -> tuple[Path, Path]:
+        """Arquivos de dados e indice do dia."""
+        stem = day.strftime("%Y%m%d")
+        return self._dir / f"{stem}.seg", self._dir / f"{stem}.idx"
+
+    def _segment(self, day: date) -> _Segment:
+        """Segmento do dia, mantendo no maximo max_open_segments mapeados."""
+        segment = self._segments.get(day)
+        if segment is not None:
+            self._segments.move_to_end(day)
+            return segment
+
+        segment = _Segment(*self._paths(day))
+        self._segments[day] = segment
+        while len(self._segments) > self._max_open:
+            _, evicted = self._segments.popitem(last=False)
+            evicted.close()
+        return segment
+
+
+def _map_file(path: Path) -> mmap.mmap:
+    """Mapeia o arquivo inteiro para leitura."""
+    with open(path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _last_timestamp(idx_path: Path) -> int:
+    """Ultimo timestamp do indice (minimo int64 se vazio)."""
+    size = idx_path.stat().st_size
+    size -= size % _INDEX_ENTRY.size
+    if size == 0:
+        return -(2**63)
+    with open(idx_path, "rb") as idx:
+        idx.seek(size - _INDEX_ENTRY.size)
+        ts, _ = _INDEX_ENTRY.unpack(idx.read(_INDEX_ENTRY.size))
+    return int(ts)
+
+
+def _to_micros(value: datetime) -> int:
+    """Converte datetime (sem timezone) em microssegundos desde 1970."""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> datetime:
+    """Converte microssegundos desde 1970 em datetime (sem timezone)."""
+    return _EPOCH + timedelta(microseconds=value)
@@ -0,0 +1,31 @@
+"""Modulo de autenticacao."""
+
+from backend.shared.infrastructure.auth.api_key_index import (
+    ApiKeyEntry,
+    ApiKeyIndex,
+    ApiKeyIndexRepository,
+    ApiKeyStatus,
+    get_api_key_index_repository,
+    hash_api_key,
+)
+from backend.shared.infrastructure.auth.ip_matcher import (
+    IpMatcher,
+    compile_ip_matcher,
+    get_allowed_ips_matcher,
+    get_trusted_proxies_matcher,
+    resolve_client_ip,
+)
+
+__all__ = [
+    "ApiKeyEntry",
+    "ApiKeyIndex",
+    "ApiKeyIndexRepository",
+    "ApiKeyStatus",
+    "IpMatcher",
+    "compile_ip_matcher",
+    "get_allowed_ips_matcher",
+    "get_api_key_index_repository",
+    "get_trusted_proxies_matcher",
+    "hash_api_key",
+    "resolve_client_ip",
+]
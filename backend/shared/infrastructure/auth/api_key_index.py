@@ -0,0 +1,419 @@
+"""Indice em processo das API Keys de TOKEN_ACESSO.
+
+Os tokens ativos sao carregados em memoria indexados pelo SHA-256 da
+chave e recarregados periodicamente; validar uma requisicao e uma busca
+em dict (sem ida ao banco). A chave em texto nunca fica no indice.
+
+Os acessos (TOTAL_ACESSOS, ULTIMO_ACESSO) sao acumulados por token e
+gravados em lote a cada refresh, com um UPDATE incremental por token
+em vez de um por requisicao.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any
+
+from backend.shared.infrastructure.auth.ip_matcher import IpMatcher
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.database.query_registry import query_registry
+from backend.shared.infrastructure.logger import get_logger
+
+QUERY_TOKENS_ATIVOS = query_registry.register(
+    "tokens_acesso_ativos",
+    """
+    SELECT
+        ID,
+        NOME,
+        CHAVE,
+        DATA_EXPIRACAO,
+        IP_ORIGEM_PERMITIDO
+    FROM
+        RADAR_API.TOKEN_ACESSO
+    WHERE
+        ATIVO = 'S'
+        AND (DATA_EXPIRACAO IS NULL OR DATA_EXPIRACAO > SYSDATE)
+    """,
+    arraysize=500,
+)
+
+# Incremento (e nao atribuicao): cada worker grava apenas os seus acessos
+UPDATE_ACESSOS = """
+    UPDATE RADAR_API.TOKEN_ACESSO
+    SET
+        TOTAL_ACESSOS = NVL(TOTAL_ACESSOS, 0) + :acessos,
+        ULTIMO_ACESSO = GREATEST(NVL(ULTIMO_ACESSO, :ultimo_acesso), :ultimo_acesso)
+    WHERE
+        ID = :id
+"""
+
+
+def hash_api_key(chave: str) -> bytes:
+    """
+    Digest usado como chave do indice.
+
+    Args:
+        chave: API Key em texto
+
+    Returns:
+        SHA-256 da chave
+    """
+    return hashlib.sha256(chave.encode()).digest()
+
+
+def parse_ips_permitidos(valor: str | None) -> IpMatcher | None:
+    """
+    Compila IP_ORIGEM_PERMITIDO (IPs ou CIDR, separados por virgula).
+
+    Args:
+        valor: Conteudo da coluna
+
+    Returns:
+        IPs permitidos, ou None se qualquer IP e aceito (vazio ou "*")
+    """
+    if not valor or not valor.strip():
+        return None
+    matcher = IpMatcher.parse(valor)
+    if not matcher or matcher.allow_all:
+        return None
+    return matcher
+
+
+class ApiKeyStatus(str, Enum):
+    """Resultado da validacao de uma API Key."""
+
+    VALIDA = "valida"
+    INVALIDA = "invalida"
+    EXPIRADA = "expirada"
+    IP_NAO_PERMITIDO = "ip_nao_permitido"
+
+
+@dataclass(frozen=True, slots=True)
+class ApiKeyEntry:
+    """
+    Token ativo no indice.
+
+    Attributes:
+        id: ID em TOKEN_ACESSO
+        nome: Nome do cliente/sistema
+        digest: SHA-256 da chave
+        data_expiracao: Expiracao (None = sem expiracao)
+        ips_permitidos: IPs aceitos (None = qualquer IP)
+    """
+
+    id: str
+    nome: str
+    digest: bytes
+    data_expiracao: datetime | None = None
+    ips_permitidos: IpMatcher | None = None
+
+    def is_expirado(self, agora: datetime) -> bool:
+        """Mesma regra de TokenAcesso.is_ativo para a expiracao."""
+        return self.data_expiracao is not None and agora > self.data_expiracao
+
+    def permite_ip(self, client_ip: str | None) -> bool:
+        """Verifica o IP na lista do token (IP desconhecido so sem lista)."""
+        if self.ips_permitidos is None:
+            return True
+        return self.ips_permitidos.match(client_ip)
+
+
+@dataclass(frozen=True, slots=True)
+class ApiKeyIndex:
+    """
+    Versao imutavel do indice digest -> token.
+
+    Attributes:
+        version: Incrementada quando o conteudo muda
+        loaded_at: Momento (epoch) da carga
+        tokens: SHA-256 da chave -> token
+    """
+
+    version: int = 0
+    loaded_at: float | None = None
+    tokens: dict[bytes, ApiKeyEntry] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Numero de tokens ativos."""
+        return len(self.tokens)
+
+    def lookup(self, chave: str) -> ApiKeyEntry | None:
+        """
+        Busca o token da chave.
+
+        A busca e pelo digest (a chave nunca e comparada diretamente) e o
+        digest encontrado e confirmado com compare_digest.
+
+        Args:
+            chave: API Key recebida
+
+        Returns:
+            Token correspondente, ou None
+        """
+        digest = hash_api_key(chave)
+        entry = self.tokens.get(digest)
+        if entry is None or not hmac.compare_digest(entry.digest, digest):
+            return None
+        return entry
+
+
+def build_api_key_tokens(
+    rows: Iterable[tuple[Any, ...]],
+) -> tuple[dict[bytes, ApiKeyEntry], list[str]]:
+    """
+    Monta o mapa do indice a partir das linhas de TOKEN_ACESSO.
+
+    Token com IP_ORIGEM_PERMITIDO invalido fica fora do indice (a chave
+    e recusada) sem impedir a carga dos demais. Cada lista distinta e
+    compilada uma vez por carga.
+
+    Args:
+        rows: Tuplas (id, nome, chave, data_expiracao, ip_origem_permitido)
+
+    Returns:
+        SHA-256 da chave -> token, e IDs dos tokens descartados
+    """
+    tokens: dict[bytes, ApiKeyEntry] = {}
+    invalidos: list[str] = []
+    compiladas: dict[str | None, IpMatcher | None] = {}
+    for token_id, nome, chave, data_expiracao, ips in rows:
+        try:
+            ips_permitidos = compiladas[ips]
+        except KeyError:
+            try:
+                ips_permitidos = compiladas[ips] = parse_ips_permitidos(ips)
+            except ValueError:
+                invalidos.append(token_id)
+                continue
+        digest = hash_api_key(chave)
+        tokens[digest] = ApiKeyEntry(
+            id=token_id,
+            nome=nome,
+            digest=digest,
+            data_expiracao=data_expiracao,
+            ips_permitidos=ips_permitidos,
+        )
+    return tokens, invalidos
+
+
+@dataclass
+class ApiKeyIndexStats:
+    """Estatisticas do indice de API Keys."""
+
+    version: int
+    tokens: int
+    reloads: int
+    failures: int
+    invalid_tokens: int
+    pending_tokens: int
+    flushed_accesses: int
+    flush_failures: int
+
+
+class ApiKeyIndexRepository:
+    """
+    Valida API Keys contra o indice de TOKEN_ACESSO.
+
+    Caracteristicas:
+    - Carga sob demanda na primeira validacao (coalescida)
+    - refresh() em background (RefreshAheadScheduler): grava os acessos
+      pendentes e recarrega os tokens; falha mantem a versao anterior
+    - validate() e sincrono e O(1): nao acessa o banco
+    - Acessos que falham ao gravar voltam para a fila pendente
+    - Token com lista de IPs invalida e ignorado (chave recusada)
+    """
+
+    def __init__(self, pool: OraclePool) -> None:
+        self.pool = pool
+        self._index = ApiKeyIndex()
+        self._lock = asyncio.Lock()
+        self._pending: dict[str, list[Any]] = {}
+        self._reloads = 0
+        self._failures = 0
+        self._invalid_tokens = 0
+        self._flushed_accesses = 0
+        self._flush_failures = 0
+        self.logger = get_logger("auth.api_key_index")
+
+    @property
+    def current(self) -> ApiKeyIndex:
+        """Indice atual (pode estar vazio se ainda nao carregado)."""
+        return self._index
+
+    async def get_index(self) -> ApiKeyIndex:
+        """
+        Retorna o indice, carregando na primeira chamada.
+
+        Returns:
+            Versao atual do indice
+
+        Raises:
+            DatabaseQueryError: Se a carga inicial falhar
+        """
+        if self._index.loaded_at is None:
+            async with self._lock:
+                if self._index.loaded_at is None:
+                    await self._load()
+        return self._index
+
+    def validate(
+        self,
+        chave: str,
+        client_ip: str | None,
+        index: ApiKeyIndex | None = None,
+    ) -> tuple[ApiKeyStatus, ApiKeyEntry | None]:
+        """
+        Valida a chave e o IP de origem; registra o acesso se valida.
+
+        Args:
+            chave: API Key recebida
+            client_ip: IP do cliente
+            index: Indice a usar (padrao: o atual)
+
+        Returns:
+            Status da validacao e o token (None se a chave nao existe)
+        """
+        if index is None:
+            index = self._index
+        entry = index.lookup(chave)
+        if entry is None:
+            return ApiKeyStatus.INVALIDA, None
+
+        agora = datetime.now()
+        if entry.is_expirado(agora):
+            return ApiKeyStatus.EXPIRADA, entry
+        if not entry.permite_ip(client_ip):
+            return ApiKeyStatus.IP_NAO_PERMITIDO, entry
+
+        self.registrar_acesso(entry.id, agora)
+        return ApiKeyStatus.VALIDA, entry
+
+    def registrar_acesso(
+        self,
+        token_id: str,
+        quando: datetime | None = None,
+        acessos: int = 1,
+    ) -> None:
+        """
+        Acumula acessos do token (gravados no proximo flush).
+
+        Args:
+            token_id: ID em TOKEN_ACESSO
+            quando: Momento do acesso (padrao: agora)
+            acessos: Quantidade de acessos
+        """
+        quando = quando or datetime.now()
+        pendente = self._pending.get(token_id)
+        if pendente is None:
+            self._pending[token_id] = [acessos, quando]
+            return
+        pendente[0] += acessos
+        if quando > pendente[1]:
+            pendente[1] = quando
+
+    async def flush_acessos(self) -> int:
+        """
+        Grava os acessos acumulados (um UPDATE por token, em lote).
+
+        Returns:
+            Numero de acessos gravados
+
+        Raises:
+            DatabaseQueryError: Se o UPDATE falhar (acessos mantidos)
+        """
+        if not self._pending:
+            return 0
+
+        pendentes, self._pending = self._pending, {}
+        rows = [
+            {"id": token_id, "acessos": acessos, "ultimo_acesso": ultimo}
+            for token_id, (acessos, ultimo) in pendentes.items()
+        ]
+        try:
+            await self.pool.executemany(UPDATE_ACESSOS, rows)
+        except Exception:
+            self._flush_failures += 1
+            for token_id, (acessos, ultimo) in pendentes.items():
+                self.registrar_acesso(token_id, ultimo, acessos)
+            raise
+
+        total = sum(row["acessos"] for row in rows)
+        self._flushed_accesses += total
+        return total
+
+    async def refresh(self) -> ApiKeyIndex:
+        """
+        Grava os acessos pendentes e recarrega os tokens.
+
+        Returns:
+            Nova versao (ou a mesma, se o conteudo nao mudou)
+
+        Raises:
+            DatabaseQueryError: Se a carga falhar (versao anterior mantida)
+        """
+        try:
+            await self.flush_acessos()
+        except Exception as e:
+            self.logger.warning("Falha ao gravar acessos dos tokens", error=str(e))
+
+        async with self._lock:
+            await self._load()
+        return self._index
+
+    def get_stats(self) -> ApiKeyIndexStats:
+        """Retorna estatisticas do indice."""
+        return ApiKeyIndexStats(
+            version=self._index.version,
+            tokens=len(self._index),
+            reloads=self._reloads,
+            failures=self._failures,
+            invalid_tokens=self._invalid_tokens,
+            pending_tokens=len(self._pending),
+            flushed_accesses=self._flushed_accesses,
+            flush_failures=self._flush_failures,
+        )
+
+    async def _load(self) -> None:
+        """Consulta os tokens ativos e troca o indice."""
+        try:
+            rows = await self.pool.execute_rows(QUERY_TOKENS_ATIVOS)
+        except Exception:
+            self._failures += 1
+            raise
+
+        tokens, invalidos = build_api_key_tokens(rows)
+        self._invalid_tokens = len(invalidos)
+        if invalidos:
+            self.logger.error(
+                "Tokens com IP_ORIGEM_PERMITIDO invalido ignorados",
+                token_ids=invalidos,
+            )
+        anterior = self._index
+        changed = tokens != anterior.tokens
+        self._index = ApiKeyIndex(
+            version=anterior.version + 1 if changed else anterior.version,
+            loaded_at=time.time(),
+            tokens=tokens if changed else anterior.tokens,
+        )
+        self._reloads += 1
+
+        self.logger.info(
+            "Indice de API Keys carregado",
+            version=self._index.version,
+            tokens=len(tokens),
+            changed=changed,
+        )
+
+
+@lru_cache
+def get_api_key_index_repository() -> ApiKeyIndexRepository:
+    """Retorna a instancia (por processo) do indice de API Keys."""
+    return ApiKeyIndexRepository(oracle_pool)
@@ -0,0 +1,245 @@
+"""Lista de IPs/CIDRs compilada e resolucao do IP real do cliente.
+
+A lista (ex.: "200.198.1.10, 10.0.0.0/8, 2001:db8::/32") e compilada uma
+vez em uma arvore de prefixos por familia (IPv4/IPv6) com um byte por
+nivel; prefixos que nao terminam em byte inteiro sao expandidos no
+ultimo nivel. Verificar um IP percorre no maximo um no por byte do
+prefixo mais longo (4 no IPv4) e para no primeiro prefixo que contem o
+IP.
+
+X-Forwarded-For e X-Real-IP so sao considerados quando a conexao vem de
+um proxy confiavel; caso contrario qualquer cliente poderia escolher o
+proprio IP.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import socket
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import Any
+
+from backend.shared.infrastructure.config import get_settings
+
+# No da arvore: byte -> filho; TERMINAL marca fim de prefixo
+_Node = dict[int, Any]
+TERMINAL: _Node = {}
+
+_IPV4_MAPPED = b"\x00" * 10 + b"\xff\xff"
+
+
+def pack_ip(valor: str | None) -> bytes | None:
+    """
+    Converte texto no endereco binario (IPv4 mapeado em IPv6 vira IPv4).
+
+    Args:
+        valor: IP em texto
+
+    Returns:
+        4 bytes (IPv4) ou 16 bytes (IPv6), ou None se vazio ou invalido
+    """
+    if not valor:
+        return None
+    valor = valor.strip()
+    try:
+        return socket.inet_pton(socket.AF_INET, valor)
+    except OSError:
+        pass
+    try:
+        packed = socket.inet_pton(socket.AF_INET6, valor)
+    except OSError:
+        return None
+    return packed[12:] if packed[:12] == _IPV4_MAPPED else packed
+
+
+class IpMatcher:
+    """
+    Conjunto compilado de IPs e faixas CIDR.
+
+    Caracteristicas:
+    - "*" em qualquer posicao aceita todos os IPs
+    - IP sem mascara equivale a /32 (IPv4) ou /128 (IPv6)
+    - Prefixo contido em outro ja inserido e descartado na compilacao
+    - Entrada invalida gera ValueError (erro de configuracao)
+    - Igualdade por valor: mesmas redes normalizadas, em qualquer ordem
+    """
+
+    __slots__ = ("allow_all", "_roots", "_entries", "_networks")
+
+    def __init__(self, entries: Iterable[str]) -> None:
+        self.allow_all = False
+        # Raiz por tamanho do endereco: 4 (IPv4) ou 16 (IPv6) bytes
+        self._roots: dict[int, _Node] = {4: {}, 16: {}}
+        self._entries: list[str] = []
+        networks: set[str] = set()
+
+        for entry in entries:
+            entry = entry.strip()
+            if not entry:
+                continue
+            self._entries.append(entry)
+            if entry == "*":
+                self.allow_all = True
+                continue
+            network = ipaddress.ip_network(entry, strict=False)
+            networks.add(str(network))
+            self._insert(network.network_address.packed, network.prefixlen)
+        self._networks = frozenset(networks)
+
+    @classmethod
+    def parse(cls, valor: str | None) -> IpMatcher:
+        """
+        Compila uma lista separada por virgula.
+
+        Args:
+            valor: Ex.: "10.0.0.1, 192.168.0.0/16"
+
+        Returns:
+            Matcher compilado (vazio se valor vazio)
+        """
+        return cls((valor or "").split(","))
+
+    def __bool__(self) -> bool:
+        """Falso se nenhuma entrada foi configurada."""
+        return bool(self._entries)
+
+    def __eq__(self, other: object) -> bool:
+        """Mesmo conjunto de redes (e mesmo "*")."""
+        if not isinstance(other, IpMatcher):
+            return NotImplemented
+        return self.allow_all == other.allow_all and self._networks == other._networks
+
+    def __hash__(self) -> int:
+        return hash((self.allow_all, self._networks))
+
+    def __repr__(self) -> str:
+        return f"IpMatcher({', '.join(self._entries)!r})"
+
+    def __contains__(self, ip: object) -> bool:
+        """Permite `ip in matcher`."""
+        return isinstance(ip, str) and self.match(ip)
+
+    def match(self, ip: str | None) -> bool:
+        """
+        Verifica se o IP esta em alguma entrada.
+
+        Args:
+            ip: IP em texto
+
+        Returns:
+            True se o IP pertence a lista (IP invalido nunca pertence,
+            exceto com "*")
+        """
+        if self.allow_all:
+            return True
+        packed = pack_ip(ip)
+        return packed is not None and self.match_packed(packed)
+
+    def match_packed(self, packed: bytes) -> bool:
+        """Mesma verificacao de match() para o endereco binario."""
+        node = self._roots[len(packed)]
+        if node is TERMINAL:
+            return True
+        for byte in packed:
+            node = node.get(byte)
+            if node is None:
+                return False
+            if node is TERMINAL:
+                return True
+        return False
+
+    def _insert(self, packed: bytes, prefixlen: int) -> None:
+        """Insere o prefixo; um prefixo mais curto absorve os mais longos."""
+        if prefixlen == 0:
+            self._roots[len(packed)] = TERMINAL
+            return
+
+        node = self._roots[len(packed)]
+        if node is TERMINAL:
+            return
+
+        full, rest = divmod(prefixlen, 8)
+        for byte in packed[:full] if rest else packed[: full - 1]:
+            child = node.get(byte)
+            if child is TERMINAL:
+                return
+            if child is None:
+                child = node[byte] = {}
+            node = child
+
+        if rest:
+            # Expande os bits livres do ultimo byte: /20 vira 16 entradas
+            first = packed[full]
+            for byte in range(first, first + (1 << (8 - rest))):
+                node[byte] = TERMINAL
+        else:
+            node[packed[full - 1]] = TERMINAL
+
+
+@lru_cache(maxsize=16)
+def compile_ip_matcher(valor: str) -> IpMatcher:
+    """
+    Matcher compilado para a lista (cacheado pelo texto da lista).
+
+    Reservado as listas da configuracao (allowed_ips, trusted_proxies),
+    consultadas a cada requisicao; listas por token sao compiladas na
+    carga do indice para nao disputar estas posicoes.
+
+    Args:
+        valor: Lista separada por virgula
+
+    Returns:
+        Matcher compartilhado entre chamadas com a mesma lista
+    """
+    return IpMatcher.parse(valor)
+
+
+def get_allowed_ips_matcher() -> IpMatcher:
+    """Matcher de settings.allowed_ips (recompilado se a lista mudar)."""
+    return compile_ip_matcher(get_settings().allowed_ips)
+
+
+def get_trusted_proxies_matcher() -> IpMatcher:
+    """Matcher de settings.trusted_proxies (recompilado se a lista mudar)."""
+    return compile_ip_matcher(get_settings().trusted_proxies)
+
+
+def resolve_client_ip(
+    client_host: str | None,
+    headers: Mapping[str, str],
+    trusted_proxies: IpMatcher,
+) -> str | None:
+    """
+    IP real do cliente considerando proxies confiaveis.
+
+    Se a conexao vem de um proxy confiavel, X-Forwarded-For e percorrido
+    da direita para a esquerda pulando os proxies confiaveis; o primeiro
+    IP restante e o cliente. Sem X-Forwarded-For usa X-Real-IP. Conexao
+    de um IP nao confiavel usa o proprio IP da conexao.
+
+    Args:
+        client_host: IP da conexao
+        headers: Headers da requisicao (chaves sem distincao de caixa)
+        trusted_proxies: Proxies confiaveis
+
+    Returns:
+        IP do cliente (None se a conexao nao informa IP)
+    """
+    if not trusted_proxies or not trusted_proxies.match(client_host):
+        return client_host
+
+    forwarded_for = headers.get("x-forwarded-for")
+    if forwarded_for:
+        hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not trusted_proxies.match(hop):
+                return hop
+        if hops:
+            return hops[0]
+
+    real_ip = headers.get("x-real-ip")
+    if real_ip and real_ip.strip():
+        return real_ip.strip()
+
+    return client_host
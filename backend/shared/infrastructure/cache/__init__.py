@@ -1,5 +1,19 @@
 """Modulo de cache."""
 
 from backend.shared.infrastructure.cache.memory_cache import MemoryCache
+from backend.shared.infrastructure.cache.refresh_ahead import RefreshAheadScheduler
+from backend.shared.infrastructure.cache.shared_cache import (
+    LeaderLock,
+    SharedFileCache,
+    get_leader_lock,
+)
+from backend.shared.infrastructure.cache.single_flight import SingleFlight
 
-__all__ = ["MemoryCache"]
+__all__ = [
+    "LeaderLock",
+    "MemoryCache",
+    "RefreshAheadScheduler",
+    "SharedFileCache",
+    "SingleFlight",
+    "get_leader_lock",
+]
@@ -0,0 +1,242 @@
+"""Politicas de eviccao do cache em memoria.
+
+Todas as politicas mantem sua propria estrutura de ordenacao, evitando
+varrer as chaves do cache a cada escrita:
+
+- LRU: OrderedDict, O(1) por operacao
+- LFU: buckets de frequencia com OrderedDict, O(1) por operacao
+- TTL: heap de expiracao com remocao preguicosa, O(log n) por operacao
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from typing import Literal, Protocol
+
+EvictionPolicyName = Literal["lru", "lfu", "ttl"]
+
+
+class EvictionPolicy(Protocol):
+    """Contrato das politicas de eviccao."""
+
+    def on_insert(self, key: str, expires_at: float) -> None:
+        """Registra insercao (ou sobrescrita) de uma chave."""
+        ...
+
+    def on_access(self, key: str) -> None:
+        """Registra leitura bem-sucedida de uma chave."""
+        ...
+
+    def on_remove(self, key: str) -> None:
+        """Registra remocao de uma chave (expiracao ou invalidacao)."""
+        ...
+
+    def pop_victim(self) -> str | None:
+        """Remove e retorna a proxima chave a ser despejada."""
+        ...
+
+    def clear(self) -> None:
+        """Remove todas as chaves."""
+        ...
+
+
+class ExpiryHeap:
+    """
+    Heap de expiracao com remocao preguicosa.
+
+    Sobrescritas e remocoes apenas invalidam a entrada antiga; ela e
+    descartada quando chega ao topo. O heap e compactado quando as
+    entradas invalidas passam a dominar.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, str]] = []
+        self._current: dict[str, int] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def push(self, key: str, expires_at: float) -> None:
+        """Registra (ou atualiza) a expiracao de uma chave."""
+        self._seq += 1
+        self._current[key] = self._seq
+        heapq.heappush(self._heap, (expires_at, self._seq, key))
+
+        if len(self._heap) > 2 * len(self._current) + 64:
+            self._compact()
+
+    def remove(self, key: str) -> None:
+        """Remove a chave (a entrada no heap e descartada depois)."""
+        self._current.pop(key, None)
+
+    def pop_min(self) -> str | None:
+        """Remove e retorna a chave com expiracao mais proxima."""
+        while self._heap:
+            _, seq, key = heapq.heappop(self._heap)
+            if self._current.get(key) == seq:
+                del self._current[key]
+                return key
+        return None
+
+    def pop_expired(self, now: float) -> list[str]:
+        """Remove e retorna as chaves expiradas ate `now`."""
+        expired: list[str] = []
+        while self._heap and self._heap[0][0] < now:
+            _, seq, key = heapq.heappop(self._heap)
+            if self._current.get(key) == seq:
+                del self._current[key]
+                expired.append(key)
+        return expired
+
+    def clear(self) -> None:
+        """Remove todas as chaves."""
+        self._heap.clear()
+        self._current.clear()
+
+    def _compact(self) -> None:
+        """Descarta entradas invalidas do heap."""
+        self._heap = [
+            entry for entry in self._heap if self._current.get(entry[2]) == entry[1]
+        ]
+        heapq.heapify(self._heap)
+
+
+class LRUPolicy:
+    """Despeja a chave usada ha mais tempo."""
+
+    def __init__(self) -> None:
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def on_insert(self, key: str, expires_at: float) -> None:
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def on_access(self, key: str) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def pop_victim(self) -> str | None:
+        if not self._order:
+            return None
+        key, _ = self._order.popitem(last=False)
+        return key
+
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class LFUPolicy:
+    """
+    Despeja a chave menos acessada.
+
+    Empates sao resolvidos pela chave usada ha mais tempo (LRU dentro
+    do bucket de frequencia).
+    """
+
+    def __init__(self) -> None:
+        self._freq: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_freq = 0
+
+    def on_insert(self, key: str, expires_at: float) -> None:
+        if key in self._freq:
+            self.on_access(key)
+            return
+
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def on_access(self, key: str) -> None:
+        freq = self._freq.get(key)
+        if freq is None:
+            return
+
+        self._detach(key, freq)
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+        if self._min_freq == freq and freq not in self._buckets:
+            self._min_freq = freq + 1
+
+    def on_remove(self, key: str) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is not None:
+            self._detach(key, freq)
+
+    def pop_victim(self) -> str | None:
+        if not self._freq:
+            return None
+
+        if self._min_freq not in self._buckets:
+            # Minimo ficou desatualizado apos remocoes (raro)
+            self._min_freq = min(self._buckets)
+
+        bucket = self._buckets[self._min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_freq]
+        del self._freq[key]
+        return key
+
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+    def _detach(self, key: str, freq: int) -> None:
+        """Remove a chave do bucket da sua frequencia."""
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+
+
+class TTLPolicy:
+    """Despeja a chave mais proxima de expirar."""
+
+    def __init__(self) -> None:
+        self._heap = ExpiryHeap()
+
+    def on_insert(self, key: str, expires_at: float) -> None:
+        self._heap.push(key, expires_at)
+
+    def on_access(self, key: str) -> None:
+        pass
+
+    def on_remove(self, key: str) -> None:
+        self._heap.remove(key)
+
+    def pop_victim(self) -> str | None:
+        return self._heap.pop_min()
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+
+def create_eviction_policy(name: EvictionPolicyName) -> EvictionPolicy:
+    """
+    Cria a politica de eviccao pelo nome.
+
+    Args:
+        name: lru, lfu ou ttl
+
+    Returns:
+        Instancia da politica
+
+    Raises:
+        ValueError: Se a politica for desconhecida
+    """
+    policies: dict[str, type[EvictionPolicy]] = {
+        "lru": LRUPolicy,
+        "lfu": LFUPolicy,
+        "ttl": TTLPolicy,
+    }
+    if name not in policies:
+        raise ValueError(f"Politica de eviccao invalida: {name}")
+    return policies[name]()
@@ -4,9 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
+from backend.shared.infrastructure.cache.eviction import (
+    EvictionPolicyName,
+    ExpiryHeap,
+    create_eviction_policy,
+)
+
 T = TypeVar("T")
 
 
@@ -27,6 +34,8 @@ class CacheStats:
     hits: int
     misses: int
     hit_rate: float
+    stale_item_count: int = 0
+    evictions: int = 0
 
 
 class MemoryCache:
@@ -38,6 +47,8 @@ class MemoryCache:
     - Suporte a dados stale para fallback
     - Estatisticas de uso
     - Limpeza automatica de itens expirados
+    - Eviccao O(1) (LRU/LFU) ou O(log n) (TTL) ao atingir max_items
+    - Stale cache limitado a max_stale_items (descarta o mais antigo)
     """
 
     def __init__(
@@ -45,14 +56,21 @@ class MemoryCache:
         default_ttl_seconds: int = 300,
         stale_ttl_seconds: int = 3600,
         max_items: int = 1000,
+        eviction_policy: EvictionPolicyName = "lru",
+        max_stale_items: int | None = None,
     ) -> None:
         self._cache: dict[str, CacheItem[Any]] = {}
-        self._stale_cache: dict[str, CacheItem[Any]] = {}
+        # Ordem de insercao == ordem de expiracao (stale TTL e fixo)
+        self._stale_cache: OrderedDict[str, CacheItem[Any]] = OrderedDict()
+        self._policy = create_eviction_policy(eviction_policy)
+        self._expirations = ExpiryHeap()
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
         self._default_ttl = default_ttl_seconds
         self._stale_ttl = stale_ttl_seconds
         self._max_items = max_items
+        self._max_stale_items = max_stale_items or max_items
         self._cleanup_task: asyncio.Task[None] | None = None
 
     async def start(self) -> None:
@@ -87,15 +105,11 @@ class MemoryCache:
         now = time.time()
         if now > item.expires_at:
             # Item expirado - mover para stale
-            self._stale_cache[key] = CacheItem(
-                value=item.value,
-                expires_at=now + self._stale_ttl,
-                created_at=item.created_at,
-            )
-            del self._cache[key]
+            self._move_to_stale(key, now)
             self._misses += 1
             return None
 
+        self._policy.on_access(key)
         self._hits += 1
         return item.value
 
@@ -114,30 +128,50 @@ class MemoryCache:
             ttl_seconds: Tempo de vida em segundos (usa padrao se None)
         """
         # Verificar limite
-        if len(self._cache) >= self._max_items:
-            self._evict_oldest()
+        if key not in self._cache and len(self._cache) >= self._max_items:
+            self._evict()
 
         ttl = ttl_seconds or self._default_ttl
         now = time.time()
+        expires_at = now + ttl
 
         self._cache[key] = CacheItem(
             value=value,
-            expires_at=now + ttl,
+            expires_at=expires_at,
             created_at=now,
         )
+        self._policy.on_insert(key, expires_at)
+        self._expirations.push(key, expires_at)
 
         # Remover da stale cache
         self._stale_cache.pop(key, None)
 
     async def invalidate(self, key: str) -> None:
         """Remove um item do cache."""
-        self._cache.pop(key, None)
+        if self._cache.pop(key, None) is not None:
+            self._policy.on_remove(key)
+            self._expirations.remove(key)
         self._stale_cache.pop(key, None)
 
     async def invalidate_all(self) -> None:
         """Remove todos os itens do cache."""
         self._cache.clear()
         self._stale_cache.clear()
+        self._policy.clear()
+        self._expirations.clear()
+
+    async def delete(self, key: str) -> None:
+        """Alias de invalidate() (contrato CacheService)."""
+        await self.invalidate(key)
+
+    async def exists(self, key: str) -> bool:
+        """Verifica se a chave existe e nao expirou (sem contar hit/miss)."""
+        item = self._cache.get(key)
+        return item is not None and time.time() <= item.expires_at
+
+    async def clear(self) -> None:
+        """Alias de invalidate_all() (contrato CacheService)."""
+        await self.invalidate_all()
 
     async def get_stale(self, key: str) -> Any | None:
         """
@@ -170,25 +204,40 @@ class MemoryCache:
             hits=self._hits,
             misses=self._misses,
             hit_rate=self._hits / total if total > 0 else 0.0,
+            stale_item_count=len(self._stale_cache),
+            evictions=self._evictions,
         )
 
-    def _evict_oldest(self) -> None:
-        """Remove o item mais antigo."""
-        if not self._cache:
+    def _evict(self) -> None:
+        """Remove o item escolhido pela politica de eviccao."""
+        key = self._policy.pop_victim()
+        if key is None:
             return
 
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].created_at,
-        )
+        item = self._cache.pop(key)
+        self._expirations.remove(key)
+        self._add_stale(key, item, time.time())
+        self._evictions += 1
+
+    def _move_to_stale(self, key: str, now: float) -> None:
+        """Move um item expirado do cache principal para o stale."""
+        item = self._cache.pop(key)
+        self._policy.on_remove(key)
+        self._expirations.remove(key)
+        self._add_stale(key, item, now)
 
-        item = self._cache.pop(oldest_key)
-        self._stale_cache[oldest_key] = CacheItem(
+    def _add_stale(self, key: str, item: CacheItem[Any], now: float) -> None:
+        """Adiciona ao stale cache, descartando o mais antigo se cheio."""
+        self._stale_cache.pop(key, None)
+        self._stale_cache[key] = CacheItem(
             value=item.value,
-            expires_at=time.time() + self._stale_ttl,
+            expires_at=now + self._stale_ttl,
             created_at=item.created_at,
         )
 
+        while len(self._stale_cache) > self._max_stale_items:
+            self._stale_cache.popitem(last=False)
+
     async def _cleanup_loop(self) -> None:
         """Loop de limpeza periodica."""
         while True:
@@ -196,26 +245,20 @@ class MemoryCache:
             self._cleanup()
 
     def _cleanup(self) -> None:
-        """Remove itens expirados."""
+        """Remove itens expirados (custo proporcional aos expirados)."""
         now = time.time()
 
         # Limpar cache principal
-        expired_keys = [
-            key for key, item in self._cache.items() if now > item.expires_at
-        ]
-        for key in expired_keys:
+        for key in self._expirations.pop_expired(now):
             item = self._cache.pop(key)
-            self._stale_cache[key] = CacheItem(
-                value=item.value,
-                expires_at=now + self._stale_ttl,
-                created_at=item.created_at,
-            )
-
-        # Limpar stale cache
-        expired_stale = [
-            key for key, item in self._stale_cache.items() if now > item.expires_at
-        ]
-        for key in expired_stale:
+            self._policy.on_remove(key)
+            self._add_stale(key, item, now)
+
+        # Limpar stale cache (mais antigos primeiro)
+        while self._stale_cache:
+            key, item = next(iter(self._stale_cache.items()))
+            if now <= item.expires_at:
+                break
             del self._stale_cache[key]
 
 
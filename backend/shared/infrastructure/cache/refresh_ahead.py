@@ -0,0 +1,150 @@
+"""Atualizacao antecipada (refresh-ahead) de entradas do cache."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from backend.shared.infrastructure.logger import get_logger
+
+
+@dataclass
+class RefreshStats:
+    """Estatisticas do agendador de refresh."""
+
+    refreshes: int
+    failures: int
+    consecutive_failures: int
+    last_success_at: float | None
+    last_duration_ms: float | None
+    skipped: int = 0
+
+
+class RefreshAheadScheduler:
+    """
+    Recalcula periodicamente um valor do cache antes de ele expirar.
+
+    Caracteristicas:
+    - Primeira execucao imediata (aquece o cache no startup)
+    - Intervalo com jitter subtraido, para nunca passar do TTL
+    - Backoff exponencial em caso de falha, limitado ao intervalo
+    - Falhas nao derrubam o loop: o valor anterior segue disponivel
+      como stale no cache ate a proxima execucao bem-sucedida
+    - Com is_leader, apenas o worker lider executa o refresh; os demais
+      seguem no loop para assumir se o lider cair
+    """
+
+    def __init__(
+        self,
+        name: str,
+        refresh: Callable[[], Awaitable[Any]],
+        interval_seconds: float,
+        jitter_seconds: float = 0.0,
+        retry_base_seconds: float = 5.0,
+        max_backoff_seconds: float | None = None,
+        is_leader: Callable[[], bool] | None = None,
+    ) -> None:
+        self._name = name
+        self._refresh = refresh
+        self._interval = interval_seconds
+        self._jitter = min(jitter_seconds, interval_seconds / 2)
+        self._retry_base = min(retry_base_seconds, interval_seconds)
+        self._max_backoff = max_backoff_seconds or interval_seconds
+        self._is_leader = is_leader
+        self._task: asyncio.Task[None] | None = None
+        self._refreshes = 0
+        self._skipped = 0
+        self._failures = 0
+        self._consecutive_failures = 0
+        self._last_success_at: float | None = None
+        self._last_duration_ms: float | None = None
+        self.logger = get_logger("cache.refresh_ahead")
+
+    async def start(self) -> None:
+        """Inicia o loop de refresh em background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Para o loop de refresh."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Verifica se o loop esta ativo."""
+        return self._task is not None and not self._task.done()
+
+    async def run_once(self) -> bool:
+        """
+        Executa um refresh, registrando sucesso ou falha.
+
+        Returns:
+            True se o refresh foi bem-sucedido
+        """
+        start = time.perf_counter()
+        try:
+            await self._refresh()
+        except Exception as e:
+            self._failures += 1
+            self._consecutive_failures += 1
+            self.logger.warning(
+                "Falha no refresh antecipado",
+                key=self._name,
+                error=str(e),
+                consecutive_failures=self._consecutive_failures,
+            )
+            return False
+
+        self._last_duration_ms = (time.perf_counter() - start) * 1000
+        self._last_success_at = time.time()
+        self._refreshes += 1
+        self._consecutive_failures = 0
+        self.logger.debug(
+            "Refresh antecipado concluido",
+            key=self._name,
+            duration_ms=round(self._last_duration_ms, 2),
+        )
+        return True
+
+    def next_delay(self) -> float:
+        """
+        Calcula o tempo ate o proximo refresh.
+
+        Returns:
+            Segundos ate a proxima execucao
+        """
+        if self._consecutive_failures:
+            backoff = self._retry_base * 2 ** (self._consecutive_failures - 1)
+            return min(backoff, self._max_backoff)
+
+        return self._interval - random.uniform(0, self._jitter)
+
+    def get_stats(self) -> RefreshStats:
+        """Retorna estatisticas do agendador."""
+        return RefreshStats(
+            refreshes=self._refreshes,
+            failures=self._failures,
+            consecutive_failures=self._consecutive_failures,
+            last_success_at=self._last_success_at,
+            last_duration_ms=self._last_duration_ms,
+            skipped=self._skipped,
+        )
+
+    async def _run(self) -> None:
+        """Loop de refresh periodico."""
+        while True:
+            if self._is_leader is None or self._is_leader():
+                await self.run_once()
+            else:
+                self._skipped += 1
+            await asyncio.sleep(self.next_delay())
@@ -0,0 +1,506 @@
+"""Cache compartilhado entre workers via arquivos locais.
+
+Com uvicorn em varios processos cada worker tem seu proprio
+MemoryCache. Este backend grava cada chave em um arquivo de um
+diretorio local, permitindo que um unico lider faca o refresh e todos
+os workers sirvam os mesmos bytes.
+
+Formato de cada arquivo (.entry):
+    header (MAGIC, generation, expires_at, created_at) + valor (pickle)
+
+Escritas usam arquivo temporario + os.replace (atomico no mesmo
+filesystem): leitores veem a versao anterior ou a nova, nunca um
+arquivo parcial. Cada worker guarda o valor decodificado e so rele o
+arquivo quando o inode muda, entao um cache hit custa um os.stat().
+
+Limites (max_items): a copia decodificada de cada worker e uma LRU de
+max_items chaves, e o diretorio e varrido a cada max_items // 10
+escritas do worker, removendo entradas vencidas alem do stale e, acima
+de max_items, as gravadas ha mais tempo.
+
+Os valores sao desserializados com pickle, entao o diretorio precisa
+ser privado: ensure_private_directory() recusa um diretorio que nao seja
+do usuario do processo ou que tenha permissao para grupo/outros, e os
+arquivos sao abertos sem seguir links simbolicos.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import stat
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from backend.shared.infrastructure.cache.memory_cache import CacheStats
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows (sem multiplos workers)
+    fcntl = None  # type: ignore[assignment]
+
+_MAGIC = b"RDC1"
+_HEADER = struct.Struct("<4sQdd")
+_SUFFIX = ".entry"
+
+# Abre sem seguir link simbolico (0 onde a flag nao existe)
+O_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+def ensure_private_directory(directory: str | Path) -> Path:
+    """
+    Cria (se preciso) e valida um diretorio privado do processo.
+
+    Args:
+        directory: Caminho do diretorio
+
+    Returns:
+        Caminho validado
+
+    Raises:
+        PermissionError: Se o caminho for link simbolico, nao for
+            diretorio, pertencer a outro usuario ou tiver permissao para
+            grupo/outros
+    """
+    path = Path(directory)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"Diretorio compartilhado nao e um diretorio: {path}")
+    if hasattr(os, "getuid"):
+        if info.st_uid != os.getuid():
+            raise PermissionError(f"Diretorio compartilhado de outro usuario: {path}")
+        if info.st_mode & 0o077:
+            raise PermissionError(
+                f"Diretorio compartilhado acessivel a grupo/outros "
+                f"({stat.filemode(info.st_mode)}): {path}"
+            )
+    return path
+
+
+@dataclass
+class _LocalEntry:
+    """Copia decodificada de um arquivo, valida enquanto o inode nao mudar."""
+
+    signature: tuple[int, int, int]
+    generation: int
+    value: Any
+    expires_at: float
+    created_at: float
+
+
+class SharedFileCache:
+    """
+    Cache compartilhado entre processos da mesma maquina.
+
+    Implementa o contrato de CacheService (get/set/delete/exists/clear)
+    e get_stale(), podendo substituir o MemoryCache no caso de uso.
+
+    Caracteristicas:
+    - Escrita atomica (tmp + os.replace) com contador de geracao
+    - Leitura sem I/O de conteudo enquanto o arquivo nao muda
+    - Stale disponivel ate stale_ttl_seconds apos a expiracao
+    - Copia local LRU e arquivos limitados a max_items (sweep())
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        default_ttl_seconds: int = 300,
+        stale_ttl_seconds: int = 3600,
+        max_items: int = 1000,
+    ) -> None:
+        self._dir = ensure_private_directory(directory)
+        self._default_ttl = default_ttl_seconds
+        self._stale_ttl = stale_ttl_seconds
+        self._max_items = max_items
+        self._sweep_every = max(1, max_items // 10)
+        self._writes_since_sweep = 0
+        self._local: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._evictions = 0
+        self.logger = get_logger("cache.shared")
+
+    @property
+    def directory(self) -> Path:
+        """Diretorio onde as entradas sao gravadas."""
+        return self._dir
+
+    async def start(self) -> None:
+        """Sem tarefas em background (mantido por compatibilidade)."""
+
+    async def stop(self) -> None:
+        """Sem tarefas em background (mantido por compatibilidade)."""
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Obtem um valor do cache.
+
+        Args:
+            key: Chave do item
+
+        Returns:
+            Valor ou None se nao existir ou estiver expirado
+        """
+        entry = self._load(key)
+        if entry is None or time.time() > entry.expires_at:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return entry.value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """
+        Grava um valor visivel para todos os workers.
+
+        Args:
+            key: Chave do item
+            value: Valor (precisa ser serializavel com pickle)
+            ttl_seconds: Tempo de vida em segundos (usa padrao se None)
+        """
+        path = self._path(key)
+        now = time.time()
+        expires_at = now + (ttl_seconds or self._default_ttl)
+        generation = self._current_generation(key) + 1
+
+        data = _HEADER.pack(_MAGIC, generation, expires_at, now) + pickle.dumps(
+            value, protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        fd, tmp_name = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        info = path.stat()
+        self._remember(
+            key,
+            _LocalEntry(
+                signature=(info.st_ino, info.st_mtime_ns, info.st_size),
+                generation=generation,
+                value=value,
+                expires_at=expires_at,
+                created_at=now,
+            ),
+        )
+
+        self._writes_since_sweep += 1
+        if self._writes_since_sweep >= self._sweep_every:
+            self.sweep()
+
+    async def delete(self, key: str) -> None:
+        """Remove um item do cache (para todos os workers)."""
+        self._path(key).unlink(missing_ok=True)
+        self._local.pop(key, None)
+
+    async def exists(self, key: str) -> bool:
+        """Verifica se a chave existe e nao expirou."""
+        entry = self._load(key)
+        return entry is not None and time.time() <= entry.expires_at
+
+    async def clear(self) -> None:
+        """Remove todos os itens do cache."""
+        for path in self._dir.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
+        self._local.clear()
+
+    async def invalidate(self, key: str) -> None:
+        """Alias de delete(), mesma interface do MemoryCache."""
+        await self.delete(key)
+
+    async def invalidate_all(self) -> None:
+        """Alias de clear(), mesma interface do MemoryCache."""
+        await self.clear()
+
+    async def get_stale(self, key: str) -> Any | None:
+        """
+        Obtem um valor do cache, mesmo que esteja expirado.
+
+        Util para fallback quando o banco esta indisponivel.
+        """
+        entry = self._load(key)
+        if entry is None:
+            return None
+
+        if time.time() > entry.expires_at + self._stale_ttl:
+            return None
+
+        return entry.value
+
+    def sweep(self) -> int:
+        """
+        Remove do diretorio as entradas vencidas e o excedente.
+
+        Entradas vencidas ha mais de stale_ttl_seconds (ou ilegiveis)
+        sao removidas; se ainda restarem mais de max_items, as gravadas
+        ha mais tempo sao removidas ate o limite. Seguro com varios
+        workers: remover um arquivo ja removido e ignorado.
+
+        Returns:
+            Numero de arquivos removidos
+        """
+        now = time.time()
+        vivas: list[tuple[float, Path]] = []
+        removidas: list[Path] = []
+        for path in self._dir.glob(f"*{_SUFFIX}"):
+            try:
+                magic, _, expires_at, created_at = _HEADER.unpack_from(
+                    _read_private_file(path, _HEADER.size)
+                )
+            except FileNotFoundError:
+                continue
+            except Exception:
+                removidas.append(path)
+                continue
+            if magic != _MAGIC or now > expires_at + self._stale_ttl:
+                removidas.append(path)
+            else:
+                vivas.append((created_at, path))
+
+        excedente = len(vivas) - self._max_items
+        if excedente > 0:
+            vivas.sort()
+            removidas.extend(path for _, path in vivas[:excedente])
+
+        for path in removidas:
+            path.unlink(missing_ok=True)
+        self._writes_since_sweep = 0
+        self._evictions += len(removidas)
+
+        if removidas:
+            self.logger.debug(
+                "Entradas removidas do cache shared",
+                removed=len(removidas),
+                remaining=len(vivas) - max(excedente, 0),
+            )
+        return len(removidas)
+
+    def get_generation(self, key: str) -> int | None:
+        """
+        Retorna a geracao atual da chave.
+
+        Args:
+            key: Chave do item
+
+        Returns:
+            Contador de geracao ou None se a chave nao existir
+        """
+        entry = self._load(key)
+        return entry.generation if entry is not None else None
+
+    def get_stats(self) -> CacheStats:
+        """Retorna estatisticas do cache (hits/misses deste worker)."""
+        total = self._hits + self._misses
+        return CacheStats(
+            item_count=sum(1 for _ in self._dir.glob(f"*{_SUFFIX}")),
+            hits=self._hits,
+            misses=self._misses,
+            hit_rate=self._hits / total if total > 0 else 0.0,
+            evictions=self._evictions,
+        )
+
+    @property
+    def reloads(self) -> int:
+        """Quantas vezes este worker releu um arquivo alterado por outro."""
+        return self._reloads
+
+    def _path(self, key: str) -> Path:
+        """Arquivo da chave (hash evita caracteres invalidos no nome)."""
+        digest = hashlib.sha1(key.encode("utf-8"), usedforsecurity=False).hexdigest()
+        return self._dir / f"{digest}{_SUFFIX}"
+
+    def _current_generation(self, key: str) -> int:
+        """Geracao gravada atualmente (0 se a chave nao existir)."""
+        entry = self._load(key)
+        return entry.generation if entry is not None else 0
+
+    def _load(self, key: str) -> _LocalEntry | None:
+        """Retorna a copia local, relendo o arquivo se ele mudou."""
+        path = self._path(key)
+        try:
+            info = path.stat()
+        except FileNotFoundError:
+            self._local.pop(key, None)
+            return None
+
+        signature = (info.st_ino, info.st_mtime_ns, info.st_size)
+        entry = self._local.get(key)
+        if entry is not None and entry.signature == signature:
+            self._local.move_to_end(key)
+            return entry
+
+        try:
+            data = _read_private_file(path)
+            magic, generation, expires_at, created_at = _HEADER.unpack_from(data)
+            if magic != _MAGIC:
+                raise ValueError("cabecalho invalido")
+            # Diretorio e arquivo validados como do proprio processo
+            value = pickle.loads(data[_HEADER.size :])  # noqa: S301
+        except FileNotFoundError:
+            self._local.pop(key, None)
+            return None
+        except Exception as e:
+            self.logger.warning("Entrada de cache invalida", key=key, error=str(e))
+            self._local.pop(key, None)
+            return None
+
+        self._reloads += 1
+        entry = _LocalEntry(
+            signature=signature,
+            generation=generation,
+            value=value,
+            expires_at=expires_at,
+            created_at=created_at,
+        )
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: _LocalEntry) -> None:
+        """Guarda a copia local, descartando a menos usada acima de max_items."""
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self._max_items:
+            self._local.popitem(last=False)
+
+
+def _read_private_file(path: Path, size: int = -1) -> bytes:
+    """
+    Le um arquivo do diretorio privado.
+
+    Args:
+        path: Arquivo
+        size: Bytes a ler (padrao: o arquivo inteiro)
+
+    Raises:
+        FileNotFoundError: Se o arquivo nao existir
+        OSError: Se for link simbolico (O_NOFOLLOW)
+        PermissionError: Se o arquivo pertencer a outro usuario
+    """
+    fd = os.open(path, os.O_RDONLY | O_NOFOLLOW)
+    with os.fdopen(fd, "rb") as file:
+        if hasattr(os, "getuid") and os.fstat(file.fileno()).st_uid != os.getuid():
+            raise PermissionError(f"Entrada de cache de outro usuario: {path}")
+        return file.read(size)
+
+
+class LeaderLock:
+    """
+    Eleicao de lider entre workers via flock nao bloqueante.
+
+    O worker que obtem o lock executa tarefas exclusivas (ex.: refresh
+    do snapshot). O lock e liberado pelo kernel se o processo morrer;
+    os demais workers tentam novamente a cada chamada de try_acquire(),
+    assumindo a lideranca automaticamente.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._fd: int | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        """Verifica se este processo detem o lock."""
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """
+        Tenta obter a lideranca sem bloquear.
+
+        Returns:
+            True se este processo e (ou passou a ser) o lider
+        """
+        if self._fd is not None:
+            return True
+
+        if fcntl is None:
+            # Sem flock nao ha multiplos workers: o processo unico e lider
+            self._fd = -1
+            return True
+
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT | O_NOFOLLOW, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Libera a lideranca."""
+        if self._fd is None:
+            return
+
+        if self._fd >= 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+        self._fd = None
+
+
+@lru_cache
+def get_shared_cache() -> SharedFileCache:
+    """Retorna a instancia (por processo) do cache compartilhado."""
+    settings = get_settings()
+    return SharedFileCache(
+        directory=settings.cache_shared_path,
+        default_ttl_seconds=settings.cache_ttl_seconds,
+        stale_ttl_seconds=settings.cache_stale_ttl_seconds,
+        max_items=settings.cache_max_items,
+    )
+
+
+LEADER_LOCK_NAME = "interrupcoes_ativas.leader"
+
+
+def leader_lock_directory() -> Path:
+    """
+    Diretorio do lock de lider.
+
+    Usa cache_shared_dir quando configurado; caso contrario um diretorio
+    privado do usuario no diretorio temporario. O arquivo de lock nunca e
+    lido, entao o fallback previsivel e seguro: um diretorio de outro
+    usuario apenas impede a inicializacao.
+
+    Returns:
+        Diretorio validado por ensure_private_directory
+    """
+    settings = get_settings()
+    if settings.cache_shared_dir:
+        return ensure_private_directory(settings.cache_shared_path)
+    owner = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return ensure_private_directory(Path(tempfile.gettempdir()) / f"{settings.app_name}-{owner}")
+
+
+@lru_cache
+def get_leader_lock() -> LeaderLock:
+    """
+    Retorna o lock (por processo) de lider entre os workers.
+
+    Independe de cache_backend: tarefas que nao podem rodar em todos os
+    workers (historico, expurgo, refresh da materialized view) usam este
+    lock mesmo com o cache em memoria.
+    """
+    return LeaderLock(leader_lock_directory() / LEADER_LOCK_NAME)
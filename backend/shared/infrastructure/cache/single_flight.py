@@ -0,0 +1,86 @@
+"""Coalescencia de requisicoes concorrentes (single-flight)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Estatisticas de coalescencia."""
+
+    executions: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight:
+    """
+    Garante no maximo uma execucao em andamento por chave.
+
+    A primeira corrotina que pede uma chave dispara a funcao; as demais
+    aguardam o mesmo resultado (ou a mesma excecao). Evita que varias
+    requisicoes refacam a mesma consulta quando o cache expira.
+
+    A execucao roda em uma task propria: se a requisicao que a disparou
+    for cancelada (cliente desconectou), as demais continuam aguardando.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Executa fn uma unica vez para chamadas concorrentes da mesma chave.
+
+        Args:
+            key: Chave que identifica a execucao
+            fn: Funcao assincrona a executar
+
+        Returns:
+            Resultado de fn (compartilhado entre as chamadas coalescidas)
+
+        Raises:
+            Exception: A mesma excecao levantada por fn
+        """
+        call = self._calls.get(key)
+
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            call.add_done_callback(partial(self._forget, key))
+            self._calls[key] = call
+            self._executions += 1
+        else:
+            self._coalesced += 1
+
+        result: T = await asyncio.shield(call)
+        return result
+
+    def get_stats(self) -> SingleFlightStats:
+        """Retorna estatisticas de coalescencia."""
+        return SingleFlightStats(
+            executions=self._executions,
+            coalesced=self._coalesced,
+            in_flight=len(self._calls),
+        )
+
+    def _forget(self, key: str, call: asyncio.Future[Any]) -> None:
+        """Remove a execucao concluida do registro."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+        # Marca a excecao como recuperada mesmo sem nenhum chamador aguardando
+        if not call.cancelled():
+            call.exception()
+
+
+# Instancia singleton
+single_flight = SingleFlight()
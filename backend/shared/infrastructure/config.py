@@ -1,9 +1,10 @@
 """Configuracoes da aplicacao usando Pydantic Settings."""
 
 from functools import lru_cache
+from pathlib import Path
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -40,17 +41,102 @@ class Settings(BaseSettings):
     pool_max: int = Field(default=10, ge=1)
     pool_increment: int = Field(default=1, ge=1)
     pool_timeout: int = Field(default=60, ge=1)
+    pool_stmt_cache_size: int = Field(
+        default=40, ge=0, description="Statements em cache por conexao (0 = desliga)"
+    )
 
     # Autenticacao
     api_key: str = Field(..., description="Chave de API para autenticacao")
     allowed_ips: str = Field(
-        default="*", description="IPs permitidos (separados por virgula)"
+        default="*", description="IPs ou faixas CIDR permitidos (separados por virgula)"
+    )
+    trusted_proxies: str = Field(
+        default="",
+        description="Proxies (IPs ou CIDR) cujos X-Forwarded-For/X-Real-IP sao aceitos",
+    )
+    # static (api_key acima) ou token (tabela TOKEN_ACESSO, indice em memoria)
+    auth_backend: Literal["static", "token"] = "static"
+    api_key_refresh_interval_seconds: int = Field(
+        default=60,
+        ge=10,
+        description="Intervalo da recarga dos tokens e da gravacao dos acessos",
+    )
+
+    # Auditoria de requisicoes (RAD-124) e header X-Request-ID
+    audit_enabled: bool = False
+    # log (structlog na requisicao) ou oracle (fila + gravacao em lote em CONSULTA)
+    audit_sink: Literal["log", "oracle"] = "log"
+    audit_batch_size: int = Field(default=500, ge=1, le=5000)
+    audit_flush_interval_ms: int = Field(default=1000, ge=10)
+    audit_queue_max: int = Field(
+        default=10_000, ge=1, description="Registros enfileirados; excedente e descartado"
+    )
+
+    # Rate limit (10 req/min ANEEL): memory (por worker) ou shared (tabela
+    # mapeada em memoria no diretorio do cache shared, vale entre workers)
+    rate_limit_backend: Literal["memory", "shared"] = "memory"
+    rate_limit_max_clients: int = Field(
+        default=100_000, ge=100, description="Clientes rastreados (slots da tabela shared)"
     )
 
     # Cache
     cache_ttl_seconds: int = Field(default=300, ge=1)
     cache_stale_ttl_seconds: int = Field(default=3600, ge=1)
     cache_max_items: int = Field(default=1000, ge=1)
+    cache_backend: Literal["memory", "shared"] = Field(
+        default="memory",
+        description="memory (por worker) ou shared (arquivos locais, um lider faz o refresh)",
+    )
+    cache_shared_dir: str = Field(
+        default="",
+        description="Diretorio privado dos backends shared (obrigatorio com backend shared)",
+    )
+    cache_refresh_ahead_enabled: bool = True
+    cache_refresh_ahead_ratio: float = Field(
+        default=0.8, gt=0, le=1, description="Fracao do TTL apos a qual o snapshot e recalculado"
+    )
+    cache_refresh_jitter_ratio: float = Field(
+        default=0.1, ge=0, lt=1, description="Jitter maximo como fracao do intervalo de refresh"
+    )
+
+    # Agregacao: query (GROUP BY a cada refresh), incremental (deltas),
+    # materialized (leitura de MV_INTERRUPCAO_FORNECIMENTO), fanout
+    # (uma sub-query por DBLink, em paralelo, com join na aplicacao) ou
+    # indexed (apenas eventos; conjunto/municipio do indice e ocorrencias
+    # programadas do conjunto em memoria)
+    aggregation_mode: Literal["query", "incremental", "materialized", "fanout", "indexed"] = (
+        "query"
+    )
+    aggregation_reconcile_interval_seconds: int = Field(
+        default=900, ge=60, description="Intervalo da reconciliacao completa"
+    )
+    aggregation_mview_refresh_interval_seconds: int = Field(
+        default=120, ge=30, description="Intervalo do refresh da materialized view"
+    )
+    device_index_reload_interval_seconds: int = Field(
+        default=3600, ge=60, description="Intervalo da recarga do indice de dispositivos"
+    )
+    outages_programadas_refresh_interval_seconds: int = Field(
+        default=60, ge=10, description="Intervalo do delta das ocorrencias programadas"
+    )
+    # Universo (qtdUCsAtendidas) pre-calculado, refresh a cada CacheTTL.UNIVERSO
+    # (sem efeito em materialized: a view ja traz o universo)
+    universo_cache_enabled: bool = True
+
+    # Historico de snapshots (dthRecuperacao). Opt-in: com backend oracle
+    # grava em CONSULTA/INTERRUPCAO_ATIVA a cada refresh e exige a
+    # migracao 003 (SEQ_INTERRUPCAO_ATIVA)
+    snapshot_history_enabled: bool = False
+    snapshot_history_backend: Literal["oracle", "local"] = Field(
+        default="oracle",
+        description="oracle (CONSULTA/INTERRUPCAO_ATIVA) ou local (arquivo colunar)",
+    )
+    snapshot_history_dir: str = Field(
+        default="data/snapshot-history", description="Diretorio do historico local"
+    )
+    snapshot_history_retention_months: int = Field(
+        default=36, ge=1, description="Retencao do historico (especificacao ANEEL: 36 meses)"
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
@@ -83,6 +169,25 @@ class Settings(BaseSettings):
         """Retorna lista de origens CORS."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    @property
+    def cache_refresh_interval_seconds(self) -> float:
+        """Intervalo do refresh antecipado, antes da expiracao do TTL."""
+        return self.cache_ttl_seconds * self.cache_refresh_ahead_ratio
+
+    @property
+    def cache_shared_path(self) -> Path:
+        """Diretorio do cache compartilhado entre workers."""
+        return Path(self.cache_shared_dir)
+
+    @model_validator(mode="after")
+    def _check_shared_dir(self) -> "Settings":
+        """Backends shared usam arquivos privados: o diretorio deve ser explicito."""
+        if self.cache_backend == "shared" and not self.cache_shared_dir:
+            raise ValueError("cache_backend=shared exige cache_shared_dir")
+        if self.rate_limit_backend == "shared" and not self.cache_shared_dir:
+            raise ValueError("rate_limit_backend=shared exige cache_shared_dir")
+        return self
+
     @property
     def allowed_ips_list(self) -> list[str]:
         """Retorna lista de IPs permitidos."""
@@ -10,10 +10,26 @@ from backend.shared.infrastructure.database.oracle_connection import (
     get_oracle_connection,
     run_in_executor,
 )
+from backend.shared.infrastructure.database.mview_refresher import (
+    MaterializedViewRefresher,
+    MViewRefreshStats,
+)
 from backend.shared.infrastructure.database.oracle_pool import OraclePool
+from backend.shared.infrastructure.database.query_registry import (
+    PreparedQuery,
+    QueryRegistry,
+    QueryStats,
+    query_registry,
+)
 
 __all__ = [
+    "MaterializedViewRefresher",
+    "MViewRefreshStats",
     "OraclePool",
+    "PreparedQuery",
+    "QueryRegistry",
+    "QueryStats",
+    "query_registry",
     "OracleConnection",
     "get_oracle_connection",
     "get_engine",
@@ -0,0 +1,43 @@
+"""Index snapshot history for dthRecuperacao lookups
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+Prepara CONSULTA/INTERRUPCAO_ATIVA para guardar o historico de snapshots
+de interrupcoes ativas (parametro dthRecuperacao, retencao de 36 meses):
+- IDX_CONSULTA_TIPO_STATUS_DATA: busca do snapshot mais recente ate uma
+  data/hora com um unico range scan descendente
+- SEQ_INTERRUPCAO_ATIVA: gera o ID das linhas gravadas em lote
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema padrao do RADAR
+SCHEMA = "RADAR_API"
+
+
+def upgrade() -> None:
+    """Aplica a migracao - cria indice e sequence do historico."""
+    op.create_index(
+        "IDX_CONSULTA_TIPO_STATUS_DATA",
+        "CONSULTA",
+        ["ID_TIPO_CONSULTA", "STATUS", "DATA_BRASILIA"],
+        schema=SCHEMA,
+    )
+
+    op.execute(f"CREATE SEQUENCE {SCHEMA}.SEQ_INTERRUPCAO_ATIVA START WITH 1 CACHE 1000")
+
+
+def downgrade() -> None:
+    """Reverte a migracao - remove indice e sequence."""
+    op.execute(f"DROP SEQUENCE {SCHEMA}.SEQ_INTERRUPCAO_ATIVA")
+    op.drop_index("IDX_CONSULTA_TIPO_STATUS_DATA", table_name="CONSULTA", schema=SCHEMA)
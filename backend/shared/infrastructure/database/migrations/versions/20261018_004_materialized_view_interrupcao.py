@@ -0,0 +1,61 @@
+"""Create materialized view MV_INTERRUPCAO_FORNECIMENTO
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+Materializa localmente o resultado de VW_INTERRUPCAO_FORNECIMENTO (quatro
+CTEs sobre DBLinks). A leitura da API passa a ser um full scan de poucas
+centenas de linhas locais, independente da latencia dos DBLinks.
+
+Refresh:
+- COMPLETE ON DEMAND: fast refresh nao e suportado para agregacoes com
+  COUNT(DISTINCT) e FULL OUTER JOIN sobre tabelas remotas
+- Disparado pela aplicacao (MaterializedViewRefresher) com
+  atomic_refresh: leitores veem o conteudo anterior ate o commit
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema padrao do RADAR
+SCHEMA = "RADAR_API"
+
+MVIEW_DDL = f"""
+CREATE MATERIALIZED VIEW {SCHEMA}.MV_INTERRUPCAO_FORNECIMENTO
+    BUILD IMMEDIATE
+    REFRESH COMPLETE ON DEMAND
+AS
+SELECT
+    IDE_CONJUNTO_UC,
+    IDE_MUNICIPIO,
+    QTD_UCS_ATENDIDAS,
+    QTD_OCORRENCIA_PROGRAMADA,
+    QTD_OCORRENCIA_NAO_PROGRAMADA
+FROM
+    {SCHEMA}.VW_INTERRUPCAO_FORNECIMENTO
+"""
+
+
+def upgrade() -> None:
+    """Aplica a migracao - cria a materialized view de interrupcoes."""
+    op.execute(MVIEW_DDL)
+
+    op.execute(
+        f"""
+        COMMENT ON MATERIALIZED VIEW {SCHEMA}.MV_INTERRUPCAO_FORNECIMENTO IS
+        'Copia local de VW_INTERRUPCAO_FORNECIMENTO (refresh pela aplicacao)'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Reverte a migracao - remove a materialized view."""
+    op.execute(f"DROP MATERIALIZED VIEW {SCHEMA}.MV_INTERRUPCAO_FORNECIMENTO")
@@ -23,6 +23,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    Sequence,
     String,
     Text,
     UniqueConstraint,
@@ -152,7 +153,7 @@ class Consulta(Base):
         data_fim: Timestamp de fim do processamento
         parametros: JSON com parametros da requisicao
         ip_origem: IP de origem da requisicao
-        status: Status da consulta (SUCESSO, ERRO, PARCIAL)
+        status: Status da consulta (SUCESSO, ERRO, PARCIAL; SNAPSHOT para historico)
         mensagem_erro: Mensagem de erro (se houver)
     """
 
@@ -161,6 +162,9 @@ class Consulta(Base):
         Index("IDX_CONSULTA_DATA_BRASILIA", "DATA_BRASILIA"),
         Index("IDX_CONSULTA_TOKEN", "ID_TOKEN"),
         Index("IDX_CONSULTA_STATUS", "STATUS"),
+        Index(
+            "IDX_CONSULTA_TIPO_STATUS_DATA", "ID_TIPO_CONSULTA", "STATUS", "DATA_BRASILIA"
+        ),
         {"schema": "RADAR_API"},
     )
 
@@ -231,7 +235,13 @@ class InterrupcaoAtiva(Base):
         {"schema": "RADAR_API"},
     )
 
-    id = Column("ID", Integer, primary_key=True, autoincrement=True)
+    id = Column(
+        "ID",
+        Integer,
+        Sequence("SEQ_INTERRUPCAO_ATIVA", schema="RADAR_API"),
+        primary_key=True,
+        autoincrement=True,
+    )
     id_consulta = Column(
         "ID_CONSULTA",
         String(100),
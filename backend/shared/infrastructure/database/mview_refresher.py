@@ -0,0 +1,94 @@
+"""Orquestracao do refresh de materialized views."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+from backend.shared.infrastructure.logger import get_logger
+
+# Refresh completo e atomico: leitores veem o conteudo anterior ate o commit
+_REFRESH_SQL = """
+    BEGIN
+        DBMS_MVIEW.REFRESH(list => :mview, method => 'C', atomic_refresh => TRUE);
+    END;
+"""
+
+
+@dataclass
+class MViewRefreshStats:
+    """Estatisticas de refresh de uma materialized view."""
+
+    refreshes: int
+    failures: int
+    last_refresh_at: float | None
+    last_duration_ms: float | None
+    last_row_count: int | None
+
+
+class MaterializedViewRefresher:
+    """
+    Executa o refresh de uma materialized view e registra o resultado.
+
+    O custo dos DBLinks fica no refresh (em background); as leituras da
+    API consultam apenas o objeto local. Agendado normalmente por um
+    RefreshAheadScheduler no worker lider.
+    """
+
+    def __init__(self, pool: OraclePool, mview: str) -> None:
+        """
+        Args:
+            pool: Pool de conexoes Oracle
+            mview: Nome qualificado da view (ex.: RADAR_API.MV_...)
+        """
+        self.pool = pool
+        self.mview = mview
+        self._count_sql = f"SELECT COUNT(*) AS total FROM {mview}"
+        self._refreshes = 0
+        self._failures = 0
+        self._last_refresh_at: float | None = None
+        self._last_duration_ms: float | None = None
+        self._last_row_count: int | None = None
+        self.logger = get_logger("database.mview_refresher")
+
+    async def refresh(self) -> int:
+        """
+        Executa o refresh completo da materialized view.
+
+        Returns:
+            Numero de linhas apos o refresh
+
+        Raises:
+            DatabaseQueryError: Se o refresh falhar (conteudo anterior mantido)
+        """
+        start = time.perf_counter()
+        try:
+            await self.pool.execute_batch([(_REFRESH_SQL, {"mview": self.mview})])
+            row = await self.pool.execute_one(self._count_sql)
+        except Exception:
+            self._failures += 1
+            raise
+
+        self._last_duration_ms = (time.perf_counter() - start) * 1000
+        self._last_refresh_at = time.time()
+        self._last_row_count = int(row["total"]) if row else 0
+        self._refreshes += 1
+
+        self.logger.info(
+            "Materialized view atualizada",
+            mview=self.mview,
+            duration_ms=round(self._last_duration_ms, 2),
+            rows=self._last_row_count,
+        )
+        return self._last_row_count
+
+    def get_stats(self) -> MViewRefreshStats:
+        """Retorna estatisticas dos refreshes."""
+        return MViewRefreshStats(
+            refreshes=self._refreshes,
+            failures=self._failures,
+            last_refresh_at=self._last_refresh_at,
+            last_duration_ms=self._last_duration_ms,
+            last_row_count=self._last_row_count,
+        )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
@@ -10,6 +11,10 @@ import oracledb
 
 from backend.shared.domain.errors import DatabaseConnectionError, DatabaseQueryError
 from backend.shared.infrastructure.config import Settings
+from backend.shared.infrastructure.database.query_registry import (
+    QueryRegistry,
+    query_registry,
+)
 
 
 class OraclePool:
@@ -18,10 +23,15 @@ class OraclePool:
 
     Implementa o padrao Singleton para garantir uma unica instancia do pool.
     Suporta health checks e graceful shutdown.
+
+    Queries registradas no QueryRegistry usam a configuracao de fetch
+    registrada (arraysize, prefetchrows, output type handler) e tem os
+    tempos de prepare/execute/fetch contabilizados.
     """
 
     _instance: OraclePool | None = None
     _pool: oracledb.AsyncConnectionPool | None = None
+    registry: QueryRegistry = query_registry
 
     def __new__(cls) -> OraclePool:
         if cls._instance is None:
@@ -47,6 +57,7 @@ class OraclePool:
                 max=settings.pool_max,
                 increment=settings.pool_increment,
                 timeout=settings.pool_timeout,
+                stmtcachesize=settings.pool_stmt_cache_size,
             )
         except Exception as e:
             raise DatabaseConnectionError(e, "RADAR") from e
@@ -96,17 +107,100 @@ class OraclePool:
             DatabaseQueryError: Se falhar ao executar query
         """
         async with self.connection() as conn:
-            try:
-                cursor = await conn.cursor()
-                await cursor.execute(sql, params or {})
+            columns, rows = await self._fetch(conn, sql, params)
+            return [dict(zip(columns, row)) for row in rows]
+
+    async def execute_rows(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """
+        Executa uma query e retorna as linhas sem converter para dict.
+
+        Linhas sao tuplas na ordem do SELECT, ou namedtuples se a query
+        foi registrada com row_type="namedtuple".
+
+        Args:
+            sql: Query SQL
+            params: Parametros bind
+
+        Returns:
+            Lista de linhas
+
+        Raises:
+            DatabaseQueryError: Se falhar ao executar query
+        """
+        async with self.connection() as conn:
+            _, rows = await self._fetch(conn, sql, params, use_row_class=True)
+            return rows
+
+    async def stream(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Executa uma query e entrega as linhas em lotes (fetchmany).
+
+        A conexao fica ocupada ate o fim da iteracao: consuma o stream
+        ate o fim ou feche-o (contextlib.aclosing) ao interromper.
+
+        Args:
+            sql: Query SQL
+            params: Parametros bind
+            batch_size: Linhas por lote (padrao: arraysize registrado)
 
-                columns = [col[0].lower() for col in cursor.description or []]
-                rows = await cursor.fetchall()
+        Yields:
+            Lotes de linhas (tuplas ou namedtuples, como em execute_rows)
 
-                return [dict(zip(columns, row)) for row in rows]
+        Raises:
+            DatabaseQueryError: Se falhar ao executar ou buscar linhas
+        """
+        async with self.connection() as conn:
+            start = time.perf_counter()
+            try:
+                cursor = self._cursor(conn, sql)
+                if batch_size is not None:
+                    cursor.arraysize = batch_size
+                cursor.prepare(sql)
+                prepared = time.perf_counter()
+                await cursor.execute(None, params or {})
+                executed = time.perf_counter()
+
+                columns = tuple(col[0].lower() for col in cursor.description or ())
+                row_class = self.registry.row_class(sql, columns)
+                if row_class is not None:
+                    cursor.rowfactory = row_class
             except Exception as e:
+                self.registry.record_error(sql)
                 raise DatabaseQueryError(e, sql) from e
 
+            fetch_ms = 0.0
+            total = 0
+            while True:
+                fetch_start = time.perf_counter()
+                try:
+                    rows = await cursor.fetchmany()
+                except Exception as e:
+                    self.registry.record_error(sql)
+                    raise DatabaseQueryError(e, sql) from e
+                fetch_ms += (time.perf_counter() - fetch_start) * 1000
+                if not rows:
+                    break
+                total += len(rows)
+                # Tempo do consumidor entre lotes nao entra no fetch_ms
+                yield rows
+
+            self.registry.record(
+                sql,
+                prepare_ms=(prepared - start) * 1000,
+                execute_ms=(executed - prepared) * 1000,
+                fetch_ms=fetch_ms,
+                rows=total,
+            )
+
     async def execute_one(
         self,
         sql: str,
@@ -125,6 +219,114 @@ class OraclePool:
         results = await self.execute(sql, params)
         return results[0] if results else None
 
+    async def execute_batch(
+        self,
+        statements: Sequence[tuple[str, dict[str, Any] | list[dict[str, Any]]]],
+    ) -> int:
+        """
+        Executa comandos DML em uma unica transacao.
+
+        Parametros em lista usam executemany (array binding): todas as
+        linhas vao ao banco em um unico round-trip.
+
+        Args:
+            statements: Pares (sql, params) ou (sql, lista de params)
+
+        Returns:
+            Total de linhas afetadas
+
+        Raises:
+            DatabaseQueryError: Se algum comando falhar (nada e gravado)
+        """
+        async with self.connection() as conn:
+            sql = ""
+            try:
+                cursor = conn.cursor()
+                affected = 0
+                for sql, params in statements:
+                    if isinstance(params, list):
+                        if not params:
+                            continue
+                        await cursor.executemany(sql, params)
+                    else:
+                        await cursor.execute(sql, params)
+                    affected += cursor.rowcount
+                await conn.commit()
+                return affected
+            except Exception as e:
+                await conn.rollback()
+                raise DatabaseQueryError(e, sql) from e
+
+    async def executemany(self, sql: str, rows: list[dict[str, Any]]) -> int:
+        """
+        Executa um comando DML para varias linhas (array binding).
+
+        Args:
+            sql: Comando SQL
+            rows: Parametros bind de cada linha
+
+        Returns:
+            Total de linhas afetadas
+        """
+        return await self.execute_batch([(sql, rows)])
+
+    async def _fetch(
+        self,
+        conn: oracledb.AsyncConnection,
+        sql: str,
+        params: dict[str, Any] | None,
+        use_row_class: bool = False,
+    ) -> tuple[tuple[str, ...], list[Any]]:
+        """
+        Executa a query aplicando a configuracao registrada.
+
+        Returns:
+            Tupla (nomes das colunas em minusculo, linhas)
+
+        Raises:
+            DatabaseQueryError: Se falhar ao executar query
+        """
+        try:
+            cursor = self._cursor(conn, sql)
+
+            start = time.perf_counter()
+            cursor.prepare(sql)
+            prepared = time.perf_counter()
+            await cursor.execute(None, params or {})
+            executed = time.perf_counter()
+
+            columns = tuple(col[0].lower() for col in cursor.description or ())
+            if use_row_class:
+                row_class = self.registry.row_class(sql, columns)
+                if row_class is not None:
+                    cursor.rowfactory = row_class
+            rows = await cursor.fetchall()
+            fetched = time.perf_counter()
+        except Exception as e:
+            self.registry.record_error(sql)
+            raise DatabaseQueryError(e, sql) from e
+
+        self.registry.record(
+            sql,
+            prepare_ms=(prepared - start) * 1000,
+            execute_ms=(executed - prepared) * 1000,
+            fetch_ms=(fetched - executed) * 1000,
+            rows=len(rows),
+        )
+        return columns, rows
+
+    def _cursor(self, conn: oracledb.AsyncConnection, sql: str) -> oracledb.AsyncCursor:
+        """Cria o cursor com a configuracao de fetch registrada para o SQL."""
+        cursor = conn.cursor()
+        query = self.registry.lookup(sql)
+        if query is not None:
+            cursor.arraysize = query.arraysize
+            if query.prefetchrows is not None:
+                cursor.prefetchrows = query.prefetchrows
+            if query.output_type_handler is not None:
+                cursor.outputtypehandler = query.output_type_handler
+        return cursor
+
     async def health_check(self) -> dict[str, Any]:
         """
         Verifica se o pool esta saudavel.
@@ -132,8 +334,6 @@ class OraclePool:
         Returns:
             Dicionario com status e latencia
         """
-        import time
-
         start = time.perf_counter()
         try:
             await self.execute("SELECT 1 FROM DUAL")
@@ -0,0 +1,222 @@
+"""Registro de queries preparadas do OraclePool.
+
+Cada query nomeada e registrada uma unica vez (no import do
+repositorio) com a configuracao de fetch adequada ao seu volume:
+
+- arraysize / prefetchrows: linhas por round-trip no DBLink
+- output_type_handler: conversao de tipos no driver
+- row_type: formato das linhas em OraclePool.execute_rows()
+
+O pool consulta o registro pelo texto SQL (hash ja cacheado na str),
+entao os repositorios continuam chamando execute(sql, params). Cada
+execucao registra os tempos de prepare, execute e fetch da query.
+
+Timings:
+- prepare_ms: cursor.prepare() (cache de statements do cliente)
+- execute_ms: round-trip do execute (parse no servidor + execucao +
+  primeiras prefetchrows linhas)
+- fetch_ms: round-trips restantes ate esvaziar o cursor
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+RowType = Literal["tuple", "namedtuple"]
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedQuery:
+    """
+    Query nomeada com configuracao de fetch.
+
+    Attributes:
+        name: Nome da query (usado nas estatisticas)
+        sql: Texto SQL
+        arraysize: Linhas buscadas por round-trip no fetch
+        prefetchrows: Linhas trazidas junto com o execute (None = padrao)
+        row_type: Formato das linhas em execute_rows()
+        output_type_handler: Handler de tipos do oracledb (opcional)
+    """
+
+    name: str
+    sql: str
+    arraysize: int = 100
+    prefetchrows: int | None = None
+    row_type: RowType = "tuple"
+    output_type_handler: Callable[..., Any] | None = None
+
+
+@dataclass
+class QueryStats:
+    """Tempos acumulados de uma query."""
+
+    executions: int = 0
+    errors: int = 0
+    rows: int = 0
+    prepare_ms: float = 0.0
+    execute_ms: float = 0.0
+    fetch_ms: float = 0.0
+    last_execute_ms: float | None = None
+    last_fetch_ms: float | None = None
+
+    @property
+    def avg_execute_ms(self) -> float:
+        """Tempo medio de execute por execucao."""
+        return self.execute_ms / self.executions if self.executions else 0.0
+
+    @property
+    def avg_fetch_ms(self) -> float:
+        """Tempo medio de fetch por execucao."""
+        return self.fetch_ms / self.executions if self.executions else 0.0
+
+
+@dataclass
+class _Entry:
+    """Query registrada, com estatisticas e fabricas de linha."""
+
+    query: PreparedQuery
+    stats: QueryStats = field(default_factory=QueryStats)
+    row_classes: dict[tuple[str, ...], type] = field(default_factory=dict)
+
+
+class QueryRegistry:
+    """
+    Registro de queries preparadas.
+
+    Caracteristicas:
+    - Busca O(1) pelo texto SQL no caminho de execucao
+    - Fabrica de namedtuple criada uma vez por conjunto de colunas
+    - Estatisticas por query para localizar o tempo do round-trip
+    """
+
+    def __init__(self) -> None:
+        self._by_sql: dict[str, _Entry] = {}
+        self._by_name: dict[str, _Entry] = {}
+
+    def register(
+        self,
+        name: str,
+        sql: str,
+        *,
+        arraysize: int = 100,
+        prefetchrows: int | None = None,
+        row_type: RowType = "tuple",
+        output_type_handler: Callable[..., Any] | None = None,
+    ) -> str:
+        """
+        Registra uma query nomeada.
+
+        Args:
+            name: Nome unico da query
+            sql: Texto SQL
+            arraysize: Linhas por round-trip no fetch
+            prefetchrows: Linhas trazidas junto com o execute
+            row_type: Formato das linhas em execute_rows()
+            output_type_handler: Handler de tipos do oracledb
+
+        Returns:
+            O proprio texto SQL (para uso como constante do repositorio)
+
+        Raises:
+            ValueError: Se o nome ja estiver registrado com outro SQL
+        """
+        existing = self._by_name.get(name)
+        if existing is not None:
+            if existing.query.sql != sql:
+                raise ValueError(f"Query ja registrada com outro SQL: {name}")
+            return existing.query.sql
+
+        entry = _Entry(
+            PreparedQuery(
+                name=name,
+                sql=sql,
+                arraysize=arraysize,
+                prefetchrows=prefetchrows,
+                row_type=row_type,
+                output_type_handler=output_type_handler,
+            )
+        )
+        self._by_name[name] = entry
+        self._by_sql[sql] = entry
+        return sql
+
+    def lookup(self, sql: str) -> PreparedQuery | None:
+        """Retorna a query registrada para o SQL (None se nao registrada)."""
+        entry = self._by_sql.get(sql)
+        return entry.query if entry is not None else None
+
+    def get(self, name: str) -> PreparedQuery | None:
+        """Retorna a query registrada pelo nome."""
+        entry = self._by_name.get(name)
+        return entry.query if entry is not None else None
+
+    def row_class(self, sql: str, columns: tuple[str, ...]) -> type | None:
+        """
+        Classe de linha (namedtuple) da query, criada uma vez.
+
+        Args:
+            sql: Texto SQL registrado
+            columns: Nomes das colunas (minusculos)
+
+        Returns:
+            namedtuple para row_type="namedtuple", senao None
+        """
+        entry = self._by_sql.get(sql)
+        if entry is None or entry.query.row_type != "namedtuple":
+            return None
+
+        row_class = entry.row_classes.get(columns)
+        if row_class is None:
+            row_class = namedtuple(  # type: ignore[misc]
+                f"{entry.query.name.title().replace('_', '')}Row",
+                columns,
+                rename=True,
+            )
+            entry.row_classes[columns] = row_class
+        return row_class
+
+    def record(
+        self,
+        sql: str,
+        *,
+        prepare_ms: float,
+        execute_ms: float,
+        fetch_ms: float,
+        rows: int,
+    ) -> None:
+        """Registra os tempos de uma execucao bem-sucedida."""
+        entry = self._by_sql.get(sql)
+        if entry is None:
+            return
+
+        stats = entry.stats
+        stats.executions += 1
+        stats.rows += rows
+        stats.prepare_ms += prepare_ms
+        stats.execute_ms += execute_ms
+        stats.fetch_ms += fetch_ms
+        stats.last_execute_ms = execute_ms
+        stats.last_fetch_ms = fetch_ms
+
+    def record_error(self, sql: str) -> None:
+        """Registra uma execucao com erro."""
+        entry = self._by_sql.get(sql)
+        if entry is not None:
+            entry.stats.errors += 1
+
+    def get_stats(self) -> dict[str, QueryStats]:
+        """Retorna as estatisticas por nome de query."""
+        return {name: entry.stats for name, entry in self._by_name.items()}
+
+    def reset_stats(self) -> None:
+        """Zera as estatisticas (mantem as queries registradas)."""
+        for entry in self._by_name.values():
+            entry.stats = QueryStats()
+
+
+# Instancia singleton
+query_registry = QueryRegistry()
@@ -1,5 +1,33 @@
 """Modulo HTTP."""
 
-from backend.shared.infrastructure.http.aneel_response import AneelResponseBuilder
+from backend.shared.infrastructure.http.aneel_response import (
+    NDJSON_MEDIA_TYPE,
+    AneelResponseBuilder,
+)
+from backend.shared.infrastructure.http.conditional import (
+    format_http_date,
+    is_not_modified,
+    not_modified_response,
+)
+from backend.shared.infrastructure.http.encoded_body import EncodedBody
+from backend.shared.infrastructure.http.rate_limiter import (
+    RateLimitDecision,
+    RateLimiter,
+    SharedRateLimiter,
+    SlidingLogRateLimiter,
+    create_rate_limiter,
+)
 
-__all__ = ["AneelResponseBuilder"]
+__all__ = [
+    "NDJSON_MEDIA_TYPE",
+    "AneelResponseBuilder",
+    "EncodedBody",
+    "RateLimitDecision",
+    "RateLimiter",
+    "SharedRateLimiter",
+    "SlidingLogRateLimiter",
+    "create_rate_limiter",
+    "format_http_date",
+    "is_not_modified",
+    "not_modified_response",
+]
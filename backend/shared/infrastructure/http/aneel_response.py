@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from datetime import date, datetime
 from enum import IntEnum
 from typing import Any
 
 from pydantic import BaseModel
+from starlette.responses import StreamingResponse
+
+from backend.shared.infrastructure.logger import get_logger
+
+logger = get_logger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 
 class AneelStatusRequisicao(IntEnum):
@@ -123,3 +133,139 @@ class AneelResponseBuilder:
     def timeout(cls) -> dict[str, Any]:
         """Cria resposta de timeout."""
         return cls.error("Tempo limite de processamento excedido. Tente novamente.")
+
+    @classmethod
+    async def stream_json(
+        cls,
+        batches: AsyncIterable[Iterable[Any]],
+        message: str = "",
+        email: str | None = None,
+        key: str = "interrupcaoFornecimento",
+    ) -> AsyncIterator[bytes]:
+        """
+        Gera a resposta de sucesso ANEEL em partes.
+
+        Envia o cabecalho do envelope, os itens de cada lote assim que
+        chegam e, por fim, fecha a lista e o objeto. A memoria usada e a
+        de um lote, independente do total de itens.
+
+        Como o status 200 ja foi enviado, uma falha no meio do stream
+        interrompe o corpo (JSON incompleto) em vez de gerar um JSON
+        valido com dados parciais.
+
+        Args:
+            batches: Lotes de itens (dicts, modelos pydantic)
+            message: Mensagem opcional
+            email: Email de contato (usa padrao se None)
+            key: Nome da lista no envelope
+
+        Yields:
+            Partes do corpo JSON (UTF-8)
+        """
+        header = _dumps(cls.success({}, message, email))
+        yield header[:-1] + b',"' + key.encode() + b'":['
+
+        first = True
+        try:
+            async for batch in batches:
+                encoded = [_dumps(item) for item in batch]
+                if not encoded:
+                    continue
+                chunk = b",".join(encoded)
+                yield chunk if first else b"," + chunk
+                first = False
+        except Exception as e:
+            logger.error("Falha durante resposta em stream", error=str(e))
+            raise
+
+        yield b"]}"
+
+    @classmethod
+    async def stream_ndjson(
+        cls,
+        batches: AsyncIterable[Iterable[Any]],
+        message: str = "",
+        email: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Gera a resposta ANEEL em NDJSON (um objeto JSON por linha).
+
+        Primeira linha: envelope sem a lista (idcStatusRequisicao = 1).
+        Linhas seguintes: um item por linha. Se a consulta falhar no
+        meio, a ultima linha e um envelope de erro (idcStatusRequisicao
+        = 2), permitindo ao consumidor descartar o resultado parcial.
+
+        Args:
+            batches: Lotes de itens (dicts, modelos pydantic)
+            message: Mensagem opcional
+            email: Email de contato (usa padrao se None)
+
+        Yields:
+            Linhas NDJSON (UTF-8, terminadas em \\n)
+        """
+        yield _dumps(cls.success({}, message, email)) + b"\n"
+
+        try:
+            async for batch in batches:
+                lines = b"".join(_dumps(item) + b"\n" for item in batch)
+                if lines:
+                    yield lines
+        except Exception as e:
+            logger.error("Falha durante resposta em stream", error=str(e))
+            error = cls.internal_error()
+            del error["interrupcaoFornecimento"]
+            yield _dumps(error) + b"\n"
+
+    @classmethod
+    def streaming_response(
+        cls,
+        batches: AsyncIterable[Iterable[Any]],
+        ndjson: bool = False,
+        message: str = "",
+        email: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> StreamingResponse:
+        """
+        Cria a resposta HTTP em stream (chunked).
+
+        Args:
+            batches: Lotes de itens (ex.: repository.stream_ativas_detalhadas())
+            ndjson: True para application/x-ndjson, False para JSON ANEEL
+            message: Mensagem opcional
+            email: Email de contato
+            headers: Headers adicionais
+
+        Returns:
+            StreamingResponse com o corpo gerado sob demanda
+        """
+        if ndjson:
+            return StreamingResponse(
+                cls.stream_ndjson(batches, message, email),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=headers,
+            )
+        return StreamingResponse(
+            cls.stream_json(batches, message, email),
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+def _default(value: Any) -> Any:
+    """Serializa tipos nao nativos do JSON (datas e modelos pydantic)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Tipo nao serializavel: {type(value).__name__}")
+
+
+def _dumps(value: Any) -> bytes:
+    """JSON compacto em UTF-8 (mesmo formato do JSONResponse)."""
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
@@ -0,0 +1,80 @@
+"""Requisicoes condicionais (ETag / Last-Modified)."""
+
+from __future__ import annotations
+
+from email.utils import formatdate, parsedate_to_datetime
+
+from starlette.responses import Response
+
+
+def format_http_date(timestamp: float) -> str:
+    """
+    Formata um timestamp como data HTTP (IMF-fixdate).
+
+    Args:
+        timestamp: Epoch em segundos
+
+    Returns:
+        Data no formato "Sun, 06 Nov 1994 08:49:37 GMT"
+    """
+    return formatdate(timestamp, usegmt=True)
+
+
+def is_not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str | None,
+    last_modified: float | None,
+) -> bool:
+    """
+    Avalia os headers condicionais de um GET (RFC 9110).
+
+    If-None-Match tem precedencia: quando presente, If-Modified-Since
+    e ignorado. A comparacao de ETag e fraca (ignora o prefixo W/).
+
+    Args:
+        if_none_match: Header If-None-Match da requisicao
+        if_modified_since: Header If-Modified-Since da requisicao
+        etag: ETag da representacao atual
+        last_modified: Momento (epoch) da ultima alteracao
+
+    Returns:
+        True se o cliente ja possui a versao atual (responder 304)
+    """
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        current = _opaque_tag(etag)
+        return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
+
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+    # Datas HTTP tem resolucao de segundos
+    return int(last_modified) <= since
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    """
+    Cria uma resposta 304 sem corpo.
+
+    Args:
+        headers: Validadores e headers de cache (ETag, Last-Modified, Vary)
+
+    Returns:
+        Response 304
+    """
+    return Response(status_code=304, headers=headers)
+
+
+def _opaque_tag(tag: str) -> str:
+    """Remove espacos e o prefixo de ETag fraca."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
@@ -0,0 +1,146 @@
+"""Corpo de resposta JSON pre-serializado e pre-comprimido."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None  # type: ignore[assignment]
+
+
+# Abaixo deste tamanho a compressao nao compensa o custo do header
+MIN_COMPRESS_BYTES = 512
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedBody:
+    """
+    Corpo JSON codificado uma unica vez, com variantes comprimidas.
+
+    Gerado quando o dado muda (ex.: refresh do snapshot) e reutilizado
+    em todas as respostas: no caminho da requisicao resta apenas
+    escolher a variante pelo Accept-Encoding.
+
+    Attributes:
+        identity: JSON sem compressao
+        gzip: JSON comprimido com gzip (None se pequeno demais)
+        br: JSON comprimido com brotli (None se indisponivel ou pequeno)
+        etag: ETag fraca derivada do conteudo (igual para todas as variantes)
+    """
+
+    identity: bytes
+    gzip: bytes | None = None
+    br: bytes | None = None
+    etag: str | None = None
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> EncodedBody:
+        """
+        Serializa e comprime um payload JSON.
+
+        Usa o mesmo formato compacto do JSONResponse do Starlette.
+
+        Args:
+            payload: Objeto serializavel em JSON
+
+        Returns:
+            EncodedBody com as variantes disponiveis
+        """
+        identity = json.dumps(
+            payload,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        # Fraca: as variantes comprimidas compartilham a mesma ETag
+        etag = f'W/"{hashlib.blake2b(identity, digest_size=16).hexdigest()}"'
+
+        if len(identity) < MIN_COMPRESS_BYTES:
+            return cls(identity=identity, etag=etag)
+
+        return cls(
+            identity=identity,
+            gzip=gzip.compress(identity, compresslevel=6, mtime=0),
+            br=brotli.compress(identity) if brotli is not None else None,
+            etag=etag,
+        )
+
+    def select(self, accept_encoding: str | None) -> tuple[bytes, str | None]:
+        """
+        Escolhe a variante conforme o header Accept-Encoding.
+
+        Args:
+            accept_encoding: Valor do header (pode ser None)
+
+        Returns:
+            Tupla (bytes, content-encoding ou None para identity)
+        """
+        accepted = _parse_accept_encoding(accept_encoding)
+
+        if self.br is not None and "br" in accepted:
+            return self.br, "br"
+        if self.gzip is not None and "gzip" in accepted:
+            return self.gzip, "gzip"
+        return self.identity, None
+
+    def to_response(
+        self,
+        accept_encoding: str | None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """
+        Cria a resposta HTTP com a variante adequada.
+
+        Args:
+            accept_encoding: Valor do header Accept-Encoding
+            status_code: Codigo HTTP
+            headers: Headers adicionais
+
+        Returns:
+            Response com o corpo pronto, sem nova serializacao
+        """
+        content, encoding = self.select(accept_encoding)
+
+        response_headers = {"Vary": "Accept-Encoding", **(headers or {})}
+        if self.etag is not None:
+            response_headers.setdefault("ETag", self.etag)
+        if encoding is not None:
+            response_headers["Content-Encoding"] = encoding
+
+        return Response(
+            content=content,
+            status_code=status_code,
+            media_type="application/json",
+            headers=response_headers,
+        )
+
+
+def _parse_accept_encoding(header: str | None) -> frozenset[str]:
+    """Retorna as codificacoes aceitas (q > 0) do header."""
+    if not header:
+        return frozenset()
+
+    accepted: set[str] = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            accepted.add(name.lower())
+    return frozenset(accepted)
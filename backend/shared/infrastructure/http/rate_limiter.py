@@ -0,0 +1,419 @@
+"""Rate limiting por janela deslizante (sliding log).
+
+Cada cliente guarda no maximo `limit` instantes de requisicoes aceitas;
+a requisicao e aceita se menos de `limit` deles caem na janela. Ao
+contrario de uma janela fixa, nao permite rajadas de 2x o limite na
+virada do minuto.
+
+Dois backends:
+
+- SlidingLogRateLimiter: em memoria, por worker. Clientes ficam em um
+  OrderedDict ordenado pela ultima requisicao aceita; como todos tem o
+  mesmo TTL (a janela), os ociosos estao sempre no inicio e sao
+  despejados em O(1) amortizado. max_clients limita a memoria mesmo
+  sob inundacao de IPs distintos.
+- SharedRateLimiter: tabela de tamanho fixo em arquivo mapeado em
+  memoria (mmap) no diretorio do cache shared (privado e validado
+  como em SharedFileCache), protegida por flock.
+  Todos os workers da maquina veem os mesmos contadores, entao o
+  limite vale para o servico e nao por worker. Slots ociosos sao
+  reaproveitados; a memoria e fixa por construcao.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import math
+import mmap
+import os
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from backend.shared.infrastructure.cache.shared_cache import (
+    O_NOFOLLOW,
+    ensure_private_directory,
+)
+from backend.shared.infrastructure.config import Settings, get_settings
+from backend.shared.infrastructure.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows (sem multiplos workers)
+    fcntl = None  # type: ignore[assignment]
+
+# Ociosos despejados por requisicao (cada requisicao insere no maximo um)
+_EVICT_BATCH = 64
+
+_MAGIC = b"RRL1"
+_FILE_HEADER = struct.Struct("<4sIdI")
+# Slot: hash da chave (0 = livre) + posicao do mais antigo no anel
+_SLOT_HEADER = struct.Struct("<QI4x")
+# Slots examinados por chave (sondagem linear)
+_PROBES = 8
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    """Resultado de uma requisicao no rate limiter."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Estatisticas do rate limiter (contadores deste worker).
+
+    evictions conta clientes ainda ativos despejados por falta de
+    espaco; ociosos despejados nao entram na conta.
+    """
+
+    clients: int
+    allowed: int
+    rejected: int
+    evictions: int
+
+
+class RateLimiter(Protocol):
+    """Contrato dos backends de rate limiting."""
+
+    limit: int
+    window_seconds: float
+
+    def hit(self, key: str) -> RateLimitDecision:
+        """Registra a requisicao do cliente (se aceita) e decide."""
+        ...
+
+    def get_stats(self) -> RateLimiterStats:
+        """Retorna estatisticas do rate limiter."""
+        ...
+
+
+def _retry_after(oldest: float, window_seconds: float, now: float) -> int:
+    """Segundos ate o mais antigo sair da janela (minimo 1)."""
+    return max(1, math.ceil(oldest + window_seconds - now))
+
+
+class SlidingLogRateLimiter:
+    """
+    Rate limiter em memoria, por worker.
+
+    Nao e thread-safe; o middleware roda no event loop.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float,
+        max_clients: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_clients = max_clients
+        self._clock = clock
+        # Instantes aceitos em ordem crescente (lista: bem menor que deque)
+        self._clients: OrderedDict[str, list[float]] = OrderedDict()
+        self._allowed = 0
+        self._rejected = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def hit(self, key: str) -> RateLimitDecision:
+        """
+        Registra a requisicao do cliente e decide se e aceita.
+
+        Requisicoes rejeitadas nao consomem quota.
+
+        Args:
+            key: Identificador do cliente
+
+        Returns:
+            Decisao com a quota restante
+        """
+        now = self._clock()
+        cutoff = now - self.window_seconds
+        self._evict_idle(cutoff)
+
+        log = self._clients.get(key)
+        if log is None:
+            log = self._clients[key] = []
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+                self._evictions += 1
+        elif log[0] <= cutoff:
+            del log[: bisect.bisect_right(log, cutoff)]
+
+        if len(log) >= self.limit:
+            self._rejected += 1
+            return RateLimitDecision(
+                allowed=False,
+                limit=self.limit,
+                remaining=0,
+                retry_after=_retry_after(log[0], self.window_seconds, now),
+            )
+
+        log.append(now)
+        self._clients.move_to_end(key)
+        self._allowed += 1
+        return RateLimitDecision(
+            allowed=True,
+            limit=self.limit,
+            remaining=self.limit - len(log),
+            retry_after=0,
+        )
+
+    def get_stats(self) -> RateLimiterStats:
+        """Retorna estatisticas do rate limiter."""
+        return RateLimiterStats(
+            clients=len(self._clients),
+            allowed=self._allowed,
+            rejected=self._rejected,
+            evictions=self._evictions,
+        )
+
+    def _evict_idle(self, cutoff: float) -> None:
+        """Despeja clientes sem requisicao aceita na janela."""
+        clients = self._clients
+        for _ in range(_EVICT_BATCH):
+            if not clients:
+                return
+            key, log = clients.popitem(last=False)
+            if log and log[-1] > cutoff:
+                # Ativo: volta ao inicio (move_to_end com last=False)
+                clients[key] = log
+                clients.move_to_end(key, last=False)
+                return
+
+
+class SharedRateLimiter:
+    """
+    Rate limiter compartilhado entre os workers da maquina.
+
+    Tabela hash de `slots` posicoes em um arquivo mapeado em memoria.
+    Cada slot guarda o hash de 64 bits da chave e um anel com os
+    ultimos `limit` instantes aceitos. Um cliente sonda ate _PROBES
+    slots; na falta de slot livre ou ocioso, o menos recente e
+    reaproveitado (contado em evictions).
+
+    O arquivo e recriado se limit, janela ou numero de slots mudarem.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        limit: int,
+        window_seconds: float,
+        slots: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self._clock = clock
+        self._ring = struct.Struct(f"<{limit}d")
+        self._slot_size = _SLOT_HEADER.size + self._ring.size
+        self._allowed = 0
+        self._rejected = 0
+        self._evictions = 0
+        self.logger = get_logger("http.rate_limiter")
+
+        self._path = Path(path)
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT | O_NOFOLLOW, 0o600)
+        if hasattr(os, "getuid") and os.fstat(self._fd).st_uid != os.getuid():
+            os.close(self._fd)
+            raise PermissionError(f"Tabela de rate limit de outro usuario: {self._path}")
+        size = _FILE_HEADER.size + slots * self._slot_size
+        with self._locked():
+            self._ensure_layout(size)
+        self._mm = mmap.mmap(self._fd, size)
+
+    def hit(self, key: str) -> RateLimitDecision:
+        """
+        Registra a requisicao do cliente e decide se e aceita.
+
+        Args:
+            key: Identificador do cliente
+
+        Returns:
+            Decisao com a quota restante
+        """
+        key_hash = self._hash(key)
+        with self._locked():
+            now = self._clock()
+            cutoff = now - self.window_seconds
+            offset = self._find_slot(key_hash, cutoff)
+
+            head = _SLOT_HEADER.unpack_from(self._mm, offset)[1]
+            ring_offset = offset + _SLOT_HEADER.size
+            ring = self._ring.unpack_from(self._mm, ring_offset)
+
+            # Anel cronologico a partir de head: ring[head] e o mais antigo
+            oldest = ring[head]
+            if oldest > cutoff:
+                self._rejected += 1
+                return RateLimitDecision(
+                    allowed=False,
+                    limit=self.limit,
+                    remaining=0,
+                    retry_after=_retry_after(oldest, self.window_seconds, now),
+                )
+
+            struct.pack_into("<d", self._mm, ring_offset + head * 8, now)
+            _SLOT_HEADER.pack_into(self._mm, offset, key_hash, (head + 1) % self.limit)
+
+        self._allowed += 1
+        in_window = 1 + sum(1 for i, ts in enumerate(ring) if i != head and ts > cutoff)
+        return RateLimitDecision(
+            allowed=True,
+            limit=self.limit,
+            remaining=self.limit - in_window,
+            retry_after=0,
+        )
+
+    def get_stats(self) -> RateLimiterStats:
+        """Retorna estatisticas (clients conta slots ativos na janela)."""
+        cutoff = self._clock() - self.window_seconds
+        clients = 0
+        for slot in range(self.slots):
+            offset = _FILE_HEADER.size + slot * self._slot_size
+            key_hash, head = _SLOT_HEADER.unpack_from(self._mm, offset)
+            if key_hash and self._newest(offset, head) > cutoff:
+                clients += 1
+        return RateLimiterStats(
+            clients=clients,
+            allowed=self._allowed,
+            rejected=self._rejected,
+            evictions=self._evictions,
+        )
+
+    def close(self) -> None:
+        """Libera o mapeamento e o descritor."""
+        self._mm.close()
+        os.close(self._fd)
+
+    def _find_slot(self, key_hash: int, cutoff: float) -> int:
+        """Offset do slot da chave (reaproveitando um livre/ocioso se nova)."""
+        start = key_hash % self.slots
+        reusable: int | None = None
+        victim: int | None = None
+        victim_newest: float | None = None
+
+        for probe in range(_PROBES):
+            offset = _FILE_HEADER.size + ((start + probe) % self.slots) * self._slot_size
+            slot_hash, head = _SLOT_HEADER.unpack_from(self._mm, offset)
+            if slot_hash == key_hash:
+                return offset
+            if reusable is not None:
+                continue
+            if slot_hash == 0:
+                reusable = offset
+                continue
+            newest = self._newest(offset, head)
+            if newest <= cutoff:
+                reusable = offset
+            elif victim_newest is None or newest < victim_newest:
+                victim, victim_newest = offset, newest
+
+        if reusable is None:
+            assert victim is not None
+            reusable = victim
+            self._evictions += 1
+
+        _SLOT_HEADER.pack_into(self._mm, reusable, key_hash, 0)
+        self._ring.pack_into(self._mm, reusable + _SLOT_HEADER.size, *([0.0] * self.limit))
+        return reusable
+
+    def _newest(self, offset: int, head: int) -> float:
+        """Instante aceito mais recente do slot."""
+        newest_index = (head - 1) % self.limit
+        return struct.unpack_from(
+            "<d", self._mm, offset + _SLOT_HEADER.size + newest_index * 8
+        )[0]
+
+    def _ensure_layout(self, size: int) -> None:
+        """Cria (ou recria) o arquivo se o layout nao confere."""
+        header = os.pread(self._fd, _FILE_HEADER.size, 0)
+        expected = _FILE_HEADER.pack(_MAGIC, self.limit, self.window_seconds, self.slots)
+        if header == expected and os.fstat(self._fd).st_size == size:
+            return
+
+        os.ftruncate(self._fd, 0)
+        os.ftruncate(self._fd, size)
+        os.pwrite(self._fd, expected, 0)
+        self.logger.info(
+            "Tabela de rate limit inicializada",
+            path=str(self._path),
+            slots=self.slots,
+            bytes=size,
+        )
+
+    def _locked(self) -> _FileLock:
+        """Lock exclusivo do arquivo (entre processos)."""
+        return _FileLock(self._fd)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        """Hash de 64 bits da chave (0 reservado para slot livre)."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
+
+
+class _FileLock:
+    """flock exclusivo como context manager."""
+
+    __slots__ = ("_fd",)
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    def __enter__(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc: object) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+def create_rate_limiter(
+    limit: int,
+    window_seconds: float,
+    settings: Settings | None = None,
+) -> RateLimiter:
+    """
+    Cria o rate limiter do backend configurado (rate_limit_backend).
+
+    Args:
+        limit: Requisicoes aceitas por janela
+        window_seconds: Tamanho da janela em segundos
+        settings: Configuracoes (padrao: get_settings())
+
+    Returns:
+        Rate limiter em memoria (por worker) ou compartilhado
+    """
+    settings = settings or get_settings()
+    if settings.rate_limit_backend == "shared":
+        directory = ensure_private_directory(settings.cache_shared_path)
+        return SharedRateLimiter(
+            directory / "rate_limit.table",
+            limit=limit,
+            window_seconds=window_seconds,
+            slots=settings.rate_limit_max_clients,
+        )
+    return SlidingLogRateLimiter(
+        limit=limit,
+        window_seconds=window_seconds,
+        max_clients=settings.rate_limit_max_clients,
+    )
@@ -4,6 +4,11 @@ from backend.shared.infrastructure.logging.audit import (
     AuditLogger,
     get_audit_logger,
 )
+from backend.shared.infrastructure.logging.audit_sink import (
+    AuditRecord,
+    AuditSink,
+    get_audit_sink,
+)
 from backend.shared.infrastructure.logging.logger import (
     configure_logging,
     get_logger,
@@ -12,8 +17,11 @@ from backend.shared.infrastructure.logging.logger import (
 
 __all__ = [
     "AuditLogger",
+    "AuditRecord",
+    "AuditSink",
     "configure_logging",
     "get_audit_logger",
+    "get_audit_sink",
     "get_logger",
     "setup_logging",
 ]
@@ -188,11 +188,24 @@ class AuditLogger:
         Returns:
             API Key mascarada (primeiros 8 chars + ...)
         """
-        if not api_key:
-            return "none"
-        if len(api_key) <= 8:
-            return "***"
-        return api_key[:8] + "..."
+        return mask_api_key(api_key)
+
+
+def mask_api_key(api_key: str | None) -> str:
+    """
+    Mascara API Key para log/auditoria.
+
+    Args:
+        api_key: API Key original
+
+    Returns:
+        API Key mascarada (primeiros 8 chars + ...)
+    """
+    if not api_key:
+        return "none"
+    if len(api_key) <= 8:
+        return "***"
+    return api_key[:8] + "..."
 
 
 # Singleton
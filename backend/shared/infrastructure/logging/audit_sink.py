@@ -0,0 +1,281 @@
+"""Gravacao assincrona em lote da auditoria de requisicoes - RAD-124.
+
+O caminho da requisicao apenas enfileira um AuditRecord (sem I/O); um
+writer em background grava os registros na tabela CONSULTA com
+executemany (array binding) a cada batch_size registros ou
+flush_interval_ms, o que vier primeiro.
+
+A fila e limitada: se o banco ficar lento ou indisponivel e a fila
+encher, novos registros sao descartados (contador dropped) em vez de
+segurar a requisicao ou crescer a memoria.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from uuid import uuid4
+
+from backend.shared.domain.clock import agora_brasilia
+from backend.shared.infrastructure.config import get_settings
+from backend.shared.infrastructure.database.oracle_pool import OraclePool, oracle_pool
+from backend.shared.infrastructure.logger import get_logger
+from backend.shared.infrastructure.logging.audit import mask_api_key
+
+INSERT_CONSULTA = """
+    INSERT INTO RADAR_API.CONSULTA (
+        ID, ID_TIPO_CONSULTA, DATA_BRASILIA, DATA_INICIO, DATA_FIM,
+        PARAMETROS, IP_ORIGEM, STATUS, MENSAGEM_ERRO
+    ) VALUES (
+        :id, :tipo, :data_brasilia, :data_inicio, :data_fim,
+        :parametros, :ip_origem, :status, :mensagem_erro
+    )
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class AuditRecord:
+    """Linha de auditoria de uma requisicao (tabela CONSULTA)."""
+
+    id: str
+    tipo_consulta: int
+    data_inicio: datetime
+    data_fim: datetime
+    parametros: str
+    ip_origem: str
+    status: str
+    mensagem_erro: str | None = None
+
+    @classmethod
+    def from_request(
+        cls,
+        request_id: str,
+        tipo_consulta: int,
+        inicio: datetime,
+        duration_ms: float,
+        client_ip: str,
+        api_key: str | None,
+        method: str,
+        path: str,
+        query: str,
+        status_code: int,
+        error: str | None = None,
+    ) -> AuditRecord:
+        """
+        Monta o registro de uma requisicao concluida.
+
+        Args:
+            request_id: ID de correlacao (X-Request-ID)
+            tipo_consulta: ID em TIPO_CONSULTA
+            inicio: Inicio da requisicao (horario de Brasilia)
+            duration_ms: Duracao da requisicao
+            client_ip: IP do cliente
+            api_key: API Key (sera mascarada)
+            method: Metodo HTTP
+            path: Path da requisicao
+            query: Query string
+            status_code: Status HTTP enviado
+            error: Mensagem da excecao, se houver
+
+        Returns:
+            Registro pronto para enfileirar
+        """
+        parametros = {
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "query": query,
+            "status_code": status_code,
+            "api_key_prefix": mask_api_key(api_key),
+        }
+        failed = error is not None or status_code >= 400
+        return cls(
+            id=str(uuid4()),
+            tipo_consulta=tipo_consulta,
+            data_inicio=inicio,
+            data_fim=inicio + timedelta(milliseconds=duration_ms),
+            parametros=json.dumps(parametros, separators=(",", ":")),
+            ip_origem=client_ip,
+            status="ERRO" if failed else "SUCESSO",
+            mensagem_erro=(error or f"HTTP {status_code}") if failed else None,
+        )
+
+    def to_bind(self) -> dict[str, object]:
+        """Parametros bind do INSERT."""
+        return {
+            "id": self.id,
+            "tipo": self.tipo_consulta,
+            "data_brasilia": self.data_inicio,
+            "data_inicio": self.data_inicio,
+            "data_fim": self.data_fim,
+            "parametros": self.parametros,
+            "ip_origem": self.ip_origem[:50],
+            "status": self.status,
+            "mensagem_erro": self.mensagem_erro,
+        }
+
+
+@dataclass
+class AuditSinkStats:
+    """Estatisticas do writer de auditoria."""
+
+    enqueued: int
+    written: int
+    dropped: int
+    failed_batches: int
+    batches: int
+    queue_size: int
+
+
+class AuditSink:
+    """
+    Fila limitada + writer em background para a tabela CONSULTA.
+
+    Caracteristicas:
+    - enqueue() e sincrono e O(1): nunca aguarda o banco
+    - Lotes de ate batch_size registros, gravados no maximo a cada
+      flush_interval_ms (ou antes, se o lote encher)
+    - Fila cheia descarta o registro novo (dropped); lote que falha ao
+      gravar tambem conta em dropped (sem retentativa)
+    - stop() grava o que restou na fila
+    """
+
+    def __init__(
+        self,
+        pool: OraclePool,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 1000,
+    ) -> None:
+        self.pool = pool
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._buffer: deque[AuditRecord] = deque()
+        self._has_data = asyncio.Event()
+        self._batch_ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._dropped_reported = 0
+        self._failed_batches = 0
+        self._batches = 0
+        self.logger = get_logger("audit.sink")
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def enqueue(self, record: AuditRecord) -> bool:
+        """
+        Enfileira um registro para gravacao.
+
+        Args:
+            record: Registro de auditoria
+
+        Returns:
+            False se a fila estava cheia (registro descartado)
+        """
+        if len(self._buffer) >= self.max_queue:
+            self._dropped += 1
+            return False
+
+        self._buffer.append(record)
+        self._enqueued += 1
+        if len(self._buffer) >= self.batch_size:
+            self._batch_ready.set()
+        self._has_data.set()
+        return True
+
+    async def start(self) -> None:
+        """Inicia o writer em background."""
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._run(), name="audit-sink")
+            self.logger.info(
+                "Writer de auditoria iniciado",
+                batch_size=self.batch_size,
+                flush_interval_ms=int(self.flush_interval * 1000),
+            )
+
+    async def stop(self) -> None:
+        """Para o writer e grava os registros pendentes."""
+        if self._task is not None:
+            # Acorda o writer sem cancelar um lote em gravacao
+            self._closing = True
+            self._has_data.set()
+            self._batch_ready.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Grava todos os registros enfileirados, em lotes."""
+        self._batch_ready.clear()
+        while self._buffer:
+            count = min(self.batch_size, len(self._buffer))
+            await self._write([self._buffer.popleft() for _ in range(count)])
+        self._has_data.clear()
+
+        if self._dropped > self._dropped_reported:
+            self.logger.warning(
+                "Registros de auditoria descartados",
+                dropped=self._dropped - self._dropped_reported,
+                total_dropped=self._dropped,
+            )
+            self._dropped_reported = self._dropped
+
+    def get_stats(self) -> AuditSinkStats:
+        """Retorna estatisticas do writer."""
+        return AuditSinkStats(
+            enqueued=self._enqueued,
+            written=self._written,
+            dropped=self._dropped,
+            failed_batches=self._failed_batches,
+            batches=self._batches,
+            queue_size=len(self._buffer),
+        )
+
+    async def _run(self) -> None:
+        """Loop do writer: espera dados, completa o lote ou o intervalo, grava."""
+        while not self._closing:
+            await self._has_data.wait()
+            if len(self._buffer) < self.batch_size and not self._closing:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+            await self.flush()
+
+    async def _write(self, batch: list[AuditRecord]) -> None:
+        """Grava um lote com array binding (falha nao interrompe o writer)."""
+        try:
+            await self.pool.executemany(INSERT_CONSULTA, [record.to_bind() for record in batch])
+        except Exception as e:
+            self._failed_batches += 1
+            self._dropped += len(batch)
+            self.logger.warning(
+                "Falha ao gravar lote de auditoria",
+                error=str(e),
+                records=len(batch),
+            )
+            return
+
+        self._batches += 1
+        self._written += len(batch)
+
+
+@lru_cache
+def get_audit_sink() -> AuditSink:
+    """Retorna a instancia (por processo) do writer de auditoria."""
+    settings = get_settings()
+    return AuditSink(
+        oracle_pool,
+        max_queue=settings.audit_queue_max,
+        batch_size=settings.audit_batch_size,
+        flush_interval_ms=settings.audit_flush_interval_ms,
+    )
@@ -0,0 +1 @@
+# Benchmarks (executados manualmente, fora do pytest)
@@ -0,0 +1,110 @@
+"""Benchmark do repositorio de interrupcoes sob concorrencia.
+
+Compara 200 chamadores simultaneos de buscar_ativas() em:
+- caminho antigo: OracleInterrupcaoRepository (Session sincrona) via
+  run_in_executor, limitado ao ThreadPoolExecutor de 10 threads
+- caminho novo: AsyncOracleInterrupcaoRepository sobre um pool
+  assincrono com POOL_MAX conexoes
+
+O banco e simulado com latencia fixa por query (time.sleep no caminho
+sincrono, asyncio.sleep no assincrono), isolando o efeito do modelo de
+concorrencia.
+
+Uso:
+    python -m backend.tests.benchmarks.bench_async_repository
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+os.environ.setdefault("PRD_RADAR_API_KEY", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_USER", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_PASSWORD", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_DSN", "localhost:1521/XE")
+
+from backend.shared.infrastructure.database.oracle_connection import (  # noqa: E402
+    run_in_executor,
+)
+
+from backend.apps.api_interrupcoes.repositories.async_oracle_interrupcao_repository import (  # noqa: E402
+    AsyncOracleInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (  # noqa: E402
+    OracleInterrupcaoRepository,
+)
+
+CALLERS = 200
+POOL_MAX = 50
+LATENCY_SECONDS = 0.02
+ROWS = [
+    {
+        "id": i,
+        "ucs_afetadas": 100 + i,
+        "plan_id": 999 if i % 3 == 0 else None,
+        "conjunto": i % 50 + 1,
+        "codigo_ibge": 1400100,
+        "data_inicio": datetime(2026, 1, 10, 10, 0),
+        "data_fim": None,
+    }
+    for i in range(1, 101)
+]
+
+
+class _SlowSession:
+    """Session sincrona com latencia de rede simulada."""
+
+    def execute(self, query: Any, params: dict[str, Any]) -> SimpleNamespace:
+        time.sleep(LATENCY_SECONDS)
+        rows = [SimpleNamespace(**row) for row in ROWS]
+        return SimpleNamespace(fetchall=lambda: rows)
+
+
+class _SlowPool:
+    """Pool assincrono com POOL_MAX conexoes e latencia simulada."""
+
+    def __init__(self) -> None:
+        self._slots = asyncio.Semaphore(POOL_MAX)
+
+    async def execute_rows(
+        self, sql: str, params: dict[str, Any]
+    ) -> list[tuple[Any, ...]]:
+        async with self._slots:
+            await asyncio.sleep(LATENCY_SECONDS)
+            return [tuple(row.values()) for row in ROWS]
+
+
+async def bench_thread_pool() -> float:
+    """Segundos para atender CALLERS chamadas no caminho com threads."""
+    repository = OracleInterrupcaoRepository(_SlowSession())  # type: ignore[arg-type]
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(run_in_executor(repository.buscar_ativas) for _ in range(CALLERS))
+    )
+    return time.perf_counter() - start
+
+
+async def bench_async_pool() -> float:
+    """Segundos para atender CALLERS chamadas no caminho assincrono."""
+    repository = AsyncOracleInterrupcaoRepository(_SlowPool())  # type: ignore[arg-type]
+    start = time.perf_counter()
+    await asyncio.gather(*(repository.buscar_ativas() for _ in range(CALLERS)))
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    thread_s = await bench_thread_pool()
+    async_s = await bench_async_pool()
+    print(f"{CALLERS} chamadores, latencia {LATENCY_SECONDS * 1000:.0f} ms, {len(ROWS)} linhas")
+    print(f"thread pool (10 threads): {thread_s * 1000:8.1f} ms")
+    print(f"pool async ({POOL_MAX} conexoes):  {async_s * 1000:8.1f} ms")
+    print(f"ganho: {thread_s / async_s:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
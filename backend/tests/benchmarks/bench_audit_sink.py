@@ -0,0 +1,124 @@
+"""Benchmark da auditoria em lote contra o INSERT por requisicao.
+
+Inline: cada requisicao aguarda um INSERT em CONSULTA (um round-trip).
+Sink: a requisicao apenas enfileira; o writer grava com executemany.
+
+O banco e simulado com latencia fixa por round-trip mais um custo
+pequeno por linha, entao a diferenca medida e a latencia somada ao
+caminho da requisicao e o numero de round-trips.
+
+Uso:
+    python -m backend.tests.benchmarks.bench_audit_sink
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import time
+from typing import Any
+
+os.environ.setdefault("PRD_RADAR_API_KEY", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_USER", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_PASSWORD", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_DSN", "localhost:1521/XE")
+
+from backend.shared.domain.clock import agora_brasilia  # noqa: E402
+from backend.shared.infrastructure.logger import configure_logging  # noqa: E402
+from backend.shared.infrastructure.logging.audit_sink import (  # noqa: E402
+    INSERT_CONSULTA,
+    AuditRecord,
+    AuditSink,
+)
+
+REQUESTS = 5_000
+CONCURRENCY = 50
+ROUND_TRIP_S = 0.002
+PER_ROW_S = 0.000005
+
+
+class FakePool:
+    """Pool simulado: latencia por round-trip + custo por linha."""
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.rows = 0
+
+    async def execute(self, sql: str, params: dict[str, Any]) -> int:
+        self.round_trips += 1
+        self.rows += 1
+        await asyncio.sleep(ROUND_TRIP_S + PER_ROW_S)
+        return 1
+
+    async def executemany(self, sql: str, rows: list[dict[str, Any]]) -> int:
+        self.round_trips += 1
+        self.rows += len(rows)
+        await asyncio.sleep(ROUND_TRIP_S + PER_ROW_S * len(rows))
+        return len(rows)
+
+
+def _record(n: int) -> AuditRecord:
+    return AuditRecord.from_request(
+        request_id=f"{n:08x}",
+        tipo_consulta=1,
+        inicio=agora_brasilia(),
+        duration_ms=1.0,
+        client_ip="10.0.0.1",
+        api_key="chave-de-bench",
+        method="GET",
+        path="/quantitativointerrupcoesativas",
+        query="",
+        status_code=200,
+    )
+
+
+async def _timed(coro: Any) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def bench(name: str, pool: FakePool, audit: Any) -> None:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for batch in range(0, REQUESTS, CONCURRENCY):
+        latencies += await asyncio.gather(
+            *(_timed(audit(batch + i)) for i in range(CONCURRENCY))
+        )
+    rps = REQUESTS / (time.perf_counter() - start)
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<8}{cuts[49] * 1e6:>10.1f}{cuts[98] * 1e6:>10.1f}"
+        f"{rps:>10.0f}{pool.round_trips:>8}{pool.rows:>8}"
+    )
+
+
+async def main() -> None:
+    configure_logging(level="ERROR")
+    print(f"{REQUESTS} requisicoes, {CONCURRENCY} concorrentes, round-trip {ROUND_TRIP_S * 1e3} ms")
+    print(f"{'modo':<8}{'p50 us':>10}{'p99 us':>10}{'req/s':>10}{'trips':>8}{'linhas':>8}")
+
+    inline_pool = FakePool()
+
+    async def inline(n: int) -> None:
+        await inline_pool.execute(INSERT_CONSULTA, _record(n).to_bind())
+
+    await bench("inline", inline_pool, inline)
+
+    sink_pool = FakePool()
+    sink = AuditSink(sink_pool, batch_size=500, flush_interval_ms=1000)  # type: ignore[arg-type]
+    await sink.start()
+
+    async def enqueue(n: int) -> None:
+        sink.enqueue(_record(n))
+
+    await bench("sink", sink_pool, enqueue)
+    await sink.stop()
+    stats = sink.get_stats()
+    print(f"sink: written={stats.written} dropped={stats.dropped} batches={stats.batches}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""Benchmark da agregacao colunar (NumPy) vs laco sobre entidades.
+
+Compara, para EVENTS eventos:
+- entidades: agregar() sobre objetos Interrupcao
+- colunar (python): agregar_colunar() sem numpy (fallback com dict)
+- colunar (numpy): agregar_colunar() com np.unique + bincount
+
+Uso:
+    python -m backend.tests.benchmarks.bench_columnar_aggregation
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from backend.shared.domain.entities.interrupcao import Interrupcao
+from backend.shared.domain.services import interrupcao_aggregator
+from backend.shared.domain.services.interrupcao_aggregator import (
+    InterrupcaoAggregatorService,
+)
+from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
+from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
+
+EVENTS = (10_000, 100_000, 1_000_000)
+IBGE_CODES = (1400050, 1400100, 1400159, 1400209, 1400233, 1400282)
+INICIO = datetime(2026, 1, 10, 10, 0)
+
+
+def _medir(func: Callable[[], Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    service = InterrupcaoAggregatorService()
+    numpy_module = interrupcao_aggregator.np
+    ibges_vo = [CodigoIBGE.create_unsafe(code) for code in IBGE_CODES]
+
+    print(f"{'eventos':>10}{'entidades (ms)':>16}{'colunar py (ms)':>17}{'colunar np (ms)':>17}")
+    for total in EVENTS:
+        rounds = max(1, 100_000 // total)
+        conjuntos = [i % 200 + 1 for i in range(total)]
+        ibges = [IBGE_CODES[i % len(IBGE_CODES)] for i in range(total)]
+        ucs = [1 + i % 500 for i in range(total)]
+        programadas = [i % 4 == 0 for i in range(total)]
+        entidades = [
+            Interrupcao(
+                id=i,
+                tipo=TipoInterrupcao.PROGRAMADA if programadas[i] else TipoInterrupcao.NAO_PROGRAMADA,
+                municipio=ibges_vo[i % len(IBGE_CODES)],
+                conjunto=conjuntos[i],
+                ucs_afetadas=ucs[i],
+                data_inicio=INICIO,
+            )
+            for i in range(total)
+        ]
+
+        def colunar() -> None:
+            service.agregar_colunar(conjuntos, ibges, ucs, programadas)
+
+        entidades_ms = _medir(lambda: service.agregar(entidades), rounds)
+
+        interrupcao_aggregator.np = None
+        try:
+            python_ms = _medir(colunar, rounds)
+        finally:
+            interrupcao_aggregator.np = numpy_module
+
+        numpy_txt = f"{_medir(colunar, rounds):>17.2f}" if numpy_module else f"{'n/d':>17}"
+        print(f"{total:>10}{entidades_ms:>16.2f}{python_ms:>17.2f}{numpy_txt}")
+
+
+if __name__ == "__main__":
+    main()
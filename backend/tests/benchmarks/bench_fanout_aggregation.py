@@ -0,0 +1,95 @@
+"""Benchmark da agregacao com fan-out por DBLink vs query unica.
+
+O banco e simulado com latencia por link:
+- query unica: o join entre links faz o Oracle buscar os dados de um
+  link e depois do outro (latencias somadas), alem do GROUP BY
+- fan-out: uma sub-query por link em conexoes paralelas (latencia do
+  link mais lento) + hash join em Python (custo medido de verdade)
+
+Uso:
+    python -m backend.tests.benchmarks.bench_fanout_aggregation
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Any
+
+os.environ.setdefault("PRD_RADAR_API_KEY", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_USER", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_PASSWORD", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_DSN", "localhost:1521/XE")
+
+from backend.apps.api_interrupcoes.repositories.fanout_interrupcao_repository import (  # noqa: E402
+    QUERY_EVENTOS_POR_DISPOSITIVO,
+    QUERY_MUNICIPIO_POR_DISPOSITIVO,
+    FanoutInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (  # noqa: E402
+    InterrupcaoRepository,
+)
+from backend.shared.infrastructure.logger import configure_logging  # noqa: E402
+
+INSERVICE_SECONDS = 0.12
+INDICADORES_SECONDS = 0.08
+ROUNDS = 5
+DEVICES = (1_000, 20_000, 100_000)
+IBGE_CODES = (1400050, 1400100, 1400159, 1400209, 1400233, 1400282)
+
+
+class _SimulatedPool:
+    """Pool com latencia de rede por DBLink."""
+
+    def __init__(self, devices: int) -> None:
+        self.eventos = [(d, d % 200 + 1, d % 7, d % 11) for d in range(0, devices, 3)]
+        self.municipios = [(d, IBGE_CODES[d % len(IBGE_CODES)]) for d in range(devices)]
+        groups = {(c, IBGE_CODES[d % len(IBGE_CODES)]) for d, c, _, _ in self.eventos}
+        self.agregado = [
+            {
+                "conjunto": conjunto,
+                "municipio_ibge": ibge,
+                "qtd_ucs_atendidas": 0,
+                "qtd_programada": 1,
+                "qtd_nao_programada": 1,
+            }
+            for conjunto, ibge in sorted(groups)
+        ]
+
+    async def execute(self, sql: str, params: Any = None) -> list[dict[str, Any]]:
+        await asyncio.sleep(INSERVICE_SECONDS + INDICADORES_SECONDS)
+        return self.agregado
+
+    async def execute_rows(self, sql: str, params: Any = None) -> list[tuple[Any, ...]]:
+        if sql == QUERY_EVENTOS_POR_DISPOSITIVO:
+            await asyncio.sleep(INSERVICE_SECONDS)
+            return self.eventos
+        assert sql == QUERY_MUNICIPIO_POR_DISPOSITIVO
+        await asyncio.sleep(INDICADORES_SECONDS)
+        return self.municipios
+
+
+async def _medir(repository: Any) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await repository.find_ativas_agregadas()
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+async def main() -> None:
+    configure_logging(level="ERROR")
+    print(
+        f"links: INSERVICE {INSERVICE_SECONDS * 1000:.0f} ms, "
+        f"INDICADORES {INDICADORES_SECONDS * 1000:.0f} ms"
+    )
+    print(f"{'dispositivos':>13}{'query unica (ms)':>18}{'fan-out (ms)':>14}")
+    for devices in DEVICES:
+        pool = _SimulatedPool(devices)
+        unica_ms = await _medir(InterrupcaoRepository(pool))  # type: ignore[arg-type]
+        fanout_ms = await _medir(FanoutInterrupcaoRepository(pool))  # type: ignore[arg-type]
+        print(f"{devices:>13}{unica_ms:>18.1f}{fanout_ms:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
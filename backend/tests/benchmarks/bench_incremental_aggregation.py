@@ -0,0 +1,74 @@
+"""Benchmark da agregacao incremental vs recomputacao completa.
+
+Com OPEN eventos abertos, compara o custo (lado da aplicacao) de:
+- recomputar: agregar todos os eventos abertos a cada refresh
+- incremental: aplicar apenas CHANGES eventos alterados
+
+O custo no banco/DBLink segue a mesma proporcao: o delta transfere
+apenas as linhas alteradas.
+
+Uso:
+    python -m backend.tests.benchmarks.bench_incremental_aggregation
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+from backend.shared.domain.entities.interrupcao import Interrupcao
+from backend.shared.domain.services.interrupcao_aggregator import (
+    AgregacaoIncremental,
+    InterrupcaoAggregatorService,
+)
+from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
+from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
+
+OPEN = (1_000, 10_000, 50_000)
+CHANGES = 50
+ROUNDS = 20
+IBGES = [CodigoIBGE.create_unsafe(code) for code in (1400100, 1400159, 1400209)]
+INICIO = datetime(2026, 1, 10, 10, 0)
+
+
+def _evento(i: int, fechado: bool = False) -> Interrupcao:
+    return Interrupcao(
+        id=i,
+        tipo=TipoInterrupcao.PROGRAMADA if i % 4 == 0 else TipoInterrupcao.NAO_PROGRAMADA,
+        municipio=IBGES[i % len(IBGES)],
+        conjunto=i % 60 + 1,
+        ucs_afetadas=10 + i % 90,
+        data_inicio=INICIO,
+        data_fim=INICIO if fechado else None,
+    )
+
+
+def main() -> None:
+    service = InterrupcaoAggregatorService()
+    print(f"{'abertos':>8}{'recomputar (ms)':>17}{'delta de ' + str(CHANGES) + ' (ms)':>18}")
+    for total in OPEN:
+        abertos = [_evento(i) for i in range(total)]
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            service.agregar(abertos)
+        full_ms = (time.perf_counter() - start) / ROUNDS * 1000
+
+        estado = AgregacaoIncremental()
+        estado.reconciliar(abertos)
+        deltas = [
+            [_evento(total + r * CHANGES + j) for j in range(CHANGES // 2)]
+            + [_evento(r * CHANGES + j, fechado=True) for j in range(CHANGES // 2)]
+            for r in range(ROUNDS)
+        ]
+        start = time.perf_counter()
+        for delta in deltas:
+            estado.aplicar(delta)
+            estado.resultado()
+        delta_ms = (time.perf_counter() - start) / ROUNDS * 1000
+
+        print(f"{total:>8}{full_ms:>17.2f}{delta_ms:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark da whitelist compilada contra a verificacao anterior.
+
+Anterior: settings.allowed_ips_list (split da string a cada requisicao)
+seguido de `in` na lista (apenas IPs exatos).
+Novo: IpMatcher compilado uma vez (arvore de prefixos, aceita CIDR).
+
+Uso:
+    python -m backend.tests.benchmarks.bench_ip_matcher
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+
+os.environ.setdefault("PRD_RADAR_API_KEY", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_USER", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_PASSWORD", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_DSN", "localhost:1521/XE")
+
+from backend.shared.infrastructure.auth.ip_matcher import IpMatcher  # noqa: E402
+
+LOOKUPS = 200_000
+
+
+def legacy_check(allowed_ips: str, client_ip: str) -> bool:
+    """verify_ip_whitelist anterior (allowed_ips_list recalculada)."""
+    allowed = ["*"] if allowed_ips == "*" else [ip.strip() for ip in allowed_ips.split(",")]
+    return "*" in allowed or client_ip in allowed
+
+
+def bench(entries: int) -> None:
+    rng = random.Random(entries)
+    ips = [".".join(str(rng.randrange(256)) for _ in range(4)) for _ in range(entries)]
+    allowed_ips = ",".join(ips)
+    clients = [rng.choice(ips) if i % 2 else "8.8.8.8" for i in range(LOOKUPS)]
+
+    start = time.perf_counter()
+    for ip in clients:
+        legacy_check(allowed_ips, ip)
+    legacy = (time.perf_counter() - start) / LOOKUPS
+
+    matcher = IpMatcher.parse(allowed_ips)
+    start = time.perf_counter()
+    for ip in clients:
+        matcher.match(ip)
+    compiled = (time.perf_counter() - start) / LOOKUPS
+
+    print(f"{entries:>8}{legacy * 1e6:>12.2f}{compiled * 1e6:>12.2f}")
+
+
+def main() -> None:
+    print(f"{LOOKUPS} verificacoes (metade aceitas), us por verificacao")
+    print(f"{'IPs':>8}{'anterior':>12}{'compilado':>12}")
+    for entries in (2, 10, 100, 1000):
+        bench(entries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Micro-benchmark de eviccao do MemoryCache.
+
+Mede o custo por operacao de set (com eviccao) e get para capacidades
+de 1k a 100k chaves. Com eviccao O(1) o custo por operacao deve ficar
+estavel conforme a capacidade cresce; a varredura com min() (algoritmo
+anterior) cresce linearmente.
+
+Uso:
+    python -m backend.tests.benchmarks.bench_memory_cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from backend.shared.infrastructure.cache.memory_cache import MemoryCache
+
+CAPACITIES = (1_000, 10_000, 100_000)
+OPERATIONS = 50_000
+LEGACY_OPERATIONS = 200
+
+
+async def _fill(cache: MemoryCache, capacity: int) -> None:
+    for i in range(capacity):
+        await cache.set(f"k{i}", i)
+
+
+async def bench_policy(policy: str, capacity: int) -> tuple[float, float]:
+    """Retorna (us/op de set com eviccao, us/op de get)."""
+    cache = MemoryCache(max_items=capacity, eviction_policy=policy)  # type: ignore[arg-type]
+    await _fill(cache, capacity)
+
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        await cache.set(f"n{i}", i)
+    set_us = (time.perf_counter() - start) / OPERATIONS * 1e6
+
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        await cache.get(f"n{i}")
+    get_us = (time.perf_counter() - start) / OPERATIONS * 1e6
+
+    return set_us, get_us
+
+
+def bench_legacy_scan(capacity: int) -> float:
+    """Custo por operacao da eviccao antiga (min() sobre todas as chaves)."""
+    created = {f"k{i}": float(i) for i in range(capacity)}
+
+    start = time.perf_counter()
+    for i in range(LEGACY_OPERATIONS):
+        oldest = min(created.keys(), key=lambda k: created[k])
+        del created[oldest]
+        created[f"n{i}"] = float(capacity + i)
+    return (time.perf_counter() - start) / LEGACY_OPERATIONS * 1e6
+
+
+async def main() -> None:
+    print(f"{'politica':<10}{'chaves':>10}{'set us/op':>12}{'get us/op':>12}")
+    for policy in ("lru", "lfu", "ttl"):
+        for capacity in CAPACITIES:
+            set_us, get_us = await bench_policy(policy, capacity)
+            print(f"{policy:<10}{capacity:>10}{set_us:>12.2f}{get_us:>12.2f}")
+
+    print()
+    print(f"{'min() scan':<10}{'chaves':>10}{'set us/op':>12}")
+    for capacity in CAPACITIES:
+        print(f"{'legado':<10}{capacity:>10}{bench_legacy_scan(capacity):>12.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,194 @@
+"""Benchmark do pipeline ASGI de middlewares contra o stack anterior.
+
+Stack anterior: ErrorHandler, RequestLogging e RateLimit como
+BaseHTTPMiddleware (uma task e um stream intermediario por camada).
+Stack novo: MiddlewarePipeline com os estagios equivalentes.
+
+As requisicoes sao enviadas direto ao app ASGI (sem rede), entao a
+diferenca medida e o custo dos middlewares. Cada cliente usa uma API
+key propria para nao esbarrar no rate limit.
+
+Uso:
+    python -m backend.tests.benchmarks.bench_middleware_pipeline
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+os.environ.setdefault("PRD_RADAR_API_KEY", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_USER", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_PASSWORD", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_DSN", "localhost:1521/XE")
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from backend.shared.infrastructure.http.aneel_response import AneelResponseBuilder  # noqa: E402
+from backend.shared.infrastructure.http.rate_limiter import (  # noqa: E402
+    SlidingLogRateLimiter,
+)
+from backend.shared.infrastructure.logger import configure_logging, log_request  # noqa: E402
+
+from backend.apps.api_interrupcoes.middleware import (  # noqa: E402
+    ErrorHandlerStage,
+    MiddlewarePipeline,
+    RateLimitStage,
+    RequestLoggingStage,
+)
+
+REQUESTS = 5_000
+CONCURRENCY = 50
+LIMIT = 10
+BODY = {"idcStatusRequisicao": 1, "interrupcaoFornecimento": []}
+
+CallNext = Callable[[Request], Awaitable[Response]]
+
+
+class LegacyRateLimit(BaseHTTPMiddleware):
+    """RateLimitMiddleware anterior (mesmo limiter)."""
+
+    def __init__(self, app: object) -> None:
+        super().__init__(app)  # type: ignore[arg-type]
+        self._limiter = SlidingLogRateLimiter(LIMIT, 60)
+
+    async def dispatch(self, request: Request, call_next: CallNext) -> Response:
+        key = f"{request.client.host if request.client else 'unknown'}:"
+        decision = self._limiter.hit(key + request.headers.get("x-api-key", ""))
+        if not decision.allowed:
+            return JSONResponse(status_code=429, content={})
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(decision.limit)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        return response
+
+
+class LegacyRequestLogging(BaseHTTPMiddleware):
+    """RequestLoggingMiddleware anterior."""
+
+    async def dispatch(self, request: Request, call_next: CallNext) -> Response:
+        start = time.perf_counter()
+        response = await call_next(request)
+        log_request(
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            client_ip=request.client.host if request.client else None,
+        )
+        return response
+
+
+class LegacyErrorHandler(BaseHTTPMiddleware):
+    """ErrorHandlerMiddleware anterior."""
+
+    async def dispatch(self, request: Request, call_next: CallNext) -> Response:
+        try:
+            return await call_next(request)
+        except Exception:
+            return JSONResponse(status_code=500, content=AneelResponseBuilder.internal_error())
+
+
+def _base_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/quantitativointerrupcoesativas")
+    async def endpoint() -> JSONResponse:
+        return JSONResponse(BODY)
+
+    return app
+
+
+def legacy_app() -> FastAPI:
+    app = _base_app()
+    app.add_middleware(LegacyErrorHandler)
+    app.add_middleware(LegacyRequestLogging)
+    app.add_middleware(LegacyRateLimit)
+    return app
+
+
+def pipeline_app() -> FastAPI:
+    app = _base_app()
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            RateLimitStage(SlidingLogRateLimiter(LIMIT, 60)),
+            RequestLoggingStage(),
+            ErrorHandlerStage(),
+        ],
+    )
+    return app
+
+
+async def _request(app: FastAPI, client: int) -> float:
+    """Uma requisicao GET completa; retorna a latencia em segundos."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/quantitativointerrupcoesativas",
+        "raw_path": b"/quantitativointerrupcoesativas",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"x-api-key", f"cliente-{client}".encode())],
+        "client": ("10.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    sent = False
+
+    async def receive() -> dict:
+        nonlocal sent
+        if sent:
+            await asyncio.sleep(3600)
+        sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status = 0
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    elapsed = time.perf_counter() - start
+    assert status == 200, status
+    return elapsed
+
+
+async def bench(name: str, app: FastAPI) -> None:
+    # Aquecimento (monta o middleware stack)
+    for i in range(200):
+        await _request(app, -i - 1)
+
+    latencies = [await _request(app, i // LIMIT) for i in range(REQUESTS)]
+
+    start = time.perf_counter()
+    for batch in range(0, REQUESTS, CONCURRENCY):
+        await asyncio.gather(
+            *(_request(app, 10**6 + (batch + i) // LIMIT) for i in range(CONCURRENCY))
+        )
+    rps = REQUESTS / (time.perf_counter() - start)
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{name:<12}{cuts[49] * 1e6:>10.1f}{cuts[98] * 1e6:>10.1f}{rps:>12.0f}")
+
+
+async def main() -> None:
+    configure_logging(level="ERROR")
+    print(f"{REQUESTS} requisicoes (req/s com {CONCURRENCY} concorrentes)")
+    print(f"{'stack':<12}{'p50 us':>10}{'p99 us':>10}{'req/s':>12}")
+    await bench("legado", legacy_app())
+    await bench("pipeline", pipeline_app())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+"""Benchmark de carga do rate limiter com 50k clientes distintos.
+
+Compara o dicionario sem eviccao anterior (defaultdict por ip:api_key)
+com os backends de janela deslizante: custo por requisicao, memoria
+retida apos 50k clientes e clientes retidos depois que a janela passa.
+
+Uso:
+    python -m backend.tests.benchmarks.bench_rate_limiter
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from backend.shared.infrastructure.http.rate_limiter import (
+    SharedRateLimiter,
+    SlidingLogRateLimiter,
+)
+from backend.shared.infrastructure.logger import configure_logging
+
+CLIENTS = 50_000
+REQUESTS_PER_CLIENT = 3
+LIMIT = 10
+WINDOW = 60.0
+
+
+class FakeClock:
+    """Relogio avancado pelo benchmark."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class _LegacyEntry:
+    count: int = 0
+    window_start: float = field(default_factory=time.time)
+
+
+class LegacyLimiter:
+    """Algoritmo anterior (janela fixa, sem eviccao)."""
+
+    def __init__(self, clock: FakeClock) -> None:
+        self._clock = clock
+        self._clients: dict[str, _LegacyEntry] = defaultdict(_LegacyEntry)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def hit(self, key: str) -> bool:
+        entry = self._clients[key]
+        now = self._clock()
+        if now - entry.window_start >= WINDOW:
+            entry.count = 0
+            entry.window_start = now
+        if entry.count >= LIMIT:
+            return False
+        entry.count += 1
+        return True
+
+
+def _keys() -> list[str]:
+    return [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}:chave" for i in range(CLIENTS)]
+
+
+def _load(limiter, clock: FakeClock, keys: list[str]) -> float:  # noqa: ANN001
+    start = time.perf_counter()
+    for _ in range(REQUESTS_PER_CLIENT):
+        for key in keys:
+            clock.now += 0.0001
+            limiter.hit(key)
+    return time.perf_counter() - start
+
+
+def bench(name: str, factory, retained) -> None:  # noqa: ANN001
+    """Tempo (sem tracemalloc), heap retido e clientes apos a janela."""
+    keys = _keys()
+    clock = FakeClock()
+    elapsed = _load(factory(clock), clock, keys)
+
+    clock = FakeClock()
+    tracemalloc.start()
+    limiter = factory(clock)
+    _load(limiter, clock, keys)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Depois da janela, um unico cliente ativo
+    clock.now += WINDOW + 1
+    for _ in range(1_000):
+        limiter.hit("10.0.0.1:chave")
+
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    print(
+        f"{name:<10}{elapsed / total * 1e6:>10.2f}{memory / 2**20:>14.1f}"
+        f"{retained(limiter):>16}"
+    )
+
+
+def main() -> None:
+    configure_logging(level="ERROR")
+    print(f"{CLIENTS} clientes x {REQUESTS_PER_CLIENT} requisicoes")
+    print(f"{'backend':<10}{'us/req':>10}{'heap (MiB)':>14}{'retidos apos':>16}")
+
+    bench("legado", LegacyLimiter, len)
+    bench(
+        "memory",
+        lambda clock: SlidingLogRateLimiter(LIMIT, WINDOW, max_clients=100_000, clock=clock),
+        len,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = (Path(directory) / f"rate_limit{i}.table" for i in range(2))
+        bench(
+            "shared",
+            lambda clock: SharedRateLimiter(next(paths), LIMIT, WINDOW, slots=100_000, clock=clock),
+            lambda limiter: limiter.get_stats().clients,
+        )
+        size = (Path(directory) / "rate_limit0.table").stat().st_size
+        print(f"{'':<10}(tabela shared fixa: {size / 2**20:.1f} MiB, mmap)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark do mapeamento de linhas do banco.
+
+Compara, para ROWS linhas (1% com IBGE invalido):
+- result: CodigoIBGE.create + Interrupcao.create (Result) por linha
+- entidades: map_interrupcao_records() (validacao em lote, VOs compartilhados)
+- colunas: map_interrupcao_colunas() (struct-of-arrays, sem entidades)
+
+Uso:
+    python -m backend.tests.benchmarks.bench_row_mapping
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
+    map_interrupcao_colunas,
+    map_interrupcao_records,
+)
+from backend.shared.domain.entities.interrupcao import Interrupcao
+from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
+from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
+from backend.shared.infrastructure.logger import configure_logging
+
+ROWS = (1_000, 10_000, 100_000)
+ROUNDS = 5
+IBGE_CODES = CodigoIBGE.MUNICIPIOS_RORAIMA
+INICIO = datetime(2026, 1, 10, 10, 0)
+
+
+def _records(total: int) -> list[tuple[Any, ...]]:
+    return [
+        (
+            i,
+            10 + i % 90,
+            i if i % 4 == 0 else None,
+            i % 60 + 1,
+            3550308 if i % 100 == 0 else IBGE_CODES[i % len(IBGE_CODES)],
+            INICIO,
+            None,
+        )
+        for i in range(total)
+    ]
+
+
+def _map_result(records: list[tuple[Any, ...]]) -> list[Interrupcao]:
+    """Mapeamento anterior: Result e Value Objects por linha."""
+    entities = []
+    for id_, ucs, plan_id, conjunto, ibge, data_inicio, data_fim in records:
+        ibge_result = CodigoIBGE.create(ibge)
+        if ibge_result.is_failure:
+            continue
+        result = Interrupcao.create(
+            id=id_,
+            tipo=TipoInterrupcao.from_plan_id(plan_id),
+            municipio=ibge_result.value,
+            conjunto=conjunto,
+            ucs_afetadas=ucs or 0,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+        )
+        if result.is_success:
+            entities.append(result.value)
+    return entities
+
+
+def _medir(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def main() -> None:
+    # Resumo de rejeicoes fora da medicao
+    configure_logging(level="ERROR")
+    print(f"{'linhas':>8}{'result (ms)':>13}{'entidades (ms)':>16}{'colunas (ms)':>14}")
+    for total in ROWS:
+        records = _records(total)
+        result_ms = _medir(lambda: _map_result(records))
+        entidades_ms = _medir(lambda: map_interrupcao_records(records))
+        colunas_ms = _medir(lambda: map_interrupcao_colunas(records))
+        print(f"{total:>8}{result_ms:>13.2f}{entidades_ms:>16.2f}{colunas_ms:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
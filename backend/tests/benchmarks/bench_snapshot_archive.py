@@ -0,0 +1,64 @@
+"""Micro-benchmark da busca por dthRecuperacao no arquivo colunar.
+
+Grava 30 dias de snapshots (um a cada 5 minutos, 288 por dia) e mede
+a latencia de find_at() em instantes aleatorios do periodo.
+
+Uso:
+    python -m backend.tests.benchmarks.bench_snapshot_archive
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from backend.shared.infrastructure.archive import ColumnarArchive
+
+DAYS = 30
+SNAPSHOTS_PER_DAY = 288
+ROWS = 150
+LOOKUPS = 5_000
+START = datetime(2026, 1, 1)
+
+
+def _columns(seed: int) -> list[list[int]]:
+    return [
+        [i % 50 + 1 for i in range(ROWS)],
+        [1400100 + i % 15 for i in range(ROWS)],
+        [1_000 + i for i in range(ROWS)],
+        [(i + seed) % 7 for i in range(ROWS)],
+        [(i + seed) % 11 for i in range(ROWS)],
+    ]
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        archive = ColumnarArchive(directory, column_count=5)
+
+        start = time.perf_counter()
+        total = DAYS * SNAPSHOTS_PER_DAY
+        for n in range(total):
+            archive.append(START + timedelta(minutes=5 * n), _columns(n))
+        write_s = time.perf_counter() - start
+
+        span = DAYS * 24 * 3600
+        instants = [
+            START + timedelta(seconds=random.uniform(0, span)) for _ in range(LOOKUPS)
+        ]
+
+        start = time.perf_counter()
+        for instant in instants:
+            archive.find_at(instant)
+        lookup_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+
+        archive.close()
+
+    print(f"snapshots gravados: {total} ({ROWS} linhas cada)")
+    print(f"gravacao: {write_s * 1e3 / total:.3f} ms/snapshot")
+    print(f"find_at:  {lookup_us:.1f} us/consulta (inclui leitura do bloco)")
+
+
+if __name__ == "__main__":
+    main()
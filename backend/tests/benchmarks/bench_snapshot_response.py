@@ -0,0 +1,90 @@
+"""Micro-benchmark da resposta pre-serializada de interrupcoes ativas.
+
+Compara o custo por requisicao (em cache hit) de:
+- caminho antigo: model_dump dos itens, montagem do payload ANEEL,
+  validacao pelo response_model e serializacao JSON a cada requisicao
+- caminho novo: escolha da variante do snapshot pelo Accept-Encoding
+
+Uso:
+    python -m backend.tests.benchmarks.bench_snapshot_response
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+os.environ.setdefault("PRD_RADAR_API_KEY", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_USER", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_PASSWORD", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_DSN", "localhost:1521/XE")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from backend.shared.infrastructure.http.aneel_response import AneelResponseBuilder  # noqa: E402
+
+from backend.apps.api_interrupcoes.schemas import (  # noqa: E402
+    InterrupcaoAgregadaItem,
+    InterrupcoesAtivasResponse,
+)
+from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_ativas import (  # noqa: E402
+    InterrupcoesSnapshot,
+)
+
+SIZES = (15, 150, 1_500)
+REQUESTS = 2_000
+
+
+def _items(count: int) -> list[InterrupcaoAgregadaItem]:
+    return [
+        InterrupcaoAgregadaItem(
+            ideConjuntoUnidadeConsumidora=i % 50 + 1,
+            ideMunicipio=1400100 + i % 15,
+            qtdUCsAtendidas=1_000 + i,
+            qtdOcorrenciaProgramada=i % 7,
+            qtdOcorrenciaNaoProgramada=i % 11,
+        )
+        for i in range(count)
+    ]
+
+
+def bench_legacy(items: list[InterrupcaoAgregadaItem]) -> float:
+    """Requisicoes/s do caminho antigo (serializa a cada requisicao)."""
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        payload = AneelResponseBuilder.success(
+            {"interrupcaoFornecimento": [item.model_dump() for item in items]}
+        )
+        validated = InterrupcoesAtivasResponse.model_validate(payload)
+        JSONResponse(content=jsonable_encoder(validated))
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def bench_snapshot(snapshot: InterrupcoesSnapshot, accept_encoding: str | None) -> float:
+    """Requisicoes/s do caminho novo (bytes prontos do snapshot)."""
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        snapshot.body.to_response(accept_encoding)
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(
+        f"{'itens':>8}{'bytes':>10}{'gzip':>8}"
+        f"{'antigo req/s':>15}{'novo req/s':>13}{'novo gzip req/s':>17}"
+    )
+    for size in SIZES:
+        items = _items(size)
+        snapshot = InterrupcoesSnapshot.create(items)
+        gzip_size = len(snapshot.body.gzip) if snapshot.body.gzip else 0
+        print(
+            f"{size:>8}{len(snapshot.body.identity):>10}{gzip_size:>8}"
+            f"{bench_legacy(items):>15.0f}"
+            f"{bench_snapshot(snapshot, None):>13.0f}"
+            f"{bench_snapshot(snapshot, 'gzip, deflate'):>17.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
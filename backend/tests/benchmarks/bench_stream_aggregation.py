@@ -0,0 +1,95 @@
+"""Benchmark de memoria: fetchall + agregacao vs stream em lotes.
+
+Simula um grande evento com ROWS interrupcoes abertas e compara o pico
+de memoria (tracemalloc) de:
+- caminho antigo: todas as linhas materializadas, depois mapeadas e agregadas
+- caminho novo: lotes de BATCH linhas mapeados e acumulados um a um
+
+Uso:
+    python -m backend.tests.benchmarks.bench_stream_aggregation
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+os.environ.setdefault("PRD_RADAR_API_KEY", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_USER", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_PASSWORD", "bench")
+os.environ.setdefault("PRD_RADAR_ORACLE_DSN", "localhost:1521/XE")
+
+import structlog  # noqa: E402
+
+from backend.shared.domain.services.interrupcao_aggregator import (  # noqa: E402
+    InterrupcaoAggregatorService,
+)
+
+from backend.apps.api_interrupcoes.repositories.async_oracle_interrupcao_repository import (  # noqa: E402
+    AsyncOracleInterrupcaoRepository,
+)
+
+ROWS = 50_000
+BATCH = 500
+IBGES = (1400100, 1400159, 1400209, 1400308, 1400407)
+
+
+def _row(i: int) -> tuple[Any, ...]:
+    return (
+        i,
+        10 + i % 90,
+        999 if i % 4 == 0 else None,
+        i % 60 + 1,
+        IBGES[i % len(IBGES)],
+        datetime(2026, 1, 10, 10, 0),
+        None,
+    )
+
+
+class _FakePool:
+    """Pool que gera as linhas sob demanda, como o cursor do driver."""
+
+    async def execute_rows(self, sql: str, params: dict[str, Any]) -> list[tuple[Any, ...]]:
+        return [_row(i) for i in range(ROWS)]
+
+    async def stream(
+        self, sql: str, params: dict[str, Any], batch_size: int
+    ) -> AsyncIterator[list[tuple[Any, ...]]]:
+        for start in range(0, ROWS, batch_size):
+            yield [_row(i) for i in range(start, min(start + batch_size, ROWS))]
+
+
+async def _measure(label: str, func) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<18}{len(result):>8}{peak / 1024 / 1024:>12.1f}{elapsed * 1000:>12.0f}")
+
+
+async def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    repository = AsyncOracleInterrupcaoRepository(_FakePool())  # type: ignore[arg-type]
+    service = InterrupcaoAggregatorService()
+
+    async def legacy() -> list:
+        return service.agregar(await repository.buscar_ativas())
+
+    async def streamed() -> list:
+        return await service.agregar_stream(repository.stream_ativas(batch_size=BATCH))
+
+    print(f"{ROWS} interrupcoes abertas, lotes de {BATCH}")
+    print(f"{'caminho':<18}{'grupos':>8}{'pico (MB)':>12}{'tempo (ms)':>12}")
+    await _measure("fetchall", legacy)
+    await _measure("stream", streamed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
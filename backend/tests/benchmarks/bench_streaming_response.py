@@ -0,0 +1,78 @@
+"""Benchmark de memoria: resposta ANEEL completa vs em stream.
+
+Para listas detalhadas de tamanhos crescentes compara o pico de memoria
+(tracemalloc) de:
+- resposta completa: lista de dicts + json.dumps do envelope inteiro
+- stream_json: lotes de BATCH itens gerados e enviados sob demanda
+
+Uso:
+    python -m backend.tests.benchmarks.bench_streaming_response
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import tracemalloc
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from backend.shared.infrastructure.http.aneel_response import AneelResponseBuilder
+
+SIZES = (1_000, 10_000, 100_000)
+BATCH = 500
+
+
+def _item(i: int) -> dict[str, Any]:
+    return {
+        "id": i,
+        "ucs_afetadas": 10 + i % 90,
+        "data_inicio": datetime(2026, 1, 10, 10, 0).isoformat(),
+        "plan_id": 999 if i % 4 == 0 else None,
+        "conjunto": i % 60 + 1,
+        "municipio_ibge": 1400100,
+    }
+
+
+async def _batches(total: int) -> AsyncIterator[list[dict[str, Any]]]:
+    for start in range(0, total, BATCH):
+        yield [_item(i) for i in range(start, min(start + BATCH, total))]
+
+
+def bench_full(total: int) -> tuple[int, int]:
+    """(bytes, pico) montando o corpo inteiro."""
+    tracemalloc.start()
+    items = [_item(i) for i in range(total)]
+    body = json.dumps(
+        AneelResponseBuilder.success({"interrupcaoFornecimento": items}),
+        separators=(",", ":"),
+    ).encode()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(body), peak
+
+
+async def bench_stream(total: int) -> tuple[int, int]:
+    """(bytes, pico) enviando em partes (cada parte e descartada)."""
+    tracemalloc.start()
+    size = 0
+    async for chunk in AneelResponseBuilder.stream_json(_batches(total)):
+        size += len(chunk)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak
+
+
+async def main() -> None:
+    print(f"{'itens':>8}{'bytes':>12}{'completo (MB)':>15}{'stream (MB)':>13}")
+    for total in SIZES:
+        size, full_peak = bench_full(total)
+        _, stream_peak = await bench_stream(total)
+        print(
+            f"{total:>8}{size:>12}{full_peak / 2**20:>15.1f}{stream_peak / 2**20:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,6 +6,9 @@ incluindo autenticacao, formato de resposta e endpoints.
 
 from __future__ import annotations
 
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from fastapi import status
 from httpx import AsyncClient
@@ -78,6 +81,45 @@ class TestQuantitativoInterrupcoesAtivas:
             assert "interrupcaoFornecimento" in detail
             assert detail["interrupcaoFornecimento"] == []
 
+        @pytest.mark.asyncio
+        async def test_backend_token_deve_validar_pelo_indice(
+            self,
+            client: AsyncClient,
+            monkeypatch: pytest.MonkeyPatch,
+        ) -> None:
+            """Com auth_backend=token valem os tokens e IPs de TOKEN_ACESSO."""
+            # Arrange
+            from backend.apps.api_interrupcoes import dependencies
+            from backend.shared.infrastructure.auth.api_key_index import (
+                ApiKeyIndexRepository,
+            )
+            from backend.shared.infrastructure.config import get_settings
+
+            pool = MagicMock()
+            pool.execute_rows = AsyncMock(
+                return_value=[
+                    ("t1", "ANEEL", "chave-do-token", None, None),
+                    ("t2", "Restrito", "chave-restrita", None, "10.9.9.9"),
+                ]
+            )
+            repository = ApiKeyIndexRepository(pool)
+            monkeypatch.setattr(get_settings(), "auth_backend", "token")
+            monkeypatch.setattr(
+                dependencies, "get_api_key_index_repository", lambda: repository
+            )
+            path = "/quantitativointerrupcoesativas"
+
+            # Act
+            valida = await client.get(path, headers={"x-api-key": "chave-do-token"})
+            estatica = await client.get(path, headers={"x-api-key": "test-api-key-12345"})
+            restrita = await client.get(path, headers={"x-api-key": "chave-restrita"})
+
+            # Assert
+            assert valida.status_code == status.HTTP_200_OK
+            assert estatica.status_code == status.HTTP_401_UNAUTHORIZED
+            assert restrita.status_code == status.HTTP_403_FORBIDDEN
+            assert repository.get_stats().pending_tokens == 1
+
     class TestFormatoResposta:
         """Testes do formato de resposta ANEEL."""
 
@@ -171,6 +213,141 @@ class TestQuantitativoInterrupcoesAtivas:
             data = response.json()
             assert isinstance(data["interrupcaoFornecimento"], list)
 
+        @pytest.mark.asyncio
+        async def test_deve_comprimir_resposta_com_gzip(
+            self,
+            client: AsyncClient,
+            api_key: str,
+            mock_oracle_pool: MagicMock,
+        ) -> None:
+            """Snapshot grande e servido com a variante gzip pre-comprimida."""
+            # Arrange
+            mock_oracle_pool.execute.return_value = [
+                {
+                    "conjunto": conjunto,
+                    "municipio_ibge": 1400100,
+                    "qtd_ucs_atendidas": 1000,
+                    "qtd_programada": 10,
+                    "qtd_nao_programada": 5,
+                }
+                for conjunto in range(1, 31)
+            ]
+
+            # Act
+            response = await client.get(
+                "/quantitativointerrupcoesativas",
+                headers={"x-api-key": api_key, "accept-encoding": "gzip"},
+            )
+
+            # Assert
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.headers["content-type"] == "application/json"
+            data = response.json()
+            assert data["idcStatusRequisicao"] == 1
+            assert len(data["interrupcaoFornecimento"]) == 30
+
+        @pytest.mark.asyncio
+        async def test_deve_retornar_304_quando_etag_nao_mudou(
+            self,
+            client: AsyncClient,
+            api_key: str,
+        ) -> None:
+            """Poll com If-None-Match do snapshot atual recebe 304 sem corpo."""
+            # Arrange
+            first = await client.get(
+                "/quantitativointerrupcoesativas",
+                headers={"x-api-key": api_key},
+            )
+            etag = first.headers["etag"]
+
+            # Act
+            response = await client.get(
+                "/quantitativointerrupcoesativas",
+                headers={"x-api-key": api_key, "if-none-match": etag},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+            assert "last-modified" in response.headers
+
+        @pytest.mark.asyncio
+        async def test_etag_diferente_deve_retornar_corpo(
+            self,
+            client: AsyncClient,
+            api_key: str,
+        ) -> None:
+            """ETag desatualizada recebe a resposta completa."""
+            # Act
+            response = await client.get(
+                "/quantitativointerrupcoesativas",
+                headers={"x-api-key": api_key, "if-none-match": 'W/"antiga"'},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["idcStatusRequisicao"] == 1
+
+    class TestDthRecuperacao:
+        """Testes do parametro dthRecuperacao."""
+
+        @pytest.mark.asyncio
+        async def test_formato_invalido_deve_retornar_400(
+            self,
+            client: AsyncClient,
+            api_key: str,
+        ) -> None:
+            """dthRecuperacao fora de dd/mm/yyyy hh:mm e rejeitado."""
+            # Act
+            response = await client.get(
+                "/quantitativointerrupcoesativas",
+                params={"dthRecuperacao": "2025-12-10T14:30"},
+                headers={"x-api-key": api_key},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            data = response.json()
+            assert data["idcStatusRequisicao"] == 2
+            assert "dthRecuperacao" in data["mensagem"]
+
+        @pytest.mark.asyncio
+        async def test_deve_retornar_snapshot_do_historico(
+            self,
+            client: AsyncClient,
+            api_key: str,
+            mock_oracle_pool: MagicMock,
+        ) -> None:
+            """Busca pontual no historico, sem consultar o INSERVICE."""
+            # Arrange
+            mock_oracle_pool.execute.return_value = [
+                {
+                    "capturado_em": datetime(2025, 12, 10, 14, 27),
+                    "conjunto": 7,
+                    "municipio_ibge": 1400100,
+                    "qtd_ucs_atendidas": 1000,
+                    "qtd_programada": 3,
+                    "qtd_nao_programada": 4,
+                }
+            ]
+
+            # Act
+            response = await client.get(
+                "/quantitativointerrupcoesativas",
+                params={"dthRecuperacao": "10/12/2025 14:30"},
+                headers={"x-api-key": api_key},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["idcStatusRequisicao"] == 1
+            assert data["interrupcaoFornecimento"][0]["ideConjuntoUnidadeConsumidora"] == 7
+            sql = mock_oracle_pool.execute.call_args[0][0]
+            assert "RADAR_API.CONSULTA" in sql
+            assert "DBLINK_INSERVICE" not in sql
+
 
 @pytest.mark.e2e
 class TestHealthCheck:
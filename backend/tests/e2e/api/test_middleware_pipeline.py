@@ -0,0 +1,154 @@
+"""Testes E2E para o pipeline ASGI de middlewares."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from backend.apps.api_interrupcoes import middleware
+from backend.apps.api_interrupcoes.middleware import (
+    AuditStage,
+    ErrorHandlerStage,
+    MiddlewarePipeline,
+    RateLimitStage,
+    RequestLoggingStage,
+)
+from backend.shared.infrastructure.http.rate_limiter import SlidingLogRateLimiter
+
+HEADERS = {"x-api-key": "chave-de-teste"}
+
+
+def _create_app() -> FastAPI:
+    """Aplicacao minima com o pipeline completo."""
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok() -> dict:
+        return {"ok": True}
+
+    @app.get("/falha")
+    async def falha() -> dict:
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncGenerator[bytes, None]:
+            for i in range(3):
+                yield f"{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            AuditStage(),
+            RateLimitStage(SlidingLogRateLimiter(limit=2, window_seconds=60)),
+            RequestLoggingStage(),
+            ErrorHandlerStage(),
+        ],
+    )
+    return app
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Cliente HTTP da aplicacao minima."""
+    transport = ASGITransport(app=_create_app(), raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.e2e
+class TestMiddlewarePipeline:
+    """Testes do pipeline de estagios."""
+
+    @pytest.mark.asyncio
+    async def test_deve_aplicar_headers_de_todos_os_estagios(self, client: AsyncClient) -> None:
+        """Rate limit e X-Request-ID na mesma resposta."""
+        response = await client.get("/ok", headers=HEADERS)
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "2"
+        assert response.headers["X-RateLimit-Remaining"] == "1"
+        assert len(response.headers["X-Request-ID"]) == 8
+
+    @pytest.mark.asyncio
+    async def test_erro_deve_virar_envelope_aneel(self, client: AsyncClient) -> None:
+        """Excecao nao tratada vira 500 ANEEL com os headers externos."""
+        response = await client.get("/falha", headers=HEADERS)
+
+        assert response.status_code == 500
+        assert response.json()["idcStatusRequisicao"] == 2
+        assert "X-RateLimit-Remaining" in response.headers
+        assert "X-Request-ID" in response.headers
+
+    @pytest.mark.asyncio
+    async def test_429_nao_deve_passar_pelos_estagios_internos(
+        self,
+        client: AsyncClient,
+    ) -> None:
+        """Resposta antecipada nao e logada pelo estagio de logging."""
+        # patch.object: o conftest E2E recarrega os modulos da API
+        with patch.object(middleware, "log_request") as log:
+            for _ in range(3):
+                response = await client.get("/ok", headers=HEADERS)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"]
+        assert "X-Request-ID" in response.headers
+        assert log.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_streaming_deve_passar_direto(self, client: AsyncClient) -> None:
+        """Corpo em partes chega inteiro, com headers aplicados."""
+        response = await client.get("/stream", headers=HEADERS)
+
+        assert response.text == "0\n1\n2\n"
+        assert response.headers["X-RateLimit-Remaining"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_auditoria_deve_registrar_inicio_e_fim(self, client: AsyncClient) -> None:
+        """Paths auditados registram request e response com o mesmo id."""
+        audit = MagicMock()
+        with patch.object(middleware, "get_audit_logger", return_value=audit):
+            response = await client.get("/falha", headers=HEADERS)
+            await client.get("/health")
+
+        request_id = response.headers["X-Request-ID"]
+        audit.log_request.assert_called_once()
+        assert audit.log_request.call_args.kwargs["request_id"] == request_id
+        assert audit.log_response.call_args.kwargs == {
+            "request_id": request_id,
+            "status_code": 500,
+            "duration_ms": audit.log_response.call_args.kwargs["duration_ms"],
+            "error": "boom",
+        }
+
+    @pytest.mark.asyncio
+    async def test_auditoria_com_sink_deve_apenas_enfileirar(self) -> None:
+        """Com sink, a requisicao enfileira o registro sem log de auditoria."""
+        sink = MagicMock()
+        app = FastAPI()
+
+        @app.get("/ok")
+        async def ok() -> dict:
+            return {"ok": True}
+
+        app.add_middleware(MiddlewarePipeline, stages=[AuditStage(sink)])
+        transport = ASGITransport(app=app)
+        audit = MagicMock()
+        with patch.object(middleware, "get_audit_logger", return_value=audit):
+            async with AsyncClient(transport=transport, base_url="http://test") as ac:
+                response = await ac.get("/ok?ibge=1400100", headers=HEADERS)
+
+        audit.log_request.assert_not_called()
+        record = sink.enqueue.call_args.args[0]
+        assert record.status == "SUCESSO"
+        assert record.tipo_consulta == AuditStage.TIPO_CONSULTA_INTERRUPCAO
+        assert response.headers["X-Request-ID"] in record.parametros
+        assert "ibge=1400100" in record.parametros
@@ -43,6 +43,7 @@ def mock_oracle_pool() -> MagicMock:
     pool.initialize = AsyncMock()
     pool.close = AsyncMock()
     pool.execute = AsyncMock(return_value=[])
+    pool.execute_batch = AsyncMock(return_value=0)
     pool.health_check = AsyncMock(return_value={"healthy": True, "latency_ms": 1.0})
     pool.is_ready = MagicMock(return_value=True)
     return pool
@@ -0,0 +1,209 @@
+"""Testes de equivalencia entre os modos de agregacao (aggregation_mode).
+
+As queries reais de cada modo rodam contra um SQLite com as tabelas
+remotas (AGENCY_EVENT, SWITCH_PLAN_TASKS, OMS_CONNECTIVITY,
+IND_UNIVERSOS) em schemas anexados; os sufixos @DBLINK sao removidos.
+Com os mesmos dados, todos os modos devem produzir o mesmo resultado.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.async_oracle_interrupcao_repository import (
+    AsyncOracleInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.dispositivo_index_repository import (
+    DispositivoIndexRepository,
+)
+from backend.apps.api_interrupcoes.repositories.fanout_interrupcao_repository import (
+    FanoutInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.incremental_interrupcao_repository import (
+    IncrementalInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.indexed_interrupcao_repository import (
+    IndexedInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import (
+    InterrupcaoAgregadaDB,
+    InterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.outages_programadas_repository import (
+    OutagesProgramadasRepository,
+)
+
+ABERTURA = datetime(2026, 10, 18, 8, 0)
+
+SCHEMA = """
+CREATE TABLE INSERVICE.AGENCY_EVENT (
+    num_1 INTEGER, dev_id INTEGER, num_cust INTEGER, is_open TEXT,
+    ag_id INTEGER, dt_on TIMESTAMP, dt_off TIMESTAMP, ad_ts TIMESTAMP
+);
+CREATE TABLE INSERVICE.SWITCH_PLAN_TASKS (outage_num INTEGER, plan_id INTEGER);
+CREATE TABLE INSERVICE.OMS_CONNECTIVITY (mslink INTEGER, conj INTEGER, dist INTEGER);
+CREATE TABLE INDICADORES.IND_UNIVERSOS (
+    id_dispositivo INTEGER, cd_universo INTEGER, cd_tipo_universo INTEGER
+);
+"""
+
+# (mslink, conj, dist)
+CONECTIVIDADE = [(10, 1, 370), (20, 2, 370), (30, 1, 370), (40, 3, 370), (50, 4, 999), (60, 5, 370)]
+
+# (id_dispositivo, cd_universo, cd_tipo_universo); 40 atende dois municipios
+UNIVERSOS = [
+    (10, 1400100, 2),
+    (20, 1400100, 2),
+    (30, 1400159, 2),
+    (40, 1400100, 2),
+    (40, 1400159, 2),
+    (50, 1400100, 2),
+    (10, 1400472, 1),
+]
+
+# (num_1, dev_id, num_cust, is_open, ag_id)
+EVENTOS = [
+    (1001, 10, 120, "T", 370),  # plano com tres tarefas
+    (1002, 10, 30, "T", 370),  # sem plano
+    (1003, 20, 45, "T", 370),  # tarefas em dois planos
+    (1004, 30, 15, "T", 370),  # sem plano
+    (1005, 40, 60, "T", 370),  # plano, dispositivo em dois municipios
+    (1006, 10, 500, "F", 370),  # fechado
+    (1007, 10, 77, "T", 999),  # outra agencia
+    (1008, 50, 10, "T", 370),  # dispositivo de outra distribuidora
+    (1009, 60, 10, "T", 370),  # dispositivo sem municipio
+    (1010, 30, 25, "T", 370),  # tarefas sem PLAN_ID
+]
+
+# (outage_num, plan_id)
+TAREFAS = [
+    (1001, 7),
+    (1001, 7),
+    (1001, 7),
+    (1003, 8),
+    (1003, 9),
+    (1005, 11),
+    (1006, 12),
+    (1010, None),
+    (1010, None),
+    (2000, 13),  # ocorrencia sem evento
+]
+
+UNIVERSO = {(1, 1400100): 1000, (2, 1400100): 200, (1, 1400159): 300}
+
+ESPERADO = [
+    InterrupcaoAgregadaDB(1, 1400100, 1000, 120, 30),
+    InterrupcaoAgregadaDB(2, 1400100, 200, 45, 0),
+    InterrupcaoAgregadaDB(3, 1400100, 0, 60, 0),
+    InterrupcaoAgregadaDB(1, 1400159, 300, 0, 40),
+    InterrupcaoAgregadaDB(3, 1400159, 0, 60, 0),
+]
+
+
+class SqlitePool:
+    """Executa as queries registradas em SQLite (mesma interface do OraclePool)."""
+
+    _DBLINK = re.compile(r"@DBLINK_\w+", re.IGNORECASE)
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        self.conn.execute("ATTACH DATABASE ':memory:' AS INSERVICE")
+        self.conn.execute("ATTACH DATABASE ':memory:' AS INDICADORES")
+        self.conn.executescript(SCHEMA)
+
+    def insert(self, table: str, rows: list[tuple[Any, ...]]) -> None:
+        marks = ", ".join("?" * len(rows[0]))
+        self.conn.executemany(f"INSERT INTO {table} VALUES ({marks})", rows)
+
+    def _run(self, sql: str, params: dict[str, Any] | None) -> sqlite3.Cursor:
+        return self.conn.execute(self._DBLINK.sub("", sql), params or {})
+
+    async def execute(self, sql: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        cursor = self._run(sql, params)
+        columns = [col[0].lower() for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    async def execute_rows(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> list[tuple[Any, ...]]:
+        return self._run(sql, params).fetchall()
+
+
+@pytest.fixture
+def pool() -> Iterator[SqlitePool]:
+    """Banco com os eventos, planos e topologia de exemplo."""
+    pool = SqlitePool()
+    pool.insert("INSERVICE.OMS_CONNECTIVITY", CONECTIVIDADE)
+    pool.insert("INDICADORES.IND_UNIVERSOS", UNIVERSOS)
+    pool.insert(
+        "INSERVICE.AGENCY_EVENT",
+        [
+            (num, dev, ucs, aberto, ag, ABERTURA, None if aberto == "T" else ABERTURA, ABERTURA)
+            for num, dev, ucs, aberto, ag in EVENTOS
+        ],
+    )
+    pool.insert("INSERVICE.SWITCH_PLAN_TASKS", TAREFAS)
+    yield pool
+    pool.conn.close()
+
+
+Modo = Callable[[Any], Awaitable[list[InterrupcaoAgregadaDB]]]
+
+
+def _query(pool: Any) -> Awaitable[list[InterrupcaoAgregadaDB]]:
+    return InterrupcaoRepository(pool).find_ativas_agregadas(UNIVERSO)
+
+
+def _fanout(pool: Any) -> Awaitable[list[InterrupcaoAgregadaDB]]:
+    return FanoutInterrupcaoRepository(pool).find_ativas_agregadas(UNIVERSO)
+
+
+def _incremental(pool: Any) -> Awaitable[list[InterrupcaoAgregadaDB]]:
+    source = AsyncOracleInterrupcaoRepository(pool)
+    return IncrementalInterrupcaoRepository(source).find_ativas_agregadas(UNIVERSO)
+
+
+def _indexed(pool: Any) -> Awaitable[list[InterrupcaoAgregadaDB]]:
+    repository = IndexedInterrupcaoRepository(
+        pool, DispositivoIndexRepository(pool), OutagesProgramadasRepository(pool)
+    )
+    return repository.find_ativas_agregadas(UNIVERSO)
+
+
+MODOS: dict[str, Modo] = {
+    "query": _query,
+    "fanout": _fanout,
+    "incremental": _incremental,
+    "indexed": _indexed,
+}
+
+
+@pytest.mark.integration
+class TestEquivalenciaDosModos:
+    """Todos os modos de agregacao produzem o mesmo resultado."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("modo", sorted(MODOS))
+    async def test_deve_produzir_o_resultado_esperado(self, pool: SqlitePool, modo: str) -> None:
+        """Cada evento conta uma vez, independente do numero de tarefas do plano."""
+        # Act
+        result = await MODOS[modo](pool)
+
+        # Assert
+        assert result == ESPERADO
+
+    @pytest.mark.asyncio
+    async def test_modos_devem_concordar(self, pool: SqlitePool) -> None:
+        """Mesmos dados, mesmo resultado em todos os modos."""
+        # Act
+        results = {modo: await run(pool) for modo, run in MODOS.items()}
+
+        # Assert
+        referencia = results["query"]
+        assert all(result == referencia for result in results.values()), results
@@ -9,6 +9,7 @@ Para testes com banco real, configurar as variaveis de ambiente:
 
 from __future__ import annotations
 
+from collections import namedtuple
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -206,6 +207,24 @@ class TestInterrupcaoRepository:
             assert result[0].qtd_programada == 0
             assert result[0].qtd_nao_programada == 0
 
+        @pytest.mark.asyncio
+        async def test_deve_preencher_ucs_atendidas_pelo_universo(
+            self,
+            repository: InterrupcaoRepository,
+            mock_pool: MagicMock,
+            sample_db_rows: list[dict[str, Any]],
+        ) -> None:
+            """Com universo, qtd_ucs_atendidas vem do mapa pre-calculado."""
+            # Arrange
+            mock_pool.execute.return_value = sample_db_rows
+            universo = {(1, 1400100): 1200, (2, 1400100): 800}
+
+            # Act
+            result = await repository.find_ativas_agregadas(universo)
+
+            # Assert
+            assert [item.qtd_ucs_atendidas for item in result] == [1200, 800, 0]
+
         @pytest.mark.asyncio
         async def test_deve_executar_query_correta(
             self,
@@ -445,3 +464,39 @@ class TestRepositorySingleton:
 
         # Assert
         assert repo1 is repo2
+
+
+@pytest.mark.integration
+class TestStreamAtivasDetalhadas:
+    """Testes para stream_ativas_detalhadas()."""
+
+    @pytest.mark.asyncio
+    async def test_deve_entregar_lotes_como_dicts(
+        self,
+        repository: InterrupcaoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Lotes de namedtuples do pool sao entregues como dicts."""
+        # Arrange
+        Row = namedtuple("Row", "id ucs_afetadas conjunto")
+
+        async def stream(*args: Any, **kwargs: Any):
+            yield [Row(1, 10, 1), Row(2, 20, 1)]
+            yield [Row(3, 30, 2)]
+
+        mock_pool.stream = MagicMock(side_effect=stream)
+
+        # Act
+        lotes = [lote async for lote in repository.stream_ativas_detalhadas(batch_size=2)]
+
+        # Assert
+        assert lotes == [
+            [
+                {"id": 1, "ucs_afetadas": 10, "conjunto": 1},
+                {"id": 2, "ucs_afetadas": 20, "conjunto": 1},
+            ],
+            [{"id": 3, "ucs_afetadas": 30, "conjunto": 2}],
+        ]
+        sql = mock_pool.stream.call_args.args[0]
+        assert sql == InterrupcaoRepository.QUERY_INTERRUPCOES_DETALHADAS
+        assert mock_pool.stream.call_args.kwargs == {"batch_size": 2}
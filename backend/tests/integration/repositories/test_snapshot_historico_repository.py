@@ -0,0 +1,149 @@
+"""Testes de integracao para OracleSnapshotHistoricoRepository.
+
+Validam os comandos enviados ao OraclePool (mockado).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.snapshot_historico_repository import (
+    OracleSnapshotHistoricoRepository,
+)
+from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+CAPTURADO_EM = datetime(2026, 1, 10, 14, 27)
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute = AsyncMock(return_value=[])
+    pool.execute_batch = AsyncMock(return_value=0)
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock) -> OracleSnapshotHistoricoRepository:
+    """Instancia do repositorio com pool mockado."""
+    return OracleSnapshotHistoricoRepository(mock_pool)
+
+
+def _item(conjunto: int) -> InterrupcaoAgregadaItem:
+    return InterrupcaoAgregadaItem(
+        ideConjuntoUnidadeConsumidora=conjunto,
+        ideMunicipio=1400100,
+        qtdUCsAtendidas=1000,
+        qtdOcorrenciaProgramada=10,
+        qtdOcorrenciaNaoProgramada=5,
+    )
+
+
+@pytest.mark.integration
+class TestSave:
+    """Testes de gravacao do snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_deve_gravar_cabecalho_e_itens_na_mesma_transacao(
+        self,
+        repository: OracleSnapshotHistoricoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """CONSULTA e INTERRUPCAO_ATIVA vao em um unico execute_batch."""
+        await repository.save(CAPTURADO_EM, [_item(1), _item(2)])
+
+        mock_pool.execute_batch.assert_awaited_once()
+        (header_sql, header), (items_sql, rows) = mock_pool.execute_batch.call_args[0][0]
+        assert "RADAR_API.CONSULTA" in header_sql
+        assert header["status"] == "SNAPSHOT"
+        assert header["capturado_em"] == CAPTURADO_EM
+        assert "SEQ_INTERRUPCAO_ATIVA.NEXTVAL" in items_sql
+        assert [row["conjunto"] for row in rows] == [1, 2]
+        assert {row["id_consulta"] for row in rows} == {header["id"]}
+
+
+@pytest.mark.integration
+class TestFindNearest:
+    """Testes de busca por dthRecuperacao."""
+
+    @pytest.mark.asyncio
+    async def test_deve_montar_snapshot_a_partir_das_linhas(
+        self,
+        repository: OracleSnapshotHistoricoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Linhas do join viram itens no formato ANEEL."""
+        mock_pool.execute.return_value = [
+            {
+                "capturado_em": CAPTURADO_EM,
+                "conjunto": 1,
+                "municipio_ibge": 1400100,
+                "qtd_ucs_atendidas": 1000,
+                "qtd_programada": 10,
+                "qtd_nao_programada": None,
+            }
+        ]
+
+        snapshot = await repository.find_nearest(datetime(2026, 1, 10, 14, 30))
+
+        assert snapshot is not None
+        assert snapshot.capturado_em == CAPTURADO_EM
+        assert snapshot.items[0].qtdOcorrenciaNaoProgramada == 0
+        assert mock_pool.execute.call_args[0][1]["dth"] == datetime(2026, 1, 10, 14, 30)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_sem_interrupcoes_deve_ter_lista_vazia(
+        self,
+        repository: OracleSnapshotHistoricoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """LEFT JOIN sem itens retorna snapshot vazio, nao None."""
+        mock_pool.execute.return_value = [
+            {
+                "capturado_em": CAPTURADO_EM,
+                "conjunto": None,
+                "municipio_ibge": None,
+                "qtd_ucs_atendidas": None,
+                "qtd_programada": None,
+                "qtd_nao_programada": None,
+            }
+        ]
+
+        snapshot = await repository.find_nearest(datetime(2026, 1, 10, 14, 30))
+
+        assert snapshot is not None
+        assert snapshot.items == []
+
+    @pytest.mark.asyncio
+    async def test_sem_historico_deve_retornar_none(
+        self,
+        repository: OracleSnapshotHistoricoRepository,
+    ) -> None:
+        """Nenhuma linha significa que nao ha snapshot ate dth."""
+        assert await repository.find_nearest(datetime(2020, 1, 1)) is None
+
+
+@pytest.mark.integration
+class TestPurge:
+    """Testes de expurgo por retencao."""
+
+    @pytest.mark.asyncio
+    async def test_deve_remover_itens_antes_dos_cabecalhos(
+        self,
+        repository: OracleSnapshotHistoricoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """FK exige remover INTERRUPCAO_ATIVA antes de CONSULTA."""
+        mock_pool.execute_batch.return_value = 42
+
+        removed = await repository.purge_before(datetime(2023, 10, 18))
+
+        statements = mock_pool.execute_batch.call_args[0][0]
+        assert "INTERRUPCAO_ATIVA" in statements[0][0]
+        assert "DELETE FROM RADAR_API.CONSULTA" in statements[1][0]
+        assert removed == 42
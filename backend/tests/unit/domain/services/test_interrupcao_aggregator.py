@@ -7,8 +7,12 @@ from datetime import datetime
 
 import pytest
 
+from backend.shared.domain.services import interrupcao_aggregator
+
 from backend.shared.domain.entities.interrupcao import Interrupcao
 from backend.shared.domain.services.interrupcao_aggregator import (
+    AcumuladorInterrupcoes,
+    AgregacaoIncremental,
     InterrupcaoAgregada,
     InterrupcaoAggregatorService,
 )
@@ -344,3 +348,300 @@ class TestInterrupcaoAggregatorServiceAgregarPorMunicipio:
         assert len(resultado) == 2
         assert resultado[1400100]["programada"] == 50
         assert resultado[1400209]["programada"] == 30
+
+
+@pytest.mark.unit
+class TestAcumuladorInterrupcoes:
+    """Testes para agregacao incremental (lote a lote)."""
+
+    @pytest.fixture
+    def boa_vista(self) -> CodigoIBGE:
+        return CodigoIBGE.create(1400100).value
+
+    @pytest.fixture
+    def caracarai(self) -> CodigoIBGE:
+        return CodigoIBGE.create(1400209).value
+
+    def test_lotes_devem_gerar_mesmo_resultado_que_lista_completa(
+        self,
+        boa_vista: CodigoIBGE,
+        caracarai: CodigoIBGE,
+    ) -> None:
+        """Acumular em lotes equivale a agregar a lista inteira."""
+        # Arrange
+        interrupcoes = [
+            criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50),
+            criar_interrupcao(2, caracarai, 2, TipoInterrupcao.NAO_PROGRAMADA, 30),
+            criar_interrupcao(3, boa_vista, 1, TipoInterrupcao.NAO_PROGRAMADA, 20),
+            criar_interrupcao(4, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 10),
+        ]
+        universo = {(1, 1400100): 1000}
+        acumulador = AcumuladorInterrupcoes()
+
+        # Act
+        acumulador.adicionar(interrupcoes[:2])
+        acumulador.adicionar(interrupcoes[2:])
+
+        # Assert
+        assert acumulador.resultado(universo) == InterrupcaoAggregatorService().agregar(
+            interrupcoes, universo
+        )
+        assert len(acumulador) == 2
+        assert acumulador.quantidade == 4
+
+    def test_acumulador_vazio_deve_retornar_lista_vazia(self) -> None:
+        """Sem lotes o resultado e vazio."""
+        assert AcumuladorInterrupcoes().resultado() == []
+
+    @pytest.mark.asyncio
+    async def test_agregar_stream_deve_consumir_lotes(
+        self,
+        boa_vista: CodigoIBGE,
+    ) -> None:
+        """agregar_stream() consome um async iterator de lotes."""
+
+        async def lotes():
+            yield [criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50)]
+            yield []
+            yield [criar_interrupcao(2, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 25)]
+
+        resultado = await InterrupcaoAggregatorService().agregar_stream(lotes())
+
+        assert len(resultado) == 1
+        assert resultado[0].qtd_programada == 75
+        assert resultado[0].qtd_nao_programada == 0
+
+
+def fechar(interrupcao: Interrupcao) -> Interrupcao:
+    """Versao fechada (com data_fim) da interrupcao."""
+    return Interrupcao.create(
+        id=interrupcao.id,
+        tipo=interrupcao.tipo,
+        municipio=interrupcao.municipio,
+        conjunto=interrupcao.conjunto,
+        ucs_afetadas=interrupcao.ucs_afetadas,
+        data_inicio=interrupcao.data_inicio,
+        data_fim=interrupcao.data_inicio,
+    ).value
+
+
+@pytest.mark.unit
+class TestAgregacaoIncremental:
+    """Testes para agregacao mantida por deltas."""
+
+    @pytest.fixture
+    def boa_vista(self) -> CodigoIBGE:
+        return CodigoIBGE.create(1400100).value
+
+    @pytest.fixture
+    def caracarai(self) -> CodigoIBGE:
+        return CodigoIBGE.create(1400209).value
+
+    def test_deltas_devem_equivaler_a_agregacao_completa(
+        self,
+        boa_vista: CodigoIBGE,
+        caracarai: CodigoIBGE,
+    ) -> None:
+        """Abrir e fechar eventos via delta gera o mesmo que agregar os abertos."""
+        # Arrange
+        a = criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50)
+        b = criar_interrupcao(2, boa_vista, 1, TipoInterrupcao.NAO_PROGRAMADA, 30)
+        c = criar_interrupcao(3, caracarai, 2, TipoInterrupcao.NAO_PROGRAMADA, 20)
+        estado = AgregacaoIncremental()
+        estado.reconciliar([a, b])
+
+        # Act
+        alterados = estado.aplicar([fechar(a), c])
+
+        # Assert
+        assert alterados == 2
+        esperado = sorted(
+            InterrupcaoAggregatorService().agregar([b, c]),
+            key=lambda x: (x.municipio.valor, x.id_conjunto),
+        )
+        assert estado.resultado() == esperado
+        assert len(estado) == 2
+
+    def test_reaplicar_delta_deve_ser_idempotente(self, boa_vista: CodigoIBGE) -> None:
+        """Janelas sobrepostas nao contam eventos em dobro."""
+        a = criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50)
+        estado = AgregacaoIncremental()
+
+        estado.aplicar([a])
+        alterados = estado.aplicar([a])
+
+        assert alterados == 0
+        assert estado.resultado()[0].qtd_programada == 50
+
+    def test_fechar_evento_desconhecido_nao_deve_alterar(
+        self, boa_vista: CodigoIBGE
+    ) -> None:
+        """Evento aberto e fechado entre dois deltas e ignorado."""
+        a = criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50)
+        estado = AgregacaoIncremental()
+
+        assert estado.aplicar([fechar(a)]) == 0
+        assert estado.resultado() == []
+
+    def test_evento_alterado_deve_substituir_contribuicao(
+        self, boa_vista: CodigoIBGE
+    ) -> None:
+        """Mesmo evento com mais UCs substitui o valor anterior."""
+        estado = AgregacaoIncremental()
+        estado.aplicar([criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50)])
+
+        estado.aplicar([criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 80)])
+
+        assert estado.resultado()[0].qtd_programada == 80
+
+    def test_grupo_sem_eventos_abertos_deve_sumir(self, boa_vista: CodigoIBGE) -> None:
+        """Fechar o ultimo evento do grupo remove o grupo do resultado."""
+        a = criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50)
+        estado = AgregacaoIncremental()
+        estado.aplicar([a])
+
+        estado.aplicar([fechar(a)])
+
+        assert estado.resultado() == []
+        assert len(estado) == 0
+
+    def test_reconciliar_deve_informar_grupos_divergentes(
+        self,
+        boa_vista: CodigoIBGE,
+        caracarai: CodigoIBGE,
+    ) -> None:
+        """Reconciliacao substitui o estado e conta o drift."""
+        a = criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 50)
+        b = criar_interrupcao(2, caracarai, 2, TipoInterrupcao.PROGRAMADA, 10)
+        estado = AgregacaoIncremental()
+        estado.aplicar([a, b])
+
+        # NUM_CUST de "a" corrigido no banco sem alterar DT_ON/DT_OFF
+        drift = estado.reconciliar(
+            [criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 70), b]
+        )
+
+        assert drift == 1
+        assert estado.reconciliar([b]) == 1
+        assert [x.municipio.valor for x in estado.resultado()] == [1400209]
+
+    def test_reconciliar_com_linhas_repetidas_deve_contar_evento_uma_vez(
+        self, boa_vista: CodigoIBGE
+    ) -> None:
+        """Evento repetido (uma linha por tarefa do plano) nao deixa UCs fantasmas."""
+        # Arrange
+        a = criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 100)
+        estado = AgregacaoIncremental()
+
+        # Act
+        estado.reconciliar([a, a])
+        contado = estado.resultado()[0].qtd_programada
+        estado.aplicar([fechar(a)])
+
+        # Assert
+        assert contado == 100
+        assert estado.resultado() == []
+        assert len(estado) == 0
+
+    def test_evento_em_dois_municipios_deve_contar_em_cada_um(
+        self, boa_vista: CodigoIBGE, caracarai: CodigoIBGE
+    ) -> None:
+        """Dispositivo em dois municipios: uma linha por municipio, mesmo evento."""
+        # Arrange
+        em_boa_vista = criar_interrupcao(1, boa_vista, 1, TipoInterrupcao.PROGRAMADA, 60)
+        em_caracarai = criar_interrupcao(1, caracarai, 1, TipoInterrupcao.PROGRAMADA, 60)
+        estado = AgregacaoIncremental()
+
+        # Act
+        estado.reconciliar([em_boa_vista, em_caracarai])
+        contados = [x.qtd_programada for x in estado.resultado()]
+        alterados = estado.aplicar([em_boa_vista, em_caracarai])
+        estado.aplicar([fechar(em_boa_vista), fechar(em_caracarai)])
+
+        # Assert
+        assert contados == [60, 60]
+        assert alterados == 0
+        assert len(estado) == 0
+        assert estado.resultado() == []
+
+    def test_resultado_deve_ser_ordenado_por_municipio_e_conjunto(
+        self,
+        boa_vista: CodigoIBGE,
+        caracarai: CodigoIBGE,
+    ) -> None:
+        """Mesma ordenacao da query agregada (ibge, conjunto)."""
+        estado = AgregacaoIncremental()
+        estado.aplicar(
+            [
+                criar_interrupcao(1, caracarai, 1, TipoInterrupcao.PROGRAMADA, 1),
+                criar_interrupcao(2, boa_vista, 3, TipoInterrupcao.PROGRAMADA, 1),
+                criar_interrupcao(3, boa_vista, 2, TipoInterrupcao.PROGRAMADA, 1),
+            ]
+        )
+
+        chaves = [(x.municipio.valor, x.id_conjunto) for x in estado.resultado()]
+
+        assert chaves == [(1400100, 2), (1400100, 3), (1400209, 1)]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def caminho_colunar(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Executa o teste com numpy (se instalado) e com o fallback em Python."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(interrupcao_aggregator, "np", None)
+    return request.param
+
+
+@pytest.mark.unit
+class TestAgregarColunar:
+    """Testes para agregar_colunar (colunas paralelas)."""
+
+    def test_deve_gerar_mesmo_resultado_que_agregar(self, caminho_colunar: str) -> None:
+        """Mesmos agregados e mesma ordem do caminho com entidades."""
+        # Arrange
+        municipios = [CodigoIBGE.create(c).value for c in (1400209, 1400100, 1400159)]
+        interrupcoes = [
+            criar_interrupcao(
+                i,
+                municipios[i % 3],
+                i % 5 + 1,
+                TipoInterrupcao.PROGRAMADA if i % 4 == 0 else TipoInterrupcao.NAO_PROGRAMADA,
+                10 + i,
+            )
+            for i in range(200)
+        ]
+        universo = {(1, 1400100): 500, (2, 1400209): 300}
+
+        # Act
+        resultado = InterrupcaoAggregatorService().agregar_colunar(
+            [x.conjunto for x in interrupcoes],
+            [x.municipio.valor for x in interrupcoes],
+            [x.ucs_afetadas for x in interrupcoes],
+            [x.is_programada() for x in interrupcoes],
+            universo,
+        )
+
+        # Assert
+        assert resultado == InterrupcaoAggregatorService().agregar(interrupcoes, universo)
+
+    def test_colunas_vazias_devem_retornar_lista_vazia(self, caminho_colunar: str) -> None:
+        """Sem linhas nao ha agregados."""
+        assert InterrupcaoAggregatorService().agregar_colunar([], [], [], []) == []
+
+    def test_deve_rejeitar_colunas_de_tamanhos_diferentes(self) -> None:
+        """Colunas desalinhadas geram ValueError."""
+        with pytest.raises(ValueError, match="tamanhos"):
+            InterrupcaoAggregatorService().agregar_colunar([1], [1400100], [], [True])
+
+    def test_resultado_deve_usar_tipos_nativos(self, caminho_colunar: str) -> None:
+        """Valores agregados sao int do Python (serializaveis em JSON)."""
+        resultado = InterrupcaoAggregatorService().agregar_colunar(
+            [1, 1], [1400100, 1400100], [5, 7], [True, False]
+        )
+
+        agregada = resultado[0]
+        assert type(agregada.id_conjunto) is int
+        assert type(agregada.qtd_programada) is int
+        assert (agregada.qtd_programada, agregada.qtd_nao_programada) == (5, 7)
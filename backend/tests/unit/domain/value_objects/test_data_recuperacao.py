@@ -0,0 +1,51 @@
+"""Testes para Value Object DataRecuperacao (parametro dthRecuperacao)."""
+
+from datetime import datetime
+
+import pytest
+
+from backend.shared.domain.value_objects.data_recuperacao import DataRecuperacao
+
+AGORA = datetime(2026, 10, 18, 12, 0)
+
+
+class TestDataRecuperacao:
+    """Testes para Value Object DataRecuperacao."""
+
+    class TestCreate:
+        """Testes do factory method create(str)."""
+
+        @pytest.mark.unit
+        def test_deve_criar_data_no_formato_aneel(self) -> None:
+            """Formato dd/mm/yyyy hh:mm e aceito."""
+            # Act
+            result = DataRecuperacao.create("10/12/2025 14:30", agora=AGORA)
+
+            # Assert
+            assert result.is_success
+            assert result.value.valor == datetime(2025, 12, 10, 14, 30)
+            assert str(result.value) == "10/12/2025 14:30"
+
+        @pytest.mark.unit
+        @pytest.mark.parametrize(
+            "texto",
+            ["2025-12-10 14:30", "10/12/2025", "32/12/2025 14:30", "", "agora"],
+        )
+        def test_deve_rejeitar_formato_invalido(self, texto: str) -> None:
+            """Qualquer outro formato retorna falha."""
+            # Act
+            result = DataRecuperacao.create(texto, agora=AGORA)
+
+            # Assert
+            assert result.is_failure
+            assert "dd/mm/yyyy hh:mm" in result.error
+
+        @pytest.mark.unit
+        def test_deve_rejeitar_data_futura(self) -> None:
+            """Nao existe historico no futuro."""
+            # Act
+            result = DataRecuperacao.create("18/10/2026 12:01", agora=AGORA)
+
+            # Assert
+            assert result.is_failure
+            assert "futuro" in result.error
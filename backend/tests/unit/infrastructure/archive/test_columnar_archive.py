@@ -0,0 +1,161 @@
+"""Testes para ColumnarArchive."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from backend.shared.infrastructure.archive import ColumnarArchive
+
+DIA = datetime(2026, 1, 10)
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> ColumnarArchive:
+    """Arquivo isolado com 2 colunas."""
+    archive = ColumnarArchive(tmp_path / "archive", column_count=2)
+    yield archive
+    archive.close()
+
+
+@pytest.mark.unit
+class TestColumnarArchive:
+    """Testes para ColumnarArchive."""
+
+    class TestFindAt:
+        """Testes da busca do bloco vigente."""
+
+        def test_deve_retornar_bloco_mais_recente_ate_o_instante(
+            self, archive: ColumnarArchive
+        ) -> None:
+            """Entre dois blocos, retorna o ultimo gravado ate T."""
+            # Arrange
+            archive.append(DIA.replace(hour=10), ([1, 2], [10, 20]))
+            archive.append(DIA.replace(hour=11), ([3], [30]))
+
+            # Act
+            block = archive.find_at(DIA.replace(hour=10, minute=59))
+
+            # Assert
+            assert block is not None
+            assert block.timestamp == DIA.replace(hour=10)
+            assert block.columns == ((1, 2), (10, 20))
+            assert block.rows() == [(1, 10), (2, 20)]
+
+        def test_deve_retornar_bloco_exato(self, archive: ColumnarArchive) -> None:
+            """Instante igual ao da captura retorna o proprio bloco."""
+            archive.append(DIA.replace(hour=10), ([1], [10]))
+            archive.append(DIA.replace(hour=11), ([3], [30]))
+
+            block = archive.find_at(DIA.replace(hour=11))
+
+            assert block is not None
+            assert block.columns == ((3,), (30,))
+
+        def test_deve_buscar_no_dia_anterior(self, archive: ColumnarArchive) -> None:
+            """Sem bloco ate T no dia, usa o ultimo bloco do dia anterior."""
+            archive.append(datetime(2026, 1, 8, 23, 55), ([1], [10]))
+            archive.append(datetime(2026, 1, 10, 8, 0), ([2], [20]))
+
+            block = archive.find_at(datetime(2026, 1, 10, 7, 0))
+
+            assert block is not None
+            assert block.timestamp == datetime(2026, 1, 8, 23, 55)
+
+        def test_deve_retornar_none_antes_do_primeiro_bloco(
+            self, archive: ColumnarArchive
+        ) -> None:
+            """Instante anterior a todo o historico retorna None."""
+            archive.append(DIA.replace(hour=10), ([1], [10]))
+
+            assert archive.find_at(DIA.replace(hour=9)) is None
+            assert archive.find_at(datetime(2025, 12, 31)) is None
+
+        def test_deve_enxergar_blocos_gravados_apos_leitura(
+            self, archive: ColumnarArchive
+        ) -> None:
+            """Segmento ja mapeado e remapeado quando o indice cresce."""
+            archive.append(DIA.replace(hour=10), ([1], [10]))
+            assert archive.find_at(DIA.replace(hour=23)) is not None
+
+            archive.append(DIA.replace(hour=11), ([2], [20]))
+            block = archive.find_at(DIA.replace(hour=23))
+
+            assert block is not None
+            assert block.columns == ((2,), (20,))
+
+        def test_deve_ler_bloco_vazio(self, archive: ColumnarArchive) -> None:
+            """Snapshot sem interrupcoes e gravado e lido sem linhas."""
+            archive.append(DIA, ([], []))
+
+            block = archive.find_at(DIA)
+
+            assert block is not None
+            assert block.row_count == 0
+
+        def test_deve_ler_arquivo_gravado_por_outra_instancia(
+            self, tmp_path: Path
+        ) -> None:
+            """Outro processo (worker) le os blocos gravados pelo lider."""
+            writer = ColumnarArchive(tmp_path / "shared", column_count=1)
+            reader = ColumnarArchive(tmp_path / "shared", column_count=1)
+            writer.append(DIA, ([7],))
+
+            block = reader.find_at(DIA)
+
+            assert block is not None
+            assert block.columns == ((7,),)
+            writer.close()
+            reader.close()
+
+    class TestAppend:
+        """Testes de gravacao."""
+
+        def test_deve_ignorar_bloco_fora_de_ordem(self, archive: ColumnarArchive) -> None:
+            """Bloco com timestamp nao crescente nao e gravado."""
+            assert archive.append(DIA.replace(hour=11), ([1], [10])) is True
+
+            assert archive.append(DIA.replace(hour=11), ([2], [20])) is False
+            assert archive.append(DIA.replace(hour=10), ([3], [30])) is False
+            assert archive.find_at(DIA.replace(hour=12)).columns == ((1,), (10,))
+
+        def test_deve_rejeitar_numero_de_colunas_invalido(
+            self, archive: ColumnarArchive
+        ) -> None:
+            """Quantidade de colunas diferente da configurada gera ValueError."""
+            with pytest.raises(ValueError, match="colunas"):
+                archive.append(DIA, ([1],))
+
+        def test_deve_rejeitar_colunas_de_tamanhos_diferentes(
+            self, archive: ColumnarArchive
+        ) -> None:
+            """Colunas desalinhadas geram ValueError."""
+            with pytest.raises(ValueError, match="tamanhos"):
+                archive.append(DIA, ([1, 2], [10]))
+
+        def test_deve_rejeitar_valor_fora_de_int32(self, archive: ColumnarArchive) -> None:
+            """Valores acima de int32 geram ValueError sem gravar nada."""
+            with pytest.raises(ValueError, match="int32"):
+                archive.append(DIA, ([2**31], [1]))
+
+            assert archive.find_at(DIA) is None
+
+    class TestPurge:
+        """Testes de expurgo."""
+
+        def test_deve_remover_dias_anteriores_ao_limite(
+            self, archive: ColumnarArchive
+        ) -> None:
+            """Segmentos anteriores ao limite sao removidos; o resto fica."""
+            for day in (8, 9, 10):
+                archive.append(datetime(2026, 1, day, 12), ([day], [day]))
+            archive.find_at(datetime(2026, 1, 8, 13))
+
+            removed = archive.purge_before(date(2026, 1, 10))
+
+            assert removed == 2
+            assert archive.days() == [date(2026, 1, 10)]
+            assert archive.find_at(datetime(2026, 1, 9, 23)) is None
+            assert archive.find_at(datetime(2026, 1, 10, 13)) is not None
@@ -0,0 +1,286 @@
+"""Testes para o indice de API Keys (TOKEN_ACESSO)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.shared.infrastructure.auth.api_key_index import (
+    UPDATE_ACESSOS,
+    ApiKeyIndexRepository,
+    ApiKeyStatus,
+    hash_api_key,
+    parse_ips_permitidos,
+)
+from backend.shared.infrastructure.auth.ip_matcher import compile_ip_matcher
+
+AMANHA = datetime.now() + timedelta(days=1)
+ONTEM = datetime.now() - timedelta(days=1)
+
+ROWS = [
+    ("t1", "ANEEL", "chave-aneel", None, "200.198.1.10, 200.198.1.11"),
+    ("t2", "Interno", "chave-interna", AMANHA, None),
+    ("t3", "Vencido", "chave-vencida", ONTEM, "*"),
+]
+
+
+def make_pool(rows: list[tuple] | None = None) -> MagicMock:
+    """Pool que retorna as linhas de TOKEN_ACESSO."""
+    pool = MagicMock()
+    pool.execute_rows = AsyncMock(return_value=ROWS if rows is None else rows)
+    pool.executemany = AsyncMock(return_value=1)
+    return pool
+
+
+@pytest.mark.unit
+class TestParseIpsPermitidos:
+    """Testes para parse_ips_permitidos."""
+
+    def test_deve_aceitar_qualquer_ip_quando_vazio_ou_asterisco(self) -> None:
+        """Coluna vazia ou * significa sem restricao."""
+        assert parse_ips_permitidos(None) is None
+        assert parse_ips_permitidos("") is None
+        assert parse_ips_permitidos("*") is None
+
+    def test_deve_aceitar_ips_e_faixas_cidr(self) -> None:
+        """Lista separada por virgula com IPs e CIDR."""
+        matcher = parse_ips_permitidos("10.0.0.1, 192.168.0.0/16,")
+
+        assert matcher is not None
+        assert matcher.match("10.0.0.1")
+        assert matcher.match("192.168.4.2")
+        assert not matcher.match("10.0.0.2")
+
+
+@pytest.mark.unit
+class TestApiKeyIndexRepository:
+    """Testes para ApiKeyIndexRepository."""
+
+    class TestValidate:
+        """Testes para validacao de chaves."""
+
+        @pytest.mark.asyncio
+        async def test_deve_validar_chave_e_ip_permitido(self) -> None:
+            """Chave conhecida vinda de IP da lista e valida."""
+            # Arrange
+            repository = ApiKeyIndexRepository(make_pool())
+            await repository.get_index()
+
+            # Act
+            status, token = repository.validate("chave-aneel", "200.198.1.11")
+
+            # Assert
+            assert status is ApiKeyStatus.VALIDA
+            assert token is not None and token.id == "t1"
+
+        @pytest.mark.asyncio
+        async def test_deve_recusar_chave_desconhecida(self) -> None:
+            """Chave fora do indice e invalida."""
+            # Arrange
+            repository = ApiKeyIndexRepository(make_pool())
+            await repository.get_index()
+
+            # Act
+            status, token = repository.validate("chave-aneel-x", "200.198.1.10")
+
+            # Assert
+            assert status is ApiKeyStatus.INVALIDA
+            assert token is None
+
+        @pytest.mark.asyncio
+        async def test_deve_recusar_ip_fora_da_lista_do_token(self) -> None:
+            """IP nao listado em IP_ORIGEM_PERMITIDO e recusado."""
+            # Arrange
+            repository = ApiKeyIndexRepository(make_pool())
+            await repository.get_index()
+
+            # Act
+            status, _ = repository.validate("chave-aneel", "10.0.0.1")
+
+            # Assert
+            assert status is ApiKeyStatus.IP_NAO_PERMITIDO
+
+        @pytest.mark.asyncio
+        async def test_deve_recusar_token_expirado_desde_a_carga(self) -> None:
+            """Expiracao e conferida na validacao, nao so na query."""
+            # Arrange
+            repository = ApiKeyIndexRepository(make_pool())
+            await repository.get_index()
+
+            # Act
+            status, _ = repository.validate("chave-vencida", "10.0.0.1")
+
+            # Assert
+            assert status is ApiKeyStatus.EXPIRADA
+
+        @pytest.mark.asyncio
+        async def test_nao_deve_manter_chave_em_texto_no_indice(self) -> None:
+            """O indice guarda apenas o digest da chave."""
+            # Arrange
+            repository = ApiKeyIndexRepository(make_pool())
+
+            # Act
+            index = await repository.get_index()
+
+            # Assert
+            assert hash_api_key("chave-aneel") in index.tokens
+            assert "chave-aneel" not in repr(index)
+
+        @pytest.mark.asyncio
+        async def test_token_com_ips_invalidos_nao_deve_impedir_a_carga(self) -> None:
+            """Linha com IP_ORIGEM_PERMITIDO malformado e ignorada."""
+            # Arrange
+            rows = [*ROWS, ("t4", "Malformado", "chave-malformada", None, "10.0.0.1;10.0.0.2")]
+            repository = ApiKeyIndexRepository(make_pool(rows))
+
+            # Act
+            index = await repository.get_index()
+
+            # Assert
+            assert len(index) == 3
+            assert repository.validate("chave-malformada", "10.0.0.1")[0] is ApiKeyStatus.INVALIDA
+            assert repository.validate("chave-aneel", "200.198.1.10")[0] is ApiKeyStatus.VALIDA
+            assert repository.get_stats().invalid_tokens == 1
+
+    class TestRefresh:
+        """Testes para recarga do indice."""
+
+        @pytest.mark.asyncio
+        async def test_deve_carregar_uma_vez_sob_demanda(self) -> None:
+            """Leituras seguintes nao vao ao banco."""
+            # Arrange
+            pool = make_pool()
+            repository = ApiKeyIndexRepository(pool)
+
+            # Act
+            await repository.get_index()
+            await repository.get_index()
+
+            # Assert
+            assert pool.execute_rows.await_count == 1
+
+        @pytest.mark.asyncio
+        async def test_deve_trocar_versao_quando_token_e_revogado(self) -> None:
+            """Token removido da tabela deixa de validar apos o refresh."""
+            # Arrange
+            pool = make_pool()
+            repository = ApiKeyIndexRepository(pool)
+            first = await repository.get_index()
+            pool.execute_rows.return_value = ROWS[1:]
+
+            # Act
+            second = await repository.refresh()
+
+            # Assert
+            assert second.version == first.version + 1
+            assert repository.validate("chave-aneel", "200.198.1.10")[0] is ApiKeyStatus.INVALIDA
+
+        @pytest.mark.asyncio
+        async def test_deve_manter_versao_com_muitas_listas_de_ips(self) -> None:
+            """Listas distintas alem do cache de compilacao nao contam como mudanca."""
+            # Arrange
+            rows = [(f"t{n}", "Cliente", f"chave-{n}", None, f"10.0.{n}.0/24") for n in range(40)]
+            pool = make_pool(rows)
+            repository = ApiKeyIndexRepository(pool)
+            proxies = compile_ip_matcher("10.0.0.0/8")
+            first = await repository.get_index()
+
+            # Act
+            second = await repository.refresh()
+
+            # Assert
+            assert second.version == first.version
+            assert compile_ip_matcher("10.0.0.0/8") is proxies
+
+        @pytest.mark.asyncio
+        async def test_deve_manter_versao_anterior_em_falha(self) -> None:
+            """Falha na recarga propaga e mantem o indice."""
+            # Arrange
+            pool = make_pool()
+            repository = ApiKeyIndexRepository(pool)
+            first = await repository.get_index()
+            pool.execute_rows.side_effect = RuntimeError("ORA-12170")
+
+            # Act / Assert
+            with pytest.raises(RuntimeError):
+                await repository.refresh()
+            assert repository.current is first
+            assert repository.get_stats().failures == 1
+
+    class TestAcessos:
+        """Testes para gravacao em lote dos acessos."""
+
+        @pytest.mark.asyncio
+        async def test_deve_agrupar_acessos_por_token(self) -> None:
+            """Um UPDATE por token com o total de acessos."""
+            # Arrange
+            pool = make_pool()
+            repository = ApiKeyIndexRepository(pool)
+            await repository.get_index()
+            for _ in range(3):
+                repository.validate("chave-aneel", "200.198.1.10")
+            repository.validate("chave-interna", "10.0.0.1")
+            repository.validate("chave-aneel", "10.0.0.1")  # recusada
+
+            # Act
+            total = await repository.flush_acessos()
+
+            # Assert
+            assert total == 4
+            sql, rows = pool.executemany.await_args.args
+            assert sql == UPDATE_ACESSOS
+            assert {row["id"]: row["acessos"] for row in rows} == {"t1": 3, "t2": 1}
+            assert repository.get_stats().pending_tokens == 0
+
+        @pytest.mark.asyncio
+        async def test_nao_deve_gravar_sem_acessos(self) -> None:
+            """Sem acessos pendentes nao ha UPDATE."""
+            # Arrange
+            pool = make_pool()
+            repository = ApiKeyIndexRepository(pool)
+
+            # Act
+            total = await repository.flush_acessos()
+
+            # Assert
+            assert total == 0
+            pool.executemany.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_deve_manter_acessos_quando_gravacao_falha(self) -> None:
+            """Acessos voltam para a fila e sao somados aos novos."""
+            # Arrange
+            pool = make_pool()
+            repository = ApiKeyIndexRepository(pool)
+            repository.registrar_acesso("t1")
+            repository.registrar_acesso("t1")
+            pool.executemany.side_effect = RuntimeError("ORA-00054")
+
+            # Act
+            with pytest.raises(RuntimeError):
+                await repository.flush_acessos()
+            repository.registrar_acesso("t1")
+            pool.executemany.side_effect = None
+            total = await repository.flush_acessos()
+
+            # Assert
+            assert total == 3
+            assert repository.get_stats().flush_failures == 1
+
+        @pytest.mark.asyncio
+        async def test_refresh_deve_gravar_acessos_antes_de_recarregar(self) -> None:
+            """Falha ao gravar acessos nao impede a recarga."""
+            # Arrange
+            pool = make_pool()
+            pool.executemany.side_effect = RuntimeError("ORA-00054")
+            repository = ApiKeyIndexRepository(pool)
+            repository.registrar_acesso("t1")
+
+            # Act
+            index = await repository.refresh()
+
+            # Assert
+            assert len(index) == 3
+            assert repository.get_stats().pending_tokens == 1
@@ -0,0 +1,139 @@
+"""Testes para IpMatcher e resolucao do IP do cliente."""
+
+from __future__ import annotations
+
+import ipaddress
+
+import pytest
+
+from backend.shared.infrastructure.auth.ip_matcher import (
+    IpMatcher,
+    compile_ip_matcher,
+    resolve_client_ip,
+)
+
+
+@pytest.mark.unit
+class TestIpMatcher:
+    """Testes para IpMatcher."""
+
+    def test_deve_aceitar_ip_exato(self) -> None:
+        """IP sem mascara equivale a /32."""
+        matcher = IpMatcher.parse("200.198.1.10")
+
+        assert matcher.match("200.198.1.10")
+        assert not matcher.match("200.198.1.11")
+
+    def test_deve_aceitar_faixa_cidr(self) -> None:
+        """Qualquer IP da faixa pertence a lista."""
+        matcher = IpMatcher.parse("10.0.0.0/8, 192.168.1.0/24")
+
+        assert matcher.match("10.255.3.4")
+        assert matcher.match("192.168.1.200")
+        assert not matcher.match("192.168.2.1")
+        assert not matcher.match("11.0.0.1")
+
+    def test_prefixo_curto_deve_absorver_prefixos_longos(self) -> None:
+        """A ordem de insercao nao muda o resultado."""
+        longo_primeiro = IpMatcher.parse("10.1.2.3, 10.0.0.0/8")
+        curto_primeiro = IpMatcher.parse("10.0.0.0/8, 10.1.2.3")
+
+        for ip in ("10.1.2.3", "10.9.9.9"):
+            assert longo_primeiro.match(ip)
+            assert curto_primeiro.match(ip)
+
+    def test_deve_suportar_ipv6_e_ipv4_mapeado(self) -> None:
+        """Familias separadas; ::ffff:a.b.c.d vale como IPv4."""
+        matcher = IpMatcher.parse("2001:db8::/32, 172.16.0.0/12")
+
+        assert matcher.match("2001:db8:1::5")
+        assert not matcher.match("2001:db9::1")
+        assert matcher.match("::ffff:172.20.0.1")
+
+    def test_asterisco_deve_aceitar_qualquer_ip(self) -> None:
+        """* aceita todos os IPs."""
+        matcher = IpMatcher.parse("10.0.0.1, *")
+
+        assert matcher.allow_all
+        assert matcher.match("8.8.8.8")
+
+    def test_deve_recusar_ip_invalido_ou_ausente(self) -> None:
+        """Texto que nao e IP nunca pertence a lista."""
+        matcher = IpMatcher.parse("0.0.0.0/0")
+
+        assert matcher.match("1.2.3.4")
+        assert not matcher.match("nao-e-ip")
+        assert not matcher.match(None)
+
+    def test_lista_vazia_nao_deve_aceitar_nada(self) -> None:
+        """Lista vazia e falsa e nao aceita IPs."""
+        matcher = IpMatcher.parse("")
+
+        assert not matcher
+        assert not matcher.match("10.0.0.1")
+
+    def test_entrada_invalida_deve_falhar_na_compilacao(self) -> None:
+        """Erro de configuracao aparece ao compilar."""
+        with pytest.raises(ValueError):
+            IpMatcher.parse("10.0.0.0/33")
+
+    def test_deve_concordar_com_ipaddress(self) -> None:
+        """Mesmo resultado da verificacao linear com ipaddress."""
+        entradas = ["10.0.0.0/8", "172.16.5.0/24", "200.198.1.10", "100.64.0.0/10", "3.3.0.0/17"]
+        redes = [ipaddress.ip_network(e) for e in entradas]
+        matcher = IpMatcher(entradas)
+
+        for n in range(0, 2**32, 7_919_993):
+            ip = ipaddress.IPv4Address(n)
+            assert matcher.match_packed(ip.packed) == any(ip in rede for rede in redes)
+
+    def test_deve_comparar_pelas_redes_normalizadas(self) -> None:
+        """Mesma lista em outra ordem ou grafia e igual; outra lista nao."""
+        matcher = IpMatcher.parse("10.0.0.0/8, 200.198.1.10")
+
+        assert matcher == IpMatcher.parse("200.198.1.10/32,10.1.2.3/8")
+        assert hash(matcher) == hash(IpMatcher.parse("200.198.1.10/32,10.1.2.3/8"))
+        assert matcher != IpMatcher.parse("10.0.0.0/8")
+        assert IpMatcher.parse("*") != IpMatcher.parse("")
+
+    def test_compilacao_deve_ser_reaproveitada(self) -> None:
+        """A mesma lista compila uma unica vez."""
+        assert compile_ip_matcher("10.0.0.0/8") is compile_ip_matcher("10.0.0.0/8")
+
+
+@pytest.mark.unit
+class TestResolveClientIp:
+    """Testes para resolve_client_ip."""
+
+    PROXIES = IpMatcher.parse("10.0.0.0/8")
+
+    def test_deve_ignorar_headers_sem_proxy_confiavel(self) -> None:
+        """Cliente direto nao escolhe o proprio IP."""
+        headers = {"x-forwarded-for": "1.2.3.4", "x-real-ip": "5.6.7.8"}
+
+        assert resolve_client_ip("200.1.1.1", headers, self.PROXIES) == "200.1.1.1"
+        assert resolve_client_ip("10.0.0.5", headers, IpMatcher.parse("")) == "10.0.0.5"
+
+    def test_deve_pular_proxies_confiaveis_da_direita_para_esquerda(self) -> None:
+        """O cliente e o primeiro hop nao confiavel a partir da direita."""
+        headers = {"x-forwarded-for": "6.6.6.6, 200.1.1.1, 10.1.1.1"}
+
+        assert resolve_client_ip("10.0.0.5", headers, self.PROXIES) == "200.1.1.1"
+
+    def test_deve_usar_primeiro_hop_se_todos_confiaveis(self) -> None:
+        """Cadeia apenas de proxies confiaveis usa o IP mais a esquerda."""
+        headers = {"x-forwarded-for": "10.2.2.2, 10.1.1.1"}
+
+        assert resolve_client_ip("10.0.0.5", headers, self.PROXIES) == "10.2.2.2"
+
+    def test_deve_usar_x_real_ip_sem_forwarded_for(self) -> None:
+        """X-Real-IP de proxy confiavel."""
+        headers = {"x-real-ip": " 200.1.1.1 "}
+
+        assert resolve_client_ip("10.0.0.5", headers, self.PROXIES) == "200.1.1.1"
+
+    def test_asterisco_deve_manter_comportamento_anterior(self) -> None:
+        """Com * o primeiro IP de X-Forwarded-For e o cliente."""
+        headers = {"x-forwarded-for": "1.2.3.4, 5.6.7.8"}
+
+        assert resolve_client_ip("200.1.1.1", headers, IpMatcher.parse("*")) == "1.2.3.4"
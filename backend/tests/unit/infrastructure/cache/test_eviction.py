@@ -0,0 +1,141 @@
+"""Testes para as politicas de eviccao do cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.shared.infrastructure.cache.eviction import (
+    ExpiryHeap,
+    LFUPolicy,
+    LRUPolicy,
+    TTLPolicy,
+    create_eviction_policy,
+)
+
+
+@pytest.mark.unit
+class TestLRUPolicy:
+    """Testes para LRUPolicy."""
+
+    def test_deve_despejar_na_ordem_de_uso(self) -> None:
+        """Chave acessada vai para o fim da fila."""
+        policy = LRUPolicy()
+        for key in ("a", "b", "c"):
+            policy.on_insert(key, 0)
+
+        policy.on_access("a")
+
+        assert [policy.pop_victim() for _ in range(3)] == ["b", "c", "a"]
+        assert policy.pop_victim() is None
+
+    def test_remocao_tira_chave_da_fila(self) -> None:
+        """on_remove() exclui a chave da eviccao."""
+        policy = LRUPolicy()
+        policy.on_insert("a", 0)
+        policy.on_insert("b", 0)
+
+        policy.on_remove("a")
+
+        assert policy.pop_victim() == "b"
+
+
+@pytest.mark.unit
+class TestLFUPolicy:
+    """Testes para LFUPolicy."""
+
+    def test_deve_despejar_menos_frequente(self) -> None:
+        """Menor frequencia sai primeiro; empate desfeito por LRU."""
+        policy = LFUPolicy()
+        for key in ("a", "b", "c"):
+            policy.on_insert(key, 0)
+        policy.on_access("a")
+        policy.on_access("a")
+        policy.on_access("c")
+
+        assert [policy.pop_victim() for _ in range(3)] == ["b", "c", "a"]
+
+    def test_deve_recalcular_minimo_apos_remocao(self) -> None:
+        """Remover o unico item de menor frequencia nao quebra a eviccao."""
+        policy = LFUPolicy()
+        policy.on_insert("a", 0)
+        policy.on_insert("b", 0)
+        policy.on_access("b")
+        policy.on_access("b")
+
+        policy.on_remove("a")
+
+        assert policy.pop_victim() == "b"
+
+    def test_sobrescrita_conta_como_acesso(self) -> None:
+        """Regravar chave existente incrementa a frequencia."""
+        policy = LFUPolicy()
+        policy.on_insert("a", 0)
+        policy.on_insert("b", 0)
+
+        policy.on_insert("a", 0)
+
+        assert policy.pop_victim() == "b"
+
+
+@pytest.mark.unit
+class TestTTLPolicy:
+    """Testes para TTLPolicy."""
+
+    def test_deve_despejar_pela_expiracao(self) -> None:
+        """Chave com menor expiracao sai primeiro."""
+        policy = TTLPolicy()
+        policy.on_insert("a", 300)
+        policy.on_insert("b", 100)
+        policy.on_insert("c", 200)
+
+        assert [policy.pop_victim() for _ in range(3)] == ["b", "c", "a"]
+
+    def test_sobrescrita_usa_nova_expiracao(self) -> None:
+        """Entrada antiga da chave regravada e ignorada."""
+        policy = TTLPolicy()
+        policy.on_insert("a", 100)
+        policy.on_insert("b", 200)
+
+        policy.on_insert("a", 300)
+
+        assert policy.pop_victim() == "b"
+        assert policy.pop_victim() == "a"
+        assert policy.pop_victim() is None
+
+
+@pytest.mark.unit
+class TestExpiryHeap:
+    """Testes para ExpiryHeap."""
+
+    def test_pop_expired_retorna_apenas_expirados(self) -> None:
+        """Somente chaves com expiracao anterior a now sao retornadas."""
+        heap = ExpiryHeap()
+        heap.push("a", 10)
+        heap.push("b", 20)
+        heap.push("c", 30)
+
+        assert heap.pop_expired(25) == ["a", "b"]
+        assert len(heap) == 1
+
+    def test_compacta_entradas_invalidas(self) -> None:
+        """Regravacoes repetidas nao fazem o heap crescer sem limite."""
+        heap = ExpiryHeap()
+
+        for i in range(10_000):
+            heap.push("k", float(i))
+
+        assert len(heap._heap) < 200
+        assert heap.pop_min() == "k"
+
+
+@pytest.mark.unit
+class TestCreateEvictionPolicy:
+    """Testes para a factory de politicas."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [("lru", LRUPolicy), ("lfu", LFUPolicy), ("ttl", TTLPolicy)],
+    )
+    def test_deve_criar_politica_pelo_nome(self, name: str, expected: type) -> None:
+        """Factory retorna a classe correspondente."""
+        assert isinstance(create_eviction_policy(name), expected)  # type: ignore[arg-type]
@@ -0,0 +1,220 @@
+"""Testes para MemoryCache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.shared.infrastructure.cache.memory_cache import MemoryCache
+
+TIME_PATH = "backend.shared.infrastructure.cache.memory_cache.time.time"
+
+
+@pytest.mark.unit
+class TestMemoryCache:
+    """Testes para MemoryCache."""
+
+    class TestGetSet:
+        """Testes de leitura e escrita."""
+
+        @pytest.mark.asyncio
+        async def test_deve_retornar_valor_armazenado(self) -> None:
+            """get() retorna o valor gravado por set()."""
+            cache = MemoryCache()
+
+            await cache.set("k", [1, 2, 3])
+
+            assert await cache.get("k") == [1, 2, 3]
+
+        @pytest.mark.asyncio
+        async def test_item_expirado_deve_ir_para_stale(self) -> None:
+            """Item expirado vira miss, mas continua em get_stale()."""
+            cache = MemoryCache()
+            with patch(TIME_PATH, return_value=1000.0):
+                await cache.set("k", "v", ttl_seconds=10)
+
+            with patch(TIME_PATH, return_value=1011.0):
+                fresh = await cache.get("k")
+                stale = await cache.get_stale("k")
+
+            assert fresh is None
+            assert stale == "v"
+
+        @pytest.mark.asyncio
+        async def test_estatisticas_de_hit_e_miss(self) -> None:
+            """get_stats() contabiliza hits e misses."""
+            cache = MemoryCache()
+            await cache.set("k", "v")
+
+            await cache.get("k")
+            await cache.get("inexistente")
+            stats = cache.get_stats()
+
+            assert stats.hits == 1
+            assert stats.misses == 1
+            assert stats.hit_rate == 0.5
+
+    class TestEviccao:
+        """Testes de eviccao ao atingir max_items."""
+
+        @pytest.mark.asyncio
+        async def test_lru_deve_despejar_menos_recente(self) -> None:
+            """Com LRU, a chave lida recentemente sobrevive."""
+            cache = MemoryCache(max_items=2, eviction_policy="lru")
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+            await cache.get("a")
+
+            await cache.set("c", 3)
+
+            assert await cache.get("a") == 1
+            assert await cache.get("b") is None
+            assert await cache.get("c") == 3
+
+        @pytest.mark.asyncio
+        async def test_lfu_deve_despejar_menos_frequente(self) -> None:
+            """Com LFU, a chave mais acessada sobrevive."""
+            cache = MemoryCache(max_items=2, eviction_policy="lfu")
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+            for _ in range(3):
+                await cache.get("b")
+            await cache.get("a")
+
+            await cache.set("c", 3)
+
+            assert await cache.get("a") is None
+            assert await cache.get("b") == 2
+
+        @pytest.mark.asyncio
+        async def test_ttl_deve_despejar_mais_proximo_de_expirar(self) -> None:
+            """Com TTL, a chave de menor expiracao e despejada."""
+            cache = MemoryCache(max_items=2, eviction_policy="ttl")
+            await cache.set("longa", 1, ttl_seconds=600)
+            await cache.set("curta", 2, ttl_seconds=60)
+
+            await cache.set("c", 3, ttl_seconds=300)
+
+            assert await cache.get("curta") is None
+            assert await cache.get("longa") == 1
+
+        @pytest.mark.asyncio
+        async def test_sobrescrita_nao_deve_despejar(self) -> None:
+            """Regravar chave existente nao conta como item novo."""
+            cache = MemoryCache(max_items=2)
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+
+            await cache.set("a", 10)
+
+            assert await cache.get("a") == 10
+            assert await cache.get("b") == 2
+            assert cache.get_stats().evictions == 0
+
+        @pytest.mark.asyncio
+        async def test_item_despejado_deve_ficar_disponivel_como_stale(self) -> None:
+            """Eviccao preserva o valor como stale para fallback."""
+            cache = MemoryCache(max_items=1)
+            await cache.set("a", 1)
+
+            await cache.set("b", 2)
+
+            assert await cache.get_stale("a") == 1
+            assert cache.get_stats().evictions == 1
+
+        def test_politica_invalida_deve_levantar_erro(self) -> None:
+            """Politica desconhecida e rejeitada na construcao."""
+            with pytest.raises(ValueError, match="Politica de eviccao invalida"):
+                MemoryCache(eviction_policy="fifo")  # type: ignore[arg-type]
+
+    class TestStaleLimitado:
+        """Testes do limite do stale cache."""
+
+        @pytest.mark.asyncio
+        async def test_stale_deve_respeitar_max_stale_items(self) -> None:
+            """Stale cache descarta os itens mais antigos quando cheio."""
+            cache = MemoryCache(max_items=1, max_stale_items=2)
+
+            for i in range(5):
+                await cache.set(f"k{i}", i)
+
+            stats = cache.get_stats()
+            assert stats.stale_item_count == 2
+            assert await cache.get_stale("k0") is None
+            assert await cache.get_stale("k3") == 3
+
+    class TestCleanup:
+        """Testes da limpeza periodica."""
+
+        @pytest.mark.asyncio
+        async def test_cleanup_move_expirados_para_stale(self) -> None:
+            """_cleanup() tira expirados do cache principal."""
+            cache = MemoryCache()
+            with patch(TIME_PATH, return_value=1000.0):
+                await cache.set("curta", 1, ttl_seconds=10)
+                await cache.set("longa", 2, ttl_seconds=600)
+
+            with patch(TIME_PATH, return_value=1011.0):
+                cache._cleanup()
+
+            stats = cache.get_stats()
+            assert stats.item_count == 1
+            assert stats.stale_item_count == 1
+
+        @pytest.mark.asyncio
+        async def test_cleanup_remove_stale_expirado(self) -> None:
+            """_cleanup() descarta stale alem do stale TTL."""
+            cache = MemoryCache(stale_ttl_seconds=100)
+            with patch(TIME_PATH, return_value=1000.0):
+                await cache.set("k", 1, ttl_seconds=10)
+            with patch(TIME_PATH, return_value=1011.0):
+                cache._cleanup()
+
+            with patch(TIME_PATH, return_value=1112.0):
+                cache._cleanup()
+
+            assert cache.get_stats().stale_item_count == 0
+
+        @pytest.mark.asyncio
+        async def test_cleanup_ignora_chave_regravada(self) -> None:
+            """Expiracao antiga de chave regravada nao remove o valor novo."""
+            cache = MemoryCache()
+            with patch(TIME_PATH, return_value=1000.0):
+                await cache.set("k", "antigo", ttl_seconds=10)
+                await cache.set("k", "novo", ttl_seconds=600)
+
+            with patch(TIME_PATH, return_value=1011.0):
+                cache._cleanup()
+                value = await cache.get("k")
+
+            assert value == "novo"
+
+    class TestInvalidate:
+        """Testes de invalidacao."""
+
+        @pytest.mark.asyncio
+        async def test_invalidate_remove_fresh_e_stale(self) -> None:
+            """invalidate() remove a chave de ambos os caches."""
+            cache = MemoryCache(max_items=1)
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+
+            await cache.invalidate("a")
+            await cache.invalidate("b")
+
+            assert await cache.get_stale("a") is None
+            assert await cache.get_stale("b") is None
+
+        @pytest.mark.asyncio
+        async def test_invalidate_all_limpa_politica(self) -> None:
+            """Apos invalidate_all() o cache volta a aceitar max_items itens."""
+            cache = MemoryCache(max_items=2)
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+
+            await cache.invalidate_all()
+            await cache.set("c", 3)
+            await cache.set("d", 4)
+
+            assert cache.get_stats().evictions == 0
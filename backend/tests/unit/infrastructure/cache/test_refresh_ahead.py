@@ -0,0 +1,161 @@
+"""Testes para RefreshAheadScheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.shared.infrastructure.cache.refresh_ahead import RefreshAheadScheduler
+
+
+@pytest.mark.unit
+class TestRefreshAheadScheduler:
+    """Testes para RefreshAheadScheduler."""
+
+    class TestNextDelay:
+        """Testes do calculo do proximo refresh."""
+
+        def test_intervalo_com_jitter_nunca_excede_intervalo(self) -> None:
+            """Jitter e subtraido para o refresh ocorrer antes do TTL."""
+            scheduler = RefreshAheadScheduler(
+                name="k", refresh=AsyncMock(), interval_seconds=240, jitter_seconds=24
+            )
+
+            delays = [scheduler.next_delay() for _ in range(100)]
+
+            assert all(216 <= d <= 240 for d in delays)
+
+        @pytest.mark.asyncio
+        async def test_backoff_exponencial_apos_falhas(self) -> None:
+            """Falhas consecutivas dobram o intervalo de retentativa."""
+            refresh = AsyncMock(side_effect=Exception("DB Error"))
+            scheduler = RefreshAheadScheduler(
+                name="k",
+                refresh=refresh,
+                interval_seconds=240,
+                retry_base_seconds=5,
+            )
+
+            delays = []
+            for _ in range(4):
+                await scheduler.run_once()
+                delays.append(scheduler.next_delay())
+
+            assert delays == [5, 10, 20, 40]
+
+        @pytest.mark.asyncio
+        async def test_backoff_limitado_ao_maximo(self) -> None:
+            """Backoff nao ultrapassa max_backoff_seconds."""
+            refresh = AsyncMock(side_effect=Exception("DB Error"))
+            scheduler = RefreshAheadScheduler(
+                name="k",
+                refresh=refresh,
+                interval_seconds=240,
+                retry_base_seconds=5,
+                max_backoff_seconds=30,
+            )
+
+            for _ in range(10):
+                await scheduler.run_once()
+
+            assert scheduler.next_delay() == 30
+
+        @pytest.mark.asyncio
+        async def test_sucesso_reseta_backoff(self) -> None:
+            """Apos sucesso, volta ao intervalo normal."""
+            refresh = AsyncMock(side_effect=[Exception("DB Error"), None])
+            scheduler = RefreshAheadScheduler(
+                name="k", refresh=refresh, interval_seconds=240
+            )
+
+            await scheduler.run_once()
+            await scheduler.run_once()
+
+            assert scheduler.next_delay() == 240
+            assert scheduler.get_stats().consecutive_failures == 0
+
+    class TestRunOnce:
+        """Testes de uma execucao de refresh."""
+
+        @pytest.mark.asyncio
+        async def test_falha_nao_propaga_excecao(self) -> None:
+            """Falha no refresh e registrada, nao levantada."""
+            scheduler = RefreshAheadScheduler(
+                name="k",
+                refresh=AsyncMock(side_effect=Exception("DB Error")),
+                interval_seconds=60,
+            )
+
+            ok = await scheduler.run_once()
+
+            assert ok is False
+            assert scheduler.get_stats().failures == 1
+
+        @pytest.mark.asyncio
+        async def test_sucesso_registra_estatisticas(self) -> None:
+            """Refresh bem-sucedido atualiza contadores e duracao."""
+            scheduler = RefreshAheadScheduler(
+                name="k", refresh=AsyncMock(), interval_seconds=60
+            )
+
+            ok = await scheduler.run_once()
+            stats = scheduler.get_stats()
+
+            assert ok is True
+            assert stats.refreshes == 1
+            assert stats.last_success_at is not None
+            assert stats.last_duration_ms is not None
+
+    class TestLifecycle:
+        """Testes de start/stop."""
+
+        @pytest.mark.asyncio
+        async def test_start_executa_refresh_imediatamente(self) -> None:
+            """O primeiro refresh ocorre no startup, aquecendo o cache."""
+            refresh = AsyncMock()
+            scheduler = RefreshAheadScheduler(
+                name="k", refresh=refresh, interval_seconds=60
+            )
+
+            await scheduler.start()
+            await asyncio.sleep(0)
+            running = scheduler.is_running
+            await scheduler.stop()
+
+            refresh.assert_awaited_once()
+            assert running is True
+            assert scheduler.is_running is False
+
+        @pytest.mark.asyncio
+        async def test_loop_repete_no_intervalo(self) -> None:
+            """Refresh e repetido periodicamente."""
+            refresh = AsyncMock()
+            scheduler = RefreshAheadScheduler(
+                name="k", refresh=refresh, interval_seconds=0.01
+            )
+
+            await scheduler.start()
+            await asyncio.sleep(0.05)
+            await scheduler.stop()
+
+            assert refresh.await_count >= 3
+
+        @pytest.mark.asyncio
+        async def test_seguidor_nao_executa_refresh(self) -> None:
+            """Worker que nao e lider apenas aguarda o proximo ciclo."""
+            refresh = AsyncMock()
+            scheduler = RefreshAheadScheduler(
+                name="k",
+                refresh=refresh,
+                interval_seconds=0.01,
+                is_leader=lambda: False,
+            )
+
+            await scheduler.start()
+            await asyncio.sleep(0.05)
+            await scheduler.stop()
+
+            refresh.assert_not_awaited()
+            assert scheduler.get_stats().skipped >= 1
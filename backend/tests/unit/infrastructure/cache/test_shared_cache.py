@@ -0,0 +1,296 @@
+"""Testes para SharedFileCache e LeaderLock."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from backend.shared.infrastructure.cache.shared_cache import (
+    LeaderLock,
+    SharedFileCache,
+    ensure_private_directory,
+    leader_lock_directory,
+)
+from backend.shared.infrastructure.config import Settings
+
+TIME_PATH = "backend.shared.infrastructure.cache.shared_cache.time.time"
+SETTINGS_PATH = "backend.shared.infrastructure.cache.shared_cache.get_settings"
+
+
+def make_settings(**overrides: object) -> Settings:
+    """Configuracao minima valida para os testes."""
+    return Settings(
+        api_key="k",
+        oracle_user="u",
+        oracle_password="p",
+        oracle_dsn="d",
+        **overrides,
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    """Diretorio isolado do cache."""
+    return tmp_path / "cache"
+
+
+@pytest.mark.unit
+class TestSharedFileCache:
+    """Testes para SharedFileCache."""
+
+    class TestGetSet:
+        """Testes de leitura e escrita."""
+
+        @pytest.mark.asyncio
+        async def test_deve_retornar_valor_armazenado(self, cache_dir: Path) -> None:
+            """get() retorna o valor gravado por set()."""
+            cache = SharedFileCache(cache_dir)
+
+            await cache.set("interrupcoes:ativas", {"itens": [1, 2, 3]})
+
+            assert await cache.get("interrupcoes:ativas") == {"itens": [1, 2, 3]}
+            assert await cache.exists("interrupcoes:ativas") is True
+
+        @pytest.mark.asyncio
+        async def test_chave_inexistente_deve_ser_miss(self, cache_dir: Path) -> None:
+            """Chave nunca gravada retorna None e conta miss."""
+            cache = SharedFileCache(cache_dir)
+
+            result = await cache.get("inexistente")
+
+            assert result is None
+            assert cache.get_stats().misses == 1
+
+        @pytest.mark.asyncio
+        async def test_item_expirado_deve_ficar_disponivel_como_stale(
+            self, cache_dir: Path
+        ) -> None:
+            """Item expirado vira miss, mas continua em get_stale()."""
+            cache = SharedFileCache(cache_dir, stale_ttl_seconds=100)
+            with patch(TIME_PATH, return_value=1000.0):
+                await cache.set("k", "v", ttl_seconds=10)
+
+            with patch(TIME_PATH, return_value=1011.0):
+                fresh = await cache.get("k")
+                stale = await cache.get_stale("k")
+            with patch(TIME_PATH, return_value=1111.0):
+                expired = await cache.get_stale("k")
+
+            assert fresh is None
+            assert stale == "v"
+            assert expired is None
+
+        @pytest.mark.asyncio
+        async def test_delete_e_clear_devem_remover_arquivos(self, cache_dir: Path) -> None:
+            """delete() remove uma chave e clear() remove todas."""
+            cache = SharedFileCache(cache_dir)
+            await cache.set("a", 1)
+            await cache.set("b", 2)
+
+            await cache.delete("a")
+            after_delete = cache.get_stats().item_count
+            await cache.clear()
+
+            assert await cache.get("a") is None
+            assert after_delete == 1
+            assert cache.get_stats().item_count == 0
+
+    class TestCompartilhamento:
+        """Testes entre instancias (simulando workers)."""
+
+        @pytest.mark.asyncio
+        async def test_worker_deve_ler_valor_gravado_por_outro(
+            self, cache_dir: Path
+        ) -> None:
+            """Instancias no mesmo diretorio enxergam as mesmas entradas."""
+            leader = SharedFileCache(cache_dir)
+            follower = SharedFileCache(cache_dir)
+
+            await leader.set("k", "v1")
+            first = await follower.get("k")
+            await leader.set("k", "v2")
+            second = await follower.get("k")
+
+            assert (first, second) == ("v1", "v2")
+            assert follower.get_generation("k") == 2
+
+        @pytest.mark.asyncio
+        async def test_deve_reutilizar_copia_local_ate_arquivo_mudar(
+            self, cache_dir: Path
+        ) -> None:
+            """Hits repetidos nao releem o arquivo."""
+            leader = SharedFileCache(cache_dir)
+            follower = SharedFileCache(cache_dir)
+            await leader.set("k", "v")
+
+            for _ in range(5):
+                await follower.get("k")
+
+            assert follower.reloads == 1
+
+        @pytest.mark.asyncio
+        async def test_arquivo_corrompido_deve_ser_miss(self, cache_dir: Path) -> None:
+            """Entrada invalida e ignorada em vez de propagar erro."""
+            cache = SharedFileCache(cache_dir)
+            await cache.set("k", "v")
+            entry = next(cache_dir.glob("*.entry"))
+            entry.write_bytes(b"lixo")
+
+            result = await SharedFileCache(cache_dir).get("k")
+
+            assert result is None
+
+
+    class TestLimites:
+        """Testes dos limites de memoria e disco (max_items)."""
+
+        @pytest.mark.asyncio
+        async def test_sweep_deve_remover_entradas_vencidas_alem_do_stale(
+            self, cache_dir: Path
+        ) -> None:
+            """Entrada vencida ha mais de stale_ttl_seconds sai do disco."""
+            cache = SharedFileCache(cache_dir, stale_ttl_seconds=100)
+            with patch(TIME_PATH, return_value=1000.0):
+                await cache.set("antiga", 1, ttl_seconds=10)
+                await cache.set("stale", 2, ttl_seconds=1050)
+
+            with patch(TIME_PATH, return_value=1200.0):
+                removidas = cache.sweep()
+
+            assert removidas == 1
+            assert len(list(cache_dir.glob("*.entry"))) == 1
+            with patch(TIME_PATH, return_value=1200.0):
+                assert await cache.get_stale("stale") == 2
+            assert cache.get_stats().evictions == 1
+
+        @pytest.mark.asyncio
+        async def test_escritas_devem_manter_arquivos_no_limite(self, cache_dir: Path) -> None:
+            """Acima de max_items as entradas gravadas ha mais tempo saem."""
+            cache = SharedFileCache(cache_dir, max_items=10)
+
+            for n in range(25):
+                with patch(TIME_PATH, return_value=1000.0 + n):
+                    await cache.set(f"historico:{n}", n, ttl_seconds=3600)
+
+            assert len(list(cache_dir.glob("*.entry"))) <= 10
+            with patch(TIME_PATH, return_value=1030.0):
+                assert await cache.get("historico:24") == 24
+                assert await cache.get("historico:0") is None
+
+        @pytest.mark.asyncio
+        async def test_copia_local_deve_ser_lru_limitada(self, cache_dir: Path) -> None:
+            """Cada worker guarda no maximo max_items valores decodificados."""
+            writer = SharedFileCache(cache_dir, max_items=100)
+            for n in range(5):
+                await writer.set(f"k{n}", n)
+            reader = SharedFileCache(cache_dir, max_items=3)
+
+            await reader.get("k0")
+            for n in range(1, 5):
+                await reader.get(f"k{n}")
+                await reader.get("k0")
+
+            assert len(reader._local) == 3
+            assert "k0" in reader._local
+
+
+@pytest.mark.unit
+class TestDiretorioPrivado:
+    """Testes para a validacao do diretorio compartilhado."""
+
+    def test_deve_criar_diretorio_com_permissao_0700(self, cache_dir: Path) -> None:
+        """Diretorio novo e criado privado."""
+        ensure_private_directory(cache_dir)
+
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+    def test_deve_recusar_diretorio_acessivel_a_outros(self, cache_dir: Path) -> None:
+        """Diretorio pre-existente com permissao aberta impede a inicializacao."""
+        cache_dir.mkdir(mode=0o777)
+        cache_dir.chmod(0o777)
+
+        with pytest.raises(PermissionError):
+            SharedFileCache(cache_dir)
+
+    def test_deve_recusar_link_simbolico(self, tmp_path: Path, cache_dir: Path) -> None:
+        """Caminho do diretorio nao pode ser link simbolico."""
+        alvo = tmp_path / "alvo"
+        alvo.mkdir(mode=0o700)
+        cache_dir.symlink_to(alvo)
+
+        with pytest.raises(PermissionError):
+            ensure_private_directory(cache_dir)
+
+    @pytest.mark.asyncio
+    async def test_entrada_link_simbolico_deve_ser_miss(
+        self, tmp_path: Path, cache_dir: Path
+    ) -> None:
+        """Entrada substituida por link simbolico nao e desserializada."""
+        cache = SharedFileCache(cache_dir)
+        await cache.set("k", "v")
+        entry = next(cache_dir.glob("*.entry"))
+        externo = tmp_path / "externo.entry"
+        externo.write_bytes(entry.read_bytes())
+        entry.unlink()
+        os.symlink(externo, entry)
+
+        result = await SharedFileCache(cache_dir).get("k")
+
+        assert result is None
+
+    def test_backend_shared_deve_exigir_diretorio(self) -> None:
+        """cache_backend=shared sem cache_shared_dir e erro de configuracao."""
+        with pytest.raises(ValueError, match="cache_shared_dir"):
+            make_settings(cache_backend="shared", cache_shared_dir="")
+
+
+@pytest.mark.unit
+class TestLeaderLock:
+    """Testes para LeaderLock."""
+
+    def test_apenas_um_processo_deve_ser_lider(self, tmp_path: Path) -> None:
+        """Segundo lock no mesmo arquivo nao obtem a lideranca."""
+        first = LeaderLock(tmp_path / "refresh.leader")
+        second = LeaderLock(tmp_path / "refresh.leader")
+
+        assert first.try_acquire() is True
+        assert second.try_acquire() is False
+        assert first.try_acquire() is True
+
+        first.release()
+        second.release()
+
+    def test_seguidor_deve_assumir_apos_liberacao(self, tmp_path: Path) -> None:
+        """Quando o lider libera o lock, outro worker assume."""
+        first = LeaderLock(tmp_path / "refresh.leader")
+        second = LeaderLock(tmp_path / "refresh.leader")
+        first.try_acquire()
+
+        first.release()
+
+        assert second.try_acquire() is True
+        assert second.is_leader is True
+        second.release()
+
+    def test_diretorio_do_lock_deve_usar_cache_shared_dir(
+        self, monkeypatch: pytest.MonkeyPatch, cache_dir: Path
+    ) -> None:
+        """Com cache_shared_dir configurado o lock fica junto do cache."""
+        monkeypatch.setattr(SETTINGS_PATH, lambda: make_settings(cache_shared_dir=str(cache_dir)))
+
+        assert leader_lock_directory() == cache_dir
+
+    def test_diretorio_do_lock_sem_cache_shared_deve_ser_privado(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Sem cache_shared_dir (cache em memoria) o lock usa um diretorio do usuario."""
+        monkeypatch.setattr(SETTINGS_PATH, lambda: make_settings(cache_shared_dir=""))
+        monkeypatch.setattr("tempfile.gettempdir", lambda: str(tmp_path))
+
+        directory = leader_lock_directory()
+
+        assert directory.parent == tmp_path
+        assert directory.stat().st_mode & 0o777 == 0o700
@@ -0,0 +1,144 @@
+"""Testes para SingleFlight (coalescencia de cache miss)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.shared.infrastructure.cache.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Testes para SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_deve_executar_uma_vez_para_chamadas_concorrentes(self) -> None:
+        """Chamadas concorrentes da mesma chave compartilham uma execucao."""
+        # Arrange
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "dados"
+
+        # Act
+        tasks = [asyncio.create_task(flight.do("chave", fetch)) for _ in range(20)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # Assert
+        assert calls == 1
+        assert results == ["dados"] * 20
+
+    @pytest.mark.asyncio
+    async def test_deve_contabilizar_waiters_coalescidos(self) -> None:
+        """Estatisticas devem separar execucoes de chamadas coalescidas."""
+        # Arrange
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> int:
+            await release.wait()
+            return 1
+
+        # Act
+        tasks = [asyncio.create_task(flight.do("chave", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        in_flight = flight.get_stats().in_flight
+        release.set()
+        await asyncio.gather(*tasks)
+        stats = flight.get_stats()
+
+        # Assert
+        assert in_flight == 1
+        assert stats.executions == 1
+        assert stats.coalesced == 4
+        assert stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_deve_propagar_excecao_para_todos_os_waiters(self) -> None:
+        """Falha na execucao chega a todas as chamadas coalescidas."""
+        # Arrange
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> int:
+            await release.wait()
+            raise RuntimeError("DB Error")
+
+        # Act
+        tasks = [asyncio.create_task(flight.do("chave", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Assert
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_deve_executar_novamente_apos_conclusao(self) -> None:
+        """Chamadas sequenciais nao sao coalescidas."""
+        # Arrange
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        # Act
+        first = await flight.do("chave", fetch)
+        second = await flight.do("chave", fetch)
+
+        # Assert
+        assert (first, second) == (1, 2)
+        assert flight.get_stats().coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_chaves_diferentes_nao_sao_coalescidas(self) -> None:
+        """Cada chave tem sua propria execucao."""
+        # Arrange
+        flight = SingleFlight()
+
+        async def fetch() -> int:
+            await asyncio.sleep(0)
+            return 1
+
+        # Act
+        await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+
+        # Assert
+        assert flight.get_stats().executions == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelar_primeiro_chamador_nao_afeta_waiters(self) -> None:
+        """Cancelar a requisicao que disparou a execucao nao cancela a consulta."""
+        # Arrange
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "dados"
+
+        leader = asyncio.create_task(flight.do("chave", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("chave", fetch))
+        await asyncio.sleep(0)
+
+        # Act
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        # Assert
+        assert await waiter == "dados"
+        assert leader.cancelled()
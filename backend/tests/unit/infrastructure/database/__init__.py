@@ -0,0 +1 @@
+# Testes de banco de dados
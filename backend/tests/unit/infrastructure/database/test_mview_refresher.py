@@ -0,0 +1,89 @@
+"""Testes para MaterializedViewRefresher."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.shared.domain.errors import DatabaseQueryError
+from backend.shared.infrastructure.database.mview_refresher import MaterializedViewRefresher
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+MVIEW = "RADAR_API.MV_INTERRUPCAO_FORNECIMENTO"
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute_batch = AsyncMock(return_value=0)
+    pool.execute_one = AsyncMock(return_value={"total": 42})
+    return pool
+
+
+@pytest.fixture
+def refresher(mock_pool: MagicMock) -> MaterializedViewRefresher:
+    """Refresher com pool mockado."""
+    return MaterializedViewRefresher(mock_pool, MVIEW)
+
+
+@pytest.mark.unit
+class TestMaterializedViewRefresher:
+    """Testes para MaterializedViewRefresher."""
+
+    @pytest.mark.asyncio
+    async def test_deve_executar_refresh_completo_e_atomico(
+        self,
+        refresher: MaterializedViewRefresher,
+        mock_pool: MagicMock,
+    ) -> None:
+        """DBMS_MVIEW.REFRESH com a view informada por bind."""
+        # Act
+        await refresher.refresh()
+
+        # Assert
+        ((sql, params),) = mock_pool.execute_batch.await_args.args[0]
+        assert "DBMS_MVIEW.REFRESH" in sql
+        assert "atomic_refresh => TRUE" in sql
+        assert params == {"mview": MVIEW}
+
+    @pytest.mark.asyncio
+    async def test_deve_registrar_duracao_e_linhas(
+        self,
+        refresher: MaterializedViewRefresher,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Estatisticas guardam a contagem de linhas e a duracao."""
+        # Act
+        rows = await refresher.refresh()
+
+        # Assert
+        stats = refresher.get_stats()
+        assert rows == 42
+        assert stats.refreshes == 1
+        assert stats.last_row_count == 42
+        assert stats.last_duration_ms is not None
+        assert stats.last_refresh_at is not None
+        assert MVIEW in mock_pool.execute_one.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_falha_deve_ser_contada_e_propagada(
+        self,
+        refresher: MaterializedViewRefresher,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Erro no refresh e propagado (o agendador faz o backoff)."""
+        # Arrange
+        mock_pool.execute_batch.side_effect = DatabaseQueryError(
+            Exception("ORA-02068"), "BEGIN ... END;"
+        )
+
+        # Act & Assert
+        with pytest.raises(DatabaseQueryError):
+            await refresher.refresh()
+
+        stats = refresher.get_stats()
+        assert stats.failures == 1
+        assert stats.refreshes == 0
+        assert stats.last_row_count is None
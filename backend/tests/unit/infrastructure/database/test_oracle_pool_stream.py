@@ -0,0 +1,119 @@
+"""Testes para OraclePool.stream (fetch em lotes)."""
+
+from __future__ import annotations
+
+from contextlib import aclosing
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.shared.domain.errors import DatabaseConnectionError
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+from backend.shared.infrastructure.database.query_registry import QueryRegistry
+
+SQL = "SELECT id, conj FROM t"
+
+
+def _connection(rows: list[tuple[Any, ...]]) -> tuple[MagicMock, MagicMock]:
+    """Conexao e cursor simulados; fetchmany respeita o arraysize."""
+    cursor = MagicMock()
+    cursor.execute = AsyncMock()
+    cursor.description = [("ID",), ("CONJ",)]
+    cursor.rowfactory = None
+    cursor.arraysize = 100
+    remaining = list(rows)
+
+    async def fetchmany() -> list[Any]:
+        batch = remaining[: cursor.arraysize]
+        del remaining[: cursor.arraysize]
+        factory = cursor.rowfactory
+        return [factory(*row) for row in batch] if isinstance(factory, type) else batch
+
+    cursor.fetchmany = fetchmany
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    return conn, cursor
+
+
+@pytest.fixture
+def registry() -> QueryRegistry:
+    """Registro isolado."""
+    return QueryRegistry()
+
+
+@pytest.fixture
+def pool_and_cursor(registry: QueryRegistry):
+    """OraclePool com pool oracledb simulado."""
+    conn, cursor = _connection([(i, i % 3) for i in range(1, 11)])
+    pool = OraclePool()
+    pool.registry = registry
+    pool._pool = MagicMock()
+    pool._pool.acquire = AsyncMock(return_value=conn)
+    pool._pool.release = AsyncMock()
+    yield pool, cursor
+    del pool.registry
+    pool._pool = None
+
+
+@pytest.mark.unit
+class TestOraclePoolStream:
+    """Testes para OraclePool.stream."""
+
+    @pytest.mark.asyncio
+    async def test_deve_entregar_linhas_em_lotes(self, pool_and_cursor) -> None:
+        """Linhas chegam em lotes de batch_size."""
+        # Arrange
+        pool, cursor = pool_and_cursor
+
+        # Act
+        lotes = [lote async for lote in pool.stream(SQL, batch_size=4)]
+
+        # Assert
+        assert [len(lote) for lote in lotes] == [4, 4, 2]
+        assert lotes[0][0] == (1, 1)
+        cursor.execute.assert_awaited_once_with(None, {})
+        pool._pool.release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deve_usar_configuracao_registrada(
+        self, pool_and_cursor, registry: QueryRegistry
+    ) -> None:
+        """Sem batch_size usa o arraysize e o row_type registrados."""
+        pool, _ = pool_and_cursor
+        registry.register("teste", SQL, arraysize=6, row_type="namedtuple")
+
+        lotes = [lote async for lote in pool.stream(SQL)]
+
+        assert [len(lote) for lote in lotes] == [6, 4]
+        assert lotes[1][-1].conj == 10 % 3
+        stats = registry.get_stats()["teste"]
+        assert stats.executions == 1
+        assert stats.rows == 10
+
+    @pytest.mark.asyncio
+    async def test_deve_liberar_conexao_ao_interromper(self, pool_and_cursor) -> None:
+        """Fechar o stream no meio devolve a conexao ao pool."""
+        pool, _ = pool_and_cursor
+
+        async with aclosing(pool.stream(SQL, batch_size=2)) as stream:
+            async for _ in stream:
+                break
+
+        pool._pool.release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deve_propagar_erro_do_execute(
+        self, pool_and_cursor, registry: QueryRegistry
+    ) -> None:
+        """Falha no execute e contabilizada e propagada."""
+        pool, cursor = pool_and_cursor
+        registry.register("teste", SQL)
+        cursor.execute.side_effect = Exception("ORA-12170")
+
+        with pytest.raises(DatabaseConnectionError):
+            async for _ in pool.stream(SQL):
+                pass
+
+        assert registry.get_stats()["teste"].errors == 1
+        pool._pool.release.assert_awaited_once()
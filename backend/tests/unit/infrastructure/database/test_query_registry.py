@@ -0,0 +1,175 @@
+"""Testes para QueryRegistry e execucao de queries registradas no OraclePool."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.shared.domain.errors import DatabaseQueryError
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+from backend.shared.infrastructure.database.query_registry import QueryRegistry
+
+SQL = "SELECT conj, cd_universo FROM t WHERE ag_id = :ag_id"
+
+
+def _cursor(rows: list[tuple[Any, ...]]) -> MagicMock:
+    """Cursor oracledb assincrono simulado."""
+    cursor = MagicMock()
+    cursor.execute = AsyncMock()
+    cursor.description = [("CONJ",), ("CD_UNIVERSO",)]
+
+    async def fetchall() -> list[Any]:
+        factory = cursor.rowfactory
+        if isinstance(factory, type):
+            return [factory(*row) for row in rows]
+        return list(rows)
+
+    cursor.fetchall = fetchall
+    cursor.rowfactory = None
+    return cursor
+
+
+@pytest.fixture
+def registry() -> QueryRegistry:
+    """Registro isolado."""
+    return QueryRegistry()
+
+
+@pytest.mark.unit
+class TestQueryRegistry:
+    """Testes para QueryRegistry."""
+
+    def test_register_deve_retornar_sql(self, registry: QueryRegistry) -> None:
+        """register() devolve o SQL para uso como constante."""
+        assert registry.register("ativas", SQL, arraysize=500) == SQL
+
+        query = registry.lookup(SQL)
+        assert query is not None
+        assert query.name == "ativas"
+        assert query.arraysize == 500
+        assert registry.get("ativas") is query
+
+    def test_deve_aceitar_registro_repetido_com_mesmo_sql(
+        self, registry: QueryRegistry
+    ) -> None:
+        """Reimportar o modulo do repositorio nao gera erro."""
+        registry.register("ativas", SQL)
+
+        assert registry.register("ativas", SQL) == SQL
+
+    def test_deve_rejeitar_nome_repetido_com_outro_sql(
+        self, registry: QueryRegistry
+    ) -> None:
+        """Mesmo nome com SQL diferente gera ValueError."""
+        registry.register("ativas", SQL)
+
+        with pytest.raises(ValueError, match="ativas"):
+            registry.register("ativas", "SELECT 1 FROM DUAL")
+
+    def test_row_class_deve_ser_criada_uma_vez(self, registry: QueryRegistry) -> None:
+        """A namedtuple e reutilizada entre execucoes."""
+        registry.register("ativas", SQL, row_type="namedtuple")
+
+        first = registry.row_class(SQL, ("conj", "cd_universo"))
+        second = registry.row_class(SQL, ("conj", "cd_universo"))
+
+        assert first is second
+        assert first(1, 1400100).cd_universo == 1400100
+
+    def test_row_class_deve_ser_none_para_tuplas(self, registry: QueryRegistry) -> None:
+        """row_type="tuple" mantem as tuplas do driver."""
+        registry.register("ativas", SQL)
+
+        assert registry.row_class(SQL, ("conj", "cd_universo")) is None
+
+    def test_record_deve_acumular_tempos(self, registry: QueryRegistry) -> None:
+        """Estatisticas somam execucoes, linhas e tempos."""
+        registry.register("ativas", SQL)
+
+        registry.record(SQL, prepare_ms=0.1, execute_ms=10.0, fetch_ms=2.0, rows=5)
+        registry.record(SQL, prepare_ms=0.1, execute_ms=20.0, fetch_ms=4.0, rows=5)
+        registry.record_error(SQL)
+
+        stats = registry.get_stats()["ativas"]
+        assert stats.executions == 2
+        assert stats.errors == 1
+        assert stats.rows == 10
+        assert stats.avg_execute_ms == pytest.approx(15.0)
+        assert stats.avg_fetch_ms == pytest.approx(3.0)
+        assert stats.last_execute_ms == 20.0
+
+    def test_record_deve_ignorar_sql_nao_registrado(
+        self, registry: QueryRegistry
+    ) -> None:
+        """Queries ad-hoc nao geram estatisticas."""
+        registry.record("SELECT 1 FROM DUAL", prepare_ms=0, execute_ms=1, fetch_ms=0, rows=1)
+
+        assert registry.get_stats() == {}
+
+
+@pytest.mark.unit
+class TestOraclePoolRegisteredQueries:
+    """Testes da execucao de queries registradas no OraclePool."""
+
+    @pytest.fixture
+    def pool(self, registry: QueryRegistry) -> OraclePool:
+        """OraclePool com registro isolado e conexao simulada."""
+        pool = OraclePool()
+        pool.registry = registry
+        yield pool
+        del pool.registry
+
+    @pytest.mark.asyncio
+    async def test_deve_aplicar_configuracao_registrada(
+        self, pool: OraclePool, registry: QueryRegistry
+    ) -> None:
+        """arraysize e prefetchrows da query sao aplicados ao cursor."""
+        # Arrange
+        registry.register("ativas", SQL, arraysize=500, prefetchrows=501)
+        cursor = _cursor([(1, 1400100)])
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+
+        # Act
+        columns, rows = await pool._fetch(conn, SQL, {"ag_id": 370})
+
+        # Assert
+        assert cursor.arraysize == 500
+        assert cursor.prefetchrows == 501
+        cursor.prepare.assert_called_once_with(SQL)
+        cursor.execute.assert_awaited_once_with(None, {"ag_id": 370})
+        assert columns == ("conj", "cd_universo")
+        assert rows == [(1, 1400100)]
+        assert registry.get_stats()["ativas"].executions == 1
+
+    @pytest.mark.asyncio
+    async def test_deve_usar_namedtuple_em_execute_rows(
+        self, pool: OraclePool, registry: QueryRegistry
+    ) -> None:
+        """row_type="namedtuple" define o rowfactory do cursor."""
+        registry.register("ativas", SQL, row_type="namedtuple")
+        conn = MagicMock()
+        conn.cursor.return_value = _cursor([(1, 1400100)])
+
+        _, rows = await pool._fetch(conn, SQL, None, use_row_class=True)
+
+        assert rows[0].conj == 1
+        assert rows[0].cd_universo == 1400100
+
+    @pytest.mark.asyncio
+    async def test_deve_contar_erro_e_propagar(
+        self, pool: OraclePool, registry: QueryRegistry
+    ) -> None:
+        """Falha no execute conta erro e vira DatabaseQueryError."""
+        registry.register("ativas", SQL)
+        cursor = _cursor([])
+        cursor.execute.side_effect = Exception("ORA-02063")
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+
+        with pytest.raises(DatabaseQueryError):
+            await pool._fetch(conn, SQL, None)
+
+        assert registry.get_stats()["ativas"].errors == 1
@@ -0,0 +1 @@
+# Testes de HTTP
@@ -0,0 +1,154 @@
+"""Testes para as respostas em stream do AneelResponseBuilder."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.shared.infrastructure.http.aneel_response import (
+    NDJSON_MEDIA_TYPE,
+    AneelResponseBuilder,
+)
+
+from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
+
+
+async def _batches(*batches: list[Any]) -> AsyncIterator[list[Any]]:
+    for batch in batches:
+        yield batch
+
+
+async def _failing() -> AsyncIterator[list[Any]]:
+    yield [{"id": 1}]
+    raise RuntimeError("ORA-03113")
+
+
+async def _collect(stream: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.unit
+class TestAneelStreaming:
+    """Testes para stream_json e stream_ndjson."""
+
+    class TestStreamJson:
+        """Testes do envelope JSON em partes."""
+
+        @pytest.mark.asyncio
+        async def test_deve_gerar_mesmo_json_que_success(self) -> None:
+            """O corpo montado em partes e igual a resposta nao-stream."""
+            # Arrange
+            items = [{"id": 1, "municipio": "Caracaraí"}, {"id": 2}, {"id": 3}]
+
+            # Act
+            body = await _collect(
+                AneelResponseBuilder.stream_json(_batches(items[:2], [], items[2:]))
+            )
+
+            # Assert
+            assert json.loads(body) == json.loads(
+                json.dumps(AneelResponseBuilder.success({"interrupcaoFornecimento": items}))
+            )
+
+        @pytest.mark.asyncio
+        async def test_deve_gerar_lista_vazia_sem_itens(self) -> None:
+            """Sem lotes, a lista do envelope fica vazia."""
+            body = await _collect(AneelResponseBuilder.stream_json(_batches()))
+
+            payload = json.loads(body)
+            assert payload["idcStatusRequisicao"] == 1
+            assert payload["interrupcaoFornecimento"] == []
+
+        @pytest.mark.asyncio
+        async def test_deve_serializar_modelos_e_datas(self) -> None:
+            """Modelos pydantic e datetimes sao convertidos para JSON."""
+            item = InterrupcaoAgregadaItem(
+                ideConjuntoUnidadeConsumidora=1,
+                ideMunicipio=1400100,
+                qtdUCsAtendidas=10,
+                qtdOcorrenciaProgramada=1,
+                qtdOcorrenciaNaoProgramada=2,
+            )
+            detalhe = {"id": 7, "data_inicio": datetime(2026, 1, 10, 14, 30)}
+
+            body = await _collect(AneelResponseBuilder.stream_json(_batches([item, detalhe])))
+
+            lista = json.loads(body)["interrupcaoFornecimento"]
+            assert lista[0] == item.model_dump(mode="json")
+            assert lista[1]["data_inicio"] == "2026-01-10T14:30:00"
+
+        @pytest.mark.asyncio
+        async def test_falha_deve_interromper_o_corpo(self) -> None:
+            """Erro no meio propaga; o corpo parcial nao e JSON valido."""
+            chunks: list[bytes] = []
+
+            with pytest.raises(RuntimeError):
+                async for chunk in AneelResponseBuilder.stream_json(_failing()):
+                    chunks.append(chunk)
+
+            with pytest.raises(json.JSONDecodeError):
+                json.loads(b"".join(chunks))
+
+    class TestStreamNdjson:
+        """Testes do formato NDJSON."""
+
+        @pytest.mark.asyncio
+        async def test_deve_gerar_envelope_e_um_item_por_linha(self) -> None:
+            """Primeira linha e o envelope; demais sao itens."""
+            body = await _collect(
+                AneelResponseBuilder.stream_ndjson(_batches([{"id": 1}, {"id": 2}], [{"id": 3}]))
+            )
+
+            lines = [json.loads(line) for line in body.splitlines()]
+            assert lines[0]["idcStatusRequisicao"] == 1
+            assert "interrupcaoFornecimento" not in lines[0]
+            assert lines[1:] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+        @pytest.mark.asyncio
+        async def test_falha_deve_terminar_com_envelope_de_erro(self) -> None:
+            """Erro no meio gera uma ultima linha com idcStatusRequisicao 2."""
+            body = await _collect(AneelResponseBuilder.stream_ndjson(_failing()))
+
+            lines = [json.loads(line) for line in body.splitlines()]
+            assert lines[1] == {"id": 1}
+            assert lines[-1]["idcStatusRequisicao"] == 2
+
+    class TestStreamingResponse:
+        """Testes da resposta HTTP."""
+
+        @pytest.fixture
+        def client(self) -> TestClient:
+            app = FastAPI()
+
+            @app.get("/json")
+            async def as_json():
+                return AneelResponseBuilder.streaming_response(_batches([{"id": 1}]))
+
+            @app.get("/ndjson")
+            async def as_ndjson():
+                return AneelResponseBuilder.streaming_response(
+                    _batches([{"id": 1}]), ndjson=True
+                )
+
+            return TestClient(app)
+
+        def test_deve_responder_json_em_stream(self, client: TestClient) -> None:
+            """Modo JSON usa application/json."""
+            response = client.get("/json")
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            assert response.json()["interrupcaoFornecimento"] == [{"id": 1}]
+
+        def test_deve_responder_ndjson(self, client: TestClient) -> None:
+            """Modo NDJSON usa application/x-ndjson."""
+            response = client.get("/ndjson")
+
+            assert response.headers["content-type"] == NDJSON_MEDIA_TYPE
+            assert len(response.text.splitlines()) == 2
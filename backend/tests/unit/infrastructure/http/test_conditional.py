@@ -0,0 +1,90 @@
+"""Testes para requisicoes condicionais."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.shared.infrastructure.http.conditional import (
+    format_http_date,
+    is_not_modified,
+    not_modified_response,
+)
+
+ETAG = 'W/"abc123"'
+LAST_MODIFIED = 784111777.5  # Sun, 06 Nov 1994 08:49:37 GMT
+
+
+@pytest.mark.unit
+class TestIsNotModified:
+    """Testes para is_not_modified."""
+
+    class TestIfNoneMatch:
+        """Testes de comparacao de ETag."""
+
+        def test_etag_igual_deve_retornar_true(self) -> None:
+            """Mesma ETag significa que o cliente ja tem o conteudo."""
+            assert is_not_modified(ETAG, None, ETAG, LAST_MODIFIED) is True
+
+        def test_comparacao_fraca_deve_ignorar_prefixo(self) -> None:
+            """ETag forte do cliente casa com a fraca do servidor."""
+            assert is_not_modified('"abc123"', None, ETAG, LAST_MODIFIED) is True
+
+        def test_deve_aceitar_lista_de_etags(self) -> None:
+            """Qualquer ETag da lista pode casar."""
+            header = 'W/"outra", W/"abc123"'
+
+            assert is_not_modified(header, None, ETAG, LAST_MODIFIED) is True
+
+        def test_asterisco_deve_casar_com_qualquer_etag(self) -> None:
+            """If-None-Match: * casa com qualquer representacao."""
+            assert is_not_modified("*", None, ETAG, LAST_MODIFIED) is True
+
+        def test_etag_diferente_deve_retornar_false(self) -> None:
+            """Conteudo mudou: resposta completa."""
+            assert is_not_modified('W/"velha"', None, ETAG, LAST_MODIFIED) is False
+
+        def test_if_none_match_tem_precedencia(self) -> None:
+            """Com If-None-Match, If-Modified-Since e ignorado."""
+            since = format_http_date(LAST_MODIFIED + 60)
+
+            assert is_not_modified('W/"velha"', since, ETAG, LAST_MODIFIED) is False
+
+    class TestIfModifiedSince:
+        """Testes de comparacao de data."""
+
+        def test_mesma_data_deve_retornar_true(self) -> None:
+            """Data igual (resolucao de segundos) nao foi modificada."""
+            since = format_http_date(LAST_MODIFIED)
+
+            assert is_not_modified(None, since, ETAG, LAST_MODIFIED) is True
+
+        def test_data_anterior_deve_retornar_false(self) -> None:
+            """Snapshot gerado apos a data do cliente."""
+            since = format_http_date(LAST_MODIFIED - 60)
+
+            assert is_not_modified(None, since, ETAG, LAST_MODIFIED) is False
+
+        def test_data_invalida_deve_retornar_false(self) -> None:
+            """Header malformado e ignorado."""
+            assert is_not_modified(None, "ontem", ETAG, LAST_MODIFIED) is False
+
+        def test_sem_headers_deve_retornar_false(self) -> None:
+            """Requisicao nao condicional."""
+            assert is_not_modified(None, None, ETAG, LAST_MODIFIED) is False
+
+
+@pytest.mark.unit
+class TestNotModifiedResponse:
+    """Testes para not_modified_response."""
+
+    def test_deve_retornar_304_sem_corpo(self) -> None:
+        """Resposta 304 preserva os validadores e nao tem corpo."""
+        response = not_modified_response({"ETag": ETAG})
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == ETAG
+
+    def test_deve_formatar_data_http(self) -> None:
+        """Datas HTTP usam GMT com resolucao de segundos."""
+        assert format_http_date(LAST_MODIFIED) == "Sun, 06 Nov 1994 08:49:37 GMT"
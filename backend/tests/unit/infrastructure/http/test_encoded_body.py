@@ -0,0 +1,126 @@
+"""Testes para EncodedBody."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from backend.shared.infrastructure.http.encoded_body import (
+    MIN_COMPRESS_BYTES,
+    EncodedBody,
+)
+
+
+@pytest.fixture
+def payload_grande() -> dict:
+    """Payload acima do limite de compressao."""
+    return {"itens": [{"id": i, "nome": "Boa Vista"} for i in range(100)]}
+
+
+@pytest.mark.unit
+class TestEncodedBody:
+    """Testes para EncodedBody."""
+
+    class TestFromPayload:
+        """Testes de serializacao."""
+
+        def test_deve_serializar_json_compacto(self) -> None:
+            """Formato igual ao JSONResponse (sem espacos, UTF-8)."""
+            body = EncodedBody.from_payload({"mensagem": "Caracaraí", "a": [1, 2]})
+
+            assert body.identity == '{"mensagem":"Caracaraí","a":[1,2]}'.encode()
+
+        def test_payload_pequeno_nao_deve_ser_comprimido(self) -> None:
+            """Abaixo de MIN_COMPRESS_BYTES so existe a variante identity."""
+            body = EncodedBody.from_payload({"a": 1})
+
+            assert len(body.identity) < MIN_COMPRESS_BYTES
+            assert body.gzip is None
+
+        def test_payload_grande_deve_ter_variante_gzip(self, payload_grande: dict) -> None:
+            """Variante gzip descomprime para o mesmo JSON."""
+            body = EncodedBody.from_payload(payload_grande)
+
+            assert body.gzip is not None
+            assert gzip.decompress(body.gzip) == body.identity
+            assert json.loads(body.identity) == payload_grande
+
+        def test_etag_deve_depender_apenas_do_conteudo(self, payload_grande: dict) -> None:
+            """Mesmo conteudo gera a mesma ETag; conteudo diferente, outra."""
+            first = EncodedBody.from_payload(payload_grande)
+            second = EncodedBody.from_payload(payload_grande)
+            other = EncodedBody.from_payload({"a": 1})
+
+            assert first.etag == second.etag
+            assert first.etag != other.etag
+            assert first.etag is not None and first.etag.startswith('W/"')
+
+        def test_gzip_deve_ser_deterministico(self, payload_grande: dict) -> None:
+            """Mesmo payload gera os mesmos bytes (mtime fixo)."""
+            first = EncodedBody.from_payload(payload_grande)
+            second = EncodedBody.from_payload(payload_grande)
+
+            assert first.gzip == second.gzip
+
+    class TestSelect:
+        """Testes de negociacao de Accept-Encoding."""
+
+        def test_sem_header_deve_usar_identity(self, payload_grande: dict) -> None:
+            """Sem Accept-Encoding nao comprime."""
+            body = EncodedBody.from_payload(payload_grande)
+
+            content, encoding = body.select(None)
+
+            assert content == body.identity
+            assert encoding is None
+
+        def test_deve_usar_gzip_quando_aceito(self, payload_grande: dict) -> None:
+            """Accept-Encoding com gzip seleciona a variante gzip."""
+            body = EncodedBody.from_payload(payload_grande)
+
+            content, encoding = body.select("deflate, gzip")
+
+            assert content == body.gzip
+            assert encoding == "gzip"
+
+        def test_deve_respeitar_q_zero(self, payload_grande: dict) -> None:
+            """gzip;q=0 significa que gzip nao e aceito."""
+            body = EncodedBody.from_payload(payload_grande)
+
+            _, encoding = body.select("gzip;q=0")
+
+            assert encoding is None
+
+        def test_deve_preferir_br_quando_disponivel(self) -> None:
+            """Com variante br, ela tem precedencia sobre gzip."""
+            body = EncodedBody(identity=b"{}", gzip=b"gz", br=b"br")
+
+            content, encoding = body.select("gzip, br")
+
+            assert (content, encoding) == (b"br", "br")
+
+    class TestToResponse:
+        """Testes de criacao da Response."""
+
+        def test_deve_definir_headers_de_codificacao(self, payload_grande: dict) -> None:
+            """Response comprimida tem Content-Encoding e Vary."""
+            body = EncodedBody.from_payload(payload_grande)
+
+            response = body.to_response("gzip")
+
+            assert response.body == body.gzip
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.headers["vary"] == "Accept-Encoding"
+            assert response.headers["etag"] == body.etag
+            assert response.media_type == "application/json"
+
+        def test_identity_nao_deve_ter_content_encoding(self) -> None:
+            """Sem compressao nao ha Content-Encoding."""
+            body = EncodedBody.from_payload({"a": 1})
+
+            response = body.to_response("gzip")
+
+            assert "content-encoding" not in response.headers
+            assert response.body == body.identity
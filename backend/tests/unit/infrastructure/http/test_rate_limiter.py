@@ -0,0 +1,260 @@
+"""Testes para os backends de rate limiting."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from backend.shared.infrastructure.config import Settings
+from backend.shared.infrastructure.http.rate_limiter import (
+    SharedRateLimiter,
+    SlidingLogRateLimiter,
+    create_rate_limiter,
+)
+
+
+class FakeClock:
+    """Relogio controlado pelos testes."""
+
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Relogio fixo."""
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "shared"])
+def limiter(
+    request: pytest.FixtureRequest,
+    clock: FakeClock,
+    tmp_path: Path,
+) -> Iterator[SlidingLogRateLimiter | SharedRateLimiter]:
+    """Os dois backends com 3 req / 60s."""
+    if request.param == "memory":
+        yield SlidingLogRateLimiter(limit=3, window_seconds=60, clock=clock)
+        return
+
+    shared = SharedRateLimiter(
+        tmp_path / "rate_limit.table", limit=3, window_seconds=60, slots=1000, clock=clock
+    )
+    yield shared
+    shared.close()
+
+
+@pytest.mark.unit
+class TestSlidingWindow:
+    """Semantica comum aos dois backends."""
+
+    def test_deve_aceitar_ate_o_limite(self, limiter: SlidingLogRateLimiter) -> None:
+        """Limite aceito, remaining decrescente, excedente rejeitado."""
+        # Act
+        decisions = [limiter.hit("a") for _ in range(4)]
+
+        # Assert
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert [d.remaining for d in decisions] == [2, 1, 0, 0]
+
+    def test_rejeicao_deve_informar_retry_after(
+        self,
+        limiter: SlidingLogRateLimiter,
+        clock: FakeClock,
+    ) -> None:
+        """Retry-After e o tempo ate a mais antiga sair da janela."""
+        limiter.hit("a")
+        clock.now += 20
+        limiter.hit("a")
+        limiter.hit("a")
+
+        decision = limiter.hit("a")
+
+        assert decision.allowed is False
+        assert decision.retry_after == 40
+
+    def test_janela_deve_deslizar(self, limiter: SlidingLogRateLimiter, clock: FakeClock) -> None:
+        """Sem rajada de 2x na virada: so libera o que saiu da janela."""
+        limiter.hit("a")
+        clock.now += 30
+        limiter.hit("a")
+        limiter.hit("a")
+
+        clock.now += 31
+        assert limiter.hit("a").allowed is True
+        assert limiter.hit("a").allowed is False
+
+    def test_rejeitadas_nao_devem_consumir_quota(
+        self,
+        limiter: SlidingLogRateLimiter,
+        clock: FakeClock,
+    ) -> None:
+        """Insistir durante o bloqueio nao estende a espera."""
+        for _ in range(10):
+            limiter.hit("a")
+
+        clock.now += 60
+
+        assert limiter.hit("a").allowed is True
+        assert limiter.get_stats().rejected == 7
+
+    def test_clientes_devem_ser_independentes(self, limiter: SlidingLogRateLimiter) -> None:
+        """Quota de um cliente nao afeta outro."""
+        for _ in range(3):
+            limiter.hit("a")
+
+        assert limiter.hit("b").allowed is True
+
+
+@pytest.mark.unit
+class TestSlidingLogRateLimiter:
+    """Limite de memoria do backend em processo."""
+
+    def test_ociosos_devem_ser_despejados(self, clock: FakeClock) -> None:
+        """Clientes sem requisicao na janela saem do mapa."""
+        limiter = SlidingLogRateLimiter(limit=3, window_seconds=60, clock=clock)
+        for i in range(50):
+            limiter.hit(f"ip{i}")
+
+        clock.now += 61
+        limiter.hit("novo")
+
+        assert len(limiter) == 1
+        assert limiter.get_stats().evictions == 0
+
+    def test_max_clients_deve_limitar_memoria(self, clock: FakeClock) -> None:
+        """Inundacao de IPs distintos nao cresce alem de max_clients."""
+        limiter = SlidingLogRateLimiter(limit=3, window_seconds=60, max_clients=100, clock=clock)
+
+        for i in range(1000):
+            limiter.hit(f"ip{i}")
+
+        assert len(limiter) == 100
+        assert limiter.get_stats().evictions == 900
+
+
+@pytest.mark.unit
+class TestSharedRateLimiter:
+    """Backend compartilhado entre processos."""
+
+    def test_instancias_devem_compartilhar_contagem(
+        self,
+        tmp_path: Path,
+        clock: FakeClock,
+    ) -> None:
+        """Dois workers somam as requisicoes do mesmo cliente."""
+        path = tmp_path / "rate_limit.table"
+        worker_a = SharedRateLimiter(path, limit=3, window_seconds=60, slots=1000, clock=clock)
+        worker_b = SharedRateLimiter(path, limit=3, window_seconds=60, slots=1000, clock=clock)
+
+        try:
+            worker_a.hit("a")
+            worker_b.hit("a")
+            worker_a.hit("a")
+
+            assert worker_b.hit("a").allowed is False
+        finally:
+            worker_a.close()
+            worker_b.close()
+
+    def test_tabela_cheia_deve_reaproveitar_slot_menos_recente(
+        self,
+        tmp_path: Path,
+        clock: FakeClock,
+    ) -> None:
+        """Memoria fixa: mais clientes que slots despejam os mais antigos."""
+        limiter = SharedRateLimiter(
+            tmp_path / "rate_limit.table", limit=3, window_seconds=60, slots=16, clock=clock
+        )
+
+        try:
+            for i in range(100):
+                clock.now += 0.01
+                assert limiter.hit(f"ip{i}").allowed is True
+
+            stats = limiter.get_stats()
+            assert stats.clients == 16
+            assert stats.evictions == 84
+        finally:
+            limiter.close()
+
+    def test_mudanca_de_layout_deve_recriar_tabela(
+        self,
+        tmp_path: Path,
+        clock: FakeClock,
+    ) -> None:
+        """Novo limite invalida a tabela anterior."""
+        path = tmp_path / "rate_limit.table"
+        antigo = SharedRateLimiter(path, limit=3, window_seconds=60, slots=100, clock=clock)
+        for _ in range(3):
+            antigo.hit("a")
+        antigo.close()
+
+        novo = SharedRateLimiter(path, limit=5, window_seconds=60, slots=100, clock=clock)
+        try:
+            assert novo.hit("a").remaining == 4
+        finally:
+            novo.close()
+
+    def test_nao_deve_seguir_link_simbolico(self, tmp_path: Path, clock: FakeClock) -> None:
+        """Tabela substituida por link simbolico nao e aberta (nem truncada)."""
+        alvo = tmp_path / "alvo"
+        alvo.write_bytes(b"conteudo")
+        path = tmp_path / "rate_limit.table"
+        path.symlink_to(alvo)
+
+        with pytest.raises(OSError):
+            SharedRateLimiter(path, limit=3, window_seconds=60, slots=100, clock=clock)
+
+        assert alvo.read_bytes() == b"conteudo"
+
+
+@pytest.mark.unit
+class TestCreateRateLimiter:
+    """Testes para create_rate_limiter."""
+
+    @staticmethod
+    def _settings(**overrides: object) -> Settings:
+        return Settings(
+            api_key="k",
+            oracle_user="u",
+            oracle_password="p",
+            oracle_dsn="d",
+            **overrides,
+        )
+
+    def test_backend_shared_deve_exigir_diretorio(self) -> None:
+        """rate_limit_backend=shared sem cache_shared_dir e erro de configuracao."""
+        with pytest.raises(ValueError, match="cache_shared_dir"):
+            self._settings(rate_limit_backend="shared", cache_shared_dir="")
+
+    def test_deve_recusar_diretorio_acessivel_a_outros(self, tmp_path: Path) -> None:
+        """Diretorio com permissao para grupo/outros impede a criacao."""
+        directory = tmp_path / "shared"
+        directory.mkdir()
+        directory.chmod(0o777)
+        settings = self._settings(rate_limit_backend="shared", cache_shared_dir=str(directory))
+
+        with pytest.raises(PermissionError):
+            create_rate_limiter(limit=3, window_seconds=60, settings=settings)
+
+    def test_deve_criar_tabela_em_diretorio_privado(self, tmp_path: Path) -> None:
+        """Diretorio novo e criado 0700 com a tabela dentro."""
+        directory = tmp_path / "shared"
+        settings = self._settings(
+            rate_limit_backend="shared",
+            cache_shared_dir=str(directory),
+            rate_limit_max_clients=100,
+        )
+
+        limiter = create_rate_limiter(limit=3, window_seconds=60, settings=settings)
+        try:
+            assert isinstance(limiter, SharedRateLimiter)
+            assert directory.stat().st_mode & 0o777 == 0o700
+        finally:
+            limiter.close()
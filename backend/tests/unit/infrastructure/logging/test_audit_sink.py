@@ -0,0 +1,224 @@
+"""Testes para AuditSink (gravacao em lote da auditoria) - RAD-124."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.shared.infrastructure.logging.audit_sink import (
+    INSERT_CONSULTA,
+    AuditRecord,
+    AuditSink,
+)
+
+
+def make_record(n: int = 0, status_code: int = 200, error: str | None = None) -> AuditRecord:
+    """Registro de auditoria de teste."""
+    return AuditRecord.from_request(
+        request_id=f"req{n:05d}",
+        tipo_consulta=1,
+        inicio=datetime(2025, 12, 19, 10, 0, 0),
+        duration_ms=250,
+        client_ip="10.0.0.1",
+        api_key="chave-secreta-123",
+        method="GET",
+        path="/quantitativointerrupcoesativas",
+        query="",
+        status_code=status_code,
+        error=error,
+    )
+
+
+def make_pool() -> MagicMock:
+    """Pool que registra os lotes gravados."""
+    pool = MagicMock()
+    pool.executemany = AsyncMock(side_effect=lambda sql, rows: len(rows))
+    return pool
+
+
+@pytest.mark.unit
+class TestAuditRecord:
+    """Testes para AuditRecord."""
+
+    def test_deve_montar_registro_de_sucesso(self) -> None:
+        """Status < 400 vira SUCESSO, sem mensagem de erro."""
+        # Act
+        record = make_record()
+
+        # Assert
+        assert record.status == "SUCESSO"
+        assert record.mensagem_erro is None
+        assert record.data_fim == datetime(2025, 12, 19, 10, 0, 0, 250000)
+
+    def test_deve_montar_registro_de_erro_com_status_http(self) -> None:
+        """Status >= 400 vira ERRO com o codigo HTTP como mensagem."""
+        # Act
+        record = make_record(status_code=401)
+
+        # Assert
+        assert record.status == "ERRO"
+        assert record.mensagem_erro == "HTTP 401"
+
+    def test_deve_usar_mensagem_da_excecao(self) -> None:
+        """Excecao tem precedencia sobre o codigo HTTP."""
+        # Act
+        record = make_record(status_code=500, error="timeout")
+
+        # Assert
+        assert record.mensagem_erro == "timeout"
+
+    def test_deve_mascarar_api_key_nos_parametros(self) -> None:
+        """A API Key nunca e gravada inteira."""
+        # Act
+        parametros = json.loads(make_record().parametros)
+
+        # Assert
+        assert parametros["api_key_prefix"] == "chave-se..."
+        assert "chave-secreta-123" not in make_record().parametros
+
+    def test_deve_gerar_binds_do_insert(self) -> None:
+        """to_bind cobre todos os binds do INSERT."""
+        # Act
+        binds = make_record().to_bind()
+
+        # Assert
+        for name in binds:
+            assert f":{name}" in INSERT_CONSULTA
+
+
+@pytest.mark.unit
+class TestAuditSink:
+    """Testes para AuditSink."""
+
+    class TestEnqueue:
+        """Testes para enfileiramento."""
+
+        def test_deve_enfileirar_sem_acessar_o_banco(self) -> None:
+            """enqueue nao faz I/O."""
+            # Arrange
+            pool = make_pool()
+            sink = AuditSink(pool)
+
+            # Act
+            accepted = sink.enqueue(make_record())
+
+            # Assert
+            assert accepted is True
+            assert len(sink) == 1
+            pool.executemany.assert_not_called()
+
+        def test_deve_descartar_quando_fila_cheia(self) -> None:
+            """Fila cheia descarta o registro novo e conta em dropped."""
+            # Arrange
+            sink = AuditSink(make_pool(), max_queue=2)
+
+            # Act
+            results = [sink.enqueue(make_record(n)) for n in range(3)]
+
+            # Assert
+            assert results == [True, True, False]
+            stats = sink.get_stats()
+            assert stats.enqueued == 2
+            assert stats.dropped == 1
+            assert stats.queue_size == 2
+
+    class TestFlush:
+        """Testes para gravacao em lote."""
+
+        @pytest.mark.asyncio
+        async def test_deve_gravar_em_lotes_de_batch_size(self) -> None:
+            """flush divide a fila em lotes de batch_size."""
+            # Arrange
+            pool = make_pool()
+            sink = AuditSink(pool, batch_size=2)
+            for n in range(5):
+                sink.enqueue(make_record(n))
+
+            # Act
+            await sink.flush()
+
+            # Assert
+            sizes = [len(call.args[1]) for call in pool.executemany.await_args_list]
+            assert sizes == [2, 2, 1]
+            assert sink.get_stats().written == 5
+            assert sink.get_stats().batches == 3
+            assert len(sink) == 0
+
+        @pytest.mark.asyncio
+        async def test_deve_contar_lote_com_falha_como_descartado(self) -> None:
+            """Falha no banco nao propaga e conta os registros perdidos."""
+            # Arrange
+            pool = make_pool()
+            pool.executemany.side_effect = RuntimeError("ORA-12170")
+            sink = AuditSink(pool)
+            sink.enqueue(make_record(1))
+            sink.enqueue(make_record(2))
+
+            # Act
+            await sink.flush()
+
+            # Assert
+            stats = sink.get_stats()
+            assert stats.failed_batches == 1
+            assert stats.dropped == 2
+            assert stats.written == 0
+
+    class TestWriter:
+        """Testes para o writer em background."""
+
+        @pytest.mark.asyncio
+        async def test_deve_gravar_ao_completar_o_lote(self) -> None:
+            """Lote cheio e gravado sem esperar o intervalo."""
+            # Arrange
+            pool = make_pool()
+            sink = AuditSink(pool, batch_size=3, flush_interval_ms=60_000)
+            await sink.start()
+
+            # Act
+            for n in range(3):
+                sink.enqueue(make_record(n))
+            await asyncio.sleep(0.01)
+
+            # Assert
+            assert sink.get_stats().written == 3
+            await sink.stop()
+
+        @pytest.mark.asyncio
+        async def test_deve_gravar_lote_parcial_apos_o_intervalo(self) -> None:
+            """Lote incompleto e gravado apos flush_interval_ms."""
+            # Arrange
+            pool = make_pool()
+            sink = AuditSink(pool, batch_size=100, flush_interval_ms=20)
+            await sink.start()
+
+            # Act
+            sink.enqueue(make_record())
+            await asyncio.sleep(0.005)
+            before = sink.get_stats().written
+            await asyncio.sleep(0.05)
+
+            # Assert
+            assert before == 0
+            assert sink.get_stats().written == 1
+            await sink.stop()
+
+        @pytest.mark.asyncio
+        async def test_deve_gravar_pendentes_ao_parar(self) -> None:
+            """stop grava o que restou na fila."""
+            # Arrange
+            pool = make_pool()
+            sink = AuditSink(pool, batch_size=100, flush_interval_ms=60_000)
+            await sink.start()
+            sink.enqueue(make_record(1))
+            sink.enqueue(make_record(2))
+
+            # Act
+            await sink.stop()
+
+            # Assert
+            assert sink.get_stats().written == 2
+            assert len(sink) == 0
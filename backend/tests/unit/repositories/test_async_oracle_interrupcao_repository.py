@@ -0,0 +1,237 @@
+"""Testes unitarios para AsyncOracleInterrupcaoRepository (OraclePool)."""
+
+from __future__ import annotations
+
+import inspect
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.async_oracle_interrupcao_repository import (
+    AsyncOracleInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.interrupcao_repository import PLANO_POR_OUTAGE
+from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
+    QUERY_ALTERADAS,
+    QUERY_ATIVAS,
+    QUERY_HISTORICO,
+    QUERY_POR_CONJUNTO,
+    QUERY_POR_MUNICIPIO,
+    ROW_FIELDS,
+    OracleInterrupcaoRepository,
+)
+from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
+from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+ROW = {
+    "id": 12345,
+    "ucs_afetadas": 100,
+    "plan_id": None,
+    "conjunto": 1,
+    "codigo_ibge": 1400100,
+    "data_inicio": datetime(2025, 12, 22, 10, 0, 0),
+    "data_fim": None,
+}
+
+ROW_PROGRAMADA = {**ROW, "id": 12346, "plan_id": 999, "ucs_afetadas": None}
+
+ROW_IBGE_INVALIDO = {**ROW, "id": 12347, "codigo_ibge": 3550308}
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool (execute_rows retorna tuplas, como o real)."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute_rows = AsyncMock(return_value=[])
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock) -> AsyncOracleInterrupcaoRepository:
+    """Repositorio com pool mockado."""
+    return AsyncOracleInterrupcaoRepository(mock_pool)
+
+
+@pytest.mark.unit
+class TestAsyncOracleInterrupcaoRepository:
+    """Testes para AsyncOracleInterrupcaoRepository."""
+
+    class TestQueries:
+        """Testes das queries e binds enviados ao pool."""
+
+        @pytest.mark.asyncio
+        async def test_buscar_ativas_deve_usar_binds_da_agencia(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """buscar_ativas envia ag_id e dist 370."""
+            await repository.buscar_ativas()
+
+            mock_pool.execute_rows.assert_awaited_once_with(
+                QUERY_ATIVAS, {"ag_id": 370, "dist": 370}
+            )
+
+        @pytest.mark.asyncio
+        async def test_buscar_por_municipio_deve_filtrar_por_ibge(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """buscar_por_municipio envia o codigo IBGE."""
+            await repository.buscar_por_municipio(CodigoIBGE.create(1400100).value)
+
+            sql, params = mock_pool.execute_rows.await_args.args
+            assert sql == QUERY_POR_MUNICIPIO
+            assert params["ibge"] == 1400100
+
+        @pytest.mark.asyncio
+        async def test_buscar_por_conjunto_deve_filtrar_por_conjunto(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """buscar_por_conjunto envia o id do conjunto."""
+            await repository.buscar_por_conjunto(7)
+
+            sql, params = mock_pool.execute_rows.await_args.args
+            assert sql == QUERY_POR_CONJUNTO
+            assert params["conjunto"] == 7
+
+        @pytest.mark.asyncio
+        async def test_buscar_historico_deve_filtrar_por_periodo(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """buscar_historico envia inicio e fim do periodo."""
+            inicio = datetime(2025, 12, 1)
+            fim = datetime(2025, 12, 7)
+
+            await repository.buscar_historico(inicio, fim)
+
+            sql, params = mock_pool.execute_rows.await_args.args
+            assert sql == QUERY_HISTORICO
+            assert params["dt_inicio"] == inicio
+            assert params["dt_fim"] == fim
+
+        @pytest.mark.asyncio
+        async def test_buscar_alteradas_desde_deve_enviar_marca(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """buscar_alteradas_desde envia a marca d'agua."""
+            desde = datetime(2026, 1, 10, 13, 58)
+
+            await repository.buscar_alteradas_desde(desde)
+
+            sql, params = mock_pool.execute_rows.await_args.args
+            assert sql == QUERY_ALTERADAS
+            assert params["desde"] == desde
+
+        def test_plano_nao_deve_multiplicar_linhas_do_evento(self) -> None:
+            """PLAN_ID vem do plano agregado por ocorrencia, nao por tarefa."""
+            for sql in (QUERY_ATIVAS, QUERY_ALTERADAS):
+                assert f"LEFT JOIN {PLANO_POR_OUTAGE} spt" in sql
+
+        def test_metodos_devem_ser_assincronos(
+            self, repository: AsyncOracleInterrupcaoRepository
+        ) -> None:
+            """Todos os metodos do contrato sao coroutines."""
+            for name in (
+                "buscar_ativas",
+                "buscar_por_municipio",
+                "buscar_por_conjunto",
+                "buscar_historico",
+            ):
+                assert inspect.iscoroutinefunction(getattr(repository, name))
+
+    class TestMapping:
+        """Testes do mapeamento das linhas."""
+
+        @pytest.mark.asyncio
+        async def test_deve_mapear_linhas_como_repositorio_sincrono(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """Mesmas linhas geram as mesmas entidades nos dois caminhos."""
+            # Arrange
+            rows = [ROW, ROW_PROGRAMADA, ROW_IBGE_INVALIDO]
+            mock_pool.execute_rows.return_value = [
+                tuple(row[name] for name in ROW_FIELDS) for row in rows
+            ]
+            sync_repository = OracleInterrupcaoRepository(MagicMock())
+            expected = sync_repository._map_to_entities(
+                [SimpleNamespace(**row) for row in rows]
+            )
+
+            # Act
+            entities = await repository.buscar_ativas()
+
+            # Assert
+            assert entities == expected
+            assert [e.id for e in entities] == [12345, 12346]
+            assert entities[0].tipo == TipoInterrupcao.NAO_PROGRAMADA
+            assert entities[1].tipo == TipoInterrupcao.PROGRAMADA
+            assert entities[1].ucs_afetadas == 0
+
+        @pytest.mark.asyncio
+        async def test_buscar_ativas_colunas_deve_usar_mapeamento_colunar(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """Colunas com as mesmas linhas validas de buscar_ativas."""
+            # Arrange
+            rows = [ROW, ROW_PROGRAMADA, ROW_IBGE_INVALIDO]
+            mock_pool.execute_rows.return_value = [
+                tuple(row[name] for name in ROW_FIELDS) for row in rows
+            ]
+
+            # Act
+            colunas = await repository.buscar_ativas_colunas()
+
+            # Assert
+            mock_pool.execute_rows.assert_awaited_once_with(
+                QUERY_ATIVAS, {"ag_id": 370, "dist": 370}
+            )
+            assert colunas.ids == [12345, 12346]
+            assert colunas.programadas == [False, True]
+            assert colunas.to_entities() == await repository.buscar_ativas()
+
+    class TestStream:
+        """Testes da busca em lotes."""
+
+        @pytest.mark.asyncio
+        async def test_stream_ativas_deve_mapear_cada_lote(
+            self,
+            repository: AsyncOracleInterrupcaoRepository,
+            mock_pool: MagicMock,
+        ) -> None:
+            """Cada lote do pool vira um lote de entidades."""
+            # Arrange
+            lotes = [
+                [tuple(row[name] for name in ROW_FIELDS) for row in (ROW, ROW_IBGE_INVALIDO)],
+                [tuple(ROW_PROGRAMADA[name] for name in ROW_FIELDS)],
+            ]
+
+            async def stream(*args: object, **kwargs: object):
+                for lote in lotes:
+                    yield lote
+
+            mock_pool.stream = MagicMock(side_effect=stream)
+
+            # Act
+            resultado = [lote async for lote in repository.stream_ativas(batch_size=2)]
+
+            # Assert
+            assert [[e.id for e in lote] for lote in resultado] == [[12345], [12346]]
+            sql, params = mock_pool.stream.call_args.args
+            assert sql == QUERY_ATIVAS
+            assert params == {"ag_id": 370, "dist": 370}
+            assert mock_pool.stream.call_args.kwargs == {"batch_size": 2}
@@ -0,0 +1,127 @@
+"""Testes para DispositivoIndexRepository."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.dispositivo_index_repository import (
+    QUERY_CONJUNTO_POR_DISPOSITIVO,
+    DispositivoIndexRepository,
+    build_dispositivo_mapa,
+)
+from backend.apps.api_interrupcoes.repositories.fanout_interrupcao_repository import (
+    QUERY_MUNICIPIO_POR_DISPOSITIVO,
+)
+from backend.shared.domain.errors import DatabaseQueryError
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+CONJUNTOS = [(10, 1), (11, 1), (12, 2), (12, 3), (14, 4)]
+MUNICIPIOS = [(10, 1400100), (11, 1400159), (12, 1400100), (13, 1400209)]
+
+
+@pytest.fixture
+def respostas() -> dict[str, list]:
+    """Linhas devolvidas por cada query."""
+    return {
+        QUERY_CONJUNTO_POR_DISPOSITIVO: list(CONJUNTOS),
+        QUERY_MUNICIPIO_POR_DISPOSITIVO: list(MUNICIPIOS),
+    }
+
+
+@pytest.fixture
+def mock_pool(respostas: dict[str, list]) -> MagicMock:
+    """Mock do OraclePool."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute_rows = AsyncMock(side_effect=lambda sql, *args: respostas[sql])
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock) -> DispositivoIndexRepository:
+    """Repositorio com pool mockado."""
+    return DispositivoIndexRepository(mock_pool)
+
+
+@pytest.mark.unit
+class TestBuildDispositivoMapa:
+    """Testes para build_dispositivo_mapa."""
+
+    def test_deve_seguir_semantica_do_inner_join(self) -> None:
+        """Sem conjunto ou sem municipio fica fora; varios conjuntos multiplicam."""
+        mapa = build_dispositivo_mapa(CONJUNTOS, MUNICIPIOS)
+
+        assert mapa == {
+            10: ((1, 1400100),),
+            11: ((1, 1400159),),
+            12: ((2, 1400100), (3, 1400100)),
+        }
+
+
+@pytest.mark.unit
+class TestDispositivoIndexRepository:
+    """Testes para DispositivoIndexRepository."""
+
+    @pytest.mark.asyncio
+    async def test_primeira_leitura_deve_carregar_uma_vez(
+        self,
+        repository: DispositivoIndexRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Leituras concorrentes compartilham a carga inicial."""
+        # Act
+        indices = await asyncio.gather(*(repository.get_index() for _ in range(5)))
+
+        # Assert
+        assert mock_pool.execute_rows.await_count == 2
+        assert all(index is indices[0] for index in indices)
+        assert indices[0].version == 1
+        assert indices[0].resolver(12) == ((2, 1400100), (3, 1400100))
+        assert indices[0].resolver(999) == ()
+
+    @pytest.mark.asyncio
+    async def test_reload_sem_mudanca_deve_manter_versao(
+        self,
+        repository: DispositivoIndexRepository,
+    ) -> None:
+        """Versao so muda quando o conteudo muda."""
+        await repository.get_index()
+
+        index = await repository.reload()
+
+        assert index.version == 1
+        assert repository.get_stats().reloads == 2
+
+    @pytest.mark.asyncio
+    async def test_reload_com_mudanca_deve_trocar_o_indice(
+        self,
+        repository: DispositivoIndexRepository,
+        respostas: dict[str, list],
+    ) -> None:
+        """Nova topologia gera nova versao; a anterior segue intacta."""
+        anterior = await repository.get_index()
+        respostas[QUERY_MUNICIPIO_POR_DISPOSITIVO].append((14, 1400233))
+
+        index = await repository.reload()
+
+        assert index.version == 2
+        assert index.resolver(14) == ((4, 1400233),)
+        assert anterior.resolver(14) == ()
+
+    @pytest.mark.asyncio
+    async def test_falha_no_reload_deve_manter_versao_anterior(
+        self,
+        repository: DispositivoIndexRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Erro no banco nao descarta o indice carregado."""
+        anterior = await repository.get_index()
+        mock_pool.execute_rows.side_effect = DatabaseQueryError(Exception("ORA-02068"), "SELECT")
+
+        with pytest.raises(DatabaseQueryError):
+            await repository.reload()
+
+        assert repository.current is anterior
+        assert repository.get_stats().failures == 1
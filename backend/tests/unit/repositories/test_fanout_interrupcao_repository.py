@@ -0,0 +1,127 @@
+"""Testes para FanoutInterrupcaoRepository."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.fanout_interrupcao_repository import (
+    QUERY_EVENTOS_POR_DISPOSITIVO,
+    QUERY_MUNICIPIO_POR_DISPOSITIVO,
+    FanoutInterrupcaoRepository,
+    hash_join_agregados,
+)
+from backend.shared.domain.errors import DatabaseQueryError
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+# (dev_id, conjunto, programada, nao_programada)
+EVENTOS = [(10, 1, 50, 0), (11, 1, 0, 30), (12, 2, 5, 5), (99, 3, 7, 7)]
+# (dev_id, ibge): dispositivo 99 sem municipio, 12 em dois municipios
+MUNICIPIOS = [(10, 1400100), (11, 1400100), (12, 1400159), (12, 1400100), (13, 1400209)]
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool respondendo cada sub-query."""
+    pool = MagicMock(spec=OraclePool)
+    respostas = {
+        QUERY_EVENTOS_POR_DISPOSITIVO: EVENTOS,
+        QUERY_MUNICIPIO_POR_DISPOSITIVO: MUNICIPIOS,
+    }
+    pool.execute_rows = AsyncMock(side_effect=lambda sql, *args: respostas[sql])
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock) -> FanoutInterrupcaoRepository:
+    """Repositorio com pool mockado."""
+    return FanoutInterrupcaoRepository(mock_pool)
+
+
+@pytest.mark.unit
+class TestFanoutInterrupcaoRepository:
+    """Testes para FanoutInterrupcaoRepository."""
+
+    def test_cada_sub_query_deve_usar_um_unico_dblink(self) -> None:
+        """Nenhuma sub-query cruza DBLinks."""
+        assert "DBLINK_INDICADORES" not in QUERY_EVENTOS_POR_DISPOSITIVO
+        assert "DBLINK_INSERVICE" not in QUERY_MUNICIPIO_POR_DISPOSITIVO
+
+    @pytest.mark.asyncio
+    async def test_deve_agregar_como_a_query_unica(
+        self,
+        repository: FanoutInterrupcaoRepository,
+    ) -> None:
+        """INNER JOIN por dispositivo, ordenado por municipio/conjunto."""
+        # Act
+        result = await repository.find_ativas_agregadas({(1, 1400100): 900})
+
+        # Assert
+        assert [
+            (r.municipio_ibge, r.conjunto, r.qtd_ucs_atendidas, r.qtd_programada, r.qtd_nao_programada)
+            for r in result
+        ] == [
+            (1400100, 1, 900, 50, 30),
+            (1400100, 2, 0, 5, 5),
+            (1400159, 2, 0, 5, 5),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sub_queries_devem_rodar_em_paralelo(
+        self,
+        repository: FanoutInterrupcaoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """As duas consultas ficam em andamento ao mesmo tempo."""
+        # Arrange
+        em_andamento = 0
+        pico = 0
+        respostas = {
+            QUERY_EVENTOS_POR_DISPOSITIVO: EVENTOS,
+            QUERY_MUNICIPIO_POR_DISPOSITIVO: MUNICIPIOS,
+        }
+
+        async def execute_rows(sql: str, *args: object) -> list:
+            nonlocal em_andamento, pico
+            em_andamento += 1
+            pico = max(pico, em_andamento)
+            await asyncio.sleep(0.01)
+            em_andamento -= 1
+            return respostas[sql]
+
+        mock_pool.execute_rows.side_effect = execute_rows
+
+        # Act
+        await repository.find_ativas_agregadas()
+
+        # Assert
+        assert pico == 2
+
+    @pytest.mark.asyncio
+    async def test_deve_propagar_falha_de_qualquer_link(
+        self,
+        repository: FanoutInterrupcaoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Erro em uma sub-query falha a busca (sem resultado parcial)."""
+        mock_pool.execute_rows.side_effect = DatabaseQueryError(Exception("ORA-02068"), "SELECT")
+
+        with pytest.raises(DatabaseQueryError):
+            await repository.find_ativas_agregadas()
+
+
+@pytest.mark.unit
+class TestHashJoinAgregados:
+    """Testes para hash_join_agregados."""
+
+    def test_deve_tratar_nulos_como_zero(self) -> None:
+        """SUM sem linhas somadas vem NULL do banco."""
+        totais = hash_join_agregados([(1, 1, None, 4)], [(1, 1400100)])
+
+        assert totais == {(1400100, 1): [0, 4]}
+
+    def test_sem_municipios_deve_retornar_vazio(self) -> None:
+        """Sem o lado de build nada e agregado."""
+        assert hash_join_agregados(EVENTOS, []) == {}
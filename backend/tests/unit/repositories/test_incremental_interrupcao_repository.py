@@ -0,0 +1,143 @@
+"""Testes para IncrementalInterrupcaoRepository."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.incremental_interrupcao_repository import (
+    IncrementalInterrupcaoRepository,
+)
+from backend.shared.domain.entities.interrupcao import Interrupcao
+from backend.shared.domain.value_objects.codigo_ibge import CodigoIBGE
+from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
+
+AGORA = datetime(2026, 1, 10, 14, 0)
+BOA_VISTA = CodigoIBGE.create(1400100).value
+
+
+def _interrupcao(id: int, ucs: int, fechada: bool = False) -> Interrupcao:
+    return Interrupcao.create(
+        id=id,
+        tipo=TipoInterrupcao.NAO_PROGRAMADA,
+        municipio=BOA_VISTA,
+        conjunto=1,
+        ucs_afetadas=ucs,
+        data_inicio=AGORA - timedelta(hours=1),
+        data_fim=AGORA if fechada else None,
+    ).value
+
+
+@pytest.fixture
+def source() -> MagicMock:
+    """Repositorio assincrono de entidades (mock)."""
+    source = MagicMock()
+    source.buscar_ativas = AsyncMock(return_value=[_interrupcao(1, 50), _interrupcao(2, 30)])
+    source.buscar_alteradas_desde = AsyncMock(return_value=[])
+    return source
+
+
+@pytest.fixture
+def repository(source: MagicMock) -> IncrementalInterrupcaoRepository:
+    """Repositorio incremental com relogio fixo."""
+    return IncrementalInterrupcaoRepository(
+        source,
+        reconcile_interval_seconds=3600,
+        overlap_seconds=120,
+        clock=lambda: AGORA,
+    )
+
+
+@pytest.mark.unit
+class TestIncrementalInterrupcaoRepository:
+    """Testes para IncrementalInterrupcaoRepository."""
+
+    @pytest.mark.asyncio
+    async def test_primeira_chamada_deve_reconciliar(
+        self,
+        repository: IncrementalInterrupcaoRepository,
+        source: MagicMock,
+    ) -> None:
+        """Sem estado, busca todos os eventos abertos."""
+        # Act
+        agregadas = await repository.find_ativas_agregadas()
+
+        # Assert
+        source.buscar_ativas.assert_awaited_once()
+        source.buscar_alteradas_desde.assert_not_called()
+        assert len(agregadas) == 1
+        assert agregadas[0].municipio_ibge == 1400100
+        assert agregadas[0].qtd_nao_programada == 80
+        assert repository.get_stats().watermark == AGORA - timedelta(seconds=120)
+
+    @pytest.mark.asyncio
+    async def test_deve_usar_universo_informado(
+        self,
+        repository: IncrementalInterrupcaoRepository,
+    ) -> None:
+        """qtd_ucs_atendidas vem do universo pre-calculado."""
+        agregadas = await repository.find_ativas_agregadas({(1, 1400100): 900})
+
+        assert agregadas[0].qtd_ucs_atendidas == 900
+
+    @pytest.mark.asyncio
+    async def test_chamadas_seguintes_devem_aplicar_delta(
+        self,
+        repository: IncrementalInterrupcaoRepository,
+        source: MagicMock,
+    ) -> None:
+        """Apos a reconciliacao, busca apenas alteracoes desde a marca."""
+        await repository.find_ativas_agregadas()
+        source.buscar_alteradas_desde.return_value = [
+            _interrupcao(1, 50, fechada=True),
+            _interrupcao(3, 5),
+        ]
+
+        agregadas = await repository.find_ativas_agregadas()
+
+        source.buscar_ativas.assert_awaited_once()
+        source.buscar_alteradas_desde.assert_awaited_once_with(
+            AGORA - timedelta(seconds=120)
+        )
+        assert agregadas[0].qtd_nao_programada == 35
+        stats = repository.get_stats()
+        assert stats.deltas == 1
+        assert stats.last_delta_rows == 2
+        assert stats.open_events == 2
+
+    @pytest.mark.asyncio
+    async def test_deve_reconciliar_apos_intervalo(
+        self,
+        repository: IncrementalInterrupcaoRepository,
+        source: MagicMock,
+    ) -> None:
+        """Vencido o intervalo, a reconciliacao completa corrige o drift."""
+        await repository.find_ativas_agregadas()
+        repository.reconcile_interval_seconds = 0
+        source.buscar_ativas.return_value = [_interrupcao(1, 50)]
+
+        agregadas = await repository.find_ativas_agregadas()
+
+        assert source.buscar_ativas.await_count == 2
+        assert agregadas[0].qtd_nao_programada == 50
+        stats = repository.get_stats()
+        assert stats.reconciliations == 2
+        assert stats.drifted_groups == 1
+
+    @pytest.mark.asyncio
+    async def test_falha_no_delta_deve_manter_marca(
+        self,
+        repository: IncrementalInterrupcaoRepository,
+        source: MagicMock,
+    ) -> None:
+        """Erro no banco propaga e a proxima busca usa a mesma marca."""
+        await repository.find_ativas_agregadas()
+        marca = repository.get_stats().watermark
+        source.buscar_alteradas_desde.side_effect = RuntimeError("ORA-02068")
+
+        with pytest.raises(RuntimeError):
+            await repository.find_ativas_agregadas()
+
+        assert repository.get_stats().watermark == marca
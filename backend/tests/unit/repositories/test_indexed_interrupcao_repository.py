@@ -0,0 +1,94 @@
+"""Testes para IndexedInterrupcaoRepository."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.dispositivo_index_repository import (
+    DispositivoIndex,
+)
+from backend.apps.api_interrupcoes.repositories.indexed_interrupcao_repository import (
+    QUERY_EVENTOS_ABERTOS,
+    IndexedInterrupcaoRepository,
+)
+from backend.apps.api_interrupcoes.repositories.outages_programadas_repository import (
+    OutagesProgramadas,
+)
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+INDEX = DispositivoIndex(
+    version=3,
+    loaded_at=time.time(),
+    mapa={
+        10: ((1, 1400100),),
+        11: ((1, 1400100),),
+        12: ((2, 1400100), (2, 1400159)),
+    },
+)
+
+PROGRAMADAS = OutagesProgramadas(
+    version=1, watermark=500, loaded_at=time.time(), outages=frozenset({1001, 1005})
+)
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool com eventos abertos (dev_id, outage_num, ucs)."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute_rows = AsyncMock(
+        return_value=[
+            (10, 1001, 50),
+            (11, 1002, 30),
+            (11, 1003, None),
+            (12, 1004, 5),
+            (12, 1005, 5),
+            (99, 1006, 7),
+        ]
+    )
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock) -> IndexedInterrupcaoRepository:
+    """Repositorio com indice e conjunto de programadas fixos."""
+    index = MagicMock()
+    index.get_index = AsyncMock(return_value=INDEX)
+    programadas = MagicMock()
+    programadas.get_programadas = AsyncMock(return_value=PROGRAMADAS)
+    return IndexedInterrupcaoRepository(mock_pool, index, programadas)
+
+
+@pytest.mark.unit
+class TestIndexedInterrupcaoRepository:
+    """Testes para IndexedInterrupcaoRepository."""
+
+    def test_query_quente_nao_deve_tocar_topologia(self) -> None:
+        """Apenas AGENCY_EVENT, sem joins remotos."""
+        assert "AGENCY_EVENT" in QUERY_EVENTOS_ABERTOS
+        assert "SWITCH_PLAN_TASKS" not in QUERY_EVENTOS_ABERTOS
+        assert "OMS_CONNECTIVITY" not in QUERY_EVENTOS_ABERTOS
+        assert "IND_UNIVERSOS" not in QUERY_EVENTOS_ABERTOS
+
+    @pytest.mark.asyncio
+    async def test_deve_enriquecer_pelo_indice(
+        self,
+        repository: IndexedInterrupcaoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Classifica pelo conjunto; dispositivo desconhecido fica fora."""
+        # Act
+        result = await repository.find_ativas_agregadas({(2, 1400159): 40})
+
+        # Assert
+        mock_pool.execute_rows.assert_awaited_once_with(QUERY_EVENTOS_ABERTOS)
+        assert [
+            (r.municipio_ibge, r.conjunto, r.qtd_ucs_atendidas, r.qtd_programada, r.qtd_nao_programada)
+            for r in result
+        ] == [
+            (1400100, 1, 0, 50, 30),
+            (1400100, 2, 0, 5, 5),
+            (1400159, 2, 40, 5, 5),
+        ]
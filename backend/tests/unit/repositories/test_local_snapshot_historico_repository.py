@@ -0,0 +1,81 @@
+"""Testes para LocalSnapshotHistoricoRepository."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.local_snapshot_historico_repository import (
+    LocalSnapshotHistoricoRepository,
+)
+from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
+from backend.shared.infrastructure.archive import ColumnarArchive
+
+CAPTURADO_EM = datetime(2026, 1, 10, 14, 25)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> LocalSnapshotHistoricoRepository:
+    """Repositorio sobre arquivo isolado."""
+    archive = ColumnarArchive(
+        tmp_path / "historico",
+        column_count=LocalSnapshotHistoricoRepository.COLUMN_COUNT,
+    )
+    yield LocalSnapshotHistoricoRepository(archive)
+    archive.close()
+
+
+def _item(conjunto: int) -> InterrupcaoAgregadaItem:
+    return InterrupcaoAgregadaItem(
+        ideConjuntoUnidadeConsumidora=conjunto,
+        ideMunicipio=1400100 + conjunto,
+        qtdUCsAtendidas=1000 * conjunto,
+        qtdOcorrenciaProgramada=conjunto,
+        qtdOcorrenciaNaoProgramada=2 * conjunto,
+    )
+
+
+@pytest.mark.unit
+class TestLocalSnapshotHistoricoRepository:
+    """Testes para LocalSnapshotHistoricoRepository."""
+
+    @pytest.mark.asyncio
+    async def test_deve_recuperar_itens_gravados(
+        self, repository: LocalSnapshotHistoricoRepository
+    ) -> None:
+        """find_nearest() devolve os mesmos itens gravados por save()."""
+        # Arrange
+        items = [_item(1), _item(2)]
+        await repository.save(CAPTURADO_EM, items)
+
+        # Act
+        snapshot = await repository.find_nearest(CAPTURADO_EM.replace(minute=29))
+
+        # Assert
+        assert snapshot is not None
+        assert snapshot.capturado_em == CAPTURADO_EM
+        assert snapshot.items == items
+
+    @pytest.mark.asyncio
+    async def test_deve_retornar_none_sem_historico(
+        self, repository: LocalSnapshotHistoricoRepository
+    ) -> None:
+        """Sem snapshot ate dth retorna None."""
+        await repository.save(CAPTURADO_EM, [_item(1)])
+
+        assert await repository.find_nearest(CAPTURADO_EM.replace(hour=8)) is None
+
+    @pytest.mark.asyncio
+    async def test_deve_expurgar_dias_anteriores(
+        self, repository: LocalSnapshotHistoricoRepository
+    ) -> None:
+        """purge_before() remove os dias anteriores ao limite."""
+        await repository.save(datetime(2023, 1, 5, 10), [_item(1)])
+        await repository.save(CAPTURADO_EM, [_item(2)])
+
+        removed = await repository.purge_before(datetime(2023, 1, 10))
+
+        assert removed == 1
+        assert await repository.find_nearest(datetime(2023, 1, 6)) is None
@@ -0,0 +1,69 @@
+"""Testes para MaterializedInterrupcaoRepository."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.materialized_interrupcao_repository import (
+    MVIEW_INTERRUPCOES,
+    QUERY_MATERIALIZADAS,
+    MaterializedInterrupcaoRepository,
+)
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+ROWS = [(1, 1400100, 1200, 50, 30), (2, 1400159, None, None, 10)]
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute_rows = AsyncMock(return_value=ROWS)
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock) -> MaterializedInterrupcaoRepository:
+    """Repositorio com pool e refresher mockados."""
+    return MaterializedInterrupcaoRepository(mock_pool, MagicMock())
+
+
+@pytest.mark.unit
+class TestMaterializedInterrupcaoRepository:
+    """Testes para MaterializedInterrupcaoRepository."""
+
+    def test_query_deve_ler_apenas_a_view_local(self) -> None:
+        """A leitura nao usa DBLinks."""
+        assert MVIEW_INTERRUPCOES in QUERY_MATERIALIZADAS
+        assert "@DBLINK" not in QUERY_MATERIALIZADAS
+
+    @pytest.mark.asyncio
+    async def test_deve_mapear_linhas_da_view(
+        self,
+        repository: MaterializedInterrupcaoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Colunas da view viram InterrupcaoAgregadaDB (nulos como zero)."""
+        # Act
+        result = await repository.find_ativas_agregadas()
+
+        # Assert
+        mock_pool.execute_rows.assert_awaited_once_with(QUERY_MATERIALIZADAS)
+        assert [(r.conjunto, r.municipio_ibge) for r in result] == [(1, 1400100), (2, 1400159)]
+        assert result[0].qtd_ucs_atendidas == 1200
+        assert result[0].qtd_programada == 50
+        assert result[1].qtd_ucs_atendidas == 0
+        assert result[1].qtd_programada == 0
+        assert result[1].qtd_nao_programada == 10
+
+    @pytest.mark.asyncio
+    async def test_universo_informado_deve_substituir_valor_materializado(
+        self,
+        repository: MaterializedInterrupcaoRepository,
+    ) -> None:
+        """Com universo, qtd_ucs_atendidas vem do mapa."""
+        result = await repository.find_ativas_agregadas({(2, 1400159): 77})
+
+        assert [r.qtd_ucs_atendidas for r in result] == [0, 77]
@@ -420,6 +420,113 @@ class TestMapToEntities:
         assert entities == []
 
 
+def _record(**overrides) -> tuple:
+    """Registro na ordem de ROW_FIELDS."""
+    from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
+        ROW_FIELDS,
+    )
+
+    valores = {
+        "id": 1,
+        "ucs_afetadas": 10,
+        "plan_id": None,
+        "conjunto": 1,
+        "codigo_ibge": 1400100,
+        "data_inicio": datetime(2025, 12, 22, 10, 0, 0),
+        "data_fim": None,
+        **overrides,
+    }
+    return tuple(valores[campo] for campo in ROW_FIELDS)
+
+
+@pytest.mark.unit
+class TestMapeamentoRapido:
+    """Testes para map_interrupcao_records / map_interrupcao_colunas."""
+
+    def test_deve_rejeitar_mesmos_casos_que_a_entidade(self) -> None:
+        """Regras de CodigoIBGE.create e Interrupcao.create sao mantidas."""
+        from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
+            map_interrupcao_records,
+        )
+
+        # Arrange
+        records = [
+            _record(id=1),
+            _record(id=2, codigo_ibge=3550308),
+            _record(id=3, codigo_ibge=14001),
+            _record(id=4, ucs_afetadas=-1),
+            _record(id=5, conjunto=-1),
+            _record(id=6, data_fim=datetime(2025, 12, 22, 9, 0, 0)),
+        ]
+
+        # Act
+        entities = map_interrupcao_records(records)
+
+        # Assert
+        assert [e.id for e in entities] == [1]
+
+    def test_deve_registrar_rejeicoes_em_um_unico_log(self) -> None:
+        """Um evento de resumo por chamada, nao um por linha."""
+        from backend.apps.api_interrupcoes.repositories import oracle_interrupcao_repository
+
+        records = [_record(id=i, codigo_ibge=3550308) for i in range(50)]
+        records.append(_record(id=99, ucs_afetadas=-5))
+
+        with patch.object(oracle_interrupcao_repository, "logger") as mock_logger:
+            oracle_interrupcao_repository.map_interrupcao_records(records)
+
+        mock_logger.warning.assert_called_once()
+        kwargs = mock_logger.warning.call_args.kwargs
+        assert kwargs["total"] == 51
+        assert kwargs["motivos"] == {"ibge_invalido": 50, "ucs_negativas": 1}
+        assert len(kwargs["amostra_ids"]) == 10
+
+    def test_nao_deve_logar_sem_rejeicoes(self) -> None:
+        """Sem registros invalidos nao ha warning."""
+        from backend.apps.api_interrupcoes.repositories import oracle_interrupcao_repository
+
+        with patch.object(oracle_interrupcao_repository, "logger") as mock_logger:
+            oracle_interrupcao_repository.map_interrupcao_records([_record()])
+
+        mock_logger.warning.assert_not_called()
+
+    def test_deve_reutilizar_value_objects_de_municipio(self) -> None:
+        """CodigoIBGE e compartilhado entre linhas do mesmo municipio."""
+        from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
+            map_interrupcao_records,
+        )
+
+        entities = map_interrupcao_records([_record(id=1), _record(id=2)])
+
+        assert entities[0].municipio is entities[1].municipio
+        assert entities[0].municipio == CodigoIBGE.create(1400100).value
+
+    def test_colunas_devem_equivaler_as_entidades(self) -> None:
+        """to_entities() das colunas reproduz map_interrupcao_records."""
+        from backend.apps.api_interrupcoes.repositories.oracle_interrupcao_repository import (
+            map_interrupcao_colunas,
+            map_interrupcao_records,
+        )
+
+        # Arrange
+        records = [
+            _record(id=1, plan_id=7, ucs_afetadas=None),
+            _record(id=2, codigo_ibge=3550308),
+            _record(id=3, conjunto=4, codigo_ibge=1400159, data_fim=datetime(2025, 12, 23)),
+        ]
+
+        # Act
+        colunas = map_interrupcao_colunas(records)
+
+        # Assert
+        assert len(colunas) == 2
+        assert colunas.ids == [1, 3]
+        assert colunas.programadas == [True, False]
+        assert colunas.ucs_afetadas == [0, 10]
+        assert colunas.ibges == [1400100, 1400159]
+        assert colunas.to_entities() == map_interrupcao_records(records)
+
+
 @pytest.mark.unit
 class TestImplementsProtocol:
     """Testes para verificar que implementa InterrupcaoRepository Protocol."""
@@ -0,0 +1,134 @@
+"""Testes para OutagesProgramadasRepository."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.outages_programadas_repository import (
+    QUERY_OUTAGES_PROGRAMADAS,
+    QUERY_OUTAGES_PROGRAMADAS_DESDE,
+    OutagesProgramadasRepository,
+)
+from backend.shared.domain.errors import DatabaseQueryError
+from backend.shared.domain.value_objects.tipo_interrupcao import TipoInterrupcao
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool: carga completa seguida de um delta."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute_rows = AsyncMock(
+        side_effect=[
+            [(1001, 10), (1002, 12)],
+            [(1002, 12), (1003, 13)],
+        ]
+    )
+    return pool
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock) -> OutagesProgramadasRepository:
+    """Repositorio com pool mockado."""
+    return OutagesProgramadasRepository(mock_pool, reconcile_interval_seconds=900)
+
+
+@pytest.mark.unit
+class TestOutagesProgramadasRepository:
+    """Testes para OutagesProgramadasRepository."""
+
+    @pytest.mark.asyncio
+    async def test_primeira_leitura_deve_carregar_tudo(
+        self,
+        repository: OutagesProgramadasRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Carga completa define conjunto e marca d'agua."""
+        # Act
+        programadas = await repository.get_programadas()
+
+        # Assert
+        mock_pool.execute_rows.assert_awaited_once_with(QUERY_OUTAGES_PROGRAMADAS)
+        assert programadas.outages == {1001, 1002}
+        assert programadas.watermark == 12
+        assert programadas.version == 1
+
+    @pytest.mark.asyncio
+    async def test_pertinencia_deve_seguir_regra_do_plan_id(
+        self,
+        repository: OutagesProgramadasRepository,
+    ) -> None:
+        """Estar no conjunto equivale a ter PLAN_ID no LEFT JOIN."""
+        programadas = await repository.get_programadas()
+
+        assert (1001 in programadas) == TipoInterrupcao.from_plan_id(10).is_programada()
+        assert (9999 in programadas) == TipoInterrupcao.from_plan_id(None).is_programada()
+
+    @pytest.mark.asyncio
+    async def test_refresh_deve_aplicar_delta_desde_a_marca(
+        self,
+        repository: OutagesProgramadasRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Delta le a partir do ultimo PLAN_ID (inclusive) e so acrescenta."""
+        anterior = await repository.get_programadas()
+
+        programadas = await repository.refresh()
+
+        mock_pool.execute_rows.assert_awaited_with(
+            QUERY_OUTAGES_PROGRAMADAS_DESDE, {"plan_id": 12}
+        )
+        assert programadas.outages == {1001, 1002, 1003}
+        assert programadas.watermark == 13
+        assert programadas.version == 2
+        assert anterior.outages == {1001, 1002}
+        assert repository.get_stats().deltas == 1
+
+    @pytest.mark.asyncio
+    async def test_delta_sem_novidade_deve_manter_versao(
+        self,
+        repository: OutagesProgramadasRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Linhas ja conhecidas nao geram nova versao."""
+        mock_pool.execute_rows.side_effect = [[(1001, 10)], [(1001, 10)]]
+        await repository.get_programadas()
+
+        programadas = await repository.refresh()
+
+        assert programadas.version == 1
+
+    @pytest.mark.asyncio
+    async def test_reconciliacao_deve_descartar_planos_removidos(
+        self,
+        repository: OutagesProgramadasRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Carga completa periodica substitui o conjunto."""
+        repository.reconcile_interval_seconds = 0
+        mock_pool.execute_rows.side_effect = [[(1001, 10), (1002, 12)], [(1002, 12)]]
+        await repository.get_programadas()
+
+        programadas = await repository.refresh()
+
+        assert mock_pool.execute_rows.await_args.args == (QUERY_OUTAGES_PROGRAMADAS,)
+        assert programadas.outages == {1002}
+        assert repository.get_stats().reconciliations == 2
+
+    @pytest.mark.asyncio
+    async def test_falha_deve_manter_versao_anterior(
+        self,
+        repository: OutagesProgramadasRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Erro no banco nao descarta o conjunto carregado."""
+        anterior = await repository.get_programadas()
+        mock_pool.execute_rows.side_effect = DatabaseQueryError(Exception("ORA-02068"), "SELECT")
+
+        with pytest.raises(DatabaseQueryError):
+            await repository.refresh()
+
+        assert repository.current is anterior
+        assert repository.get_stats().failures == 1
@@ -0,0 +1,128 @@
+"""Testes para UniversoRepository."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.universo_repository import (
+    QUERY_UNIVERSO_CONJUNTOS,
+    UniversoRepository,
+)
+from backend.shared.domain.cache.cache_service import CacheKeys, CacheTTL
+from backend.shared.domain.errors import DatabaseQueryError
+from backend.shared.infrastructure.database.oracle_pool import OraclePool
+
+ROWS = [(1, 1400100, 1200), (2, 1400100, 800), (1, 1400159, None)]
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Mock do OraclePool."""
+    pool = MagicMock(spec=OraclePool)
+    pool.execute_rows = AsyncMock(return_value=ROWS)
+    return pool
+
+
+@pytest.fixture
+def mock_cache() -> AsyncMock:
+    """Mock do cache com stale."""
+    cache = AsyncMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.get_stale = AsyncMock(return_value=None)
+    return cache
+
+
+@pytest.fixture
+def repository(mock_pool: MagicMock, mock_cache: AsyncMock) -> UniversoRepository:
+    """Repositorio com pool e cache mockados."""
+    return UniversoRepository(mock_pool, mock_cache)
+
+
+@pytest.mark.unit
+class TestUniversoRepository:
+    """Testes para UniversoRepository."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_nao_deve_consultar_banco(
+        self,
+        repository: UniversoRepository,
+        mock_pool: MagicMock,
+        mock_cache: AsyncMock,
+    ) -> None:
+        """Universo em cache e retornado sem query."""
+        mock_cache.get.return_value = {(1, 1400100): 10}
+
+        universo = await repository.get_universo()
+
+        assert universo == {(1, 1400100): 10}
+        mock_cache.get.assert_awaited_once_with(CacheKeys.UNIVERSO_CONJUNTOS)
+        mock_pool.execute_rows.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_deve_calcular_e_gravar_com_ttl_do_universo(
+        self,
+        repository: UniversoRepository,
+        mock_pool: MagicMock,
+        mock_cache: AsyncMock,
+    ) -> None:
+        """Miss executa a query do universo e grava por CacheTTL.UNIVERSO."""
+        # Act
+        universo = await repository.get_universo()
+
+        # Assert
+        expected = {(1, 1400100): 1200, (2, 1400100): 800, (1, 1400159): 0}
+        assert universo == expected
+        mock_pool.execute_rows.assert_awaited_once_with(QUERY_UNIVERSO_CONJUNTOS)
+        mock_cache.set.assert_awaited_once_with(
+            CacheKeys.UNIVERSO_CONJUNTOS, expected, CacheTTL.UNIVERSO
+        )
+
+    @pytest.mark.asyncio
+    async def test_falha_deve_usar_universo_stale(
+        self,
+        repository: UniversoRepository,
+        mock_pool: MagicMock,
+        mock_cache: AsyncMock,
+    ) -> None:
+        """Banco indisponivel: universo anterior (stale) e mantido."""
+        mock_pool.execute_rows.side_effect = DatabaseQueryError(Exception("ORA-12541"), "SELECT")
+        mock_cache.get_stale.return_value = {(1, 1400100): 7}
+
+        assert await repository.get_universo() == {(1, 1400100): 7}
+
+    @pytest.mark.asyncio
+    async def test_falha_sem_stale_deve_retornar_vazio(
+        self,
+        repository: UniversoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Sem stale, qtdUCsAtendidas fica 0 em vez de falhar a resposta."""
+        mock_pool.execute_rows.side_effect = DatabaseQueryError(Exception("ORA-12541"), "SELECT")
+
+        assert await repository.get_universo() == {}
+
+    @pytest.mark.asyncio
+    async def test_misses_concorrentes_devem_consultar_uma_vez(
+        self,
+        repository: UniversoRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Refresh coalescido entre chamadas simultaneas."""
+        release = asyncio.Event()
+
+        async def slow_query(sql: str) -> list[tuple[int, int, int]]:
+            await release.wait()
+            return ROWS
+
+        mock_pool.execute_rows.side_effect = slow_query
+
+        tasks = [asyncio.create_task(repository.get_universo()) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert mock_pool.execute_rows.await_count == 1
+        assert all(result == results[0] for result in results)
@@ -5,6 +5,8 @@ Seguindo TDD e padrao AAA (Arrange-Act-Assert).
 
 from __future__ import annotations
 
+import asyncio
+import json
 from collections.abc import Callable
 from unittest.mock import AsyncMock
 
@@ -14,6 +16,7 @@ from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
 from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_ativas import (
     GetInterrupcoesAtivasUseCase,
     InterrupcaoAgregada,
+    InterrupcoesSnapshot,
 )
 
 
@@ -82,15 +85,17 @@ class TestGetInterrupcoesAtivasUseCase:
         ) -> None:
             """Se cache tem dados, retorna do cache sem ir ao banco."""
             # Arrange
-            cached_data = [
-                InterrupcaoAgregadaItem(
-                    ideConjuntoUnidadeConsumidora=1,
-                    ideMunicipio=1400100,
-                    qtdUCsAtendidas=0,
-                    qtdOcorrenciaProgramada=100,
-                    qtdOcorrenciaNaoProgramada=50,
-                )
-            ]
+            cached_data = InterrupcoesSnapshot.create(
+                [
+                    InterrupcaoAgregadaItem(
+                        ideConjuntoUnidadeConsumidora=1,
+                        ideMunicipio=1400100,
+                        qtdUCsAtendidas=0,
+                        qtdOcorrenciaProgramada=100,
+                        qtdOcorrenciaNaoProgramada=50,
+                    )
+                ]
+            )
             mock_cache.get.return_value = cached_data
 
             # Act
@@ -109,15 +114,17 @@ class TestGetInterrupcoesAtivasUseCase:
         ) -> None:
             """Cache hit nao deve chamar cache.set()."""
             # Arrange
-            mock_cache.get.return_value = [
-                InterrupcaoAgregadaItem(
-                    ideConjuntoUnidadeConsumidora=1,
-                    ideMunicipio=1400100,
-                    qtdUCsAtendidas=0,
-                    qtdOcorrenciaProgramada=100,
-                    qtdOcorrenciaNaoProgramada=50,
-                )
-            ]
+            mock_cache.get.return_value = InterrupcoesSnapshot.create(
+                [
+                    InterrupcaoAgregadaItem(
+                        ideConjuntoUnidadeConsumidora=1,
+                        ideMunicipio=1400100,
+                        qtdUCsAtendidas=0,
+                        qtdOcorrenciaProgramada=100,
+                        qtdOcorrenciaNaoProgramada=50,
+                    )
+                ]
+            )
 
             # Act
             await use_case.execute()
@@ -236,14 +243,108 @@ class TestGetInterrupcoesAtivasUseCase:
 
             # Assert
             assert result.is_success
-            assert len(result.value) == 1
-            item = result.value[0]
+            assert len(result.value.items) == 1
+            item = result.value.items[0]
             assert isinstance(item, InterrupcaoAgregadaItem)
             assert item.ideConjuntoUnidadeConsumidora == 1
             assert item.ideMunicipio == 1400100
             assert item.qtdOcorrenciaProgramada == 50
             assert item.qtdOcorrenciaNaoProgramada == 30
 
+        @pytest.mark.asyncio
+        async def test_snapshot_deve_conter_resposta_aneel_serializada(
+            self,
+            use_case: GetInterrupcoesAtivasUseCase,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+            interrupcao_agregada_factory: Callable[..., InterrupcaoAgregada],
+        ) -> None:
+            """O corpo pre-serializado equivale a resposta de sucesso ANEEL."""
+            # Arrange
+            mock_cache.get.return_value = None
+            mock_repository.find_ativas_agregadas.return_value = [
+                interrupcao_agregada_factory(qtd_programada=50, qtd_nao_programada=30)
+            ]
+
+            # Act
+            result = await use_case.execute()
+
+            # Assert
+            body = json.loads(result.value.body.identity)
+            assert body == {
+                "idcStatusRequisicao": 1,
+                "emailIndisponibilidade": "radar@roraimaenergia.com.br",
+                "mensagem": "",
+                "interrupcaoFornecimento": [
+                    {
+                        "ideConjuntoUnidadeConsumidora": 1,
+                        "ideMunicipio": 1400100,
+                        "qtdUCsAtendidas": 0,
+                        "qtdOcorrenciaProgramada": 50,
+                        "qtdOcorrenciaNaoProgramada": 30,
+                    }
+                ],
+            }
+
+        def test_snapshot_deve_ter_validadores_http(
+            self,
+            interrupcao_agregada_factory: Callable[..., InterrupcaoAgregada],
+        ) -> None:
+            """ETag acompanha o conteudo, nao o momento da geracao."""
+            # Arrange
+            items = [interrupcao_agregada_factory().to_aneel_format()]
+
+            # Act
+            first = InterrupcoesSnapshot.create(items)
+            second = InterrupcoesSnapshot.create(list(items))
+            changed = InterrupcoesSnapshot.create([])
+
+            # Assert
+            assert first.cache_headers["ETag"] == second.cache_headers["ETag"]
+            assert first.cache_headers["ETag"] != changed.cache_headers["ETag"]
+            assert first.cache_headers["Last-Modified"].endswith("GMT")
+
+        def test_snapshot_deve_manter_last_modified_sem_mudanca(
+            self,
+            interrupcao_agregada_factory: Callable[..., InterrupcaoAgregada],
+        ) -> None:
+            """Mesmo conteudo herda a geracao anterior; conteudo novo avanca."""
+            # Arrange
+            items = [interrupcao_agregada_factory().to_aneel_format()]
+            previous = InterrupcoesSnapshot.create(items, generated_at=1_000_000.0)
+
+            # Act
+            same = InterrupcoesSnapshot.create(list(items), previous=previous)
+            changed = InterrupcoesSnapshot.create([], previous=previous)
+
+            # Assert
+            assert same.generated_at == previous.generated_at
+            assert same.cache_headers["Last-Modified"] == previous.cache_headers["Last-Modified"]
+            assert changed.generated_at > previous.generated_at
+
+        @pytest.mark.asyncio
+        async def test_refresh_sem_mudanca_deve_manter_last_modified(
+            self,
+            use_case: GetInterrupcoesAtivasUseCase,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+            interrupcao_agregada_factory: Callable[..., InterrupcaoAgregada],
+        ) -> None:
+            """Refresh com o mesmo resultado preserva o Last-Modified do cache."""
+            # Arrange
+            interrupcao = interrupcao_agregada_factory()
+            mock_repository.find_ativas_agregadas.return_value = [interrupcao]
+            mock_cache.get_stale.return_value = InterrupcoesSnapshot.create(
+                [interrupcao.to_aneel_format()], generated_at=1_000_000.0
+            )
+
+            # Act
+            result = await use_case.execute()
+
+            # Assert
+            assert result.is_success
+            assert result.value.generated_at == 1_000_000.0
+
     class TestErros:
         """Testes de tratamento de erros."""
 
@@ -276,15 +377,17 @@ class TestGetInterrupcoesAtivasUseCase:
         ) -> None:
             """Se banco falha e tem stale cache, usa stale."""
             # Arrange
-            stale_data = [
-                InterrupcaoAgregadaItem(
-                    ideConjuntoUnidadeConsumidora=1,
-                    ideMunicipio=1400100,
-                    qtdUCsAtendidas=0,
-                    qtdOcorrenciaProgramada=100,
-                    qtdOcorrenciaNaoProgramada=50,
-                )
-            ]
+            stale_data = InterrupcoesSnapshot.create(
+                [
+                    InterrupcaoAgregadaItem(
+                        ideConjuntoUnidadeConsumidora=1,
+                        ideMunicipio=1400100,
+                        qtdUCsAtendidas=0,
+                        qtdOcorrenciaProgramada=100,
+                        qtdOcorrenciaNaoProgramada=50,
+                    )
+                ]
+            )
             mock_cache.get.return_value = None
             mock_cache.get_stale.return_value = stale_data
             mock_repository.find_ativas_agregadas.side_effect = Exception("DB Error")
@@ -316,6 +419,275 @@ class TestGetInterrupcoesAtivasUseCase:
             # Assert
             mock_cache.get_stale.assert_called_once()
 
+    class TestCoalescencia:
+        """Testes de coalescencia de cache miss concorrentes."""
+
+        @pytest.mark.asyncio
+        async def test_misses_concorrentes_devem_consultar_banco_uma_vez(
+            self,
+            use_case: GetInterrupcoesAtivasUseCase,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+            interrupcao_agregada_factory: Callable[..., InterrupcaoAgregada],
+        ) -> None:
+            """Varias requisicoes no mesmo miss compartilham uma consulta."""
+            # Arrange
+            release = asyncio.Event()
+
+            async def slow_query() -> list[InterrupcaoAgregada]:
+                await release.wait()
+                return [interrupcao_agregada_factory()]
+
+            mock_cache.get.return_value = None
+            mock_repository.find_ativas_agregadas.side_effect = slow_query
+
+            # Act
+            tasks = [asyncio.create_task(use_case.execute()) for _ in range(10)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+            # Assert
+            assert all(r.is_success for r in results)
+            mock_repository.find_ativas_agregadas.assert_called_once()
+            mock_cache.set.assert_called_once()
+            assert use_case.single_flight.get_stats().coalesced == 9
+
+        @pytest.mark.asyncio
+        async def test_falha_coalescida_deve_usar_stale_em_todos(
+            self,
+            use_case: GetInterrupcoesAtivasUseCase,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+        ) -> None:
+            """Erro na consulta compartilhada cai no stale para todos os waiters."""
+            # Arrange
+            release = asyncio.Event()
+            stale_data = InterrupcoesSnapshot.create(
+                [
+                    InterrupcaoAgregadaItem(
+                        ideConjuntoUnidadeConsumidora=1,
+                        ideMunicipio=1400100,
+                        qtdUCsAtendidas=0,
+                        qtdOcorrenciaProgramada=100,
+                        qtdOcorrenciaNaoProgramada=50,
+                    )
+                ]
+            )
+
+            async def failing_query() -> list[InterrupcaoAgregada]:
+                await release.wait()
+                raise Exception("DB Error")
+
+            mock_cache.get.return_value = None
+            mock_cache.get_stale.return_value = stale_data
+            mock_repository.find_ativas_agregadas.side_effect = failing_query
+
+            # Act
+            tasks = [asyncio.create_task(use_case.execute()) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+            # Assert
+            assert all(r.value == stale_data for r in results)
+            mock_repository.find_ativas_agregadas.assert_called_once()
+
+    class TestRefreshAntecipado:
+        """Testes do modo com refresh antecipado em background."""
+
+        @pytest.mark.asyncio
+        async def test_miss_com_stale_nao_deve_consultar_banco(
+            self,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+        ) -> None:
+            """Com refresh em background, miss com stale responde o stale."""
+            # Arrange
+            stale_data = InterrupcoesSnapshot.create(
+                [
+                    InterrupcaoAgregadaItem(
+                        ideConjuntoUnidadeConsumidora=1,
+                        ideMunicipio=1400100,
+                        qtdUCsAtendidas=0,
+                        qtdOcorrenciaProgramada=100,
+                        qtdOcorrenciaNaoProgramada=50,
+                    )
+                ]
+            )
+            mock_cache.get.return_value = None
+            mock_cache.get_stale.return_value = stale_data
+            use_case = GetInterrupcoesAtivasUseCase(
+                repository=mock_repository,
+                cache=mock_cache,
+                serve_stale_on_miss=True,
+            )
+
+            # Act
+            result = await use_case.execute()
+
+            # Assert
+            assert result.value == stale_data
+            mock_repository.find_ativas_agregadas.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_miss_sem_stale_deve_consultar_banco(
+            self,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+        ) -> None:
+            """Sem stale (cache frio), a requisicao consulta o banco."""
+            # Arrange
+            mock_cache.get.return_value = None
+            mock_cache.get_stale.return_value = None
+            use_case = GetInterrupcoesAtivasUseCase(
+                repository=mock_repository,
+                cache=mock_cache,
+                serve_stale_on_miss=True,
+            )
+
+            # Act
+            result = await use_case.execute()
+
+            # Assert
+            assert result.is_success
+            mock_repository.find_ativas_agregadas.assert_called_once()
+
+        @pytest.mark.asyncio
+        async def test_refresh_deve_atualizar_cache_com_ttl_configurado(
+            self,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+            interrupcao_agregada_factory: Callable[..., InterrupcaoAgregada],
+        ) -> None:
+            """refresh() grava o snapshot com o TTL informado."""
+            # Arrange
+            mock_repository.find_ativas_agregadas.return_value = [
+                interrupcao_agregada_factory()
+            ]
+            use_case = GetInterrupcoesAtivasUseCase(
+                repository=mock_repository,
+                cache=mock_cache,
+                ttl_seconds=120,
+            )
+
+            # Act
+            result = await use_case.refresh()
+
+            # Assert
+            assert len(result.items) == 1
+            assert mock_cache.set.call_args[0][2] == 120
+
+        @pytest.mark.asyncio
+        async def test_refresh_deve_propagar_erro_do_repositorio(
+            self,
+            use_case: GetInterrupcoesAtivasUseCase,
+            mock_repository: AsyncMock,
+        ) -> None:
+            """Falhas do refresh sobem para o agendador aplicar backoff."""
+            # Arrange
+            mock_repository.find_ativas_agregadas.side_effect = Exception("DB Error")
+
+            # Act & Assert
+            with pytest.raises(Exception, match="DB Error"):
+                await use_case.refresh()
+
+    class TestHistorico:
+        """Testes da gravacao do historico de snapshots."""
+
+        @pytest.mark.asyncio
+        async def test_refresh_deve_gravar_snapshot_no_historico(
+            self,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+            interrupcao_agregada_factory: Callable[..., InterrupcaoAgregada],
+        ) -> None:
+            """Cada snapshot recalculado e gravado com seus itens."""
+            # Arrange
+            history = AsyncMock()
+            mock_repository.find_ativas_agregadas.return_value = [
+                interrupcao_agregada_factory()
+            ]
+            use_case = GetInterrupcoesAtivasUseCase(
+                repository=mock_repository, cache=mock_cache, history=history
+            )
+
+            # Act
+            snapshot = await use_case.refresh()
+
+            # Assert
+            history.save.assert_awaited_once()
+            assert history.save.call_args[0][1] == snapshot.items
+
+        @pytest.mark.asyncio
+        async def test_apenas_o_lider_deve_gravar_historico(
+            self,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+        ) -> None:
+            """Worker que nao e lider recalcula o cache mas nao grava historico."""
+            # Arrange
+            history = AsyncMock()
+            use_case = GetInterrupcoesAtivasUseCase(
+                repository=mock_repository,
+                cache=mock_cache,
+                history=history,
+                is_history_writer=lambda: False,
+            )
+
+            # Act
+            await use_case.refresh()
+
+            # Assert
+            mock_cache.set.assert_called_once()
+            history.save.assert_not_awaited()
+
+        @pytest.mark.asyncio
+        async def test_falha_no_historico_nao_deve_afetar_resposta(
+            self,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+        ) -> None:
+            """Erro ao gravar historico e apenas registrado em log."""
+            # Arrange
+            history = AsyncMock()
+            history.save.side_effect = Exception("ORA-00942")
+            use_case = GetInterrupcoesAtivasUseCase(
+                repository=mock_repository, cache=mock_cache, history=history
+            )
+
+            # Act
+            result = await use_case.execute()
+
+            # Assert
+            assert result.is_success
+            mock_cache.set.assert_called_once()
+
+    class TestUniverso:
+        """Testes do universo de UCs atendidas pre-calculado."""
+
+        @pytest.mark.asyncio
+        async def test_refresh_deve_passar_universo_ao_repositorio(
+            self,
+            mock_cache: AsyncMock,
+            mock_repository: AsyncMock,
+        ) -> None:
+            """O mapa do UniversoRepository e repassado a agregacao."""
+            # Arrange
+            universo = AsyncMock()
+            universo.get_universo.return_value = {(1, 1400100): 1200}
+            use_case = GetInterrupcoesAtivasUseCase(
+                repository=mock_repository, cache=mock_cache, universo=universo
+            )
+
+            # Act
+            await use_case.refresh()
+
+            # Assert
+            mock_repository.find_ativas_agregadas.assert_awaited_once_with(
+                {(1, 1400100): 1200}
+            )
+
     class TestSemDados:
         """Testes quando nao ha interrupcoes ativas."""
 
@@ -336,7 +708,7 @@ class TestGetInterrupcoesAtivasUseCase:
 
             # Assert
             assert result.is_success
-            assert result.value == []
+            assert result.value.items == []
 
         @pytest.mark.asyncio
         async def test_deve_armazenar_lista_vazia_no_cache(
@@ -356,7 +728,7 @@ class TestGetInterrupcoesAtivasUseCase:
             # Assert
             mock_cache.set.assert_called_once()
             call_args = mock_cache.set.call_args
-            assert call_args[0][1] == []  # value = []
+            assert call_args[0][1].items == []  # value = snapshot vazio
 
     class TestConstantes:
         """Testes das constantes do use case."""
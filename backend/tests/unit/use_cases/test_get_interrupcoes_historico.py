@@ -0,0 +1,213 @@
+"""Testes unitarios para Use Case GetInterrupcoesHistoricoUseCase."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.apps.api_interrupcoes.repositories.snapshot_historico_repository import (
+    SnapshotHistorico,
+)
+from backend.apps.api_interrupcoes.schemas import InterrupcaoAgregadaItem
+from backend.apps.api_interrupcoes.use_cases import get_interrupcoes_historico
+from backend.apps.api_interrupcoes.use_cases.get_interrupcoes_historico import (
+    GetInterrupcoesHistoricoUseCase,
+)
+from backend.shared.domain.value_objects.data_recuperacao import DataRecuperacao
+
+AGORA = datetime(2026, 10, 18, 12, 0)
+
+
+def _item(conjunto: int = 1) -> InterrupcaoAgregadaItem:
+    return InterrupcaoAgregadaItem(
+        ideConjuntoUnidadeConsumidora=conjunto,
+        ideMunicipio=1400100,
+        qtdUCsAtendidas=1000,
+        qtdOcorrenciaProgramada=10,
+        qtdOcorrenciaNaoProgramada=5,
+    )
+
+
+@pytest.mark.unit
+class TestGetInterrupcoesHistoricoUseCase:
+    """Testes para Use Case GetInterrupcoesHistoricoUseCase."""
+
+    @pytest.fixture(autouse=True)
+    def agora(self):
+        """Fixa o relogio de Brasilia."""
+        # patch.object: o modulo pode ser recarregado pelos testes e2e
+        with patch.object(get_interrupcoes_historico, "agora_brasilia", return_value=AGORA):
+            yield
+
+    @pytest.fixture
+    def mock_history(self) -> AsyncMock:
+        """Mock do repositorio de historico."""
+        history = AsyncMock()
+        history.find_nearest = AsyncMock(return_value=None)
+        return history
+
+    @pytest.fixture
+    def mock_cache(self) -> AsyncMock:
+        """Mock do servico de cache."""
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value=None)
+        return cache
+
+    @pytest.fixture
+    def use_case(
+        self, mock_history: AsyncMock, mock_cache: AsyncMock
+    ) -> GetInterrupcoesHistoricoUseCase:
+        """Instancia do use case com mocks."""
+        return GetInterrupcoesHistoricoUseCase(history=mock_history, cache=mock_cache)
+
+    @pytest.mark.asyncio
+    async def test_deve_retornar_snapshot_mais_recente_ate_dth(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+        mock_history: AsyncMock,
+    ) -> None:
+        """O snapshot retornado pelo historico vira a resposta."""
+        # Arrange
+        dth = DataRecuperacao(valor=datetime(2026, 1, 10, 14, 30))
+        capturado_em = datetime(2026, 1, 10, 14, 27)
+        mock_history.find_nearest.return_value = SnapshotHistorico(
+            capturado_em=capturado_em, items=[_item(1), _item(2)]
+        )
+
+        # Act
+        result = await use_case.execute(dth)
+
+        # Assert
+        assert result.is_success
+        assert len(result.value.items) == 2
+        mock_history.find_nearest.assert_awaited_once_with(dth.valor)
+        assert result.value.cache_headers["Last-Modified"] == (
+            "Sat, 10 Jan 2026 17:27:00 GMT"
+        )
+
+    @pytest.mark.asyncio
+    async def test_snapshot_antigo_deve_ser_cacheado(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+        mock_history: AsyncMock,
+        mock_cache: AsyncMock,
+    ) -> None:
+        """Snapshots passados sao imutaveis e ficam em cache."""
+        # Arrange
+        mock_history.find_nearest.return_value = SnapshotHistorico(
+            capturado_em=datetime(2026, 1, 10, 14, 27), items=[]
+        )
+
+        # Act
+        await use_case.execute(DataRecuperacao(valor=datetime(2026, 1, 10, 14, 30)))
+
+        # Assert
+        mock_cache.set.assert_awaited_once()
+        assert mock_cache.set.call_args[0][0] == "interrupcoes:historico:202601101430"
+
+    @pytest.mark.asyncio
+    async def test_data_recente_nao_deve_ser_cacheada(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+        mock_history: AsyncMock,
+        mock_cache: AsyncMock,
+    ) -> None:
+        """Um snapshot mais novo ainda pode ser gravado ate dth."""
+        # Arrange
+        mock_history.find_nearest.return_value = SnapshotHistorico(
+            capturado_em=AGORA - timedelta(minutes=3), items=[]
+        )
+
+        # Act
+        await use_case.execute(DataRecuperacao(valor=AGORA - timedelta(minutes=1)))
+
+        # Assert
+        mock_cache.set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_nao_deve_consultar_historico(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+        mock_history: AsyncMock,
+        mock_cache: AsyncMock,
+    ) -> None:
+        """Cache hit retorna o snapshot sem acessar o banco."""
+        # Arrange
+        mock_cache.get.return_value = "snapshot"
+
+        # Act
+        result = await use_case.execute(
+            DataRecuperacao(valor=datetime(2026, 1, 10, 14, 30))
+        )
+
+        # Assert
+        assert result.value == "snapshot"
+        mock_history.find_nearest.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sem_snapshot_deve_retornar_failure(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+    ) -> None:
+        """Sem historico ate dth retorna erro."""
+        # Act
+        result = await use_case.execute(
+            DataRecuperacao(valor=datetime(2026, 1, 10, 14, 30))
+        )
+
+        # Assert
+        assert result.is_failure
+        assert "Nenhum snapshot" in result.error
+
+    @pytest.mark.asyncio
+    async def test_fora_da_retencao_deve_retornar_failure(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+        mock_history: AsyncMock,
+    ) -> None:
+        """Datas alem de 36 meses nao consultam o banco."""
+        # Act
+        result = await use_case.execute(
+            DataRecuperacao(valor=datetime(2023, 1, 1, 0, 0))
+        )
+
+        # Assert
+        assert result.is_failure
+        assert "retencao" in result.error
+        mock_history.find_nearest.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_erro_no_banco_deve_retornar_failure(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+        mock_history: AsyncMock,
+    ) -> None:
+        """Excecao do repositorio vira Result.fail()."""
+        # Arrange
+        mock_history.find_nearest.side_effect = Exception("ORA-12541")
+
+        # Act
+        result = await use_case.execute(
+            DataRecuperacao(valor=datetime(2026, 1, 10, 14, 30))
+        )
+
+        # Assert
+        assert result.is_failure
+        assert "ORA-12541" in result.error
+
+    @pytest.mark.asyncio
+    async def test_purge_deve_usar_limite_de_retencao(
+        self,
+        use_case: GetInterrupcoesHistoricoUseCase,
+        mock_history: AsyncMock,
+    ) -> None:
+        """Expurgo remove o que passou de 36 meses."""
+        # Act
+        await use_case.purge_expired()
+
+        # Assert
+        mock_history.purge_before.assert_awaited_once_with(
+            AGORA - timedelta(days=30 * 36)
+        )